@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Tool-argument validation micro-benchmark.
+
+Measures the per-turn cost of argument validation — one
+``ToolRegistry.validate_call`` plus one ``SafetyGuard.validate_tool_args``
+schema phase per tool call — with the legacy per-call schema walk
+("before") and the compiled validators from ``bantz.agent.arg_validation``
+("after").  Calls are synthesised from every tool in the planner registry.
+
+Usage::
+
+    python scripts/bench_arg_validation.py
+    python scripts/bench_arg_validation.py --turns 20000 --calls-per-turn 3
+    python scripts/bench_arg_validation.py --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from bantz.agent.builtin_tools import build_planner_registry  # noqa: E402
+from bantz.agent.tools import Tool, ToolRegistry  # noqa: E402
+
+_SAMPLES: dict[str, Any] = {
+    "string": "yarın 15:00",
+    "integer": "30",
+    "number": 1.5,
+    "boolean": True,
+}
+
+
+# ── legacy (per-call schema walk) ─────────────────────────────────
+
+
+def legacy_validate_call(tool: Tool, params: dict[str, Any]) -> tuple[bool, str]:
+    params = dict(params)
+    schema = tool.parameters or {}
+    for key in schema.get("required") or []:
+        if key not in params:
+            return False, f"missing_param:{key}"
+    props = schema.get("properties") or {}
+    for key, value in list(params.items()):
+        if isinstance(value, str) and not value.strip():
+            params[key] = None
+            continue
+        spec = props.get(key)
+        if not spec:
+            continue
+        expected = spec.get("type")
+        if expected == "boolean":
+            if not isinstance(value, bool):
+                return False, f"bad_type:{key}:expected_boolean"
+        elif expected == "integer":
+            if isinstance(value, bool):
+                return False, f"bad_type:{key}:expected_int"
+            if isinstance(value, str):
+                try:
+                    params[key] = int(value)
+                except (ValueError, TypeError):
+                    return False, f"bad_type:{key}:expected_int"
+            elif not isinstance(value, int):
+                return False, f"bad_type:{key}:expected_int"
+        elif expected == "number":
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return False, f"bad_type:{key}:expected_number"
+        elif expected == "string":
+            if not isinstance(value, str):
+                return False, f"bad_type:{key}:expected_string"
+        allowed = spec.get("enum")
+        if allowed and value not in allowed:
+            return False, f"bad_enum:{key}:expected_one_of:{allowed}"
+    return True, "ok"
+
+
+def legacy_guard_schema(tool: Tool, params: dict[str, Any]) -> tuple[bool, str | None]:
+    schema = tool.parameters or {}
+    for fld in schema.get("required", []):
+        if fld not in params:
+            return False, f"Missing required field: {fld}"
+    properties = schema.get("properties", {})
+    for fld in [f for f in params if f not in properties]:
+        del params[fld]
+    for fld, value in params.items():
+        expected = properties[fld].get("type")
+        if expected == "string" and not isinstance(value, str):
+            return False, f"Field '{fld}' must be string"
+        elif expected == "integer":
+            if isinstance(value, bool):
+                return False, f"Field '{fld}' must be integer"
+            if isinstance(value, str):
+                try:
+                    params[fld] = int(value)
+                except ValueError:
+                    return False, f"Field '{fld}' must be integer"
+        elif expected == "number" and (isinstance(value, bool) or not isinstance(value, (int, float))):
+            return False, f"Field '{fld}' must be number"
+        elif expected == "boolean" and not isinstance(value, bool):
+            return False, f"Field '{fld}' must be boolean"
+    return True, None
+
+
+# ── compiled ──────────────────────────────────────────────────────
+
+
+def compiled_guard_schema(reg: ToolRegistry, tool: Tool, params: dict[str, Any]) -> tuple[bool, str | None]:
+    v = reg.validator(tool.name)
+    missing = v.missing(params)
+    if missing is not None:
+        return False, f"Missing required field: {missing}"
+    for fld in v.unknown(params):
+        del params[fld]
+    failure = v.coerce_in_place(params)
+    if failure is not None:
+        return False, f"Field '{failure[0]}' must be {failure[1].expected}"
+    return True, None
+
+
+# ── harness ───────────────────────────────────────────────────────
+
+
+def build_calls(reg: ToolRegistry) -> list[tuple[Tool, dict[str, Any]]]:
+    calls = []
+    for name in reg.names():
+        tool = reg.get(name)
+        props = (tool.parameters or {}).get("properties") or {}
+        params: dict[str, Any] = {}
+        for key, spec in props.items():
+            enum = spec.get("enum") if isinstance(spec, dict) else None
+            if enum:
+                params[key] = enum[0]
+            elif isinstance(spec, dict) and isinstance(spec.get("type"), str):
+                params[key] = _SAMPLES.get(spec["type"], "x")
+        params["natural_query"] = "router leftovers"
+        calls.append((tool, params))
+    return calls
+
+
+def run(turns: int, calls_per_turn: int, fn: Callable[[Tool, dict[str, Any]], Any],
+        calls: list[tuple[Tool, dict[str, Any]]]) -> float:
+    """Return microseconds of validation per turn."""
+    n = len(calls)
+    start = time.perf_counter()
+    i = 0
+    for _ in range(turns):
+        for _ in range(calls_per_turn):
+            tool, params = calls[i % n]
+            fn(tool, dict(params))
+            i += 1
+    return (time.perf_counter() - start) / turns * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--turns", type=int, default=10000)
+    p.add_argument("--calls-per-turn", type=int, default=2)
+    p.add_argument("--format", choices=["text", "json"], default="text")
+    args = p.parse_args(argv)
+
+    reg = build_planner_registry()
+    calls = build_calls(reg)
+
+    def before(tool: Tool, params: dict[str, Any]) -> None:
+        legacy_validate_call(tool, params)
+        legacy_guard_schema(tool, params)
+
+    def after(tool: Tool, params: dict[str, Any]) -> None:
+        reg.validate_call(tool.name, params)
+        compiled_guard_schema(reg, tool, params)
+
+    def noop(tool: Tool, params: dict[str, Any]) -> None:
+        return None
+
+    for fn in (noop, before, after):  # warm-up
+        run(200, args.calls_per_turn, fn, calls)
+    # Harness overhead (loop + params copy) is measured and subtracted.
+    overhead_us = run(args.turns, args.calls_per_turn, noop, calls)
+    before_us = run(args.turns, args.calls_per_turn, before, calls) - overhead_us
+    after_us = run(args.turns, args.calls_per_turn, after, calls) - overhead_us
+
+    result = {
+        "tools": len(calls),
+        "turns": args.turns,
+        "calls_per_turn": args.calls_per_turn,
+        "before_us_per_turn": round(before_us, 2),
+        "after_us_per_turn": round(after_us, 2),
+        "speedup": round(before_us / after_us, 2) if after_us else None,
+    }
+    if args.format == "json":
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"tools={result['tools']} turns={args.turns} calls/turn={args.calls_per_turn}")
+        print(f"  before (schema walk): {result['before_us_per_turn']:8.2f} µs/turn")
+        print(f"  after  (compiled)   : {result['after_us_per_turn']:8.2f} µs/turn")
+        print(f"  speedup             : {result['speedup']}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
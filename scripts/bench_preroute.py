@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""PreRouter / HybridNLU regex matcher benchmark.
+
+Routes a preroute corpus — the golden router-accuracy utterances plus
+typical bypass inputs (greetings, confirmations, time queries) — through
+the legacy rule loop, which evaluates every rule ("before"), and the
+compiled matcher, which selects candidate rules with a single literal
+scan ("after").  The same comparison is made for ``RegexPatterns.match``
+of the hybrid NLU fast path.  Both paths must return identical results.
+
+Usage::
+
+    python scripts/bench_preroute.py
+    python scripts/bench_preroute.py --repeat 50
+    python scripts/bench_preroute.py --corpus my_inputs.txt --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from bantz.nlu.hybrid import RegexPatterns  # noqa: E402
+from bantz.routing.preroute import CompiledRuleMatcher, PreRouter  # noqa: E402
+
+DEFAULT_CORPUS = Path(__file__).resolve().parent.parent / "tests" / "golden" / "router_accuracy.jsonl"
+
+_BYPASS_INPUTS = (
+    "merhaba", "selam", "günaydın", "iyi akşamlar", "teşekkürler", "sağ ol",
+    "güle güle", "görüşürüz", "evet", "tamam", "hayır", "vazgeç",
+    "saat kaç", "bugün hangi gün", "tarih ne", "nasılsın", "naber",
+    "ekran görüntüsü al", "sesi kıs", "sistem durumu nasıl", "cpu kullanımı",
+    "youtube aç", "spotify kapat", "yardım", "duraklat", "devam et",
+)
+
+
+def load_corpus(path: Optional[Path]) -> list[str]:
+    """Golden router-accuracy texts (JSON ``cases``) or one input per line."""
+    path = path or DEFAULT_CORPUS
+    raw = path.read_text(encoding="utf-8")
+    try:
+        texts = [case["text"] for case in json.loads(raw)["cases"]]
+    except (ValueError, KeyError, TypeError):
+        texts = [line.strip() for line in raw.splitlines() if line.strip()]
+    if path == DEFAULT_CORPUS:
+        texts += _BYPASS_INPUTS
+    return texts
+
+
+def legacy_regex_match(patterns: RegexPatterns, text: str) -> Any:
+    """``RegexPatterns.match`` without the literal prefilter."""
+    text = text.strip()
+    for pattern, handler in patterns.patterns:
+        m = pattern.match(text)
+        if m is None and pattern.pattern.startswith("("):
+            m = pattern.search(text)
+        if m:
+            return handler(m, text)
+    return None
+
+
+def _preroute_key(m: Any) -> tuple:
+    return (m.matched, m.intent, m.confidence, m.rule_name)
+
+
+def _nlu_key(r: Any) -> Optional[tuple]:
+    return None if r is None else (r.intent, r.slots, r.confidence)
+
+
+def run(fn: Callable[[str], Any], texts: list[str], repeat: int) -> float:
+    """Return mean µs per input."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text in texts:
+            fn(text)
+    return (time.perf_counter() - start) / (repeat * len(texts)) * 1e6
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--corpus", type=Path, default=None, help="golden JSON or one input per line")
+    p.add_argument("--repeat", type=int, default=20)
+    p.add_argument("--format", choices=["text", "json"], default="text")
+    args = p.parse_args(argv)
+
+    texts = load_corpus(args.corpus)
+    loop_router, compiled_router = PreRouter(compiled=False), PreRouter()
+    patterns = RegexPatterns()
+
+    for text in texts:
+        assert _preroute_key(loop_router.route(text)) == _preroute_key(compiled_router.route(text)), text
+        assert _nlu_key(legacy_regex_match(patterns, text)) == _nlu_key(patterns.match(text)), text
+
+    matcher = CompiledRuleMatcher(compiled_router.rules)
+    evaluated = sum(len(matcher.candidates(t.strip())) for t in texts) / len(texts)
+    nlu_evaluated = sum(len(patterns._candidates(t.strip())) for t in texts) / len(texts)
+
+    pre_before = run(loop_router.route, texts, args.repeat)
+    pre_after = run(compiled_router.route, texts, args.repeat)
+    nlu_before = run(lambda t: legacy_regex_match(patterns, t), texts, args.repeat)
+    nlu_after = run(patterns.match, texts, args.repeat)
+
+    result = {
+        "inputs": len(texts),
+        "repeat": args.repeat,
+        "preroute": {
+            "rules": len(compiled_router.rules),
+            "rules_evaluated": round(evaluated, 2),
+            "before_us": round(pre_before, 2),
+            "after_us": round(pre_after, 2),
+            "speedup": round(pre_before / pre_after, 2) if pre_after else None,
+        },
+        "hybrid_nlu": {
+            "patterns": len(patterns.patterns),
+            "patterns_evaluated": round(nlu_evaluated, 2),
+            "before_us": round(nlu_before, 2),
+            "after_us": round(nlu_after, 2),
+            "speedup": round(nlu_before / nlu_after, 2) if nlu_after else None,
+        },
+    }
+    if args.format == "json":
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"inputs={len(texts)} repeat={args.repeat} (results identical)")
+        for name, key in (("preroute", "rules"), ("hybrid_nlu", "patterns")):
+            r = result[name]
+            print(f"{name}: {r[key]} {key}, {r[key + '_evaluated']} evaluated per input")
+            print(f"  before (rule loop): {r['before_us']:8.2f} µs/input")
+            print(f"  after  (compiled) : {r['after_us']:8.2f} µs/input")
+            print(f"  speedup           : {r['speedup']}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""Sandbox.execute_python latency benchmark.
+
+Runs the same small snippets through ``Sandbox.execute_python`` with a
+fresh interpreter per call (``python_pool_size=0``, "before") and with
+the warm fork-server pool ("after"), reporting per-call latency.
+
+Usage::
+
+    python scripts/bench_sandbox_pool.py
+    python scripts/bench_sandbox_pool.py --runs 200 --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from bantz.security.sandbox import Sandbox, SandboxConfig  # noqa: E402
+from bantz.security.sandbox_pool import shutdown_pools  # noqa: E402
+
+_SNIPPETS = (
+    "print(sum(range(1000)))",
+    "import json; print(json.dumps({'a': [1, 2, 3]}))",
+    "x = [i * i for i in range(100)]\nprint(len(x))",
+)
+
+
+def measure(sandbox: Sandbox, runs: int) -> list[float]:
+    """Per-call wall times in milliseconds."""
+    times = []
+    for i in range(runs):
+        start = time.perf_counter()
+        result = sandbox.execute_python(_SNIPPETS[i % len(_SNIPPETS)])
+        times.append((time.perf_counter() - start) * 1000)
+        assert result.success, result.stderr
+    return times
+
+
+def summary(times: list[float]) -> dict:
+    ordered = sorted(times)
+    return {
+        "median_ms": round(statistics.median(ordered), 2),
+        "p95_ms": round(ordered[int(len(ordered) * 0.95) - 1], 2),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--runs", type=int, default=50)
+    p.add_argument("--format", choices=["text", "json"], default="text")
+    args = p.parse_args(argv)
+
+    with Sandbox(SandboxConfig(python_pool_size=0)) as fresh:
+        before = summary(measure(fresh, args.runs))
+    with Sandbox() as pooled:
+        pooled._python_pool().warm()
+        after = summary(measure(pooled, args.runs))
+    shutdown_pools()
+
+    result = {
+        "runs": args.runs,
+        "before": before,
+        "after": after,
+        "speedup": round(before["median_ms"] / after["median_ms"], 1),
+    }
+    if args.format == "json":
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"runs={args.runs}")
+        print(f"  before (fresh interpreter): median {before['median_ms']:7.2f} ms  p95 {before['p95_ms']:7.2f} ms")
+        print(f"  after  (warm pool)        : median {after['median_ms']:7.2f} ms  p95 {after['p95_ms']:7.2f} ms")
+        print(f"  speedup                   : {result['speedup']}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,522 @@
+#!/usr/bin/env python3
+"""End-to-end turn benchmark for ``OrchestratorLoop.process_turn``.
+
+Replays recorded turns (``tests/fixtures/bench_turns.json``) through a real
+``OrchestratorLoop`` — preroute → route → tools → reflection → finalize →
+state update — with deterministic tool fixtures and a fixture LLM that
+answers from the recording after a configurable latency.  Because the
+LLM wait is known exactly, the report separates it from the Python
+overhead around it.
+
+Reports, per phase and for the whole turn:
+  - wall-clock p50/p95/p99 (phases are exclusive: a nested phase's time
+    is not counted again in its parent)
+  - CPU time (``time.process_time``; the LLM sleep costs none)
+  - allocations (tracemalloc peak and retained KiB, measured in a separate
+    pass so tracing does not skew the timings)
+
+Baselines are plain JSON result files; ``--baseline`` compares against one
+and exits 1 when a metric regresses by more than ``--fail-regression-pct``.
+
+Usage:
+    python scripts/bench_turns.py                          # 20 iterations, 0 ms LLM
+    python scripts/bench_turns.py --latency-ms 150 --finalizer-latency-ms 400
+    python scripts/bench_turns.py --save-baseline artifacts/results/bench_turns_baseline.json
+    python scripts/bench_turns.py --baseline artifacts/results/bench_turns_baseline.json \\
+        --fail-regression-pct 20
+    python scripts/bench_turns.py --format json --output artifacts/results/bench_turns.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import functools
+import json
+import logging
+import platform
+import sys
+import time
+import tracemalloc
+import warnings
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from bantz.agent.tools import Tool, ToolRegistry  # noqa: E402
+from bantz.brain.llm_router import JarvisLLMOrchestrator  # noqa: E402
+from bantz.brain.orchestrator_loop import (  # noqa: E402
+    OrchestratorConfig,
+    OrchestratorLoop,
+    OrchestratorState,
+)
+from bantz.core.events import EventBus  # noqa: E402
+from bantz.llm.base import LLMClient, LLMMessage, LLMResponse  # noqa: E402
+
+DEFAULT_FIXTURES = Path(__file__).resolve().parent.parent / "tests" / "fixtures" / "bench_turns.json"
+
+# Exclusive wall-clock phases, in pipeline order.
+PHASES = ("preroute", "route", "tools", "reflection", "finalize", "state", "other")
+# Loop attributes timed as each phase (``prerouter.route`` is handled separately).
+PHASE_METHODS = {
+    "_llm_planning_phase": "route",
+    "_react_execute_loop": "tools",
+    "_subtask_execute_loop": "tools",
+    "_reflection_phase": "reflection",
+    "_llm_finalization_phase": "finalize",
+    "_update_state_phase": "state",
+}
+
+# Metrics compared against a baseline, and the smallest absolute change
+# (ms or KiB) that counts as a regression — sub-noise deltas are ignored.
+REGRESSION_METRICS = ("p50", "p95")
+MIN_REGRESSION_DELTA = {"ms": 0.5, "kib": 16.0}
+
+_FALLBACK_ROUTER = {
+    "route": "smalltalk",
+    "calendar_intent": "none",
+    "slots": {},
+    "confidence": 0.5,
+    "tool_plan": [],
+    "assistant_reply": "Anlayamadım efendim.",
+}
+_DEFAULT_REFLECTION = {"satisfied": True, "reason": "Sonuç isteği karşılıyor.", "corrective_action": None}
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@dataclass
+class RecordedTurn:
+    """One recorded turn: what the LLMs said and what each tool returned.
+
+    ``router`` is the router JSON, ``finalizer`` the final reply text,
+    ``reflection`` the optional self-reflection verdict and ``tools`` maps
+    tool names to their recorded results.
+    """
+
+    name: str
+    user_input: str
+    router: dict = field(default_factory=dict)
+    finalizer: str = ""
+    reflection: dict = field(default_factory=dict)
+    tools: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "RecordedTurn":
+        return cls(
+            name=data["name"],
+            user_input=data["user_input"],
+            router=data.get("router") or {},
+            finalizer=data.get("finalizer", ""),
+            reflection=data.get("reflection") or {},
+            tools=data.get("tools") or {},
+        )
+
+
+def load_turns(path: Path = DEFAULT_FIXTURES) -> list[RecordedTurn]:
+    """Load recorded turns from a fixture file."""
+    raw = json.loads(Path(path).read_text(encoding="utf-8"))
+    return [RecordedTurn.from_dict(t) for t in raw.get("turns", raw if isinstance(raw, list) else [])]
+
+
+class FixtureLLM(LLMClient):
+    """LLM client that replays the current turn's recording after a fixed latency.
+
+    The answer depends on the prompt, not on which client is asked: the
+    router client also serves the fast finalizer and reflection prompts.
+    Router prompts get the recorded router JSON, reflection prompts the
+    recorded ``reflection`` verdict (default: satisfied), everything else
+    the recorded final reply.
+    """
+
+    def __init__(self, name: str, latency_ms: float = 0.0):
+        self.name = name
+        self.latency_s = max(0.0, latency_ms) / 1000
+        self.turn: Optional[RecordedTurn] = None
+        self.calls = 0
+        self.wait_s = 0.0
+
+    @property
+    def model_name(self) -> str:
+        return f"fixture-{self.name}"
+
+    @property
+    def backend_name(self) -> str:
+        return "fixture"
+
+    def is_available(self, *, timeout_seconds: float = 1.5) -> bool:
+        return True
+
+    def _respond(self, prompt: str) -> str:
+        self.calls += 1
+        if self.latency_s:
+            start = time.perf_counter()
+            time.sleep(self.latency_s)
+            self.wait_s += time.perf_counter() - start
+        turn = self.turn or RecordedTurn(name="", user_input="")
+        tail = prompt[-200:]
+        if "sadece JSON" in tail and '"satisfied"' in prompt:
+            return json.dumps(turn.reflection or _DEFAULT_REFLECTION, ensure_ascii=False)
+        if "sadece JSON" in tail:
+            return json.dumps(turn.router or _FALLBACK_ROUTER, ensure_ascii=False)
+        return turn.finalizer or "Tamam efendim."
+
+    def complete_text(self, *, prompt: str, temperature: float = 0.0, max_tokens: int = 200, system_prompt: Optional[str] = None) -> str:
+        return self._respond(prompt)
+
+    def chat(self, messages: list[LLMMessage], *, temperature: float = 0.4, max_tokens: int = 512) -> str:
+        return self.chat_detailed(messages, temperature=temperature, max_tokens=max_tokens).content
+
+    def chat_detailed(
+        self,
+        messages: list[LLMMessage],
+        *,
+        temperature: float = 0.4,
+        max_tokens: int = 512,
+        seed: Optional[int] = None,
+    ) -> LLMResponse:
+        content = self._respond("\n".join(m.content for m in messages))
+        return LLMResponse(content=content, model=self.model_name, tokens_used=len(content) // 4, finish_reason="stop")
+
+
+def build_fixture_registry(turns: list[RecordedTurn], current: Callable[[], Optional[RecordedTurn]]) -> ToolRegistry:
+    """Registry with one tool per recorded tool name, returning the current turn's result."""
+    registry = ToolRegistry()
+    names = sorted({name for turn in turns for name in turn.tools})
+
+    def make_handler(tool_name: str) -> Callable[..., Any]:
+        def handler(**kwargs: Any) -> Any:
+            turn = current()
+            result = turn.tools.get(tool_name) if turn else None
+            return copy.deepcopy(result) if result is not None else {"ok": True}
+        return handler
+
+    for name in names:
+        registry.register(Tool(
+            name=name,
+            description=f"Recorded fixture for {name}",
+            parameters={"type": "object", "properties": {}, "additionalProperties": True},
+            handler=make_handler(name),
+        ))
+    return registry
+
+
+# ============================================================================
+# PHASE TIMING
+# ============================================================================
+
+class PhaseTimer:
+    """Accumulates exclusive wall-clock time per phase for the running turn."""
+
+    def __init__(self) -> None:
+        self.current: dict[str, float] = defaultdict(float)
+        self._children: list[float] = []
+
+    def reset(self) -> None:
+        self.current = defaultdict(float)
+        self._children = []
+
+    def wrap(self, obj: Any, attr: str, phase: str) -> None:
+        fn = getattr(obj, attr)
+
+        @functools.wraps(fn)
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            self._children.append(0.0)
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.current[phase] += elapsed - self._children.pop()
+                if self._children:
+                    self._children[-1] += elapsed
+
+        setattr(obj, attr, timed)
+
+
+class TurnBench:
+    """Builds an instrumented ``OrchestratorLoop`` and replays recorded turns."""
+
+    def __init__(
+        self,
+        turns: list[RecordedTurn],
+        *,
+        latency_ms: float = 0.0,
+        finalizer_latency_ms: Optional[float] = None,
+    ):
+        if not turns:
+            raise ValueError("No recorded turns to benchmark")
+        self.turns = turns
+        self.router_llm = FixtureLLM("router", latency_ms)
+        self.finalizer_llm = FixtureLLM(
+            "finalizer", latency_ms if finalizer_latency_ms is None else finalizer_latency_ms,
+        )
+        self._turn: Optional[RecordedTurn] = None
+        self.timer = PhaseTimer()
+
+        registry = build_fixture_registry(turns, lambda: self._turn)
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            self.loop = OrchestratorLoop(
+                JarvisLLMOrchestrator(llm_client=self.router_llm),
+                registry,
+                EventBus(),
+                OrchestratorConfig(enable_safety_guard=False),
+                finalizer_llm=self.finalizer_llm,
+            )
+        self.timer.wrap(self.loop.prerouter, "route", "preroute")
+        for attr, phase in PHASE_METHODS.items():
+            if hasattr(self.loop, attr):
+                self.timer.wrap(self.loop, attr, phase)
+
+    def run_turn(self, turn: RecordedTurn) -> dict[str, float]:
+        """Process one turn in a fresh session; returns timings in ms."""
+        self._turn = self.router_llm.turn = self.finalizer_llm.turn = turn
+        self.router_llm.wait_s = self.finalizer_llm.wait_s = 0.0
+        self.timer.reset()
+        state = OrchestratorState()
+
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        self.loop.process_turn(turn.user_input, state)
+        total = time.perf_counter() - start
+        cpu = time.process_time() - cpu_start
+
+        sample = {phase: self.timer.current.get(phase, 0.0) * 1000 for phase in PHASES}
+        sample["other"] = max(0.0, total * 1000 - sum(sample.values()))
+        llm_wait = (self.router_llm.wait_s + self.finalizer_llm.wait_s) * 1000
+        sample.update(total=total * 1000, llm_wait=llm_wait, overhead=total * 1000 - llm_wait, cpu=cpu * 1000)
+        return sample
+
+    def run_allocations(self, turn: RecordedTurn) -> dict[str, float]:
+        """Process one turn under tracemalloc; returns peak/retained KiB."""
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+        try:
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            self.run_turn(turn)
+            after, peak = tracemalloc.get_traced_memory()
+        finally:
+            if started:
+                tracemalloc.stop()
+        return {"alloc_peak": (peak - before) / 1024, "alloc_retained": (after - before) / 1024}
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def _percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lo = int(k)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(values: list[float]) -> dict[str, float]:
+    """p50/p95/p99/mean of a sample list, rounded to 3 decimals."""
+    return {
+        "p50": round(_percentile(values, 50), 3),
+        "p95": round(_percentile(values, 95), 3),
+        "p99": round(_percentile(values, 99), 3),
+        "mean": round(sum(values) / len(values), 3) if values else 0.0,
+    }
+
+
+def run_benchmark(
+    turns: list[RecordedTurn],
+    *,
+    iterations: int = 20,
+    warmup: int = 2,
+    latency_ms: float = 0.0,
+    finalizer_latency_ms: Optional[float] = None,
+    allocations: bool = True,
+) -> dict[str, Any]:
+    """Replay every turn ``iterations`` times and aggregate the timings.
+
+    Returns:
+        Result dict with ``meta``, ``metrics`` (all turns pooled) and
+        ``turns`` (per-turn metrics); every metric maps to p50/p95/p99/mean.
+    """
+    bench = TurnBench(turns, latency_ms=latency_ms, finalizer_latency_ms=finalizer_latency_ms)
+    for _ in range(warmup):
+        for turn in turns:
+            bench.run_turn(turn)
+
+    pooled: dict[str, list[float]] = defaultdict(list)
+    per_turn: dict[str, dict[str, list[float]]] = {t.name: defaultdict(list) for t in turns}
+    for _ in range(iterations):
+        for turn in turns:
+            for metric, value in bench.run_turn(turn).items():
+                pooled[metric].append(value)
+                per_turn[turn.name][metric].append(value)
+
+    if allocations:
+        for _ in range(max(1, iterations // 4)):
+            for turn in turns:
+                for metric, value in bench.run_allocations(turn).items():
+                    pooled[metric].append(value)
+                    per_turn[turn.name][metric].append(value)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "iterations": iterations,
+            "warmup": warmup,
+            "latency_ms": latency_ms,
+            "finalizer_latency_ms": latency_ms if finalizer_latency_ms is None else finalizer_latency_ms,
+            "turns": [t.name for t in turns],
+        },
+        "metrics": {metric: summarize(values) for metric, values in pooled.items()},
+        "turns": {
+            name: {metric: summarize(values) for metric, values in metrics.items()}
+            for name, metrics in per_turn.items()
+        },
+    }
+
+
+def _unit(metric: str) -> str:
+    return "kib" if metric.startswith("alloc") else "ms"
+
+
+def compare_to_baseline(result: dict, baseline: dict, *, max_regression_pct: float = 20.0) -> list[dict]:
+    """List metrics that got slower/larger than the baseline.
+
+    The LLM wait (``total``/``llm_wait``) is excluded: it is set by the
+    fixture latency, not by the code under test.  Per-turn metrics are
+    compared as well as the pooled ones.
+    """
+    regressions: list[dict] = []
+
+    def check(scope: str, current: dict, base: dict) -> None:
+        for metric, stats in current.items():
+            if metric in ("total", "llm_wait") or metric not in base:
+                continue
+            for stat in REGRESSION_METRICS:
+                old, new = base[metric].get(stat, 0.0), stats.get(stat, 0.0)
+                if new - old < MIN_REGRESSION_DELTA[_unit(metric)]:
+                    continue
+                pct = (new - old) / old * 100 if old > 0 else float("inf")
+                if pct > max_regression_pct:
+                    regressions.append({
+                        "scope": scope,
+                        "metric": metric,
+                        "stat": stat,
+                        "baseline": old,
+                        "current": new,
+                        "change_pct": round(pct, 1),
+                    })
+
+    check("all", result.get("metrics", {}), baseline.get("metrics", {}))
+    for name, metrics in result.get("turns", {}).items():
+        check(name, metrics, baseline.get("turns", {}).get(name, {}))
+    return regressions
+
+
+# ============================================================================
+# OUTPUT
+# ============================================================================
+
+def format_text(result: dict, regressions: Optional[list[dict]] = None) -> str:
+    meta = result["meta"]
+    lines = [
+        f"OrchestratorLoop.process_turn — {len(meta['turns'])} turns × {meta['iterations']} iterations "
+        f"(router LLM {meta['latency_ms']} ms, finalizer LLM {meta['finalizer_latency_ms']} ms)",
+        "",
+        f"{'metric':<22}{'p50':>10}{'p95':>10}{'p99':>10}{'mean':>10}",
+    ]
+    metrics = result["metrics"]
+    order = [*PHASES, "llm_wait", "overhead", "total", "cpu", "alloc_peak", "alloc_retained"]
+    for metric in order:
+        if metric not in metrics:
+            continue
+        s = metrics[metric]
+        unit = "KiB" if _unit(metric) == "kib" else "ms"
+        lines.append(f"{metric + ' (' + unit + ')':<22}{s['p50']:>10.2f}{s['p95']:>10.2f}{s['p99']:>10.2f}{s['mean']:>10.2f}")
+
+    lines += ["", f"{'turn':<26}{'overhead p50':>14}{'cpu p50':>10}{'alloc peak':>12}"]
+    for name, m in result["turns"].items():
+        alloc = m.get("alloc_peak", {}).get("p50", 0.0)
+        lines.append(f"{name:<26}{m['overhead']['p50']:>11.2f} ms{m['cpu']['p50']:>7.2f} ms{alloc:>8.0f} KiB")
+
+    if regressions is not None:
+        lines.append("")
+        if not regressions:
+            lines.append("No regressions against baseline.")
+        for r in regressions:
+            lines.append(
+                f"REGRESSION {r['scope']}/{r['metric']} {r['stat']}: "
+                f"{r['baseline']:.2f} → {r['current']:.2f} (+{r['change_pct']}%)"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--fixtures", type=Path, default=DEFAULT_FIXTURES, help="Recorded turns JSON")
+    p.add_argument("--turn", action="append", help="Only run turns with this name (repeatable)")
+    p.add_argument("--iterations", type=int, default=20)
+    p.add_argument("--warmup", type=int, default=2)
+    p.add_argument("--latency-ms", type=float, default=0.0, help="Router LLM latency per call")
+    p.add_argument("--finalizer-latency-ms", type=float, default=None, help="Finalizer LLM latency (default: --latency-ms)")
+    p.add_argument("--no-alloc", action="store_true", help="Skip the tracemalloc pass")
+    p.add_argument("--format", choices=["text", "json"], default="text")
+    p.add_argument("--output", type=Path, help="Also write the JSON result here")
+    p.add_argument("--save-baseline", type=Path, metavar="PATH", help="Write the result as a baseline")
+    p.add_argument("--baseline", type=Path, metavar="PATH", help="Compare against a saved baseline")
+    p.add_argument("--fail-regression-pct", type=float, default=20.0)
+    p.add_argument("--verbose", action="store_true", help="Keep bantz logging output")
+    args = p.parse_args(argv)
+
+    turns = load_turns(args.fixtures)
+    if args.turn:
+        turns = [t for t in turns if t.name in set(args.turn)]
+
+    previous_disable = logging.root.manager.disable
+    if not args.verbose:
+        logging.disable(logging.WARNING)
+    try:
+        result = run_benchmark(
+            turns,
+            iterations=args.iterations,
+            warmup=args.warmup,
+            latency_ms=args.latency_ms,
+            finalizer_latency_ms=args.finalizer_latency_ms,
+            allocations=not args.no_alloc,
+        )
+    finally:
+        logging.disable(previous_disable)
+
+    regressions = None
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        regressions = compare_to_baseline(result, baseline, max_regression_pct=args.fail_regression_pct)
+        result["regressions"] = regressions
+
+    for path in (args.output, args.save_baseline):
+        if path:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(result, indent=2, ensure_ascii=False), encoding="utf-8")
+
+    if args.format == "json":
+        print(json.dumps(result, indent=2, ensure_ascii=False))
+    else:
+        print(format_text(result, regressions))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Workspace index benchmark.
+
+Generates a synthetic Python project and times the coding-tool queries
+three ways: the legacy full walk (``rglob`` + read + regex / ``ast``
+parse per call, "before"), the persistent ``WorkspaceIndex`` ("after")
+and a no-change ``refresh()`` — the cost every query pays once the index
+is older than its max age.  Initial build time is reported separately.
+
+Usage::
+
+    python scripts/bench_workspace_index.py
+    python scripts/bench_workspace_index.py --files 20000
+    python scripts/bench_workspace_index.py --format json
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from bantz.coding.context import python_symbols  # noqa: E402
+from bantz.coding.index import WorkspaceIndex  # noqa: E402
+
+_MODULE = '''"""Module {i}."""
+
+import os
+from pkg{dep}.mod{dep2} import Service{dep2}
+
+
+class Service{i}:
+    """Service number {i}."""
+
+    def handle_{i}(self, request):
+        return os.path.join("x", str(request))
+
+
+def helper_{i}(value: int) -> int:
+    return value * {i}
+'''
+
+
+def build_tree(root: Path, files: int, per_dir: int = 100) -> None:
+    for i in range(files):
+        directory = root / "src" / f"pkg{i // per_dir}"
+        directory.mkdir(parents=True, exist_ok=True)
+        dep = max(0, i // per_dir - 1)
+        (directory / f"mod{i}.py").write_text(_MODULE.format(i=i, dep=dep, dep2=max(0, i - per_dir)))
+
+
+# ── legacy (walk the tree on every call) ──────────────────────────
+
+
+def legacy_content(root: Path, regex: str) -> list[str]:
+    compiled = re.compile(regex)
+    hits = []
+    for path in root.rglob("*.py"):
+        if compiled.search(path.read_text(errors="ignore")):
+            hits.append(str(path.relative_to(root)))
+    return hits
+
+
+def legacy_symbols(root: Path, name: str) -> list[str]:
+    hits = []
+    for path in root.rglob("*.py"):
+        try:
+            tree = ast.parse(path.read_text())
+        except SyntaxError:
+            continue
+        hits.extend(s.name for s in python_symbols(tree) if name.lower() in s.name.lower())
+    return hits
+
+
+# ── harness ───────────────────────────────────────────────────────
+
+
+def timed(fn: Callable[[], object], repeat: int = 1) -> float:
+    """Return the best wall time in milliseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(argv: list[str] | None = None) -> int:
+    p = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("--files", type=int, default=2000)
+    p.add_argument("--format", choices=["text", "json"], default="text")
+    args = p.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "project"
+        build_tree(root, args.files)
+        index = WorkspaceIndex(root, db_path=Path(tmp) / "index.db", max_age=3600)
+
+        build_ms = timed(index.refresh)
+        needle = f"helper_{args.files - 1}\\b"
+        assert index.search_content(needle) == legacy_content(root, needle)
+
+        queries = {
+            "content": (lambda: legacy_content(root, needle), lambda: index.search_content(needle)),
+            "symbol": (
+                lambda: legacy_symbols(root, f"Service{args.files // 2}"),
+                lambda: index.search_symbols(f"Service{args.files // 2}"),
+            ),
+            "files": (
+                lambda: sorted(str(q.relative_to(root)) for q in root.rglob("mod1*.py")),
+                lambda: index.find_files("mod1*.py", max_results=10**6),
+            ),
+        }
+        rows = {}
+        for name, (before, after) in queries.items():
+            b, a = timed(before), timed(after, repeat=5)
+            rows[name] = {"before_ms": round(b, 2), "after_ms": round(a, 2), "speedup": round(b / a, 1) if a else None}
+        refresh_ms = timed(index.refresh, repeat=3)
+        index.close()
+
+    result = {"files": args.files, "build_ms": round(build_ms, 1), "refresh_ms": round(refresh_ms, 2), "queries": rows}
+    if args.format == "json":
+        print(json.dumps(result, indent=2))
+    else:
+        print(f"files={args.files} build={result['build_ms']} ms no-change refresh={result['refresh_ms']} ms")
+        for name, row in rows.items():
+            print(f"  {name:8s} before {row['before_ms']:9.2f} ms  after {row['after_ms']:7.2f} ms  {row['speedup']}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
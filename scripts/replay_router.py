@@ -9,6 +9,10 @@ Usage:
     python scripts/replay_router.py --stats            # Show stats only
     python scripts/replay_router.py --export out.json  # Export dataset
     python scripts/replay_router.py --format json      # Output as JSON
+    python scripts/replay_router.py --concurrency 32   # 32 router calls in flight
+    python scripts/replay_router.py --base-url http://127.0.0.1:8001  # Plain HTTP
+                                                       # router (works with
+                                                       # scripts/vllm_mock_server.py)
 """
 
 from __future__ import annotations
@@ -16,9 +20,11 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import re
 import sys
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
@@ -30,6 +36,7 @@ from bantz.router.misroute_collector import (
     get_dataset_stats,
     replay_dataset,
 )
+from bantz.router.replay_engine import default_max_in_flight
 
 
 # ============================================================================
@@ -108,6 +115,66 @@ def create_vllm_router() -> Optional[callable]:
         return None
 
 
+# ============================================================================
+# HTTP ROUTER (OpenAI-compatible endpoint, e.g. vLLM or the mock server)
+# ============================================================================
+
+HTTP_ROUTER_PROMPT = (
+    "Kullanıcı mesajını sınıflandır. Sadece JSON döndür: "
+    '{{"route": "...", "calendar_intent": "...", "slots": {{}}, "confidence": 0.0}}\n'
+    "USER: {text}\nASSISTANT:"
+)
+
+
+def create_http_router(base_url: str, model: Optional[str] = None) -> Callable[[str], dict]:
+    """Router that POSTs each text to ``/v1/chat/completions``.
+    
+    Thread-safe (one HTTP session per thread) so it can be replayed with
+    many requests in flight.
+    """
+    import requests
+    
+    base_url = base_url.rstrip("/")
+    local = threading.local()
+    
+    def session() -> "requests.Session":
+        if not hasattr(local, "session"):
+            local.session = requests.Session()
+        return local.session
+    
+    if model is None:
+        resp = session().get(f"{base_url}/v1/models", timeout=5)
+        resp.raise_for_status()
+        model = resp.json()["data"][0]["id"]
+    
+    def router_fn(user_text: str) -> dict:
+        resp = session().post(
+            f"{base_url}/v1/chat/completions",
+            json={
+                "model": model,
+                "messages": [{"role": "user", "content": HTTP_ROUTER_PROMPT.format(text=user_text)}],
+                "temperature": 0.0,
+                "max_tokens": 128,
+            },
+            timeout=60,
+        )
+        resp.raise_for_status()
+        content = resp.json()["choices"][0]["message"]["content"]
+        match = re.search(r"\{.*\}", content, re.DOTALL)
+        try:
+            parsed = json.loads(match.group(0)) if match else {}
+        except json.JSONDecodeError:
+            parsed = {}
+        return {
+            "route": parsed.get("route", "unknown"),
+            "intent": parsed.get("calendar_intent", parsed.get("intent", "")),
+            "slots": parsed.get("slots", {}),
+            "confidence": parsed.get("confidence", 0.0),
+        }
+    
+    return router_fn
+
+
 # ============================================================================
 # MAIN
 # ============================================================================
@@ -154,11 +221,18 @@ def run_replay(
     use_mock: bool = False,
     limit: Optional[int] = None,
     format_json: bool = False,
+    concurrency: Optional[int] = None,
+    cache: bool = True,
+    base_url: Optional[str] = None,
+    progress_every: int = 0,
 ) -> None:
     """Run replay and show results."""
     
     # Select router
-    if use_mock:
+    if base_url:
+        print(f"Using HTTP router at {base_url}")
+        router_fn = create_http_router(base_url)
+    elif use_mock:
         print("Using mock router (pattern matching)")
         router_fn = mock_router
     else:
@@ -173,9 +247,27 @@ def run_replay(
     print(f"\nReplaying dataset: {dataset_path}")
     if limit:
         print(f"Limit: {limit} records")
+    print(f"In flight: {concurrency or default_max_in_flight()}")
     print("-" * 40)
     
-    summary = replay_dataset(router_fn, dataset_path, limit)
+    def on_progress(summary: ReplaySummary) -> None:
+        if progress_every and summary.total % progress_every == 0:
+            print(
+                f"  [{summary.total}] route_acc={summary.route_accuracy:.1%} "
+                f"improved={summary.improved} regressed={summary.regressed} "
+                f"errors={summary.errors} cache_hits={summary.cache_hits} "
+                f"({summary.total / max(summary.elapsed_s, 1e-9):.1f} rec/s)",
+                file=sys.stderr,
+            )
+    
+    summary = replay_dataset(
+        router_fn,
+        dataset_path,
+        limit,
+        max_in_flight=concurrency,
+        cache=cache,
+        on_progress=on_progress,
+    )
     
     if format_json:
         print(json.dumps(summary.to_dict(), indent=2, ensure_ascii=False))
@@ -217,6 +309,27 @@ def main():
         action="store_true",
         help="Use mock router instead of vLLM",
     )
+    parser.add_argument(
+        "--base-url",
+        help="Route through an OpenAI-compatible endpoint (vLLM or scripts/vllm_mock_server.py)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        help="Router calls in flight (default: BANTZ_REPLAY_CONCURRENCY or 8)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Route repeated user texts again instead of reusing the result",
+    )
+    parser.add_argument(
+        "--progress",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Print running stats to stderr every N records",
+    )
     parser.add_argument(
         "--export",
         metavar="PATH",
@@ -254,6 +367,10 @@ def main():
         use_mock=args.mock,
         limit=args.limit,
         format_json=format_json,
+        concurrency=args.concurrency,
+        cache=not args.no_cache,
+        base_url=args.base_url,
+        progress_every=args.progress,
     )
     return 0
 
@@ -17,6 +17,7 @@ Usage:
 """
 
 from flask import Flask, request, jsonify
+import re
 import time
 import json
 import sys
@@ -94,6 +95,15 @@ def chat_completions():
     })
 
 
+@app.route("/tokenize", methods=["POST"])
+def tokenize():
+    """vLLM-style tokenize endpoint (words split into <=4-char pieces)."""
+    data = request.json or {}
+    pieces = re.findall(r"\w{1,4}|[^\w\s]", str(data.get("prompt", "")))
+    tokens = [abs(hash(p)) % 50_000 for p in pieces]
+    return jsonify({"count": len(tokens), "max_model_len": 4096, "tokens": tokens})
+
+
 def generate_mock_response(prompt: str, temperature: float) -> str:
     """Generate mock response based on prompt pattern."""
     
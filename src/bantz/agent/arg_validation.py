@@ -0,0 +1,272 @@
+"""Compiled tool-argument validators.
+
+Tool parameter schemas are static, yet every validation entry point used
+to re-walk them per call: ``ToolRegistry.validate_call`` copied the params
+dict and looked up ``required``/``properties``/``type``/``enum`` for every
+key, and ``SafetyGuard.validate_tool_args`` did the same walk again a few
+lines later in the same turn.
+
+:func:`compile_schema` turns a parameters schema into a
+:class:`CompiledArgValidator` once — required keys as a tuple, known
+properties as a frozenset, and one :class:`FieldRule` per property whose
+``coerce`` is the type checker/coercer for that property's JSON type.
+Compiled validators are cached by schema identity, so the registry (which
+compiles at ``register()``) and the safety guard share the same object.
+
+Coercions (shared by all entry points):
+
+- ``integer`` accepts ``"30"`` → 30 and ``"H:MM"`` → minutes (LLMs often
+  emit durations as ``"0:30"``); ``bool`` is rejected (``bool ⊂ int``)
+- ``number`` accepts int/float but not bool
+- ``boolean`` / ``string`` are strict isinstance checks
+
+Usage::
+
+    from bantz.agent.arg_validation import compile_schema
+
+    v = compile_schema(tool.parameters)
+    ok, reason = v.check_call(params)
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
+
+__all__ = [
+    "ArgTypeError",
+    "FieldRule",
+    "CompiledArgValidator",
+    "compile_schema",
+    "clear_compiled_cache",
+]
+
+
+class ArgTypeError(ValueError):
+    """A value does not match (and cannot be coerced to) its schema type."""
+
+    def __init__(self, expected: str, got: str):
+        super().__init__(f"expected {expected}, got {got}")
+        self.expected = expected
+        self.got = got
+
+
+# ── per-type coercers ────────────────────────────────────────────────
+# Each returns the (possibly coerced) value or raises ArgTypeError.
+
+
+def _coerce_any(value: Any) -> Any:
+    return value
+
+
+def _coerce_string(value: Any) -> Any:
+    if not isinstance(value, str):
+        raise ArgTypeError("string", type(value).__name__)
+    return value
+
+
+def _coerce_boolean(value: Any) -> Any:
+    if not isinstance(value, bool):
+        raise ArgTypeError("boolean", type(value).__name__)
+    return value
+
+
+def _coerce_number(value: Any) -> Any:
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ArgTypeError("number", type(value).__name__)
+    return value
+
+
+def _coerce_integer(value: Any) -> Any:
+    # bool must be checked before int (bool ⊂ int in Python) — Issue #656
+    if isinstance(value, bool):
+        raise ArgTypeError("integer", "bool")
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        # "H:MM" / "HH:MM" duration strings → minutes ("0:30" → 30)
+        if ":" in value:
+            parts = value.strip().split(":")
+            if len(parts) == 2:
+                try:
+                    return int(parts[0]) * 60 + int(parts[1])
+                except ValueError:
+                    pass
+        try:
+            return int(value)
+        except ValueError:
+            raise ArgTypeError("integer", "non-numeric string") from None
+    raise ArgTypeError("integer", type(value).__name__)
+
+
+_COERCERS: dict[str, Callable[[Any], Any]] = {
+    "string": _coerce_string,
+    "boolean": _coerce_boolean,
+    "number": _coerce_number,
+    "integer": _coerce_integer,
+}
+
+# Classes each type accepts as-is; anything else goes through the coercer.
+# Exact-class membership is the fast path — subclasses (and bool for
+# integer/number) fall through to the full isinstance checks.
+_ACCEPTS: dict[str, frozenset[type]] = {
+    "string": frozenset({str}),
+    "boolean": frozenset({bool}),
+    "number": frozenset({int, float}),
+    "integer": frozenset({int}),
+}
+
+# Suffixes of ToolRegistry.validate_call's ``bad_type:<key>:expected_*`` codes.
+_TYPE_CODES: dict[str, str] = {
+    "string": "expected_string",
+    "boolean": "expected_boolean",
+    "number": "expected_number",
+    "integer": "expected_int",
+}
+
+
+@dataclass(frozen=True)
+class FieldRule:
+    """Compiled checks for one schema property."""
+
+    name: str
+    type: Optional[str]
+    coerce: Callable[[Any], Any]
+    # Exact classes that pass without calling ``coerce`` (None = any value).
+    accepts: Optional[frozenset[type]] = None
+    enum: Optional[tuple[Any, ...]] = None
+    # Original enum list, kept for error messages.
+    enum_label: Optional[list[Any]] = None
+
+
+class CompiledArgValidator:
+    """Validator for one tool's parameters schema.
+
+    Attributes:
+        required: Required keys in schema order.
+        properties: Known property names.
+        rules: Compiled rule per property.
+    """
+
+    __slots__ = ("schema", "required", "properties", "rules")
+
+    def __init__(self, schema: Optional[dict[str, Any]]):
+        schema = schema or {}
+        self.schema = schema
+        self.required: tuple[str, ...] = tuple(schema.get("required") or ())
+        props = schema.get("properties") or {}
+        self.properties: frozenset[str] = frozenset(props)
+        rules: dict[str, FieldRule] = {}
+        for key, spec in props.items():
+            spec = spec if isinstance(spec, dict) else {}
+            expected = spec.get("type")
+            if not isinstance(expected, str):
+                expected = None  # union types (["string", "null"]) are not checked
+            allowed = spec.get("enum")
+            rules[key] = FieldRule(
+                name=key,
+                type=expected if expected in _COERCERS else None,
+                coerce=_COERCERS.get(expected, _coerce_any),
+                accepts=_ACCEPTS.get(expected),
+                enum=tuple(allowed) if allowed else None,
+                enum_label=allowed if allowed else None,
+            )
+        self.rules: dict[str, FieldRule] = rules
+
+    def missing(self, params: dict[str, Any]) -> Optional[str]:
+        """First required key absent from *params*, or ``None``."""
+        for key in self.required:
+            if key not in params:
+                return key
+        return None
+
+    def coerce_in_place(self, params: dict[str, Any]) -> Optional[tuple[str, ArgTypeError]]:
+        """Type-check declared *params*, writing coerced values back.
+
+        Returns ``(field, error)`` for the first mismatch, else ``None``.
+        Keys without a rule (undeclared) are ignored.
+        """
+        rules = self.rules
+        for key, value in params.items():
+            rule = rules.get(key)
+            if rule is None:
+                continue
+            accepts = rule.accepts
+            if accepts is None or value.__class__ in accepts:
+                continue
+            try:
+                coerced = rule.coerce(value)
+            except ArgTypeError as e:
+                return key, e
+            if coerced is not value:
+                params[key] = coerced
+        return None
+
+    def unknown(self, params: dict[str, Any]) -> list[str]:
+        """Keys of *params* not declared in the schema."""
+        props = self.properties
+        return [key for key in params if key not in props]
+
+    def check_call(self, params: dict[str, Any]) -> tuple[bool, str]:
+        """``ToolRegistry.validate_call`` semantics, without copying *params*.
+
+        Returns ``(True, "ok")`` or ``(False, code)`` with one of
+        ``missing_param:<k>``, ``bad_type:<k>:expected_*`` or
+        ``bad_enum:<k>:expected_one_of:<allowed>``.  Empty strings are
+        treated as ``None`` and skip type/enum checks (Issue #663).
+        """
+        key = self.missing(params)
+        if key is not None:
+            return False, f"missing_param:{key}"
+
+        rules = self.rules
+        for key, value in params.items():
+            rule = rules.get(key)
+            if rule is None:
+                continue
+            accepts = rule.accepts
+            if accepts is not None and value.__class__ not in accepts:
+                if isinstance(value, str) and not value.strip():
+                    continue
+                try:
+                    rule.coerce(value)
+                except ArgTypeError:
+                    return False, f"bad_type:{key}:{_TYPE_CODES[rule.type]}"
+            if rule.enum is not None and value not in rule.enum:
+                if isinstance(value, str) and not value.strip():
+                    continue
+                return False, f"bad_enum:{key}:expected_one_of:{rule.enum_label}"
+
+        return True, "ok"
+
+
+# ── compile cache ────────────────────────────────────────────────────
+# Keyed by schema identity; the schema itself is kept in the entry so the
+# id cannot be reused by a different dict while cached.
+
+_CACHE_MAX = 1024
+_cache: dict[int, tuple[dict[str, Any], CompiledArgValidator]] = {}
+_cache_lock = threading.Lock()
+_EMPTY = CompiledArgValidator(None)
+
+
+def compile_schema(schema: Optional[dict[str, Any]]) -> CompiledArgValidator:
+    """Return the (cached) compiled validator for a parameters schema."""
+    if not schema:
+        return _EMPTY
+    entry = _cache.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    compiled = CompiledArgValidator(schema)
+    with _cache_lock:
+        if len(_cache) >= _CACHE_MAX:
+            _cache.clear()
+        _cache[id(schema)] = (schema, compiled)
+    return compiled
+
+
+def clear_compiled_cache() -> None:
+    """Drop all cached validators (e.g. after mutating a schema in place)."""
+    with _cache_lock:
+        _cache.clear()
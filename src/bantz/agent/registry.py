@@ -42,27 +42,51 @@ See Also
 from __future__ import annotations
 
 from bantz.agent.tools import Tool, ToolRegistry
+from bantz.tools.lazy import lazy_handlers
 from bantz.tools.registry import register_web_tools
 
-from bantz.tools.calendar_tools import (
+# Handler modules are imported on first tool call (see bantz.tools.lazy);
+# the names below are LazyHandler proxies unless BANTZ_LAZY_TOOLS=0.
+(
     calendar_create_event_tool,
     calendar_delete_event_tool,
     calendar_find_free_slots_tool,
     calendar_list_events_tool,
     calendar_update_event_tool,
+) = lazy_handlers(
+    "bantz.tools.calendar_tools",
+    "calendar_create_event_tool",
+    "calendar_delete_event_tool",
+    "calendar_find_free_slots_tool",
+    "calendar_list_events_tool",
+    "calendar_update_event_tool",
 )
-from bantz.tools.gmail_tools import (
+(
     gmail_get_message_tool,
     gmail_list_messages_tool,
     gmail_send_tool,
     gmail_smart_search_tool,
     gmail_unread_count_tool,
+) = lazy_handlers(
+    "bantz.tools.gmail_tools",
+    "gmail_get_message_tool",
+    "gmail_list_messages_tool",
+    "gmail_send_tool",
+    "gmail_smart_search_tool",
+    "gmail_unread_count_tool",
 )
-from bantz.tools.system_tools import system_screenshot_tool, system_status
-from bantz.tools.time_tools import time_now_tool
+(
+    system_screenshot_tool,
+    system_status,
+) = lazy_handlers(
+    "bantz.tools.system_tools",
+    "system_screenshot_tool",
+    "system_status",
+)
+(time_now_tool,) = lazy_handlers("bantz.tools.time_tools", "time_now_tool")
 
 # Issue #845: New tool imports ────────────────────────────────────────
-from bantz.tools.browser_tools import (
+(
     browser_back_tool,
     browser_click_tool,
     browser_detail_tool,
@@ -74,38 +98,81 @@ from bantz.tools.browser_tools import (
     browser_search_tool,
     browser_type_tool,
     browser_wait_tool,
+) = lazy_handlers(
+    "bantz.tools.browser_tools",
+    "browser_back_tool",
+    "browser_click_tool",
+    "browser_detail_tool",
+    "browser_info_tool",
+    "browser_open_tool",
+    "browser_scan_tool",
+    "browser_scroll_down_tool",
+    "browser_scroll_up_tool",
+    "browser_search_tool",
+    "browser_type_tool",
+    "browser_wait_tool",
 )
-from bantz.tools.pc_tools import (
+(
     clipboard_get_tool,
     clipboard_set_tool,
     pc_hotkey_tool,
     pc_mouse_click_tool,
     pc_mouse_move_tool,
     pc_mouse_scroll_tool,
+) = lazy_handlers(
+    "bantz.tools.pc_tools",
+    "clipboard_get_tool",
+    "clipboard_set_tool",
+    "pc_hotkey_tool",
+    "pc_mouse_click_tool",
+    "pc_mouse_move_tool",
+    "pc_mouse_scroll_tool",
 )
-from bantz.tools.file_tools import (
+(
     file_create_tool,
     file_edit_tool,
     file_read_tool,
     file_search_tool,
     file_undo_tool,
     file_write_tool,
+) = lazy_handlers(
+    "bantz.tools.file_tools",
+    "file_create_tool",
+    "file_edit_tool",
+    "file_read_tool",
+    "file_search_tool",
+    "file_undo_tool",
+    "file_write_tool",
 )
-from bantz.tools.terminal_tools import (
+(
     terminal_background_kill_tool,
     terminal_background_list_tool,
     terminal_background_tool,
     terminal_run_tool,
+) = lazy_handlers(
+    "bantz.tools.terminal_tools",
+    "terminal_background_kill_tool",
+    "terminal_background_list_tool",
+    "terminal_background_tool",
+    "terminal_run_tool",
 )
-from bantz.tools.code_tools import (
+(
     code_format_tool,
     code_replace_function_tool,
     project_info_tool,
     project_search_symbol_tool,
     project_symbols_tool,
     project_tree_tool,
+) = lazy_handlers(
+    "bantz.tools.code_tools",
+    "code_format_tool",
+    "code_replace_function_tool",
+    "project_info_tool",
+    "project_search_symbol_tool",
+    "project_symbols_tool",
+    "project_tree_tool",
 )
-from bantz.tools.gmail_extended_tools import (
+(
     gmail_add_label_tool,
     gmail_archive_tool,
     gmail_batch_modify_tool,
@@ -120,6 +187,22 @@ from bantz.tools.gmail_extended_tools import (
     gmail_remove_label_tool,
     gmail_send_draft_tool,
     gmail_update_draft_tool,
+) = lazy_handlers(
+    "bantz.tools.gmail_extended_tools",
+    "gmail_add_label_tool",
+    "gmail_archive_tool",
+    "gmail_batch_modify_tool",
+    "gmail_create_draft_tool",
+    "gmail_delete_draft_tool",
+    "gmail_download_attachment_tool",
+    "gmail_generate_reply_tool",
+    "gmail_list_drafts_tool",
+    "gmail_list_labels_tool",
+    "gmail_mark_read_tool",
+    "gmail_mark_unread_tool",
+    "gmail_remove_label_tool",
+    "gmail_send_draft_tool",
+    "gmail_update_draft_tool",
 )
 
 
@@ -1072,11 +1155,9 @@ def build_default_registry() -> ToolRegistry:
 
     # ── Contacts tools (4) + send_to_contact (1) ───────────────────
     try:
-        from bantz.contacts.store import (
-            contacts_delete as _contacts_delete,
-            contacts_list as _contacts_list,
-            contacts_resolve as _contacts_resolve,
-            contacts_upsert as _contacts_upsert,
+        _contacts_delete, _contacts_list, _contacts_resolve, _contacts_upsert = lazy_handlers(
+            "bantz.contacts.store",
+            "contacts_delete", "contacts_list", "contacts_resolve", "contacts_upsert",
         )
     except Exception:  # pragma: no cover
         _contacts_upsert = None
@@ -1141,8 +1222,8 @@ def build_default_registry() -> ToolRegistry:
 
     # Convenience: send email to a saved contact
     try:
-        from bantz.contacts.store import contacts_resolve as _cr
-        from bantz.google.gmail import gmail_send as _gs
+        (_cr,) = lazy_handlers("bantz.contacts.store", "contacts_resolve")
+        (_gs,) = lazy_handlers("bantz.google.gmail", "gmail_send")
 
         def _gmail_send_to_contact(*, name: str, subject: str, body: str, cc: str | None = None, bcc: str | None = None):
             resolved = _cr(name=name)
@@ -1174,7 +1255,7 @@ def build_default_registry() -> ToolRegistry:
 
     # ── Gmail query_from_nl + search templates (Issue #874 sync) ─────
     try:
-        from bantz.google.gmail_query import gmail_query_from_nl as _gmail_query_from_nl
+        (_gmail_query_from_nl,) = lazy_handlers("bantz.google.gmail_query", "gmail_query_from_nl")
     except Exception:  # pragma: no cover
         _gmail_query_from_nl = None  # type: ignore[assignment]
 
@@ -1197,11 +1278,9 @@ def build_default_registry() -> ToolRegistry:
     )
 
     try:
-        from bantz.google.gmail_search_templates import (
-            templates_delete as _templates_delete,
-            templates_get as _templates_get,
-            templates_list as _templates_list,
-            templates_upsert as _templates_upsert,
+        _templates_delete, _templates_get, _templates_list, _templates_upsert = lazy_handlers(
+            "bantz.google.gmail_search_templates",
+            "templates_delete", "templates_get", "templates_list", "templates_upsert",
         )
     except Exception:  # pragma: no cover
         _templates_upsert = None  # type: ignore[assignment]
@@ -1273,9 +1352,8 @@ def build_default_registry() -> ToolRegistry:
 
     # ── Calendar plan/draft tools ───────────────────────────────────
     try:
-        from bantz.planning.executor import (
-            apply_plan_draft as _apply_plan_draft,
-            plan_events_from_draft as _plan_events_from_draft,
+        _apply_plan_draft, _plan_events_from_draft = lazy_handlers(
+            "bantz.planning.executor", "apply_plan_draft", "plan_events_from_draft",
         )
     except Exception:  # pragma: no cover
         _apply_plan_draft = None  # type: ignore[assignment]
@@ -3,6 +3,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Callable, Optional, Literal
 
+from bantz.agent.arg_validation import CompiledArgValidator, compile_schema
+
 
 JsonSchema = dict[str, Any]
 
@@ -60,17 +62,69 @@ class Tool:
 
 
 class ToolRegistry:
+    """Tool registry with memoised catalog views.
+
+    Every catalog/schema view (route one-liners, OpenAI ``tools`` arrays,
+    LLM catalogs) is built once per registry *generation* and served from
+    a memo afterwards — router prompt assembly does no schema work on the
+    hot path and produces identical output across turns.  ``register()``
+    / ``unregister()`` bump the generation and drop the memo.
+    ``register()`` also compiles the tool's argument validator, so
+    :meth:`validate_call` does no schema walking per call.
+
+    Memoised views share their inner dicts between callers; treat them as
+    read-only.
+    """
+
     def __init__(self):
         self._tools: dict[str, Tool] = {}
+        self._generation = 0
+        self._sorted_names: Optional[tuple[str, ...]] = None
+        self._views: dict[tuple[Any, ...], Any] = {}
+        self._validators: dict[str, CompiledArgValidator] = {}
+
+    @property
+    def generation(self) -> int:
+        """Incremented on every register/unregister."""
+        return self._generation
+
+    def _invalidate(self) -> None:
+        self._generation += 1
+        self._sorted_names = None
+        self._views = {}
+
+    def _view(self, key: tuple[Any, ...], build: Callable[[], Any]) -> Any:
+        views = self._views
+        try:
+            return views[key]
+        except KeyError:
+            value = views[key] = build()
+            return value
 
     def register(self, tool: Tool) -> None:
         self._tools[tool.name] = tool
+        self._validators[tool.name] = compile_schema(tool.parameters)
+        self._invalidate()
+
+    def unregister(self, name: str) -> bool:
+        """Remove a tool; returns ``False`` if it was not registered."""
+        if self._tools.pop(name, None) is None:
+            return False
+        self._validators.pop(name, None)
+        self._invalidate()
+        return True
 
     def get(self, name: str) -> Optional[Tool]:
         return self._tools.get(name)
 
+    def _names(self) -> tuple[str, ...]:
+        names = self._sorted_names
+        if names is None:
+            names = self._sorted_names = tuple(sorted(self._tools.keys()))
+        return names
+
     def names(self) -> list[str]:
-        return sorted(self._tools.keys())
+        return list(self._names())
 
     def as_schema(self) -> list[dict[str, Any]]:
         """Return a JSON-serializable schema list for prompting."""
@@ -93,9 +147,11 @@ class ToolRegistry:
         - `format="short"`: token-budget friendly, minimized schemas.
         - `format="long"`: full schemas + optional examples/returns.
         """
+        return list(self._view(("llm_catalog", format), lambda: self._build_llm_catalog(format)))
 
+    def _build_llm_catalog(self, format: str) -> tuple[dict[str, Any], ...]:
         catalog: list[dict[str, Any]] = []
-        for name in self.names():
+        for name in self._names():
             tool = self._tools[name]
 
             risk_level: RiskLevel
@@ -125,7 +181,7 @@ class ToolRegistry:
             )
             catalog.append(_normalize_schema(spec.to_dict()))
 
-        return catalog
+        return tuple(catalog)
 
     def as_json_schema(
         self, *, format: Literal["short", "long"] = "short"
@@ -145,7 +201,18 @@ class ToolRegistry:
 
     def list_tools(self) -> list[Tool]:
         """Return all registered tools sorted by name."""
-        return [self._tools[n] for n in self.names()]
+        return [self._tools[n] for n in self._names()]
+
+    def _route_names(
+        self,
+        route: str,
+        valid_tools: frozenset[str] | set[str] | None,
+    ) -> list[str]:
+        prefix = f"{route}."
+        return [
+            name for name in self._names()
+            if name.startswith(prefix) and (valid_tools is None or name in valid_tools)
+        ]
 
     # ------------------------------------------------------------------
     # Issue #1275: Route-based compact tool schema for LLM prompt injection
@@ -168,15 +235,16 @@ class ToolRegistry:
             - gmail.send(to*, subject*, body*) — E-posta gönderir [HIGH,confirm]
             - gmail.list_messages(query, max_results, label) — Mailleri listeler [LOW]
         """
-        prefix = f"{route}."
-        lines: list[str] = []
-
-        for name in self.names():
-            if not name.startswith(prefix):
-                continue
-            if valid_tools is not None and name not in valid_tools:
-                continue
+        key = ("route_schemas", route, _tool_set_key(valid_tools))
+        return self._view(key, lambda: self._build_route_schemas(route, valid_tools))
 
+    def _build_route_schemas(
+        self,
+        route: str,
+        valid_tools: frozenset[str] | set[str] | None,
+    ) -> str:
+        lines: list[str] = []
+        for name in self._route_names(route, valid_tools):
             tool = self._tools[name]
             schema = tool.parameters or {}
             props = schema.get("properties") or {}
@@ -245,24 +313,32 @@ class ToolRegistry:
         Returns:
             List of OpenAI-compatible tool definitions.
         """
-        result: list[dict[str, Any]] = []
-        for name in self.names():
-            if tool_names is not None and name not in tool_names:
-                continue
+        def build() -> tuple[dict[str, Any], ...]:
+            return tuple(
+                self._openai_tool(name) for name in self._names()
+                if tool_names is None or name in tool_names
+            )
+
+        return list(self._view(("openai", _tool_set_key(tool_names)), build))
+
+    def _openai_tool(self, name: str) -> dict[str, Any]:
+        """OpenAI ``tools`` entry for one tool (memoised per generation)."""
+        def build() -> dict[str, Any]:
             tool = self._tools[name]
             # Ensure parameters is a valid object schema
             params = tool.parameters or {"type": "object", "properties": {}}
             if "type" not in params:
                 params = {**params, "type": "object"}
-            result.append({
+            return {
                 "type": "function",
                 "function": {
                     "name": tool.name,
                     "description": tool.description or "",
                     "parameters": params,
                 },
-            })
-        return result
+            }
+
+        return self._view(("openai_tool", name), build)
 
     def as_openai_tools_for_route(
         self,
@@ -284,82 +360,39 @@ class ToolRegistry:
         Returns:
             List of OpenAI-compatible tool definitions for the route.
         """
-        prefix = f"{route}."
-        result: list[dict[str, Any]] = []
-        for name in self.names():
-            if not name.startswith(prefix):
-                continue
-            if valid_tools is not None and name not in valid_tools:
-                continue
-            tool = self._tools[name]
-            params = tool.parameters or {"type": "object", "properties": {}}
-            if "type" not in params:
-                params = {**params, "type": "object"}
-            result.append({
-                "type": "function",
-                "function": {
-                    "name": tool.name,
-                    "description": tool.description or "",
-                    "parameters": params,
-                },
-            })
-        return result
+        def build() -> tuple[dict[str, Any], ...]:
+            return tuple(self._openai_tool(name) for name in self._route_names(route, valid_tools))
+
+        key = ("openai_route", route, _tool_set_key(valid_tools))
+        return list(self._view(key, build))
+
+    def validator(self, name: str) -> Optional[CompiledArgValidator]:
+        """Compiled argument validator for *name* (built at registration)."""
+        validator = self._validators.get(name)
+        if validator is None:
+            tool = self._tools.get(name)
+            if tool is None:
+                return None
+            validator = self._validators[name] = compile_schema(tool.parameters)
+        return validator
 
     def validate_call(self, name: str, params: dict[str, Any]) -> tuple[bool, str]:
-        tool = self.get(name)
-        if not tool:
+        validator = self.validator(name)
+        if validator is None:
             return False, f"unknown_tool:{name}"
+        # Lightweight type checks (avoid extra deps like jsonschema); the
+        # schema walk happens once per tool in compile_schema().
+        return validator.check_call(params)
 
-        # Issue #1174: Work on a shallow copy so empty-string → None
-        # coercion doesn't mutate the caller's original dict.
-        params = dict(params)
-
-        schema = tool.parameters or {}
-        required = schema.get("required") or []
-        for key in required:
-            if key not in params:
-                return False, f"missing_param:{key}"
-
-        # Lightweight type checks (avoid extra deps like jsonschema)
-        # Issue #656: check bool BEFORE int because bool is a subclass of int.
-        props = schema.get("properties") or {}
-        for key, value in list(params.items()):
-            # Empty-string → None coercion (Issue #663)
-            if isinstance(value, str) and not value.strip():
-                params[key] = None
-                continue
 
-            spec = props.get(key)
-            if not spec:
-                continue
-            expected = spec.get("type")
-            # bool must be checked before int (bool ⊂ int in Python)
-            if expected == "boolean":
-                if not isinstance(value, bool):
-                    return False, f"bad_type:{key}:expected_boolean"
-            elif expected == "integer":
-                if isinstance(value, bool):
-                    return False, f"bad_type:{key}:expected_int"
-                if isinstance(value, str):
-                    try:
-                        params[key] = int(value)
-                    except (ValueError, TypeError):
-                        return False, f"bad_type:{key}:expected_int"
-                elif not isinstance(value, int):
-                    return False, f"bad_type:{key}:expected_int"
-            elif expected == "number":
-                if isinstance(value, bool) or not isinstance(value, (int, float)):
-                    return False, f"bad_type:{key}:expected_number"
-            elif expected == "string":
-                if not isinstance(value, str):
-                    return False, f"bad_type:{key}:expected_string"
-
-            # Enum validation (Issue #663)
-            allowed = spec.get("enum")
-            if allowed and value not in allowed:
-                return False, f"bad_enum:{key}:expected_one_of:{allowed}"
-
-        return True, "ok"
+def _tool_set_key(names: frozenset[str] | set[str] | None) -> Optional[frozenset[str]]:
+    """Hashable memo key for a tool-name filter.
+
+    ``frozenset(fs)`` returns *fs* itself and frozensets cache their hash,
+    so the router's constant ``_VALID_TOOLS`` costs nothing after the
+    first call.
+    """
+    return None if names is None else frozenset(names)
 
 
 def _normalize_schema(schema: Any) -> Any:
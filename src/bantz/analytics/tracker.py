@@ -18,9 +18,155 @@ import sqlite3
 import threading
 import json
 
+from bantz.data.rollups import bin_labels, iso_hour_end, latency_bin, latency_bin_sql
+
 logger = logging.getLogger(__name__)
 
 
+# =============================================================================
+# Rollup Schema
+# =============================================================================
+
+# Hourly rollups keyed by the ISO hour prefix of the event timestamp
+# ("YYYY-MM-DDTHH").  Triggers keep them in step with every insert, update
+# and delete on ``events``; see :mod:`bantz.data.rollups`.  Intent
+# transitions (for sequence patterns) are maintained in
+# :meth:`UsageAnalytics.record`.
+
+_ROLLUP_VERSION = 1
+
+
+def _rollup_add_sql(r: str) -> str:
+    """Trigger statements adding event row *r* (``NEW``) to the rollups."""
+    key = (
+        f"bucket = substr({r}.timestamp, 1, 13) AND intent = {r}.intent"
+        f" AND bin = {latency_bin_sql(r + '.execution_time_ms')}"
+    )
+    err_key = (
+        f"bucket = substr({r}.timestamp, 1, 13) AND intent = {r}.intent"
+        f" AND error_message = {r}.error_message"
+    )
+    return f"""
+    INSERT INTO intent_rollup_hourly (bucket, intent, bin)
+    SELECT substr({r}.timestamp, 1, 13), {r}.intent, {latency_bin_sql(r + '.execution_time_ms')}
+    WHERE NOT EXISTS (SELECT 1 FROM intent_rollup_hourly WHERE {key});
+    UPDATE intent_rollup_hourly SET
+        calls    = calls + 1,
+        success  = success + {r}.success,
+        time_sum = time_sum + {r}.execution_time_ms,
+        time_max = max(time_max, {r}.execution_time_ms)
+    WHERE {key};
+    INSERT INTO error_rollup_hourly (bucket, intent, error_message)
+    SELECT substr({r}.timestamp, 1, 13), {r}.intent, {r}.error_message
+    WHERE {r}.success = 0 AND {r}.error_message IS NOT NULL
+      AND NOT EXISTS (SELECT 1 FROM error_rollup_hourly WHERE {err_key});
+    UPDATE error_rollup_hourly SET count = count + 1
+    WHERE {r}.success = 0 AND {err_key};"""
+
+
+def _rollup_sub_sql(r: str) -> str:
+    """Trigger statements removing event row *r* (``OLD``) from the rollups."""
+    key = (
+        f"bucket = substr({r}.timestamp, 1, 13) AND intent = {r}.intent"
+        f" AND bin = {latency_bin_sql(r + '.execution_time_ms')}"
+    )
+    err_key = (
+        f"bucket = substr({r}.timestamp, 1, 13) AND intent = {r}.intent"
+        f" AND error_message = {r}.error_message"
+    )
+    return f"""
+    UPDATE intent_rollup_hourly SET
+        calls    = calls - 1,
+        success  = success - {r}.success,
+        time_sum = time_sum - {r}.execution_time_ms
+    WHERE {key};
+    DELETE FROM intent_rollup_hourly WHERE {key} AND calls <= 0;
+    UPDATE error_rollup_hourly SET count = count - 1
+    WHERE {r}.success = 0 AND {err_key};
+    DELETE FROM error_rollup_hourly WHERE {err_key} AND count <= 0;"""
+
+
+_ROLLUP_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS intent_rollup_hourly (
+    bucket   TEXT NOT NULL,
+    intent   TEXT NOT NULL,
+    bin      INTEGER NOT NULL,
+    calls    INTEGER NOT NULL DEFAULT 0,
+    success  INTEGER NOT NULL DEFAULT 0,
+    time_sum INTEGER NOT NULL DEFAULT 0,
+    time_max INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, intent, bin)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS error_rollup_hourly (
+    bucket        TEXT NOT NULL,
+    intent        TEXT NOT NULL,
+    error_message TEXT NOT NULL,
+    count         INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, intent, error_message)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS intent_transitions (
+    prev_intent TEXT NOT NULL,
+    intent      TEXT NOT NULL,
+    count       INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (prev_intent, intent)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS rollup_state (
+    key   TEXT PRIMARY KEY,
+    value TEXT
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_events_rollup_insert AFTER INSERT ON events
+BEGIN {add_new} END;
+
+CREATE TRIGGER IF NOT EXISTS trg_events_rollup_delete AFTER DELETE ON events
+BEGIN {sub_old} END;
+
+CREATE TRIGGER IF NOT EXISTS trg_events_rollup_update AFTER UPDATE ON events
+BEGIN {sub_old} {add_new} END;
+""".format(add_new=_rollup_add_sql("NEW"), sub_old=_rollup_sub_sql("OLD"))
+
+_ROLLUP_REBUILD_SQL = (
+    "DELETE FROM intent_rollup_hourly",
+    "DELETE FROM error_rollup_hourly",
+    f"""INSERT INTO intent_rollup_hourly
+        (bucket, intent, bin, calls, success, time_sum, time_max)
+    SELECT substr(timestamp, 1, 13), intent, {latency_bin_sql("execution_time_ms")},
+           COUNT(*), SUM(success), SUM(execution_time_ms), MAX(execution_time_ms)
+    FROM events GROUP BY 1, 2, 3""",
+    """INSERT INTO error_rollup_hourly (bucket, intent, error_message, count)
+    SELECT substr(timestamp, 1, 13), intent, error_message, COUNT(*)
+    FROM events WHERE success = 0 AND error_message IS NOT NULL
+    GROUP BY 1, 2, 3""",
+)
+
+# Whole hourly buckets after the cutoff's bucket come from the rollup; the
+# cutoff's own (partial) bucket is read from raw rows.
+_INTENT_WINDOW_SQL = """
+WITH w AS (
+    SELECT bucket, intent, bin, calls, success, time_sum
+    FROM intent_rollup_hourly WHERE bucket > :bucket
+    UNION ALL
+    SELECT substr(timestamp, 1, 13), intent, {raw_bin}, 1, success, execution_time_ms
+    FROM events WHERE timestamp > :cutoff AND timestamp < :bucket_end
+)
+""".format(raw_bin=latency_bin_sql("execution_time_ms"))
+
+_ERROR_WINDOW_SQL = """
+WITH w AS (
+    SELECT intent, error_message, count
+    FROM error_rollup_hourly WHERE bucket > :bucket
+    UNION ALL
+    SELECT intent, error_message, 1
+    FROM events
+    WHERE timestamp > :cutoff AND timestamp < :bucket_end
+      AND success = 0 AND error_message IS NOT NULL
+)
+"""
+
+
 # =============================================================================
 # Data Classes
 # =============================================================================
@@ -181,9 +327,23 @@ class UsageAnalytics:
                 ON events(success)
             """)
             conn.commit()
+            conn.executescript(_ROLLUP_SCHEMA_SQL)
+            self._backfill_rollups(conn)
         finally:
             conn.close()
     
+    def _backfill_rollups(self, conn: sqlite3.Connection) -> None:
+        """Build rollups for databases created before they existed."""
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _ROLLUP_VERSION:
+            return
+        with conn:
+            for sql in _ROLLUP_REBUILD_SQL:
+                conn.execute(sql)
+            self._set_state(conn, "transitions_dirty", "1")
+            conn.execute(f"PRAGMA user_version={_ROLLUP_VERSION}")
+        logger.info("Analytics rollups rebuilt")
+    
     def record(self, event: CommandEvent) -> int:
         """
         Record a command event.
@@ -213,6 +373,7 @@ class UsageAnalytics:
                     event.error_message,
                     json.dumps(event.metadata) if event.metadata else None,
                 ))
+                self._track_transition(conn, event.timestamp.isoformat(), event.intent)
                 conn.commit()
                 event_id = cursor.lastrowid
                 logger.debug(f"Recorded event {event_id}: {event.intent}")
@@ -230,57 +391,40 @@ class UsageAnalytics:
         Returns:
             UsageStats object
         """
-        cutoff = datetime.now() - timedelta(days=days)
-        cutoff_str = cutoff.isoformat()
+        window = self._window(days)
         
         with self._lock:
             conn = sqlite3.connect(str(self.db_path))
             try:
-                # Total commands
-                total = conn.execute(
-                    "SELECT COUNT(*) FROM events WHERE timestamp > ?",
-                    (cutoff_str,)
-                ).fetchone()[0]
-                
-                # Success count
-                success = conn.execute(
-                    "SELECT COUNT(*) FROM events WHERE timestamp > ? AND success = 1",
-                    (cutoff_str,)
-                ).fetchone()[0]
-                
-                # Average execution time
-                avg_time = conn.execute(
-                    "SELECT AVG(execution_time_ms) FROM events WHERE timestamp > ?",
-                    (cutoff_str,)
-                ).fetchone()[0] or 0
-                
-                # Top intents
-                intents = conn.execute("""
-                    SELECT intent, COUNT(*) as cnt 
-                    FROM events WHERE timestamp > ?
-                    GROUP BY intent ORDER BY cnt DESC LIMIT 10
-                """, (cutoff_str,)).fetchall()
-                
-                # Top errors
-                errors = conn.execute("""
-                    SELECT error_message, COUNT(*) as cnt 
-                    FROM events 
-                    WHERE timestamp > ? AND success = 0 AND error_message IS NOT NULL
-                    GROUP BY error_message ORDER BY cnt DESC LIMIT 10
-                """, (cutoff_str,)).fetchall()
+                per_intent = conn.execute(
+                    _INTENT_WINDOW_SQL + """
+                    SELECT intent, SUM(calls), SUM(success), SUM(time_sum)
+                    FROM w GROUP BY intent
+                """, window).fetchall()
                 
-                return UsageStats(
-                    total_commands=total,
-                    success_count=success,
-                    failure_count=total - success,
-                    success_rate=success / total if total > 0 else 0.0,
-                    avg_execution_time_ms=avg_time,
-                    top_intents=dict(intents),
-                    top_errors=dict(errors),
-                    time_range_days=days,
-                )
+                errors = conn.execute(
+                    _ERROR_WINDOW_SQL + """
+                    SELECT error_message, SUM(count) as cnt
+                    FROM w GROUP BY error_message ORDER BY cnt DESC LIMIT 10
+                """, window).fetchall()
             finally:
                 conn.close()
+        
+        total = sum(r[1] for r in per_intent)
+        success = sum(r[2] for r in per_intent)
+        time_sum = sum(r[3] for r in per_intent)
+        top_intents = sorted(per_intent, key=lambda r: r[1], reverse=True)[:10]
+        
+        return UsageStats(
+            total_commands=total,
+            success_count=success,
+            failure_count=total - success,
+            success_rate=success / total if total > 0 else 0.0,
+            avg_execution_time_ms=time_sum / total if total > 0 else 0,
+            top_intents={r[0]: r[1] for r in top_intents},
+            top_errors=dict(errors),
+            time_range_days=days,
+        )
     
     def get_failure_patterns(self, min_count: int = 2) -> List[FailurePattern]:
         """
@@ -340,36 +484,29 @@ class UsageAnalytics:
         Returns:
             Statistics dictionary
         """
-        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        window = self._window(days)
+        window["intent"] = intent
         
         with self._lock:
             conn = sqlite3.connect(str(self.db_path))
             try:
-                total = conn.execute(
-                    "SELECT COUNT(*) FROM events WHERE intent = ? AND timestamp > ?",
-                    (intent, cutoff)
-                ).fetchone()[0]
-                
-                success = conn.execute(
-                    "SELECT COUNT(*) FROM events WHERE intent = ? AND timestamp > ? AND success = 1",
-                    (intent, cutoff)
-                ).fetchone()[0]
-                
-                avg_time = conn.execute(
-                    "SELECT AVG(execution_time_ms) FROM events WHERE intent = ? AND timestamp > ?",
-                    (intent, cutoff)
-                ).fetchone()[0] or 0
-                
-                return {
-                    "intent": intent,
-                    "total": total,
-                    "success": success,
-                    "failure": total - success,
-                    "success_rate": success / total if total > 0 else 0.0,
-                    "avg_execution_time_ms": avg_time,
-                }
+                row = conn.execute(
+                    _INTENT_WINDOW_SQL + """
+                    SELECT SUM(calls), SUM(success), SUM(time_sum)
+                    FROM w WHERE intent = :intent
+                """, window).fetchone()
             finally:
                 conn.close()
+        
+        total, success, time_sum = (v or 0 for v in row)
+        return {
+            "intent": intent,
+            "total": total,
+            "success": success,
+            "failure": total - success,
+            "success_rate": success / total if total > 0 else 0.0,
+            "avg_execution_time_ms": time_sum / total if total > 0 else 0,
+        }
     
     def get_hourly_distribution(self, days: int = 7) -> Dict[int, int]:
         """
@@ -381,28 +518,59 @@ class UsageAnalytics:
         Returns:
             Dictionary mapping hour (0-23) to command count
         """
-        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        window = self._window(days)
         
         with self._lock:
             conn = sqlite3.connect(str(self.db_path))
             try:
-                rows = conn.execute("""
-                    SELECT 
-                        CAST(strftime('%H', timestamp) AS INTEGER) as hour,
-                        COUNT(*) as cnt
-                    FROM events 
-                    WHERE timestamp > ?
-                    GROUP BY hour
-                """, (cutoff,)).fetchall()
-                
-                # Initialize all hours
-                distribution = {h: 0 for h in range(24)}
-                for hour, count in rows:
-                    distribution[hour] = count
-                
-                return distribution
+                rows = conn.execute(
+                    _INTENT_WINDOW_SQL + """
+                    SELECT CAST(substr(bucket, 12, 2) AS INTEGER) as hour,
+                           SUM(calls) as cnt
+                    FROM w GROUP BY hour
+                """, window).fetchall()
             finally:
                 conn.close()
+        
+        # Initialize all hours
+        distribution = {h: 0 for h in range(24)}
+        for hour, count in rows:
+            distribution[hour] = count
+        
+        return distribution
+    
+    def get_latency_histogram(
+        self,
+        days: int = 7,
+        intent: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """
+        Get execution time histogram.
+        
+        Args:
+            days: Number of days to analyze
+            intent: Restrict to one intent
+            
+        Returns:
+            Dictionary mapping bin label (e.g. "100-250" ms) to command count
+        """
+        window = self._window(days)
+        window["intent"] = intent
+        
+        with self._lock:
+            conn = sqlite3.connect(str(self.db_path))
+            try:
+                rows = conn.execute(
+                    _INTENT_WINDOW_SQL + """
+                    SELECT bin, SUM(calls) FROM w
+                    WHERE :intent IS NULL OR intent = :intent
+                    GROUP BY bin
+                """, window).fetchall()
+            finally:
+                conn.close()
+        
+        counts = dict(rows)
+        return {label: counts.get(i, 0) for i, label in enumerate(bin_labels())}
     
     def get_recent_events(self, limit: int = 100) -> List[CommandEvent]:
         """
@@ -456,28 +624,18 @@ class UsageAnalytics:
         with self._lock:
             conn = sqlite3.connect(str(self.db_path))
             try:
-                # Get all intents in order
-                rows = conn.execute("""
-                    SELECT intent FROM events ORDER BY timestamp
-                """).fetchall()
-                
-                if len(rows) < 2:
-                    return []
-                
-                # Count pairs
-                pairs = Counter()
-                for i in range(len(rows) - 1):
-                    pair = (rows[i][0], rows[i + 1][0])
-                    pairs[pair] += 1
+                if self._get_state(conn, "transitions_dirty"):
+                    self._rebuild_transitions(conn)
+                    conn.commit()
                 
-                # Filter by min_support
-                result = [
-                    (a, b, count)
-                    for (a, b), count in pairs.most_common()
-                    if count >= min_support
-                ]
+                rows = conn.execute("""
+                    SELECT prev_intent, intent, count
+                    FROM intent_transitions
+                    WHERE count >= ?
+                    ORDER BY count DESC
+                """, (min_support,)).fetchall()
                 
-                return result
+                return [(a, b, count) for a, b, count in rows]
             finally:
                 conn.close()
     
@@ -500,8 +658,11 @@ class UsageAnalytics:
                     "DELETE FROM events WHERE timestamp < ?",
                     (cutoff,)
                 )
-                conn.commit()
                 deleted = cursor.rowcount
+                if deleted > 0:
+                    # Transitions spanning deleted events are stale now.
+                    self._set_state(conn, "transitions_dirty", "1")
+                conn.commit()
                 
                 if deleted > 0:
                     logger.info(f"Cleaned up {deleted} old events")
@@ -521,10 +682,74 @@ class UsageAnalytics:
             conn = sqlite3.connect(str(self.db_path))
             try:
                 cursor = conn.execute("DELETE FROM events")
+                conn.execute("DELETE FROM intent_transitions")
+                conn.execute("DELETE FROM rollup_state")
                 conn.commit()
                 return cursor.rowcount
             finally:
                 conn.close()
+    
+    # =========================================================================
+    # Rollup maintenance
+    # =========================================================================
+    
+    @staticmethod
+    def _window(days: int) -> Dict[str, str]:
+        """Query bounds shared by the rollup window SQL."""
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        bucket = cutoff[:13]
+        return {"cutoff": cutoff, "bucket": bucket, "bucket_end": iso_hour_end(bucket)}
+    
+    @staticmethod
+    def _get_state(conn: sqlite3.Connection, key: str) -> Optional[str]:
+        row = conn.execute("SELECT value FROM rollup_state WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+    
+    @staticmethod
+    def _set_state(conn: sqlite3.Connection, key: str, value: Optional[str]) -> None:
+        if value is None:
+            conn.execute("DELETE FROM rollup_state WHERE key = ?", (key,))
+        else:
+            conn.execute(
+                "INSERT OR REPLACE INTO rollup_state (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+    
+    def _track_transition(self, conn: sqlite3.Connection, timestamp: str, intent: str) -> None:
+        """Count the (previous intent → intent) pair for a new event.
+        
+        Only in-order inserts can be counted incrementally; an event older
+        than the latest one marks the table for a rebuild on next read.
+        """
+        if self._get_state(conn, "transitions_dirty"):
+            return
+        last = self._get_state(conn, "last_event")
+        if last is not None:
+            last_ts, last_intent = json.loads(last)
+            if timestamp < last_ts:
+                self._set_state(conn, "transitions_dirty", "1")
+                return
+            conn.execute("""
+                INSERT INTO intent_transitions (prev_intent, intent, count)
+                VALUES (?, ?, 1)
+                ON CONFLICT (prev_intent, intent) DO UPDATE SET count = count + 1
+            """, (last_intent, intent))
+        self._set_state(conn, "last_event", json.dumps([timestamp, intent]))
+    
+    def _rebuild_transitions(self, conn: sqlite3.Connection) -> None:
+        """Recount intent transitions from the raw events."""
+        rows = conn.execute(
+            "SELECT timestamp, intent FROM events ORDER BY timestamp, id"
+        ).fetchall()
+        intents = [r[1] for r in rows]
+        pairs = Counter(zip(intents, intents[1:]))
+        conn.execute("DELETE FROM intent_transitions")
+        conn.executemany(
+            "INSERT INTO intent_transitions (prev_intent, intent, count) VALUES (?, ?, ?)",
+            [(a, b, n) for (a, b), n in pairs.items()],
+        )
+        self._set_state(conn, "last_event", json.dumps(list(rows[-1])) if rows else None)
+        self._set_state(conn, "transitions_dirty", None)
 
 
 # =============================================================================
@@ -633,6 +858,22 @@ class MockUsageAnalytics(UsageAnalytics):
                     distribution[e.timestamp.hour] += 1
             return distribution
     
+    def get_latency_histogram(
+        self,
+        days: int = 7,
+        intent: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """Get execution time histogram from memory."""
+        cutoff = datetime.now() - timedelta(days=days)
+        labels = bin_labels()
+        counts = [0] * len(labels)
+        
+        with self._lock:
+            for e in self._events:
+                if e.timestamp > cutoff and (intent is None or e.intent == intent):
+                    counts[latency_bin(e.execution_time_ms)] += 1
+        return dict(zip(labels, counts))
+    
     def get_sequence_patterns(self, min_support: int = 3) -> List[Tuple[str, str, int]]:
         """Get sequence patterns from memory."""
         with self._lock:
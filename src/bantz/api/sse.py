@@ -19,6 +19,7 @@ from fastapi.responses import Response
 
 from bantz.api.auth import require_auth
 from bantz.api.models import NotificationEvent
+from bantz.core.events import OverflowPolicy, progress_coalesce_key
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +65,11 @@ async def sse_notifications(
                 logger.warning("SSE queue full, dropping event: %s", event.event_type)
 
         # Subscribe to all events
-        event_bus.subscribe_all(_on_event)
+        event_bus.subscribe_all(
+            _on_event,
+            overflow=OverflowPolicy.COALESCE,
+            coalesce_key=progress_coalesce_key,
+        )
 
         try:
             # Send initial keepalive
@@ -29,6 +29,7 @@ from typing import Optional
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 
 from bantz.api.auth import is_auth_enabled, _resolve_token
+from bantz.core.events import OverflowPolicy, progress_coalesce_key
 
 logger = logging.getLogger(__name__)
 
@@ -72,7 +73,11 @@ async def websocket_chat(
             pass
 
     # Subscribe to all events for real-time streaming
-    event_bus.subscribe_all(_on_event)
+    event_bus.subscribe_all(
+        _on_event,
+        overflow=OverflowPolicy.COALESCE,
+        coalesce_key=progress_coalesce_key,
+    )
 
     # Background task: forward events to client
     async def _event_forwarder() -> None:
@@ -48,6 +48,8 @@ from bantz.automation.orchestrator import (
 )
 
 from bantz.automation.overnight import (
+    ConcurrentOvernightRunner,
+    DomainRateLimiter,
     OvernightRunner,
     OvernightState,
     OvernightTask,
@@ -57,6 +59,7 @@ from bantz.automation.overnight import (
     parse_overnight_tasks,
     resume_overnight,
     generate_morning_report,
+    create_overnight_runner,
 )
 
 __all__ = [
@@ -98,4 +101,7 @@ __all__ = [
     "parse_overnight_tasks",
     "resume_overnight",
     "generate_morning_report",
+    "ConcurrentOvernightRunner",
+    "DomainRateLimiter",
+    "create_overnight_runner",
 ]
@@ -7,6 +7,8 @@ Architecture:
     - OvernightTask: Tek bir gece görevi
     - OvernightState: Tüm gece seansının durumu (JSON serializable)
     - OvernightRunner: Ana runner — task queue, checkpoint, rate limiting
+    - ConcurrentOvernightRunner: Bağımsız görevleri paralel çalıştırır;
+      araç alanı (Gmail, Calendar, Gemini, yerel LLM) başına token bucket
     - OvernightFailSafe: Karar gereken durumlarda WAITING_HUMAN kuyruğu
     - Morning report: Inbox'a sabah özeti gönderir
 
@@ -18,20 +20,26 @@ Usage:
     runner.add_task("AI konferanslarını araştır")
     runner.add_task("Haftalık AI haberlerini özetle")
     runner.run()  # Blocking, otonom çalışır
+
+    # Paralel (opt-in): BANTZ_OVERNIGHT_WORKERS=3 (varsayılan 1, sıralı)
+    runner = create_overnight_runner(bantz_server)
 """
 from __future__ import annotations
 
 import json
 import logging
+import math
 import os
+import re
 import threading
 import time
 import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +54,12 @@ DEFAULT_TASK_DELAY_SECONDS = 5.0
 DEFAULT_API_COOLDOWN_SECONDS = 2.0
 MAX_CONSECUTIVE_ERRORS = 3
 
+# Concurrent runner defaults — BantzServer.handle_command is not
+# thread-safe, so parallel runs are opt-in via BANTZ_OVERNIGHT_WORKERS.
+DEFAULT_OVERNIGHT_WORKERS = 1
+DEFAULT_CONCURRENT_WORKERS = 3
+MAX_DOMAIN_BACKOFF_SECONDS = 60.0
+
 
 # ─────────────────────────────────────────────────────────────────
 # Data models
@@ -203,9 +217,9 @@ class OvernightState:
             "current_task_index": self.current_task_index,
             "started_at": self.started_at,
             "completed_at": self.completed_at,
-            "human_decisions_pending": self.human_decisions_pending,
+            "human_decisions_pending": list(self.human_decisions_pending),
             "morning_report": self.morning_report,
-            "error_log": self.error_log,
+            "error_log": list(self.error_log),
         }
 
     @classmethod
@@ -228,13 +242,14 @@ class OvernightState:
 # Checkpoint persistence
 # ─────────────────────────────────────────────────────────────────
 
-def save_checkpoint(state: OvernightState, path: Path = CHECKPOINT_FILE) -> None:
-    """Save overnight state to disk for resume after crash."""
+def save_checkpoint(state: Union[OvernightState, dict], path: Path = CHECKPOINT_FILE) -> None:
+    """Save overnight state (or a ``to_dict()`` snapshot of it) to disk for resume after crash."""
+    data = state.to_dict() if isinstance(state, OvernightState) else state
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_suffix(".tmp")
     try:
         with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(state.to_dict(), f, indent=2, ensure_ascii=False)
+            json.dump(data, f, indent=2, ensure_ascii=False)
         tmp.replace(path)
         logger.debug("Checkpoint saved: %s", path)
     except Exception as exc:
@@ -358,6 +373,164 @@ class ResourceMonitor:
         self.api_cooldown = DEFAULT_API_COOLDOWN_SECONDS
 
 
+# ─────────────────────────────────────────────────────────────────
+# Tool domains & per-domain rate limits
+# ─────────────────────────────────────────────────────────────────
+
+DOMAIN_GMAIL = "gmail"
+DOMAIN_CALENDAR = "calendar"
+DOMAIN_GEMINI = "gemini"
+DOMAIN_LOCAL_LLM = "local_llm"
+
+# Keyword hints (Turkish + English, suffix-tolerant) for the tool domains a
+# free-text task will touch.  Every task goes through the local router LLM.
+_DOMAIN_PATTERNS: Dict[str, re.Pattern] = {
+    DOMAIN_GMAIL: re.compile(r"\b(?:e-?posta|mail|gmail|inbox|gelen kutus)", re.IGNORECASE),
+    DOMAIN_CALENDAR: re.compile(
+        r"\b(?:takvim|toplantı|etkinlik|randevu|ajanda|calendar|meeting|event)", re.IGNORECASE,
+    ),
+    DOMAIN_GEMINI: re.compile(
+        r"\b(?:araştır|özet|rapor|analiz|haber|research|summar|report|news)", re.IGNORECASE,
+    ),
+}
+
+
+def classify_task_domains(description: str) -> List[str]:
+    """Return the tool domains a task is expected to hit.
+
+    Always includes ``local_llm`` (routing); adds ``gmail``, ``calendar``
+    and ``gemini`` on keyword matches.
+    """
+    domains = [name for name, pattern in _DOMAIN_PATTERNS.items() if pattern.search(description)]
+    domains.append(DOMAIN_LOCAL_LLM)
+    return domains
+
+
+def task_domains(task: OvernightTask) -> List[str]:
+    """Domains for *task*: ``metadata["domains"]`` if set, else classified.
+
+    The result is stored in metadata so it survives checkpoints.
+    """
+    domains = task.metadata.get("domains")
+    if not domains:
+        domains = task.metadata["domains"] = classify_task_domains(task.description)
+    return list(domains)
+
+
+@dataclass(frozen=True)
+class DomainLimit:
+    """Rate (token bucket) and concurrency limit for one tool domain."""
+    requests_per_minute: float
+    burst: int = 1
+    max_concurrent: int = 1
+
+
+DEFAULT_DOMAIN_LIMITS: Dict[str, DomainLimit] = {
+    DOMAIN_GMAIL: DomainLimit(requests_per_minute=30, burst=5, max_concurrent=2),
+    DOMAIN_CALENDAR: DomainLimit(requests_per_minute=20, burst=3, max_concurrent=1),
+    DOMAIN_GEMINI: DomainLimit(requests_per_minute=15, burst=3, max_concurrent=2),
+    DOMAIN_LOCAL_LLM: DomainLimit(requests_per_minute=60, burst=4, max_concurrent=3),
+}
+
+
+class TokenBucket:
+    """Classic token bucket: ``capacity`` tokens, refilled at ``rate``/s."""
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def wait_time(self, now: float) -> float:
+        """Seconds until a token is available (0 if one is now)."""
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.rate if self.rate > 0 else math.inf
+
+    def take(self) -> None:
+        self._tokens -= 1
+
+
+class DomainRateLimiter:
+    """Admits tasks only when every domain they touch has budget.
+
+    Each domain has a token bucket (requests/minute + burst), a cap on
+    in-flight tasks and an exponential backoff after rate-limit errors.
+    Domains without a configured limit are unrestricted.  Thread-safe.
+    """
+
+    def __init__(self, limits: Optional[Dict[str, DomainLimit]] = None):
+        self.limits = dict(DEFAULT_DOMAIN_LIMITS if limits is None else limits)
+        self._buckets = {
+            name: TokenBucket(limit.requests_per_minute / 60.0, limit.burst)
+            for name, limit in self.limits.items()
+        }
+        self._in_flight: Dict[str, int] = {name: 0 for name in self.limits}
+        self._blocked_until: Dict[str, float] = {}
+        self._backoff: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def try_acquire(self, domains: Sequence[str]) -> float:
+        """Reserve a slot in every domain, or say how long to wait.
+
+        Returns 0.0 when reserved; otherwise the seconds until the rate
+        limits allow it, or ``math.inf`` when a concurrency cap is hit
+        (retry after a running task finishes).  Nothing is reserved then.
+        """
+        known = [d for d in dict.fromkeys(domains) if d in self.limits]
+        with self._lock:
+            now = time.monotonic()
+            delay = 0.0
+            for domain in known:
+                if self._in_flight[domain] >= self.limits[domain].max_concurrent:
+                    return math.inf
+                delay = max(
+                    delay,
+                    self._blocked_until.get(domain, 0.0) - now,
+                    self._buckets[domain].wait_time(now),
+                )
+            if delay > 0:
+                return delay
+            for domain in known:
+                self._buckets[domain].take()
+                self._in_flight[domain] += 1
+            return 0.0
+
+    def release(self, domains: Sequence[str]) -> None:
+        with self._lock:
+            for domain in dict.fromkeys(domains):
+                if self._in_flight.get(domain, 0) > 0:
+                    self._in_flight[domain] -= 1
+
+    def report_rate_limit(self, domains: Sequence[str]) -> None:
+        """Back off these domains: 2s → 4s → 8s … (max 60s)."""
+        with self._lock:
+            now = time.monotonic()
+            for domain in domains:
+                if domain not in self.limits:
+                    continue
+                backoff = min(self._backoff.get(domain, DEFAULT_API_COOLDOWN_SECONDS / 2) * 2,
+                              MAX_DOMAIN_BACKOFF_SECONDS)
+                self._backoff[domain] = backoff
+                self._blocked_until[domain] = now + backoff
+                logger.warning("Rate limit hit on %s — pausing for %.1fs", domain, backoff)
+
+    def report_success(self, domains: Sequence[str]) -> None:
+        with self._lock:
+            for domain in domains:
+                self._backoff.pop(domain, None)
+
+    def in_flight(self, domain: str) -> int:
+        with self._lock:
+            return self._in_flight.get(domain, 0)
+
+
 # ─────────────────────────────────────────────────────────────────
 # Morning Report Generator
 # ─────────────────────────────────────────────────────────────────
@@ -510,20 +683,7 @@ class OvernightRunner:
             return self._state or OvernightState(session_id="empty")
 
         state = self._state
-        state.status = OvernightStatus.RUNNING
-        state.started_at = datetime.now().isoformat()
-
-        self._emit("overnight.started", {
-            "session_id": state.session_id,
-            "task_count": state.total_tasks,
-            "tasks": [t.description for t in state.tasks],
-        })
-
-        logger.info(
-            "🌙 Gece modu başlatıldı — %d görev, session=%s",
-            state.total_tasks, state.session_id,
-        )
-        self._print_banner(state)
+        self._begin_session(state)
 
         consecutive_errors = 0
 
@@ -547,38 +707,82 @@ class OvernightRunner:
             # Execute task
             success = self._execute_task(task, state)
 
-            if success:
-                consecutive_errors = 0
-                self._resources.report_success()
-            else:
-                consecutive_errors += 1
-                if self._failsafe.should_wait_for_human(consecutive_errors):
-                    self._failsafe.queue_decision(
-                        task,
-                        error=task.error or "Unknown error",
-                        question=f"'{task.description}' görevi {task.retry_count} kez başarısız oldu. Tekrar deneyelim mi, atlayalım mı?",
-                    )
-                    consecutive_errors = 0  # Reset after queueing
-                elif task.can_retry:
-                    # Auto-retry
-                    task.retry_count += 1
-                    task.status = TaskStatus.PENDING
-                    task.error = None
-                    logger.info("Auto-retry task %s (attempt %d)", task.id, task.retry_count + 1)
-                    continue
-                else:
-                    task.status = TaskStatus.FAILED
+            consecutive_errors, retrying = self._settle_task(task, success, consecutive_errors)
+            if retrying:
+                continue
 
             # Checkpoint after every task
-            save_checkpoint(state, self._checkpoint_path)
-            self._emit("overnight.checkpoint", {
-                "session_id": state.session_id,
-                "progress": state.progress_percent,
-                "completed": state.completed_count,
-                "total": state.total_tasks,
-            })
+            self._checkpoint(state)
+
+        return self._finish_session(state)
+
+    # ── Session lifecycle (shared with ConcurrentOvernightRunner) ─
+
+    def _begin_session(self, state: OvernightState) -> None:
+        state.status = OvernightStatus.RUNNING
+        state.started_at = datetime.now().isoformat()
+
+        self._emit("overnight.started", {
+            "session_id": state.session_id,
+            "task_count": state.total_tasks,
+            "tasks": [t.description for t in state.tasks],
+        })
+
+        logger.info(
+            "🌙 Gece modu başlatıldı — %d görev, session=%s",
+            state.total_tasks, state.session_id,
+        )
+        self._print_banner(state)
+
+    def _settle_task(
+        self, task: OvernightTask, success: bool, consecutive_errors: int,
+    ) -> Tuple[int, bool]:
+        """Apply retry / fail-safe policy after a task ran.
+
+        Returns the new consecutive error count and whether the task was
+        put back in the queue for an automatic retry.
+        """
+        if success:
+            self._on_task_success(task)
+            return 0, False
+
+        consecutive_errors += 1
+        if self._failsafe.should_wait_for_human(consecutive_errors):
+            self._failsafe.queue_decision(
+                task,
+                error=task.error or "Unknown error",
+                question=f"'{task.description}' görevi {task.retry_count} kez başarısız oldu. Tekrar deneyelim mi, atlayalım mı?",
+            )
+            return 0, False  # Reset after queueing
+        if task.can_retry:
+            # Auto-retry
+            task.retry_count += 1
+            task.status = TaskStatus.PENDING
+            task.error = None
+            logger.info("Auto-retry task %s (attempt %d)", task.id, task.retry_count + 1)
+            return consecutive_errors, True
+        task.status = TaskStatus.FAILED
+        return consecutive_errors, False
 
-        # Finalize
+    def _snapshot(self, state: OvernightState) -> dict:
+        """Consistent ``to_dict()`` of the state.
+
+        Task fields are written under ``self._lock`` by ``_execute_task``,
+        which may run on worker threads.
+        """
+        with self._lock:
+            return state.to_dict()
+
+    def _checkpoint(self, state: OvernightState) -> None:
+        save_checkpoint(self._snapshot(state), self._checkpoint_path)
+        self._emit("overnight.checkpoint", {
+            "session_id": state.session_id,
+            "progress": state.progress_percent,
+            "completed": state.completed_count,
+            "total": state.total_tasks,
+        })
+
+    def _finish_session(self, state: OvernightState) -> OvernightState:
         state.status = OvernightStatus.COMPLETED if state.status == OvernightStatus.RUNNING else state.status
         state.completed_at = datetime.now().isoformat()
         state.human_decisions_pending = self._failsafe.pending_decisions
@@ -591,7 +795,7 @@ class OvernightRunner:
         self._deliver_morning_report(state, report)
 
         # Final checkpoint
-        save_checkpoint(state, self._checkpoint_path)
+        save_checkpoint(self._snapshot(state), self._checkpoint_path)
 
         self._emit("overnight.completed", {
             "session_id": state.session_id,
@@ -608,6 +812,18 @@ class OvernightRunner:
 
         return state
 
+    # ── Pacing hooks ─────────────────────────────────────────────
+
+    def _pace_api(self, task: OvernightTask) -> None:
+        """Called before each task hits the server."""
+        self._resources.wait_for_api_cooldown()
+
+    def _on_rate_limited(self, task: OvernightTask) -> None:
+        self._resources.report_rate_limit()
+
+    def _on_task_success(self, task: OvernightTask) -> None:
+        self._resources.report_success()
+
     def cancel(self) -> None:
         """Cancel the running overnight session."""
         self._cancel_event.set()
@@ -619,8 +835,9 @@ class OvernightRunner:
 
         Returns True on success, False on failure.
         """
-        task.status = TaskStatus.RUNNING
-        task.started_at = datetime.now().isoformat()
+        with self._lock:
+            task.status = TaskStatus.RUNNING
+            task.started_at = datetime.now().isoformat()
 
         self._emit("overnight.task.started", {
             "session_id": state.session_id,
@@ -628,15 +845,16 @@ class OvernightRunner:
             "description": task.description,
         })
 
+        position = state.tasks.index(task) + 1
         logger.info(
             "🔄 [%d/%d] Görev başlatılıyor: %s",
-            state.current_task_index + 1, state.total_tasks, task.description,
+            position, state.total_tasks, task.description,
         )
 
         start = time.time()
 
         try:
-            self._resources.wait_for_api_cooldown()
+            self._pace_api(task)
 
             if self._server is None:
                 raise RuntimeError("BantzServer not initialized")
@@ -644,12 +862,18 @@ class OvernightRunner:
             result = self._server.handle_command(task.description)
 
             elapsed_ms = (time.time() - start) * 1000
-            task.duration_ms = elapsed_ms
+            ok = bool(result.get("ok"))
 
-            if result.get("ok"):
-                task.status = TaskStatus.COMPLETED
-                task.result = result.get("text", "Tamamlandı")
+            with self._lock:
+                task.duration_ms = elapsed_ms
                 task.completed_at = datetime.now().isoformat()
+                if ok:
+                    task.status = TaskStatus.COMPLETED
+                    task.result = result.get("text", "Tamamlandı")
+                else:
+                    task.error = result.get("text", "Bilinmeyen hata")
+
+            if ok:
 
                 self._emit("overnight.task.completed", {
                     "session_id": state.session_id,
@@ -660,19 +884,16 @@ class OvernightRunner:
 
                 logger.info(
                     "✅ [%d/%d] Görev tamamlandı (%.1fs): %s",
-                    state.current_task_index + 1, state.total_tasks,
+                    position, state.total_tasks,
                     elapsed_ms / 1000, task.description,
                 )
                 return True
 
             else:
-                task.error = result.get("text", "Bilinmeyen hata")
-                task.completed_at = datetime.now().isoformat()
-
                 # Check for rate limiting
                 error_text = (task.error or "").lower()
                 if "rate" in error_text and "limit" in error_text:
-                    self._resources.report_rate_limit()
+                    self._on_rate_limited(task)
 
                 self._emit("overnight.task.failed", {
                     "session_id": state.session_id,
@@ -683,17 +904,18 @@ class OvernightRunner:
 
                 logger.warning(
                     "❌ [%d/%d] Görev başarısız: %s — %s",
-                    state.current_task_index + 1, state.total_tasks,
+                    position, state.total_tasks,
                     task.description, task.error,
                 )
                 return False
 
         except Exception as exc:
             elapsed_ms = (time.time() - start) * 1000
-            task.duration_ms = elapsed_ms
-            task.error = str(exc)
-            task.completed_at = datetime.now().isoformat()
-            state.error_log.append(f"[{task.id}] {exc}")
+            with self._lock:
+                task.duration_ms = elapsed_ms
+                task.error = str(exc)
+                task.completed_at = datetime.now().isoformat()
+                state.error_log.append(f"[{task.id}] {exc}")
 
             self._emit("overnight.task.failed", {
                 "session_id": state.session_id,
@@ -741,6 +963,159 @@ class OvernightRunner:
         print()
 
 
+# ─────────────────────────────────────────────────────────────────
+# ConcurrentOvernightRunner — parallel, per-domain rate limited
+# ─────────────────────────────────────────────────────────────────
+
+class ConcurrentOvernightRunner(OvernightRunner):
+    """Overnight runner that executes independent tasks in parallel.
+
+    Each task is classified into the tool domains it touches
+    (:func:`task_domains`).  A task starts as soon as a worker is free and
+    every one of its domains has a token and a free concurrency slot in
+    the :class:`DomainRateLimiter`, so e.g. a Gmail cleanup and a calendar
+    summary run side by side while two Gemini research tasks respect the
+    Gemini quota.  The fixed ``wait_between_tasks`` / API cooldown sleeps
+    of the sequential runner are replaced by those buckets.
+
+    The state is checkpointed after every completion from a snapshot
+    taken under the runner lock; retries and the WAITING_HUMAN fail-safe
+    work as in :class:`OvernightRunner`.
+
+    ``BantzServer.handle_command`` is not thread-safe (it mutates the
+    shared context, pagination and brain state), so this runner is only
+    selected when ``BANTZ_OVERNIGHT_WORKERS`` > 1 is set explicitly and the
+    server in use tolerates concurrent calls.
+
+    Parameters
+    ----------
+    max_workers:
+        Upper bound on tasks in flight.
+    limiter:
+        Per-domain limits (defaults to :data:`DEFAULT_DOMAIN_LIMITS`).
+    """
+
+    def __init__(
+        self,
+        bantz_server: Any = None,
+        resource_monitor: Optional[ResourceMonitor] = None,
+        failsafe: Optional[OvernightFailSafe] = None,
+        checkpoint_path: Path = CHECKPOINT_FILE,
+        *,
+        max_workers: int = DEFAULT_CONCURRENT_WORKERS,
+        limiter: Optional[DomainRateLimiter] = None,
+    ):
+        super().__init__(bantz_server, resource_monitor, failsafe, checkpoint_path)
+        self.max_workers = max(1, max_workers)
+        self.limiter = limiter or DomainRateLimiter()
+
+    def run(self) -> OvernightState:
+        """Run all tasks, up to ``max_workers`` at a time. Blocking."""
+        if self._state is None or not self._state.tasks:
+            logger.warning("No tasks to run in overnight mode")
+            return self._state or OvernightState(session_id="empty")
+
+        state = self._state
+        self._begin_session(state)
+
+        running: Dict[Future, OvernightTask] = {}
+        consecutive_errors = 0
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="overnight") as pool:
+            while True:
+                if self._cancel_event.is_set() and state.status == OvernightStatus.RUNNING:
+                    state.status = OvernightStatus.CANCELLED
+                    logger.info("Overnight cancelled by user — waiting for %d running task(s)", len(running))
+
+                delay: Optional[float] = None
+                if state.status == OvernightStatus.RUNNING:
+                    delay = self._dispatch(state, pool, running)
+
+                if not running:
+                    if delay is None:
+                        break  # Nothing left to start
+                    self._cancel_event.wait(delay if math.isfinite(delay) else 1.0)
+                    continue
+
+                timeout = delay if delay is not None and math.isfinite(delay) else None
+                done, _ = wait(list(running), timeout=timeout, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    self.limiter.release(task_domains(task))
+                    success = future.result()
+                    consecutive_errors, retrying = self._settle_task(task, success, consecutive_errors)
+                    if not retrying:
+                        self._checkpoint(state)
+
+        return self._finish_session(state)
+
+    def _dispatch(
+        self,
+        state: OvernightState,
+        pool: ThreadPoolExecutor,
+        running: Dict[Future, OvernightTask],
+    ) -> Optional[float]:
+        """Start every pending task the limits allow.
+
+        Returns ``None`` when no pending task is left, ``math.inf`` when
+        the rest must wait for a running task, otherwise the seconds until
+        a token bucket admits the next one.
+        """
+        pending = [t for t in state.tasks if t.status == TaskStatus.PENDING]
+        if not pending:
+            return None
+        delay = math.inf
+        for task in pending:
+            if len(running) >= self.max_workers:
+                return math.inf
+            wait_s = self.limiter.try_acquire(task_domains(task))
+            if wait_s > 0:
+                delay = min(delay, wait_s)
+                continue
+            task.status = TaskStatus.RUNNING
+            running[pool.submit(self._execute_task, task, state)] = task
+        if not any(t.status == TaskStatus.PENDING for t in pending):
+            return math.inf
+        return delay
+
+    # ── Pacing hooks: token buckets instead of global sleeps ─────
+
+    def _pace_api(self, task: OvernightTask) -> None:
+        pass
+
+    def _on_rate_limited(self, task: OvernightTask) -> None:
+        self.limiter.report_rate_limit(task_domains(task))
+
+    def _on_task_success(self, task: OvernightTask) -> None:
+        self.limiter.report_success(task_domains(task))
+
+
+def create_overnight_runner(
+    bantz_server: Any = None,
+    *,
+    max_workers: Optional[int] = None,
+    checkpoint_path: Path = CHECKPOINT_FILE,
+) -> OvernightRunner:
+    """Runner honouring ``BANTZ_OVERNIGHT_WORKERS``.
+
+    One worker (the default) gives the sequential :class:`OvernightRunner`;
+    more give a :class:`ConcurrentOvernightRunner`, which calls
+    ``handle_command`` from several threads at once.
+    """
+    if max_workers is None:
+        try:
+            max_workers = int(os.getenv("BANTZ_OVERNIGHT_WORKERS", str(DEFAULT_OVERNIGHT_WORKERS)))
+        except ValueError:
+            max_workers = DEFAULT_OVERNIGHT_WORKERS
+    if max_workers <= 1:
+        return OvernightRunner(bantz_server=bantz_server, checkpoint_path=checkpoint_path)
+    return ConcurrentOvernightRunner(
+        bantz_server=bantz_server,
+        checkpoint_path=checkpoint_path,
+        max_workers=max_workers,
+    )
+
+
 # ─────────────────────────────────────────────────────────────────
 # Resume from checkpoint
 # ─────────────────────────────────────────────────────────────────
@@ -748,6 +1123,7 @@ class OvernightRunner:
 def resume_overnight(
     bantz_server: Any = None,
     checkpoint_path: Path = CHECKPOINT_FILE,
+    max_workers: Optional[int] = None,
 ) -> Optional[OvernightState]:
     """Resume an interrupted overnight session from checkpoint.
 
@@ -784,8 +1160,9 @@ def resume_overnight(
     except Exception:
         pass
 
-    runner = OvernightRunner(
-        bantz_server=bantz_server,
+    runner = create_overnight_runner(
+        bantz_server,
+        max_workers=max_workers,
         checkpoint_path=checkpoint_path,
     )
     runner.set_state(state)
@@ -7,6 +7,7 @@ into clean, independently testable Strategy classes:
 - ``NoNewFactsGuard`` — validates output against source data
 - ``QualityFinalizer`` — cloud / Gemini response generation
 - ``FastFinalizer`` — local 3B planner-based fast response
+- ``FinalizerHedge`` — hedge delay + per-route win-rates for racing the two
 - ``FinalizationPipeline`` — orchestrates the full finalization flow
 
 Each strategy produces ``Optional[str]`` (the final ``assistant_reply``)
@@ -24,6 +25,10 @@ import concurrent.futures
 import json
 import logging
 import re
+import statistics
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass, replace
 from typing import Any, Optional, Protocol
 
@@ -164,6 +169,9 @@ class FinalizationContext:
     # Issue #874: Personality block for finalizer prompt injection
     personality_block: Optional[str] = None
 
+    # Completion-token cap set by the latency controller (None = default)
+    max_tokens: Optional[int] = None
+
 
 # ---------------------------------------------------------------------------
 # No-New-Facts Guard
@@ -189,8 +197,13 @@ class NoNewFactsGuard:
         allowed_sources: list[str],
         original_prompt: str,
         state: OrchestratorState,
+        cancel: Optional[threading.Event] = None,
     ) -> Optional[str]:
-        """Return the validated text, a retried text, or ``None`` on failure."""
+        """Return the validated text, a retried text, or ``None`` on failure.
+
+        When *cancel* is set before a retry would start (the hedged fast
+        finalizer already won), the retry is skipped and ``None`` returned.
+        """
         try:
             from bantz.llm.no_new_facts import find_new_numeric_facts
         except ImportError:
@@ -207,6 +220,9 @@ class NoNewFactsGuard:
         if not violates:
             return candidate_text
 
+        if cancel is not None and cancel.is_set():
+            return None
+
         # --- Violation detected: retry with stricter prompt -----------------
         state.update_trace(
             finalizer_attempted=True,
@@ -236,6 +252,32 @@ class NoNewFactsGuard:
 
         return retry_text if not violates2 else None
 
+    @staticmethod
+    def passes(*, candidate_text: str, allowed_sources: list[str]) -> bool:
+        """Check *candidate_text* without retrying (used for hedged fast replies)."""
+        try:
+            from bantz.llm.no_new_facts import find_new_numeric_facts
+        except ImportError:
+            return True
+        try:
+            violates, _ = find_new_numeric_facts(
+                allowed_texts=allowed_sources,
+                candidate_text=candidate_text,
+            )
+        except Exception:
+            return True  # best-effort
+        return not violates
+
+
+def _allowed_sources(ctx: FinalizationContext) -> list[str]:
+    """Source texts a finalizer reply may draw numeric facts from."""
+    return [
+        ctx.user_input,
+        ctx.dialog_summary or "",
+        json.dumps(ctx.planner_decision, ensure_ascii=False),
+        json.dumps(ctx.tool_results or [], ensure_ascii=False),
+    ]
+
 
 # ---------------------------------------------------------------------------
 # Quality Finalizer (cloud / Gemini)
@@ -255,26 +297,26 @@ class QualityFinalizer:
         self._guard = guard
         self._timeout = timeout
 
-    def finalize(self, ctx: FinalizationContext) -> Optional[str]:
+    def finalize(
+        self,
+        ctx: FinalizationContext,
+        cancel: Optional[threading.Event] = None,
+    ) -> Optional[str]:
         """Build a prompt, call the quality LLM, apply guard, return text or ``None``."""
         finalizer_prompt = self._build_prompt(ctx)
-        text = _safe_complete(self._llm, finalizer_prompt, timeout=self._timeout, temperature=0.3, max_tokens=512)
+        max_tokens = min(512, ctx.max_tokens or 512)
+        text = _safe_complete(self._llm, finalizer_prompt, timeout=self._timeout, temperature=0.3, max_tokens=max_tokens)
 
         if not text:
             return None
 
         if self._guard is not None:
-            allowed_sources = [
-                ctx.user_input,
-                ctx.dialog_summary or "",
-                json.dumps(ctx.planner_decision, ensure_ascii=False),
-                json.dumps(ctx.tool_results or [], ensure_ascii=False),
-            ]
             text = self._guard.check_and_retry(
                 candidate_text=text,
-                allowed_sources=allowed_sources,
+                allowed_sources=_allowed_sources(ctx),
                 original_prompt=finalizer_prompt,
                 state=ctx.state,
+                cancel=cancel,
             )
 
         return text or None
@@ -426,7 +468,8 @@ class FastFinalizer:
         """Build a fast prompt, call the planner LLM, return text or ``None``."""
         try:
             prompt = self._build_prompt(ctx)
-            return _safe_complete(self._llm, prompt, timeout=self._timeout, temperature=0.2, max_tokens=256)
+            max_tokens = min(256, ctx.max_tokens or 256)
+            return _safe_complete(self._llm, prompt, timeout=self._timeout, temperature=0.2, max_tokens=max_tokens)
         except Exception:
             return None
 
@@ -597,6 +640,118 @@ def decide_finalization_tier(
         return False, "fast", "tiering_error_default_fast"
 
 
+# ---------------------------------------------------------------------------
+# Hedged finalization (quality racing fast)
+# ---------------------------------------------------------------------------
+
+class FinalizerHedge:
+    """Hedge delay and per-route win-rates for quality/fast racing.
+
+    Without hedging a slow or failing quality call is paid in full before
+    the fast finalizer even starts.  In hedged mode the pipeline starts the
+    fast finalizer once the quality call has been running longer than
+    :meth:`delay` — the p50 of recent quality latencies, clamped to
+    ``[min_delay, max_delay]`` — and keeps whichever reply passes the
+    no-new-facts check first.
+
+    Args:
+        initial_delay: Delay (s) used until ``min_samples`` latencies exist.
+        min_delay: Lower clamp for the hedge delay (s).
+        max_delay: Upper clamp for the hedge delay (s).
+        multiplier: Scale applied to the p50 (``>1`` hedges later).
+        window: Number of recent quality latencies kept.
+        min_samples: Samples required before the p50 is trusted.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_delay: float = 1.5,
+        min_delay: float = 0.25,
+        max_delay: float = 5.0,
+        multiplier: float = 1.0,
+        window: int = 64,
+        min_samples: int = 5,
+    ):
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.min_samples = min_samples
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._routes: dict[str, dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        """Seconds to wait on the quality finalizer before starting fast."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                base = self.initial_delay
+            else:
+                base = statistics.median(self._latencies) * self.multiplier
+        return max(self.min_delay, min(self.max_delay, base))
+
+    def record_latency(self, seconds: float) -> None:
+        """Record how long a completed quality call took."""
+        with self._lock:
+            self._latencies.append(max(0.0, float(seconds)))
+
+    def record(self, route: str, *, fired: bool, winner: str) -> None:
+        """Count a hedged turn.  *winner* is ``quality``, ``fast`` or ``none``."""
+        with self._lock:
+            row = self._routes.setdefault(
+                route or "unknown",
+                {"turns": 0, "hedged": 0, "quality_wins": 0, "fast_wins": 0, "no_winner": 0},
+            )
+            row["turns"] += 1
+            if fired:
+                row["hedged"] += 1
+            if winner == "quality":
+                row["quality_wins"] += 1
+            elif winner == "fast":
+                row["fast_wins"] += 1
+            else:
+                row["no_winner"] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Hedge delay and per-route counters with fast win-rates."""
+        with self._lock:
+            routes = {}
+            for route, row in self._routes.items():
+                hedged = row["hedged"]
+                routes[route] = {
+                    **row,
+                    "hedge_rate": round(hedged / row["turns"], 3) if row["turns"] else 0.0,
+                    "fast_win_rate": round(row["fast_wins"] / hedged, 3) if hedged else 0.0,
+                }
+            samples = len(self._latencies)
+        return {
+            "delay_s": round(self.delay(), 3),
+            "latency_samples": samples,
+            "routes": routes,
+        }
+
+
+@dataclass
+class _HedgeResult:
+    """Outcome of one hedged quality/fast race."""
+
+    text: Optional[str]
+    winner: str  # "quality" | "fast" | "none"
+    fired: bool
+    delay: float
+    # Fast reply even if it failed the guard — reused as the degraded
+    # fallback instead of calling the fast finalizer a second time.
+    fast_text: Optional[str] = None
+
+
+# Racers run here; each racer's own LLM call goes through _FINALIZER_EXECUTOR.
+_HEDGE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="finalizer-hedge",
+)
+atexit.register(_HEDGE_EXECUTOR.shutdown, wait=False)
+
+
 # ---------------------------------------------------------------------------
 # Finalization Pipeline
 # ---------------------------------------------------------------------------
@@ -608,7 +763,8 @@ class FinalizationPipeline:
     pipeline:
 
     1. Early exits (ask_user, hard failures)
-    2. Quality finalizer (with no-new-facts guard) OR fast finalizer
+    2. Quality finalizer (with no-new-facts guard) OR fast finalizer;
+       with a ``FinalizerHedge`` the fast finalizer races a slow quality call
     3. Default fallback (tool-success summary)
     """
 
@@ -618,10 +774,17 @@ class FinalizationPipeline:
         quality: Optional[QualityFinalizer] = None,
         fast: Optional[FastFinalizer] = None,
         event_bus: Any = None,
+        hedge: Optional[FinalizerHedge] = None,
     ):
         self._quality = quality
         self._fast = fast
         self._event_bus = event_bus
+        self._hedge = hedge
+
+    @property
+    def hedge(self) -> Optional[FinalizerHedge]:
+        """Hedge policy when hedged mode is enabled, else ``None``."""
+        return self._hedge
 
     def run(self, ctx: FinalizationContext) -> OrchestratorOutput:
         """Execute the finalization pipeline and return the updated output."""
@@ -778,7 +941,23 @@ class FinalizationPipeline:
         )
 
         if ctx.use_quality and self._quality is not None and not quality_is_fast_fallback:
-            text = self._try_quality(ctx)
+            hedged: Optional[_HedgeResult] = None
+            if self._hedge is not None and self._fast is not None:
+                hedged = self._run_hedged(ctx, route=route)
+                text = hedged.text
+                if text and hedged.winner == "fast":
+                    text = _validate_reply_language(text, route=route, tool_results=ctx.tool_results)
+                    ctx.state.update_trace(
+                        response_tier=ctx.tier_name or "quality",
+                        response_tier_reason=ctx.tier_reason or "quality_finalizer",
+                        finalizer_attempted=True,
+                        finalizer_used=False,
+                        finalizer_fallback="planner",
+                        finalizer_strategy="hedged_fast",
+                    )
+                    return replace(output, assistant_reply=text, finalizer_model=_fast_model or "fast(hedge)")
+            else:
+                text = self._try_quality(ctx)
             if text:
                 # Issue #653 + #1232: language post-validation with route context
                 text = _validate_reply_language(text, route=route, tool_results=ctx.tool_results)
@@ -786,7 +965,10 @@ class FinalizationPipeline:
 
             # Quality failed / guard rejected → fall back to fast
             if self._fast is not None:
-                text = self._fast.finalize(ctx)
+                if hedged is not None and hedged.fired:
+                    text = hedged.fast_text  # fast already ran during the race
+                else:
+                    text = self._fast.finalize(ctx)
                 if text:
                     # Issue #653 + #1232: language post-validation with route context
                     text = _validate_reply_language(text, route=route, tool_results=ctx.tool_results)
@@ -864,18 +1046,114 @@ class FinalizationPipeline:
         try:
             text = self._quality.finalize(ctx)  # type: ignore[union-attr]
             if text:
-                ctx.state.update_trace(
-                    response_tier=ctx.tier_name or "quality",
-                    response_tier_reason=ctx.tier_reason or "quality_finalizer",
-                    finalizer_used=True,
-                    finalizer_attempted=True,
-                )
+                self._mark_quality_used(ctx)
                 return text
             return None
         except Exception as e:
             self._handle_quality_error(e, ctx)
             return None
 
+    @staticmethod
+    def _mark_quality_used(ctx: FinalizationContext) -> None:
+        ctx.state.update_trace(
+            response_tier=ctx.tier_name or "quality",
+            response_tier_reason=ctx.tier_reason or "quality_finalizer",
+            finalizer_used=True,
+            finalizer_attempted=True,
+        )
+
+    def _run_hedged(self, ctx: FinalizationContext, *, route: str) -> _HedgeResult:
+        """Race the quality finalizer against a delayed fast finalizer.
+
+        The quality call starts immediately.  If it has not finished after
+        the hedge delay, the fast finalizer starts too; the first reply that
+        passes the no-new-facts check wins and the loser is cancelled — a
+        queued call never starts, a running quality call skips its guard
+        retry, and an in-flight HTTP request is abandoned (its result is
+        discarded).
+        """
+        hedge = self._hedge
+        assert hedge is not None and self._quality is not None and self._fast is not None
+        delay = hedge.delay()
+        cancel = threading.Event()
+        started = time.monotonic()
+
+        quality_future = _HEDGE_EXECUTOR.submit(self._quality.finalize, ctx, cancel=cancel)
+
+        def _record_quality_latency(f: concurrent.futures.Future) -> None:
+            if not f.cancelled() and f.exception() is None:
+                hedge.record_latency(time.monotonic() - started)
+
+        quality_future.add_done_callback(_record_quality_latency)
+
+        result = _HedgeResult(text=None, winner="none", fired=False, delay=delay)
+        try:
+            quality_text = quality_future.result(timeout=delay)
+        except concurrent.futures.TimeoutError:
+            result.fired = True
+        except Exception as e:
+            self._handle_quality_error(e, ctx)
+        else:
+            if quality_text:
+                self._mark_quality_used(ctx)
+                result.text, result.winner = quality_text, "quality"
+
+        if result.fired:
+            allowed = _allowed_sources(ctx)
+            fast_future = _HEDGE_EXECUTOR.submit(self._fast.finalize, ctx)
+            pending: dict[concurrent.futures.Future, str] = {
+                quality_future: "quality",
+                fast_future: "fast",
+            }
+            while pending and result.winner == "none":
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED,
+                )
+                for future in done:
+                    racer = pending.pop(future)
+                    try:
+                        text = future.result()
+                    except Exception as e:
+                        if racer == "quality":
+                            self._handle_quality_error(e, ctx)
+                        continue
+                    if not text:
+                        continue
+                    if racer == "quality":
+                        self._mark_quality_used(ctx)
+                        result.text, result.winner = text, "quality"
+                        break
+                    result.fast_text = text
+                    if NoNewFactsGuard.passes(candidate_text=text, allowed_sources=allowed):
+                        result.text, result.winner = text, "fast"
+                        break
+            cancel.set()
+            for future in pending:
+                future.cancel()
+
+        hedge.record(route, fired=result.fired, winner=result.winner)
+        ctx.state.update_trace(
+            finalizer_hedge_fired=result.fired,
+            finalizer_hedge_winner=result.winner,
+            finalizer_hedge_delay_ms=int(delay * 1000),
+        )
+        if result.fired:
+            logger.info(
+                "[FINALIZER] Hedge fired after %.0fms on route=%s → winner=%s",
+                delay * 1000, route, result.winner,
+            )
+            if self._event_bus is not None:
+                try:
+                    self._event_bus.publish("finalizer.hedge", {
+                        "route": route,
+                        "winner": result.winner,
+                        "delay_ms": int(delay * 1000),
+                        "elapsed_ms": int((time.monotonic() - started) * 1000),
+                    })
+                except Exception as exc:
+                    logger.debug("[FINALIZER] event_bus.publish failed: %s", exc)
+        return result
+
     def _handle_quality_error(
         self, e: Exception, ctx: FinalizationContext
     ) -> None:
@@ -1185,8 +1463,9 @@ def _sanitize_tool_error(error: str) -> str:
 
 # Issue #1183: Reusable thread pool for _safe_complete — avoids creating
 # and destroying a ThreadPoolExecutor on every finalization call.
+# Sized for a hedged quality/fast race plus one abandoned in-flight call.
 _FINALIZER_EXECUTOR = concurrent.futures.ThreadPoolExecutor(
-    max_workers=2, thread_name_prefix="finalizer",
+    max_workers=4, thread_name_prefix="finalizer",
 )
 # Issue #1314: Clean shutdown — prevent thread leak on interpreter exit
 atexit.register(_FINALIZER_EXECUTOR.shutdown, wait=False)
@@ -1261,10 +1540,11 @@ def _safe_complete(
             # Prompt itself is too large — truncate it
             safe_prompt_budget = context_window - _MIN_COMPLETION_TOKENS - _CONTEXT_SAFETY_MARGIN
             if safe_prompt_budget > 200:
-                # Rough char-based trim (estimate_tokens ≈ len/4)
-                target_chars = safe_prompt_budget * 4
-                if len(prompt) > target_chars:
-                    prompt = prompt[:target_chars]
+                from bantz.llm.token_utils import trim_to_tokens
+
+                trimmed = trim_to_tokens(prompt, safe_prompt_budget)
+                if trimmed != prompt:
+                    prompt = trimmed
                     logger.warning(
                         "[FINALIZER] Context guard: prompt truncated to ~%d tokens "
                         "(ctx=%d)",
@@ -1483,8 +1763,13 @@ def create_pipeline(
     event_bus: Any = None,
     quality_timeout: float = 10.0,
     fast_timeout: float = 5.0,
+    hedge: bool | FinalizerHedge = False,
 ) -> FinalizationPipeline:
-    """Create a ``FinalizationPipeline`` from LLM instances."""
+    """Create a ``FinalizationPipeline`` from LLM instances.
+
+    ``hedge=True`` enables hedged quality/fast racing with a default
+    ``FinalizerHedge`` whose delay is capped at half the quality timeout.
+    """
     guard = (
         NoNewFactsGuard(finalizer_llm=finalizer_llm) if finalizer_llm else None
     )
@@ -1494,6 +1779,11 @@ def create_pipeline(
         else None
     )
     fast = FastFinalizer(planner_llm=planner_llm, timeout=fast_timeout) if planner_llm else None
+    if hedge is True:
+        hedge = FinalizerHedge(max_delay=max(0.25, quality_timeout / 2))
     return FinalizationPipeline(
-        quality=quality, fast=fast, event_bus=event_bus
+        quality=quality,
+        fast=fast,
+        event_bus=event_bus,
+        hedge=hedge or None,
     )
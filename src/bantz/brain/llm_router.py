@@ -24,6 +24,8 @@ import threading
 from dataclasses import dataclass, field, replace
 from typing import Any, Optional, Protocol
 
+from bantz.brain.router_cache import RouterResponseCache
+
 logger = logging.getLogger(__name__)
 
 
@@ -591,6 +593,7 @@ U: sistem durumunu göster → {"route":"system","system_intent":"status","confi
         system_prompt: Optional[str] = None,
         confidence_threshold: float = 0.5,
         max_attempts: int = 2,
+        response_cache: Optional[RouterResponseCache] = None,
     ):
         """Initialize router.
         
@@ -599,6 +602,7 @@ U: sistem durumunu göster → {"route":"system","system_intent":"status","confi
             system_prompt: Override the default SYSTEM_PROMPT (useful for benchmarking)
             confidence_threshold: Minimum confidence to execute tools (default 0.5)
             max_attempts: Max repair attempts for malformed JSON (default 2)
+            response_cache: Decision cache (default: from BANTZ_ROUTER_CACHE, off)
         """
         effective_llm = llm if llm is not None else llm_client
         if effective_llm is None:
@@ -611,6 +615,9 @@ U: sistem durumunu göster → {"route":"system","system_intent":"status","confi
         self._custom_system_prompt: Optional[str] = system_prompt
         self._confidence_threshold = float(confidence_threshold)
         self._max_attempts = int(max_attempts)
+        self._response_cache: Optional[RouterResponseCache] = (
+            response_cache if response_cache is not None else RouterResponseCache.from_env()
+        )
 
         # Router budgeting (Issue #214)
         self._cached_context_len: Optional[int] = None
@@ -814,6 +821,17 @@ ASSISTANT (sadece JSON):"""
         )
         return result
 
+    @property
+    def response_cache(self) -> Optional[RouterResponseCache]:
+        """Router decision cache, or ``None`` when disabled."""
+        return self._response_cache
+
+    @classmethod
+    def _registry_key(cls) -> tuple[Any, ...]:
+        """Identity of the current tool set; a change drops cached decisions."""
+        registry = cls._tool_registry
+        return (cls._VALID_TOOLS, id(registry), getattr(registry, "generation", None))
+
     def route(
         self,
         *,
@@ -823,9 +841,16 @@ ASSISTANT (sadece JSON):"""
         session_context: Optional[dict[str, Any]] = None,
         temperature: Optional[float] = None,
         max_tokens_override: Optional[int] = None,
+        pending_confirmation: Optional[str] = None,
     ) -> RouterOutput:
         """Route user input through LLM.
         
+        When a response cache is configured, deterministic calls for a
+        previously seen utterance and state fingerprint (pending
+        confirmation, dialog summary, retrieved memory and routing-relevant
+        session context) are answered from the cache. Anaphoric follow-ups
+        always go to the LLM.
+        
         Args:
             user_input: User's message
             dialog_summary: Previous turns summary (for memory)
@@ -833,10 +858,68 @@ ASSISTANT (sadece JSON):"""
             session_context: Session info (timezone, windows, etc.)
             temperature: Temperature for LLM call (default 0.0 for deterministic routing)
             max_tokens_override: Override for max_tokens (default uses budget calculation)
+            pending_confirmation: Tool awaiting the user's confirmation, if any;
+                only used for the response cache key, not sent to the LLM
         
         Returns:
             RouterOutput with route, intent, slots, confidence, tool_plan, reply
         """
+        cache = self._response_cache
+        use_cache = (
+            cache is not None
+            and self._router_healthy
+            and not temperature
+            and max_tokens_override is None
+        )
+        if use_cache and self._is_anaphoric_followup(user_input):
+            cache.tracker.record_bypass()
+            use_cache = False
+
+        if use_cache:
+            registry_key = self._registry_key()
+            state = {
+                "pending_confirmation": pending_confirmation,
+                "dialog_summary": dialog_summary,
+                "retrieved_memory": retrieved_memory,
+            }
+            cached = cache.get(user_input, session_context, registry_key=registry_key, **state)
+            if cached is not None:
+                logger.debug("[router_cache] hit route=%s", cached.route)
+                return cached
+
+        output = self._route_llm(
+            user_input=user_input,
+            dialog_summary=dialog_summary,
+            retrieved_memory=retrieved_memory,
+            session_context=session_context,
+            temperature=temperature,
+            max_tokens_override=max_tokens_override,
+        )
+
+        if use_cache and self._is_cacheable(output):
+            cache.put(user_input, session_context, output, registry_key=registry_key, **state)
+        return output
+
+    def _is_cacheable(self, output: OrchestratorOutput) -> bool:
+        """Only confident, successfully parsed decisions are reused."""
+        return (
+            output.route != "unknown"
+            and not output.ask_user
+            and output.confidence >= self._confidence_threshold
+            and not (output.raw_output or {}).get("error")
+        )
+
+    def _route_llm(
+        self,
+        *,
+        user_input: str,
+        dialog_summary: Optional[str],
+        retrieved_memory: Optional[str],
+        session_context: Optional[dict[str, Any]],
+        temperature: Optional[float],
+        max_tokens_override: Optional[int],
+    ) -> RouterOutput:
+        """Uncached routing: build the prompt, call the LLM, parse and validate."""
         # Issue #372: Health check gate — if router is unhealthy, return fallback
         if not self._router_healthy:
             # Periodic re-check: try to recover on each call
@@ -1377,6 +1460,8 @@ ASSISTANT (sadece JSON):"""
 
         # Add dialog memory if available (priority: lowest - trimmed first)
         dialog_budget = min(section_budgets.get("dialog", remaining // 3), remaining)
+        if dialog_summary and dialog_budget <= 0:
+            trimmed_any = True  # dropped entirely
         if dialog_summary and dialog_budget > 0:
             header = "DIALOG_SUMMARY (önceki turlar):\n"
             overhead = _estimate_tokens(header) + 1
@@ -1417,6 +1502,8 @@ ASSISTANT (sadece JSON):"""
 
         # Add retrieved memories (priority: medium)
         memory_budget = min(section_budgets.get("memory", remaining // 2), remaining)
+        if retrieved_memory and memory_budget <= 0:
+            trimmed_any = True  # dropped entirely
         if retrieved_memory and memory_budget > 0:
             header_lines = [
                 "RETRIEVED_MEMORY (hatırlanan bağlam):",
@@ -2658,12 +2745,14 @@ class HybridJarvisLLMOrchestrator:
         dialog_summary: Optional[str] = None,
         retrieved_memory: Optional[str] = None,
         session_context: Optional[dict[str, Any]] = None,
+        pending_confirmation: Optional[str] = None,
     ) -> RouterOutput:
         planned = self._planner.route(
             user_input=user_input,
             dialog_summary=dialog_summary,
             retrieved_memory=retrieved_memory,
             session_context=session_context,
+            pending_confirmation=pending_confirmation,
         )
 
         should_override = False
@@ -44,9 +44,15 @@ from bantz.brain.tool_result_summarizer import (  # noqa: F401
     _build_tool_success_summary, _count_items, _extract_count, _extract_field,
     _prepare_tool_results_for_finalizer, _summarize_tool_result)
 from bantz.core.events import EventBus, EventType
+from bantz.core.latency_budget import (PHASE_FINALIZER_FAST,
+                                       PHASE_FINALIZER_QUALITY,
+                                       PHASE_REFLECTION, PHASE_ROUTER,
+                                       PHASE_TOOL, AdaptiveLatencyController,
+                                       DegradationPlan)
 from bantz.nlu.slots import SlotExtractor
 from bantz.routing.preroute import (IntentCategory, LocalResponseGenerator,
                                     PreRouter)
+from bantz.tools.lazy import resolve_handler
 
 logger = logging.getLogger(__name__)
 
@@ -216,6 +222,8 @@ class OrchestratorConfig:
     enable_preroute: bool = True  # Issue #407: Rule-based pre-route bypass
     finalizer_timeout_seconds: float = 10.0  # Issue #947: Finalizer LLM timeout (quality)
     fast_finalizer_timeout_seconds: float = 5.0  # Issue #947: Fast finalizer LLM timeout
+    finalizer_hedge: bool = False  # Race fast finalizer against slow quality (BANTZ_FINALIZER_HEDGE)
+    latency_target_p95_ms: float = 0.0  # Adaptive degradation target; 0 = off (BANTZ_LATENCY_TARGET_MS)
     
     def __post_init__(self):
         if self.require_confirmation_for is None:
@@ -299,6 +307,19 @@ class OrchestratorLoop:
             logger.warning("[ORCHESTRATOR] UserMemoryBridge init failed: %s", _umx)
             self.user_memory = None
 
+        # Adaptive latency budget — degrade reflection/finalizer to hit p95
+        _latency_target = self.config.latency_target_p95_ms
+        if not _latency_target:
+            try:
+                _latency_target = float(os.getenv("BANTZ_LATENCY_TARGET_MS", "0") or 0)
+            except ValueError:
+                _latency_target = 0.0
+        self.latency_controller: Optional[AdaptiveLatencyController] = (
+            AdaptiveLatencyController(target_p95_ms=_latency_target)
+            if _latency_target > 0
+            else None
+        )
+
         # Issue #874: Personality injection (Jarvis/Friday/Alfred presets)
         try:
             from bantz.brain.personality_injector import PersonalityInjector
@@ -491,6 +512,8 @@ class OrchestratorLoop:
                 event_bus=self.event_bus,
                 quality_timeout=self.config.finalizer_timeout_seconds,
                 fast_timeout=self.config.fast_finalizer_timeout_seconds,
+                hedge=self.config.finalizer_hedge
+                or os.getenv("BANTZ_FINALIZER_HEDGE", "0").strip().lower() in {"1", "true", "yes", "on"},
             )
             self._finalization_pipeline_key = key
         return self._finalization_pipeline
@@ -501,6 +524,25 @@ class OrchestratorLoop:
 
     _TOOL_REMAP = TOOL_REMAP  # backward-compat alias
 
+    def _observe_latency(self, phase: str, phase_start: float) -> None:
+        if self.latency_controller is not None:
+            self.latency_controller.observe(phase, (time.time() - phase_start) * 1000)
+
+    def _plan_latency(
+        self,
+        turn_start: float,
+        remaining: list[str],
+        state: OrchestratorState,
+    ) -> Optional[DegradationPlan]:
+        """Ask the latency controller how to run the *remaining* phases."""
+        if self.latency_controller is None:
+            return None
+        plan = self.latency_controller.plan((time.time() - turn_start) * 1000, remaining)
+        if plan.degraded:
+            state.update_trace(latency_plan=plan.to_trace_dict())
+            self.event_bus.publish("latency.degraded", plan.to_trace_dict())
+        return plan
+
     def _force_tool_plan(self, output: OrchestratorOutput) -> OrchestratorOutput:
         return _force_tool_plan_fn(
             output,
@@ -732,7 +774,9 @@ class OrchestratorLoop:
                 )
             else:
                 # Phase 1: LLM Planning (route, intent, tools, confirmation)
+                _phase_start = time.time()
                 orchestrator_output = self._llm_planning_phase(_router_input, state)
+                self._observe_latency(PHASE_ROUTER, _phase_start)
             
             # Issue #837: Self-Evolving Agent — detect skill gaps
             if (
@@ -807,6 +851,7 @@ class OrchestratorLoop:
                     except Exception as _decomp_exc:
                         logger.debug("[Issue #1279] Subtask plan build failed: %s", _decomp_exc)
 
+                _phase_start = time.time()
                 if _use_subtask:
                     # ── Issue #1279: Subtask execution loop
                     tool_results = self._subtask_execute_loop(
@@ -819,29 +864,50 @@ class OrchestratorLoop:
                         orchestrator_output, state, _router_input,
                         trace_id=_trace_id,
                     )
+                self._observe_latency(PHASE_TOOL, _phase_start)
 
                 # Phase 2.75: Self-Reflection (Issue #1277)
                 # Semantic verification: does the result satisfy the user's request?
-                try:
-                    self._reflection_phase(
-                        user_input, orchestrator_output, tool_results, state,
-                    )
-                except Exception as _ref_exc:
-                    logger.debug("[Issue #1277] Reflection failed (non-fatal): %s", _ref_exc)
+                # One latency plan per turn: it decides reflection and the
+                # finalizer strategy, and every action it records is applied.
+                _latency_plan = self._plan_latency(
+                    start_time, [PHASE_REFLECTION, "finalizer"], state,
+                )
+                if _latency_plan is None or not _latency_plan.skip_reflection:
+                    _phase_start = time.time()
+                    try:
+                        self._reflection_phase(
+                            user_input, orchestrator_output, tool_results, state,
+                        )
+                    except Exception as _ref_exc:
+                        logger.debug("[Issue #1277] Reflection failed (non-fatal): %s", _ref_exc)
+                    self._observe_latency(PHASE_REFLECTION, _phase_start)
 
                 # Phase 3: LLM Finalization (generate final response with tool results)
+                _phase_start = time.time()
                 final_output = self._llm_finalization_phase(
                     user_input,
                     orchestrator_output,
                     tool_results,
                     state,
+                    latency_plan=_latency_plan,
                 )
+                _fin_model = str(getattr(final_output, "finalizer_model", "") or "")
+                if _fin_model and not _fin_model.startswith("none"):
+                    self._observe_latency(
+                        PHASE_FINALIZER_QUALITY
+                        if state.trace.get("finalizer_used") is True
+                        else PHASE_FINALIZER_FAST,
+                        _phase_start,
+                    )
 
             # Phase 4: Update State (rolling summary, conversation history, trace)
             self._update_state_phase(user_input, final_output, tool_results, state)
             
             # Emit turn end event
             elapsed = time.time() - start_time
+            if self.latency_controller is not None:
+                self.latency_controller.observe_turn(elapsed * 1000)
             self.event_bus.publish("turn.end", {
                 "elapsed_ms": int(elapsed * 1000),
                 "route": final_output.route,
@@ -1701,11 +1767,19 @@ class OrchestratorLoop:
         except Exception as _ent_exc:
             logger.debug("[Issue #1276] Entity context injection failed (non-fatal): %s", _ent_exc)
 
+        # A pending confirmation changes how the same utterance ("evet",
+        # "ekle") must be routed — part of the router cache fingerprint.
+        _pending_tool: Optional[str] = None
+        if state.has_pending_confirmation():
+            _pending = state.peek_pending_confirmation() or {}
+            _pending_tool = str(_pending.get("tool") or "yes")
+
         # Call orchestrator with enhanced summary + session context
         output = self.orchestrator.route(
             user_input=user_input,
             dialog_summary=enhanced_summary,
             session_context=session_context,
+            pending_confirmation=_pending_tool,
         )
 
         # Issue #938: Merge NLU pre-extracted slots into LLM output
@@ -2342,10 +2416,11 @@ class OrchestratorLoop:
                 if not isinstance(params, dict):
                     params = {}
 
+                handler = resolve_handler(tool.function)
                 timeout = self.config.tool_timeout_seconds
 
                 try:
-                    future = self._tool_executor.submit(tool.function, **params)
+                    future = self._tool_executor.submit(handler, **params)
                     result = future.result(timeout=timeout)
                 except concurrent.futures.TimeoutError:
                     return {
@@ -2750,7 +2825,7 @@ class OrchestratorLoop:
                     _pending.update({
                         "risk_tier": _v2_decision.tier.value,
                         "action": _v2_decision.action,
-                        "display_params": _v2_decision.display_params,
+                        "display_params": _v2_decision.get_display_params(),
                         "editable_fields": _v2_decision.editable_fields,
                         "editable": _v2_decision.editable,
                         "requires_explicit_confirm": _v2_decision.requires_explicit_confirm,
@@ -2873,10 +2948,13 @@ class OrchestratorLoop:
                         continue
                 
                 # Execute tool (Issue #431: with timeout protection)
+                # Resolve a lazily bound handler first so its module import
+                # is not charged against the tool timeout.
+                handler = resolve_handler(tool.function)
                 timeout = self.config.tool_timeout_seconds
                 try:
                     exec_start = time.time()
-                    future = self._tool_executor.submit(tool.function, **params)
+                    future = self._tool_executor.submit(handler, **params)
                     result = future.result(timeout=timeout)
                     elapsed_ms = int((time.time() - exec_start) * 1000)
                 except concurrent.futures.TimeoutError:
@@ -3141,11 +3219,15 @@ class OrchestratorLoop:
         orchestrator_output: OrchestratorOutput,
         tool_results: list[dict[str, Any]],
         state: OrchestratorState,
+        latency_plan: Optional[DegradationPlan] = None,
     ) -> OrchestratorOutput:
         """Phase 3: LLM Finalization — delegates to ``FinalizationPipeline``.
 
         Issue #404: Extracted from 300-line monolith into Strategy pattern.
         See ``bantz.brain.finalization_pipeline`` for the full pipeline.
+
+        A degraded *latency_plan* forces the fast finalizer and/or caps
+        ``max_tokens`` for this turn.
         """
         from bantz.brain.finalization_pipeline import \
             build_finalization_context
@@ -3185,6 +3267,11 @@ class OrchestratorLoop:
             finalizer_llm=self.finalizer_llm,
             personality_block=_personality_block,
         )
+        if latency_plan is not None and latency_plan.degraded:
+            if latency_plan.use_fast_finalizer and ctx.use_quality:
+                ctx = replace(ctx, use_quality=False, tier_name="fast", tier_reason="latency_budget")
+            if latency_plan.max_tokens:
+                ctx = replace(ctx, max_tokens=latency_plan.max_tokens)
 
         pipeline = self._get_finalization_pipeline()
 
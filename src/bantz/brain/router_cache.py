@@ -0,0 +1,409 @@
+"""Router decision cache.
+
+Repeated utterances ("bugün takvimimde ne var", "mailleri kontrol et")
+otherwise pay for a full LLM router call every time.  This cache stores
+the router's :class:`~bantz.brain.llm_router.OrchestratorOutput` keyed by
+
+- the normalised utterance (Turkish-aware casefold, punctuation and
+  whitespace collapsed), and
+- a fingerprint of the state that can change the decision: the pending
+  confirmation, the dialog so far (summary and retrieved memory, so a
+  follow-up such as "yarın saat 3" answering a clarification never reuses
+  another dialog's route), and from ``session_context`` the active entity
+  (anaphora target), pre-extracted NLU slots, the preroute hint and the
+  current date / timezone.
+
+Entries expire after a TTL and the whole cache is dropped when the tool
+registry changes.  An optional embedding tier answers near-identical
+utterances (cosine similarity above a threshold) with the same
+fingerprint.  Hit/miss counters are kept in a :class:`RouterCacheTracker`,
+mirroring :class:`~bantz.brain.llm_router.RepairTracker`.
+
+Enabled with ``BANTZ_ROUTER_CACHE=1``; tuned with
+``BANTZ_ROUTER_CACHE_TTL`` (seconds), ``BANTZ_ROUTER_CACHE_SIZE`` and
+``BANTZ_ROUTER_CACHE_SIMILARITY``.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Hashable, List, Optional
+
+if TYPE_CHECKING:
+    from bantz.brain.llm_router import OrchestratorOutput
+    from bantz.memory.ranking import EmbeddingProvider
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 300.0
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_SIMILARITY = 0.92
+
+# session_context keys that can change the routing decision for the same text
+FINGERPRINT_KEYS = (
+    "active_entity",
+    "nlu_slots",
+    "preroute_hint",
+    "timezone",
+    "location",
+)
+
+
+# ---------------------------------------------------------------------------
+# Hit-rate tracking
+# ---------------------------------------------------------------------------
+
+class RouterCacheTracker:
+    """Thread-safe counters for router cache lookups.
+
+    Exposes a ``hits_per_100`` metric alongside the raw counts, in the
+    same shape as :class:`~bantz.brain.llm_router.RepairTracker`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._lookups: int = 0
+        self._hits: int = 0
+        self._semantic_hits: int = 0
+        self._bypasses: int = 0
+        self._stores: int = 0
+        self._expirations: int = 0
+        self._evictions: int = 0
+        self._invalidations: int = 0
+
+    # ---- recording ----------------------------------------------------------
+    def record_lookup(self, *, hit: bool = False, semantic: bool = False) -> None:
+        with self._lock:
+            self._lookups += 1
+            if hit:
+                self._hits += 1
+                if semantic:
+                    self._semantic_hits += 1
+
+    def record_bypass(self) -> None:
+        with self._lock:
+            self._bypasses += 1
+
+    def record_store(self) -> None:
+        with self._lock:
+            self._stores += 1
+
+    def record_expiration(self) -> None:
+        with self._lock:
+            self._expirations += 1
+
+    def record_eviction(self) -> None:
+        with self._lock:
+            self._evictions += 1
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self._invalidations += 1
+
+    # ---- metrics ------------------------------------------------------------
+    @property
+    def hits(self) -> int:
+        with self._lock:
+            return self._hits
+
+    @property
+    def hits_per_100(self) -> float:
+        """Hit rate per 100 lookups."""
+        with self._lock:
+            if self._lookups == 0:
+                return 0.0
+            return (self._hits / self._lookups) * 100.0
+
+    def summary(self) -> dict[str, Any]:
+        with self._lock:
+            hp100 = 0.0 if self._lookups == 0 else (self._hits / self._lookups) * 100.0
+            return {
+                "lookups": self._lookups,
+                "hits": self._hits,
+                "semantic_hits": self._semantic_hits,
+                "misses": self._lookups - self._hits,
+                "hits_per_100": round(hp100, 2),
+                "bypasses": self._bypasses,
+                "stores": self._stores,
+                "expirations": self._expirations,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._lookups = 0
+            self._hits = 0
+            self._semantic_hits = 0
+            self._bypasses = 0
+            self._stores = 0
+            self._expirations = 0
+            self._evictions = 0
+            self._invalidations = 0
+
+
+# Global singleton – importable for dashboards / telemetry
+_cache_tracker = RouterCacheTracker()
+
+
+def get_router_cache_tracker() -> RouterCacheTracker:
+    """Return the global RouterCacheTracker instance."""
+    return _cache_tracker
+
+
+# ---------------------------------------------------------------------------
+# Keys
+# ---------------------------------------------------------------------------
+
+_PUNCT_RE = re.compile(r"[^\w\s@.:/-]+", re.UNICODE)
+_SPACE_RE = re.compile(r"\s+")
+_TR_LOWER = str.maketrans({"I": "ı", "İ": "i"})
+
+
+def normalize_utterance(text: str) -> str:
+    """Lowercase (Turkish-aware), drop punctuation, collapse whitespace."""
+    text = (text or "").translate(_TR_LOWER).lower()
+    text = _PUNCT_RE.sub(" ", text)
+    return _SPACE_RE.sub(" ", text).strip(" .")
+
+
+def state_fingerprint(
+    session_context: Optional[dict[str, Any]],
+    *,
+    pending_confirmation: Optional[str] = None,
+    dialog_summary: Optional[str] = None,
+    retrieved_memory: Optional[str] = None,
+) -> str:
+    """Hash the state that affects routing.
+
+    Only the date of ``current_datetime`` is used, so entries stay valid
+    within a day but never carry relative dates ("bugün") across midnight.
+    The dialog summary and retrieved memory are included verbatim: a reply
+    to a clarifying question only hits when the whole dialog matches.
+    """
+    ctx = session_context or {}
+    state: dict[str, Any] = {k: ctx.get(k) for k in FINGERPRINT_KEYS if ctx.get(k)}
+    current = ctx.get("current_datetime")
+    if current:
+        state["date"] = str(current)[:10]
+    if pending_confirmation:
+        state["pending_confirmation"] = pending_confirmation
+    if dialog_summary or retrieved_memory:
+        state["dialog"] = [dialog_summary or "", retrieved_memory or ""]
+    if not state:
+        return ""
+    payload = json.dumps(state, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+@dataclass
+class _Entry:
+    output: "OrchestratorOutput"
+    text: str
+    fingerprint: str
+    stored_at: float
+    vector: Optional[List[float]] = None
+
+
+class RouterResponseCache:
+    """TTL + LRU cache of router decisions with an optional semantic tier.
+
+    Args:
+        ttl_seconds: Entry lifetime.
+        max_entries: LRU capacity.
+        embedder: Optional embedding provider (``embed(text) -> list``)
+            enabling near-duplicate lookups.
+        similarity_threshold: Minimum cosine similarity for a semantic hit.
+        tracker: Counter sink (defaults to the global tracker).
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        embedder: Optional["EmbeddingProvider"] = None,
+        similarity_threshold: float = DEFAULT_SIMILARITY,
+        tracker: Optional[RouterCacheTracker] = None,
+    ) -> None:
+        self.ttl_seconds = float(ttl_seconds)
+        self.max_entries = max(1, int(max_entries))
+        self.similarity_threshold = float(similarity_threshold)
+        self._embedder = embedder
+        self._tracker = tracker or _cache_tracker
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[tuple[str, str], _Entry]" = OrderedDict()
+        self._registry_key: Optional[Hashable] = None
+        self._vectors: "OrderedDict[str, List[float]]" = OrderedDict()
+
+    @classmethod
+    def from_env(cls, **kwargs: Any) -> Optional["RouterResponseCache"]:
+        """Build a cache if ``BANTZ_ROUTER_CACHE`` is enabled, else ``None``."""
+        enabled = os.getenv("BANTZ_ROUTER_CACHE", "0").strip().lower() in ("1", "true", "yes", "on")
+        if not enabled:
+            return None
+        try:
+            kwargs.setdefault("ttl_seconds", float(os.getenv("BANTZ_ROUTER_CACHE_TTL", DEFAULT_TTL_SECONDS)))
+            kwargs.setdefault("max_entries", int(os.getenv("BANTZ_ROUTER_CACHE_SIZE", DEFAULT_MAX_ENTRIES)))
+            kwargs.setdefault(
+                "similarity_threshold",
+                float(os.getenv("BANTZ_ROUTER_CACHE_SIMILARITY", DEFAULT_SIMILARITY)),
+            )
+        except ValueError:
+            logger.warning("[router_cache] Invalid BANTZ_ROUTER_CACHE_* value, using defaults")
+        return cls(**kwargs)
+
+    @property
+    def tracker(self) -> RouterCacheTracker:
+        return self._tracker
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(
+        self,
+        user_input: str,
+        session_context: Optional[dict[str, Any]] = None,
+        *,
+        registry_key: Optional[Hashable] = None,
+        pending_confirmation: Optional[str] = None,
+        dialog_summary: Optional[str] = None,
+        retrieved_memory: Optional[str] = None,
+    ) -> Optional["OrchestratorOutput"]:
+        """Return a copy of the cached decision, or ``None`` on a miss.
+
+        The keyword arguments after ``registry_key`` are part of the state
+        fingerprint (see :func:`state_fingerprint`).
+        """
+        text = normalize_utterance(user_input)
+        if not text:
+            self._tracker.record_bypass()
+            return None
+        fingerprint = state_fingerprint(
+            session_context,
+            pending_confirmation=pending_confirmation,
+            dialog_summary=dialog_summary,
+            retrieved_memory=retrieved_memory,
+        )
+        now = time.monotonic()
+        with self._lock:
+            self._check_registry(registry_key)
+            entry = self._entries.get((text, fingerprint))
+            if entry is not None and now - entry.stored_at > self.ttl_seconds:
+                del self._entries[(text, fingerprint)]
+                self._tracker.record_expiration()
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end((text, fingerprint))
+                self._tracker.record_lookup(hit=True)
+                return copy.deepcopy(entry.output)
+
+        entry = self._semantic_lookup(text, fingerprint, now)
+        self._tracker.record_lookup(hit=entry is not None, semantic=True)
+        return copy.deepcopy(entry.output) if entry is not None else None
+
+    def put(
+        self,
+        user_input: str,
+        session_context: Optional[dict[str, Any]],
+        output: "OrchestratorOutput",
+        *,
+        registry_key: Optional[Hashable] = None,
+        pending_confirmation: Optional[str] = None,
+        dialog_summary: Optional[str] = None,
+        retrieved_memory: Optional[str] = None,
+    ) -> None:
+        """Store a decision for the utterance and state fingerprint."""
+        text = normalize_utterance(user_input)
+        if not text:
+            return
+        fingerprint = state_fingerprint(
+            session_context,
+            pending_confirmation=pending_confirmation,
+            dialog_summary=dialog_summary,
+            retrieved_memory=retrieved_memory,
+        )
+        key = (text, fingerprint)
+        with self._lock:
+            self._check_registry(registry_key)
+            vector = self._vectors.pop(text, None)
+            self._entries[key] = _Entry(
+                output=copy.deepcopy(output),
+                text=text,
+                fingerprint=key[1],
+                stored_at=time.monotonic(),
+                vector=vector,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._tracker.record_eviction()
+        self._tracker.record_store()
+
+    def invalidate(self) -> None:
+        """Drop every entry (e.g. after the tool set changed)."""
+        with self._lock:
+            self._clear()
+
+    # ----- private helpers -----
+
+    def _clear(self) -> None:
+        if self._entries:
+            self._tracker.record_invalidation()
+        self._entries.clear()
+        self._vectors.clear()
+
+    def _check_registry(self, registry_key: Optional[Hashable]) -> None:
+        # Caller holds the lock.
+        if registry_key != self._registry_key:
+            if self._entries:
+                logger.info("[router_cache] Tool registry changed — dropping %d entries", len(self._entries))
+            self._clear()
+            self._registry_key = registry_key
+
+    def _semantic_lookup(self, text: str, fingerprint: str, now: float) -> Optional[_Entry]:
+        if self._embedder is None:
+            return None
+        try:
+            vector = list(self._embedder.embed(text))
+        except Exception as exc:
+            logger.debug("[router_cache] Embedding failed: %s", exc)
+            return None
+
+        from bantz.memory.ranking import cosine_similarity
+
+        with self._lock:
+            # Kept for put() so a miss does not embed the same text twice.
+            self._vectors[text] = vector
+            while len(self._vectors) > self.max_entries:
+                self._vectors.popitem(last=False)
+            best: Optional[_Entry] = None
+            best_score = self.similarity_threshold
+            for entry in self._entries.values():
+                if (
+                    entry.fingerprint != fingerprint
+                    or entry.vector is None
+                    or now - entry.stored_at > self.ttl_seconds
+                ):
+                    continue
+                score = cosine_similarity(vector, entry.vector)
+                if score >= best_score:
+                    best, best_score = entry, score
+            if best is not None:
+                self._entries.move_to_end((best.text, best.fingerprint))
+                logger.debug("[router_cache] Semantic hit %.3f", best_score)
+            return best
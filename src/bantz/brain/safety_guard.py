@@ -19,6 +19,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any, Literal, Optional
 
+from bantz.agent.arg_validation import compile_schema
 from bantz.agent.tools import Tool
 from bantz.brain.arg_sanitizer import ArgSanitizer
 from bantz.policy.engine import PolicyEngine
@@ -242,20 +243,18 @@ class SafetyGuard:
         """
         # --- Phase 1: Schema validation ---
         if tool.parameters:
-            schema = tool.parameters
-            
+            # Compiled once per schema and shared with ToolRegistry.validate_call
+            validator = compile_schema(tool.parameters)
+
             # Check required fields
-            required = schema.get("required", [])
-            for fld in required:
-                if fld not in params:
-                    return False, f"Missing required field: {fld}"
-            
-            # Check field types (basic validation)
-            properties = schema.get("properties", {})
+            missing = validator.missing(params)
+            if missing is not None:
+                return False, f"Missing required field: {missing}"
+
             # Strip unknown fields to prevent tool execution errors.
             # The 3B model often sends router output fields (natural_query,
             # text, title) as tool params — these must be removed.
-            _unknown_fields = [fld for fld in params if fld not in properties]
+            _unknown_fields = validator.unknown(params)
             for fld in _unknown_fields:
                 logger.warning("Unknown field '%s' in tool '%s' — stripped", fld, tool.name)
                 del params[fld]
@@ -275,41 +274,13 @@ class SafetyGuard:
                     )
                 except Exception:
                     pass  # best-effort observability
-            for fld, value in params.items():
-                
-                field_schema = properties[fld]
-                expected_type = field_schema.get("type")
-                
-                if expected_type == "string" and not isinstance(value, str):
-                    return False, f"Field '{fld}' must be string, got {type(value).__name__}"
-                elif expected_type == "integer":
-                    if isinstance(value, bool):
-                        return False, f"Field '{fld}' must be integer, got bool"
-                    if isinstance(value, str):
-                        # LLM often returns "30" instead of 30 — coerce gracefully
-                        # Issue #duration: Also handle "H:MM" / "HH:MM" time-format
-                        # strings for duration fields (e.g. "0:30" → 30 minutes).
-                        _coerced = False
-                        if ":" in value:
-                            _parts = value.strip().split(":")
-                            if len(_parts) == 2:
-                                try:
-                                    _h, _m = int(_parts[0]), int(_parts[1])
-                                    params[fld] = _h * 60 + _m
-                                    _coerced = True
-                                except (ValueError, TypeError):
-                                    pass
-                        if not _coerced:
-                            try:
-                                params[fld] = int(value)
-                            except (ValueError, TypeError):
-                                return False, f"Field '{fld}' must be integer, got non-numeric string"
-                    elif not isinstance(value, int):
-                        return False, f"Field '{fld}' must be integer, got {type(value).__name__}"
-                elif expected_type == "number" and (isinstance(value, bool) or not isinstance(value, (int, float))):
-                    return False, f"Field '{fld}' must be number, got {type(value).__name__}"
-                elif expected_type == "boolean" and not isinstance(value, bool):
-                    return False, f"Field '{fld}' must be boolean, got {type(value).__name__}"
+
+            # Check field types; LLMs often return "30" (or "0:30" for
+            # durations) instead of 30 — integers are coerced in place.
+            failure = validator.coerce_in_place(params)
+            if failure is not None:
+                fld, err = failure
+                return False, f"Field '{fld}' must be {err.expected}, got {err.got}"
 
         # --- Phase 2: Sanitization (Issue #425) ---
         tool_name = getattr(tool, "name", "") or ""
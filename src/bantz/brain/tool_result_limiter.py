@@ -7,6 +7,9 @@ Strategy:
 - Soft limit (default 8 KB): log a warning
 - Hard limit (default 32 KB): truncate with a sentinel message
 - Per-result and aggregate limits
+- Token limit (default 8K tokens): results over the soft character limit
+  are also counted with the configured tokenizer, so dense Turkish text
+  is cut by tokens rather than by a fixed chars-per-token guess
 """
 
 from __future__ import annotations
@@ -22,21 +25,41 @@ __all__ = [
     "enforce_result_size_limits",
     "TOOL_RESULT_SOFT_LIMIT",
     "TOOL_RESULT_HARD_LIMIT",
+    "TOOL_RESULT_TOKEN_LIMIT",
 ]
 
 # Size limits in characters (not bytes)
 TOOL_RESULT_SOFT_LIMIT = 8_000   # ~8 KB — warn
 TOOL_RESULT_HARD_LIMIT = 32_000  # ~32 KB — truncate
+TOOL_RESULT_TOKEN_LIMIT = 8_000  # tokens — truncate
 
 
-def _estimate_size(obj: Any) -> int:
-    """Estimate the string size of a JSON-serializable object."""
+def _serialize(obj: Any) -> str:
     if isinstance(obj, str):
-        return len(obj)
+        return obj
     try:
-        return len(json.dumps(obj, ensure_ascii=False))
+        return json.dumps(obj, ensure_ascii=False)
     except (TypeError, ValueError):
-        return len(str(obj))
+        return str(obj)
+
+
+def _token_char_limit(obj: Any, size: int, token_limit: int) -> Optional[int]:
+    """Character limit that keeps *obj* within *token_limit* tokens.
+
+    Returns ``None`` when the result already fits.
+    """
+    from bantz.llm.token_utils import estimate_tokens
+
+    tokens = estimate_tokens(_serialize(obj))
+    if tokens <= token_limit:
+        return None
+    # Scale by this result's own chars/token density.
+    return max(1, int(size * token_limit / tokens))
+
+
+def _estimate_size(obj: Any) -> int:
+    """Estimate the string size of a JSON-serializable object."""
+    return len(_serialize(obj))
 
 
 def truncate_tool_result(
@@ -111,14 +134,17 @@ def enforce_result_size_limits(
     *,
     soft_limit: int = TOOL_RESULT_SOFT_LIMIT,
     hard_limit: int = TOOL_RESULT_HARD_LIMIT,
+    token_limit: Optional[int] = TOOL_RESULT_TOKEN_LIMIT,
     trace_id: str = "",
 ) -> List[Dict[str, Any]]:
     """Enforce size limits on a list of tool results.
 
     Modifies *tool_results* in place and returns it.
 
-    For results exceeding *soft_limit*, a warning is logged.
-    For results exceeding *hard_limit*, the result is truncated.
+    For results exceeding *soft_limit*, a warning is logged and (if
+    *token_limit* is set) the token count is checked.
+    For results exceeding *hard_limit* or *token_limit*, the result is
+    truncated.
     """
     for r in tool_results:
         tool_name = r.get("tool") or ""
@@ -127,14 +153,20 @@ def enforce_result_size_limits(
                 continue
             val = r[result_key]
             size = _estimate_size(val)
+            limit = hard_limit
             if size > soft_limit:
                 logger.warning(
                     "[Issue #1221] Large tool result: tool=%s key=%s size=%d trace_id=%s",
                     tool_name, result_key, size, trace_id,
                 )
-            if size > hard_limit:
+                # Below soft_limit chars a result can't reach token_limit.
+                if token_limit is not None:
+                    token_chars = _token_char_limit(val, size, token_limit)
+                    if token_chars is not None:
+                        limit = min(limit, token_chars)
+            if size > limit:
                 r[result_key] = truncate_tool_result(
-                    val, hard_limit=hard_limit, tool_name=tool_name,
+                    val, hard_limit=limit, tool_name=tool_name,
                     trace_id=trace_id,
                 )
     return tool_results
@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Iterable, Optional
 
+from bantz.router.replay_engine import ReplayCall, ReplayEngine
+
 TRACE_DIR = Path(__file__).resolve().parents[3] / "artifacts" / "logs" / "traces"
 TRACE_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -160,10 +162,14 @@ def load_golden_traces() -> list[dict[str, Any]]:
 
 def replay_golden_traces(
     router_fn: Any = None,
+    *,
+    max_in_flight: Optional[int] = None,
 ) -> dict[str, Any]:
     """Replay golden traces and return pass/fail summary.
 
     If *router_fn* is None, uses echo mode (trace vs itself → always pass).
+    Otherwise up to *max_in_flight* router calls run concurrently (default:
+    ``BANTZ_REPLAY_CONCURRENCY`` or 8) and repeated inputs are routed once.
 
     Returns:
         {total, passed, failed, diffs: [{turn, diff, user_input}]}
@@ -171,18 +177,21 @@ def replay_golden_traces(
     goldens = load_golden_traces()
     diffs: list[dict[str, Any]] = []
 
-    for idx, golden in enumerate(goldens):
-        if router_fn is None:
-            # Echo mode: expected == actual
-            actual = {"route": golden.get("route"), "tools": golden.get("tools", [])}
-        else:
-            user_input = golden.get("user_input", "")
-            result = router_fn(user_input)
-            actual = {
-                "route": result.get("route", ""),
-                "tools": [{"name": t} for t in result.get("tools", [])],
-            }
-
+    if router_fn is None:
+        # Echo mode: expected == actual
+        actuals = (
+            (idx, {"route": golden.get("route"), "tools": golden.get("tools", [])})
+            for idx, golden in enumerate(goldens)
+        )
+    else:
+        engine = ReplayEngine(router_fn, max_in_flight=max_in_flight)
+        actuals = (
+            (call.index, _replay_actual(call))
+            for call in engine.run(goldens, key=lambda g: g.get("user_input", ""))
+        )
+
+    for idx, actual in actuals:
+        golden = goldens[idx]
         diff = compare_traces(golden, actual)
         if diff:
             diffs.append({
@@ -191,6 +200,7 @@ def replay_golden_traces(
                 "user_input": golden.get("user_input"),
             })
 
+    diffs.sort(key=lambda d: d["turn"])
     total = len(goldens)
     return {
         "total": total,
@@ -200,6 +210,15 @@ def replay_golden_traces(
     }
 
 
+def _replay_actual(call: ReplayCall) -> dict[str, Any]:
+    if call.error is not None:
+        raise call.error
+    return {
+        "route": call.result.get("route", ""),
+        "tools": [{"name": t} for t in call.result.get("tools", [])],
+    }
+
+
 # ---------------------------------------------------------------------------
 # Metrics aggregation (Issue #664 Faz 4)
 # ---------------------------------------------------------------------------
@@ -467,14 +467,11 @@ def run_overnight(
 ) -> int:
     """Run overnight mode — otonom gece modu (Issue #836).
 
-    Executes tasks sequentially, checkpoints after each task,
-    generates a morning report, and exits.
+    Executes tasks (in parallel per BANTZ_OVERNIGHT_WORKERS), checkpoints
+    after each task, generates a morning report, and exits.
     """
     from bantz.server import BantzServer
-    from bantz.automation.overnight import (
-        OvernightRunner,
-        OvernightState,
-    )
+    from bantz.automation.overnight import create_overnight_runner
 
     if not tasks:
         print(f"{Colors.RED}✗ Gece modu için en az bir görev gerekli.{Colors.RESET}")
@@ -483,7 +480,7 @@ def run_overnight(
 
     server = BantzServer(session_name=session_name, policy_path=policy_path, log_path=log_path)
 
-    runner = OvernightRunner(bantz_server=server)
+    runner = create_overnight_runner(server)
     runner.add_tasks(tasks)
 
     try:
@@ -579,7 +576,7 @@ def main(argv: list[str] | None = None) -> int:
     if argv and argv[0] == "doctor":
         from bantz.doctor import run_doctor
         verbose = "--verbose" in argv or "-v" in argv
-        return run_doctor(verbose=verbose)
+        return run_doctor(verbose=verbose, importtime="--importtime" in argv)
 
     # Health — live service health checks (Issue #1298)
     if argv and argv[0] == "health":
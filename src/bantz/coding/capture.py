@@ -0,0 +1,198 @@
+"""Bounded, streaming capture of subprocess output.
+
+``TerminalExecutor`` used to collect a command's whole output with
+``communicate()`` and truncate it afterwards, so a runaway ``find /``
+could buffer gigabytes first.  The classes here are fed pipe chunks as
+they arrive instead:
+
+- :class:`HeadTailBuffer` keeps the first and last bytes of a stream
+  within a fixed budget and counts what it dropped.
+- :class:`StreamCapture` wraps one buffer per pipe and, when asked,
+  splits the stream into lines for live progress.
+- :class:`OutputPublisher` batches those lines onto the EventBus as
+  ``terminal.output`` events at a bounded rate.
+"""
+from __future__ import annotations
+
+import codecs
+import logging
+import threading
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from bantz.core.events import EventBus
+
+logger = logging.getLogger(__name__)
+
+READ_CHUNK = 64 * 1024
+MAX_LINE_CHARS = 2000
+MAX_LINES_PER_EVENT = 50
+PUBLISH_INTERVAL = 0.25  # seconds between terminal.output events per command
+
+
+def normalize_newlines(text: str) -> str:
+    """Universal-newline translation, as ``Popen(text=True)`` does."""
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+class HeadTailBuffer:
+    """Keeps the first ``limit // 2`` and last ``limit - limit // 2`` bytes.
+
+    Memory stays O(limit) however much is fed; :attr:`total` and
+    :attr:`dropped` report what the stream really produced.
+    """
+
+    def __init__(self, limit: int):
+        self.limit = max(0, limit)
+        self._head_limit = self.limit // 2
+        self._tail_limit = self.limit - self._head_limit
+        self._head = bytearray()
+        self._tail = bytearray()
+        self.total = 0
+
+    def feed(self, data: bytes) -> None:
+        self.total += len(data)
+        room = self._head_limit - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+        if not data or not self._tail_limit:
+            return
+        self._tail += data
+        # Trim lazily so the copy cost is amortised over many chunks.
+        if len(self._tail) > 2 * self._tail_limit:
+            del self._tail[:-self._tail_limit]
+
+    @property
+    def dropped(self) -> int:
+        return self.total - len(self._head) - min(len(self._tail), self._tail_limit)
+
+    @property
+    def truncated(self) -> bool:
+        return self.dropped > 0
+
+    def text(self, encoding: str = "utf-8") -> str:
+        """Decoded content with a marker where bytes were dropped."""
+        tail = bytes(self._tail[-self._tail_limit:]) if self._tail_limit else b""
+        if not self.truncated:
+            return normalize_newlines((bytes(self._head) + tail).decode(encoding, errors="replace"))
+        head = normalize_newlines(bytes(self._head).decode(encoding, errors="replace"))
+        tail_text = normalize_newlines(tail.decode(encoding, errors="replace"))
+        marker = f"\n... [truncated {self.dropped} of {self.total} bytes] ...\n"
+        return head + marker + tail_text
+
+
+class StreamCapture:
+    """One pipe's bounded buffer plus optional line splitting.
+
+    Args:
+        name: Stream name passed to *on_lines* (``"stdout"``/``"stderr"``).
+        limit: Byte budget for the retained output.
+        on_lines: Called with ``(name, lines)`` for the complete lines of
+            each chunk.  A line is forced out once it passes
+            :data:`MAX_LINE_CHARS` without a newline.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        limit: int,
+        on_lines: Optional[Callable[[str, list[str]], None]] = None,
+    ):
+        self.name = name
+        self.buffer = HeadTailBuffer(limit)
+        self._on_lines = on_lines
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace") if on_lines else None
+        self._partial = ""
+
+    def feed(self, data: bytes) -> None:
+        self.buffer.feed(data)
+        if self._decoder is None:
+            return
+        text = self._partial + self._decoder.decode(data)
+        lines = normalize_newlines(text).split("\n")
+        self._partial = lines.pop()
+        if len(self._partial) > MAX_LINE_CHARS:
+            lines.append(self._partial)
+            self._partial = ""
+        if lines:
+            self._on_lines(self.name, lines)
+
+    def close(self) -> None:
+        """Flush a trailing line without a newline."""
+        if self._decoder is None:
+            return
+        rest = self._partial + self._decoder.decode(b"", final=True)
+        self._partial = ""
+        if rest:
+            self._on_lines(self.name, [rest])
+
+    @property
+    def total(self) -> int:
+        return self.buffer.total
+
+    def text(self) -> str:
+        return self.buffer.text()
+
+
+class OutputPublisher:
+    """Batches output lines into ``terminal.output`` events.
+
+    At most one event per :data:`PUBLISH_INTERVAL`; lines beyond
+    :data:`MAX_LINES_PER_EVENT` in a batch are dropped from the front and
+    counted in ``skipped``.  Lines are cut to :data:`MAX_LINE_CHARS`.
+    Thread-safe — both pipe readers call :meth:`add`.
+    """
+
+    def __init__(self, event_bus: "EventBus", command: str, *, interval: float = PUBLISH_INTERVAL):
+        self._bus = event_bus
+        self.command = command
+        self.pid: Optional[int] = None
+        self._interval = interval
+        self._lines: deque[tuple[str, str]] = deque(maxlen=MAX_LINES_PER_EVENT)
+        self._skipped = 0
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+        self.events = 0
+
+    def add(self, stream: str, lines: list[str]) -> None:
+        with self._lock:
+            overflow = len(self._lines) + len(lines) - MAX_LINES_PER_EVENT
+            if overflow > 0:
+                self._skipped += overflow
+                lines = lines[-MAX_LINES_PER_EVENT:]
+            self._lines.extend((stream, line) for line in lines)
+            if time.monotonic() - self._last < self._interval:
+                return
+            batch = self._take()
+        self._publish(batch)
+
+    def finish(self, **data) -> None:
+        """Publish buffered lines together with the final status."""
+        with self._lock:
+            batch = self._take()
+        batch.update(data, done=True)
+        self._publish(batch)
+
+    def _take(self) -> dict:
+        lines = [{"stream": s, "line": line[:MAX_LINE_CHARS]} for s, line in self._lines]
+        batch = {"lines": lines, "skipped": self._skipped}
+        self._lines.clear()
+        self._skipped = 0
+        self._last = time.monotonic()
+        return batch
+
+    def _publish(self, batch: dict) -> None:
+        if not batch["lines"] and not batch.get("done"):
+            return
+        try:
+            self._bus.publish(
+                event_type="terminal.output",
+                data={"command": self.command, "pid": self.pid, "done": False, **batch},
+                source="terminal",
+            )
+            self.events += 1
+        except Exception as exc:
+            logger.debug("[Terminal] Output publish failed: %s", exc)
@@ -12,9 +12,13 @@ from __future__ import annotations
 import ast
 import json
 import re
+from collections import deque
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+if TYPE_CHECKING:
+    from .index import WorkspaceIndex
 
 
 @dataclass
@@ -110,6 +114,16 @@ class ProjectContext:
     def __init__(self, root: Path):
         self.root = Path(root).resolve()
         self._cache: dict[str, Any] = {}
+        self._index: Optional[WorkspaceIndex] = None
+    
+    @property
+    def index(self) -> WorkspaceIndex:
+        """Shared workspace index used for symbol and related-file queries."""
+        if self._index is None:
+            from .index import get_workspace_index
+            
+            self._index = get_workspace_index(self.root)
+        return self._index
     
     def detect_project_type(self) -> str:
         """Detect the primary project type.
@@ -422,51 +436,7 @@ class ProjectContext:
         if not p.exists():
             return []
         
-        related = set()
-        name = p.stem
-        ext = p.suffix.lower()
-        
-        # Find test files
-        test_patterns = [
-            f"test_{name}{ext}",
-            f"{name}_test{ext}",
-            f"tests/test_{name}{ext}",
-            f"tests/{name}_test{ext}",
-            f"test/test_{name}{ext}",
-            f"__tests__/{name}.test{ext}",
-            f"{name}.spec{ext}",
-        ]
-        
-        for pattern in test_patterns:
-            test_path = self.root / pattern
-            if test_path.exists():
-                related.add(str(test_path.relative_to(self.root)))
-        
-        # For Python: find imports
-        if ext == ".py":
-            try:
-                content = p.read_text()
-                tree = ast.parse(content)
-                
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Import):
-                        for alias in node.names:
-                            # Try to find local module
-                            mod_path = self.root / alias.name.replace(".", "/")
-                            if mod_path.with_suffix(".py").exists():
-                                related.add(str(mod_path.with_suffix(".py").relative_to(self.root)))
-                            elif (mod_path / "__init__.py").exists():
-                                related.add(str((mod_path / "__init__.py").relative_to(self.root)))
-                    
-                    elif isinstance(node, ast.ImportFrom):
-                        if node.module:
-                            mod_path = self.root / node.module.replace(".", "/")
-                            if mod_path.with_suffix(".py").exists():
-                                related.add(str(mod_path.with_suffix(".py").relative_to(self.root)))
-            except Exception:
-                pass
-        
-        return sorted(related)
+        return self.index.related_files(p)
     
     def get_symbols(self, file_path: str) -> list[Symbol]:
         """Extract symbols (functions, classes) from a file.
@@ -502,169 +472,20 @@ class ProjectContext:
         except Exception:
             return []
         
-        symbols = []
-        
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                decorators = [
-                    self._get_decorator_name(d) for d in node.decorator_list
-                ]
-                
-                # Get signature
-                args = []
-                for arg in node.args.args:
-                    arg_str = arg.arg
-                    if arg.annotation:
-                        arg_str += f": {ast.unparse(arg.annotation)}"
-                    args.append(arg_str)
-                
-                returns = ""
-                if node.returns:
-                    returns = f" -> {ast.unparse(node.returns)}"
-                
-                signature = f"def {node.name}({', '.join(args)}){returns}"
-                
-                # Get docstring
-                docstring = ast.get_docstring(node)
-                
-                symbols.append(Symbol(
-                    name=node.name,
-                    type="function",
-                    line=node.lineno,
-                    end_line=node.end_lineno,
-                    docstring=docstring,
-                    signature=signature,
-                    decorators=decorators,
-                ))
-            
-            elif isinstance(node, ast.AsyncFunctionDef):
-                decorators = [
-                    self._get_decorator_name(d) for d in node.decorator_list
-                ]
-                
-                docstring = ast.get_docstring(node)
-                
-                symbols.append(Symbol(
-                    name=node.name,
-                    type="function",
-                    line=node.lineno,
-                    end_line=node.end_lineno,
-                    docstring=docstring,
-                    signature=f"async def {node.name}(...)",
-                    decorators=decorators,
-                ))
-            
-            elif isinstance(node, ast.ClassDef):
-                decorators = [
-                    self._get_decorator_name(d) for d in node.decorator_list
-                ]
-                
-                # Get base classes
-                bases = [ast.unparse(b) for b in node.bases]
-                signature = f"class {node.name}" + (f"({', '.join(bases)})" if bases else "")
-                
-                docstring = ast.get_docstring(node)
-                
-                symbols.append(Symbol(
-                    name=node.name,
-                    type="class",
-                    line=node.lineno,
-                    end_line=node.end_lineno,
-                    docstring=docstring,
-                    signature=signature,
-                    decorators=decorators,
-                ))
-                
-                # Get methods
-                for item in node.body:
-                    if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
-                        method_decorators = [
-                            self._get_decorator_name(d) for d in item.decorator_list
-                        ]
-                        
-                        method_type = "method"
-                        if "@property" in method_decorators:
-                            method_type = "property"
-                        elif "@classmethod" in method_decorators:
-                            method_type = "classmethod"
-                        elif "@staticmethod" in method_decorators:
-                            method_type = "staticmethod"
-                        
-                        symbols.append(Symbol(
-                            name=item.name,
-                            type=method_type,
-                            line=item.lineno,
-                            end_line=item.end_lineno,
-                            parent=node.name,
-                            decorators=method_decorators,
-                        ))
-        
-        return symbols
+        return python_symbols(tree)
     
     def _get_js_symbols(self, file_path: Path) -> list[Symbol]:
-        """Extract symbols from JavaScript/TypeScript file using regex.
-        
-        Note: This is a simple regex-based extraction, not a full parser.
-        """
+        """Extract symbols from JavaScript/TypeScript file using regex."""
         try:
             content = file_path.read_text()
         except Exception:
             return []
         
-        symbols = []
-        lines = content.splitlines()
-        
-        # Function patterns
-        func_patterns = [
-            # function name(...) or async function name(...)
-            re.compile(r"^(\s*)(export\s+)?(async\s+)?function\s+(\w+)\s*\("),
-            # const/let/var name = function(...) or = (...)
-            re.compile(r"^(\s*)(export\s+)?(const|let|var)\s+(\w+)\s*=\s*(async\s+)?(?:function|\()"),
-            # Arrow function: const name = async? (...) =>
-            re.compile(r"^(\s*)(export\s+)?(const|let|var)\s+(\w+)\s*=\s*(async\s+)?\([^)]*\)\s*=>"),
-        ]
-        
-        # Class pattern
-        class_pattern = re.compile(r"^(\s*)(export\s+)?(default\s+)?class\s+(\w+)")
-        
-        for i, line in enumerate(lines, 1):
-            # Check for functions
-            for pattern in func_patterns:
-                match = pattern.match(line)
-                if match:
-                    groups = match.groups()
-                    name = groups[3] if len(groups) > 3 else groups[-1]
-                    symbols.append(Symbol(
-                        name=name,
-                        type="function",
-                        line=i,
-                    ))
-                    break
-            
-            # Check for classes
-            match = class_pattern.match(line)
-            if match:
-                name = match.group(4)
-                symbols.append(Symbol(
-                    name=name,
-                    type="class",
-                    line=i,
-                ))
-        
-        return symbols
+        return js_symbols(content)
     
     def _get_decorator_name(self, node: ast.expr) -> str:
         """Get decorator name from AST node."""
-        if isinstance(node, ast.Name):
-            return f"@{node.id}"
-        elif isinstance(node, ast.Call):
-            if isinstance(node.func, ast.Name):
-                return f"@{node.func.id}"
-            elif isinstance(node.func, ast.Attribute):
-                return f"@{ast.unparse(node.func)}"
-        elif isinstance(node, ast.Attribute):
-            return f"@{ast.unparse(node)}"
-        return "@?"
+        return _decorator_name(node)
     
     def get_imports(self, file_path: str) -> list[str]:
         """Get list of imports from a file.
@@ -727,38 +548,205 @@ class ProjectContext:
         else:
             extensions = [".py", ".js", ".ts"]
         
-        results = []
-        name_lower = name.lower()
-        
-        for ext in extensions:
-            for file_path in self.root.rglob(f"*{ext}"):
-                if len(results) >= max_results:
-                    break
-                
-                # Skip hidden/vendor
-                rel_parts = file_path.relative_to(self.root).parts
-                if any(p.startswith(".") or p in {"node_modules", "__pycache__", "venv"} for p in rel_parts):
-                    continue
-                
-                try:
-                    symbols = self.get_symbols(str(file_path))
-                    for sym in symbols:
-                        if name_lower in sym.name.lower():
-                            if symbol_type and sym.type != symbol_type:
-                                continue
-                            
-                            results.append({
-                                "file": str(file_path.relative_to(self.root)),
-                                **sym.to_dict(),
-                            })
-                            
-                            if len(results) >= max_results:
-                                break
-                except Exception:
-                    pass
-        
-        return results
+        return self.index.search_symbols(
+            name,
+            symbol_type=symbol_type,
+            extensions=extensions,
+            max_results=max_results,
+        )
     
     def clear_cache(self) -> None:
-        """Clear the context cache."""
+        """Clear the context cache (and re-scan the index on next use)."""
         self._cache.clear()
+        if self._index is not None:
+            self._index.invalidate()
+
+
+# ─────────────────────────────────────────────────────────────────
+# Symbol extraction (shared with the workspace index)
+# ─────────────────────────────────────────────────────────────────
+
+SYMBOL_EXTENSIONS = frozenset({".py", ".js", ".jsx", ".ts", ".tsx"})
+
+
+_BLOCK_NODES = (ast.stmt, ast.excepthandler, ast.match_case)
+
+
+def walk_statements(tree: ast.AST) -> Iterator[ast.AST]:
+    """Like ``ast.walk`` (same breadth-first order) but only visits statements.
+    
+    Definitions and imports are always statements, so this finds the same
+    ones while skipping every expression node.
+    """
+    todo = deque([tree])
+    while todo:
+        node = todo.popleft()
+        for name in node._fields:
+            value = getattr(node, name, None)
+            if isinstance(value, list) and value and isinstance(value[0], _BLOCK_NODES):
+                todo.extend(value)
+        yield node
+
+
+def python_symbols(tree: ast.AST) -> list[Symbol]:
+    """Extract symbols (functions, classes, methods) from a parsed module."""
+    symbols = []
+    
+    for node in walk_statements(tree):
+        if isinstance(node, ast.FunctionDef):
+            decorators = [
+                _decorator_name(d) for d in node.decorator_list
+            ]
+            
+            # Get signature
+            args = []
+            for arg in node.args.args:
+                arg_str = arg.arg
+                if arg.annotation:
+                    arg_str += f": {ast.unparse(arg.annotation)}"
+                args.append(arg_str)
+            
+            returns = ""
+            if node.returns:
+                returns = f" -> {ast.unparse(node.returns)}"
+            
+            signature = f"def {node.name}({', '.join(args)}){returns}"
+            
+            # Get docstring
+            docstring = ast.get_docstring(node)
+            
+            symbols.append(Symbol(
+                name=node.name,
+                type="function",
+                line=node.lineno,
+                end_line=node.end_lineno,
+                docstring=docstring,
+                signature=signature,
+                decorators=decorators,
+            ))
+        
+        elif isinstance(node, ast.AsyncFunctionDef):
+            decorators = [
+                _decorator_name(d) for d in node.decorator_list
+            ]
+            
+            docstring = ast.get_docstring(node)
+            
+            symbols.append(Symbol(
+                name=node.name,
+                type="function",
+                line=node.lineno,
+                end_line=node.end_lineno,
+                docstring=docstring,
+                signature=f"async def {node.name}(...)",
+                decorators=decorators,
+            ))
+        
+        elif isinstance(node, ast.ClassDef):
+            decorators = [
+                _decorator_name(d) for d in node.decorator_list
+            ]
+            
+            # Get base classes
+            bases = [ast.unparse(b) for b in node.bases]
+            signature = f"class {node.name}" + (f"({', '.join(bases)})" if bases else "")
+            
+            docstring = ast.get_docstring(node)
+            
+            symbols.append(Symbol(
+                name=node.name,
+                type="class",
+                line=node.lineno,
+                end_line=node.end_lineno,
+                docstring=docstring,
+                signature=signature,
+                decorators=decorators,
+            ))
+            
+            # Get methods
+            for item in node.body:
+                if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                    method_decorators = [
+                        _decorator_name(d) for d in item.decorator_list
+                    ]
+                    
+                    method_type = "method"
+                    if "@property" in method_decorators:
+                        method_type = "property"
+                    elif "@classmethod" in method_decorators:
+                        method_type = "classmethod"
+                    elif "@staticmethod" in method_decorators:
+                        method_type = "staticmethod"
+                    
+                    symbols.append(Symbol(
+                        name=item.name,
+                        type=method_type,
+                        line=item.lineno,
+                        end_line=item.end_lineno,
+                        parent=node.name,
+                        decorators=method_decorators,
+                    ))
+    
+    return symbols
+
+
+def js_symbols(content: str) -> list[Symbol]:
+    """Extract symbols from JavaScript/TypeScript source using regex.
+    
+    Note: This is a simple regex-based extraction, not a full parser.
+    """
+    symbols = []
+    lines = content.splitlines()
+    
+    # Function patterns
+    func_patterns = [
+        # function name(...) or async function name(...)
+        re.compile(r"^(\s*)(export\s+)?(async\s+)?function\s+(\w+)\s*\("),
+        # const/let/var name = function(...) or = (...)
+        re.compile(r"^(\s*)(export\s+)?(const|let|var)\s+(\w+)\s*=\s*(async\s+)?(?:function|\()"),
+        # Arrow function: const name = async? (...) =>
+        re.compile(r"^(\s*)(export\s+)?(const|let|var)\s+(\w+)\s*=\s*(async\s+)?\([^)]*\)\s*=>"),
+    ]
+    
+    # Class pattern
+    class_pattern = re.compile(r"^(\s*)(export\s+)?(default\s+)?class\s+(\w+)")
+    
+    for i, line in enumerate(lines, 1):
+        # Check for functions
+        for pattern in func_patterns:
+            match = pattern.match(line)
+            if match:
+                groups = match.groups()
+                name = groups[3] if len(groups) > 3 else groups[-1]
+                symbols.append(Symbol(
+                    name=name,
+                    type="function",
+                    line=i,
+                ))
+                break
+        
+        # Check for classes
+        match = class_pattern.match(line)
+        if match:
+            name = match.group(4)
+            symbols.append(Symbol(
+                name=name,
+                type="class",
+                line=i,
+            ))
+    
+    return symbols
+
+
+def _decorator_name(node: ast.expr) -> str:
+    """Get decorator name from AST node."""
+    if isinstance(node, ast.Name):
+        return f"@{node.id}"
+    elif isinstance(node, ast.Call):
+        if isinstance(node.func, ast.Name):
+            return f"@{node.func.id}"
+        elif isinstance(node.func, ast.Attribute):
+            return f"@{ast.unparse(node.func)}"
+    elif isinstance(node, ast.Attribute):
+        return f"@{ast.unparse(node)}"
+    return "@?"
@@ -18,6 +18,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from .index import WorkspaceIndex, get_workspace_index, notify_changed
 from .security import SecurityPolicy, SecurityError, ConfirmationRequired
 
 
@@ -87,6 +88,14 @@ class FileManager:
         self._backup_dir = self.root / ".bantz_backups"
         self._security = security or SecurityPolicy(workspace_root=self.root)
         self._edit_history: list[FileEdit] = []
+        self._index: Optional[WorkspaceIndex] = None
+    
+    @property
+    def index(self) -> WorkspaceIndex:
+        """Shared workspace index used by :meth:`search_files`."""
+        if self._index is None:
+            self._index = get_workspace_index(self.root)
+        return self._index
     
     def _resolve_path(self, path: str | Path) -> Path:
         """Resolve path relative to workspace root."""
@@ -286,6 +295,7 @@ class FileManager:
         
         # Write new content
         file_path.write_text(content, encoding="utf-8")
+        notify_changed(file_path)
         
         # Record edit for undo
         self._edit_history.append(FileEdit(
@@ -358,6 +368,7 @@ class FileManager:
         
         # Write
         file_path.write_text(new_content, encoding="utf-8")
+        notify_changed(file_path)
         
         # Record edit
         self._edit_history.append(FileEdit(
@@ -410,6 +421,7 @@ class FileManager:
         
         # Create file
         file_path.write_text(content, encoding="utf-8")
+        notify_changed(file_path)
         
         # Record
         self._edit_history.append(FileEdit(
@@ -450,6 +462,7 @@ class FileManager:
             shutil.rmtree(file_path)
         else:
             file_path.unlink()
+        notify_changed(file_path)
         
         # Record
         self._edit_history.append(FileEdit(
@@ -543,52 +556,38 @@ class FileManager:
         content_pattern: Optional[str] = None,
         extensions: Optional[list[str]] = None,
         max_results: int = 100,
+        directory: Optional[str | Path] = None,
     ) -> list[str]:
         """Search for files by name pattern and/or content.
         
+        Answered from the workspace index (see :mod:`bantz.coding.index`);
+        hidden paths and ``node_modules``/``__pycache__``/``venv`` are not
+        indexed.
+        
         Args:
             pattern: Glob pattern for filenames
             content_pattern: Regex pattern to search in content
             extensions: Filter by extensions (e.g., [".py", ".js"])
             max_results: Maximum results to return
+            directory: Only search below this directory
             
         Returns:
             List of matching file paths (relative to workspace)
         """
-        import re
-        
-        results: list[str] = []
-        content_re = re.compile(content_pattern) if content_pattern else None
-        
-        for p in self.root.rglob(pattern):
-            if len(results) >= max_results:
-                break
-            
-            # Skip hidden/backup
-            rel_parts = p.relative_to(self.root).parts
-            if any(part.startswith(".") for part in rel_parts):
-                continue
-            
-            if not p.is_file():
-                continue
-            
-            # Extension filter
-            if extensions and p.suffix.lower() not in [e.lower() for e in extensions]:
-                continue
-            
-            # Content search
-            if content_re:
-                try:
-                    text = p.read_text(encoding="utf-8", errors="ignore")
-                    if not content_re.search(text):
-                        continue
-                except Exception:
-                    continue
-            
-            rel_path = p.relative_to(self.root)
-            results.append(str(rel_path))
-        
-        return results
+        if content_pattern:
+            return self.index.search_content(
+                content_pattern,
+                pattern=pattern,
+                extensions=extensions,
+                directory=directory,
+                max_results=max_results,
+            )
+        return self.index.find_files(
+            pattern,
+            extensions=extensions,
+            directory=directory,
+            max_results=max_results,
+        )
     
     def create_directory(self, path: str) -> bool:
         """Create a directory."""
@@ -627,6 +626,7 @@ class FileManager:
         else:
             # Restore old content
             file_path.write_text(edit.old_content, encoding="utf-8")
+        notify_changed(file_path)
         
         return edit
     
@@ -646,6 +646,7 @@ class FileManager:
             raise ValueError(f"No backup found for: {path}")
         
         shutil.copy2(backup, file_path)
+        notify_changed(file_path)
         return True
     
     def list_backups(self, path: str) -> list[dict]:
@@ -0,0 +1,725 @@
+"""Persistent workspace index for the coding tools.
+
+``FileManager.search_files`` used to ``rglob`` the workspace and read every
+file for content matches, and ``ProjectContext.search_symbol`` re-parsed
+every source file on each query.  :class:`WorkspaceIndex` keeps one SQLite
+database per workspace with:
+
+- ``files``        — relative path, name, extension, size, mtime
+- ``content_fts``  — file text in an FTS5 trigram table
+- ``symbols``      — functions/classes/methods, names in ``symbol_fts``
+- ``imports``      — modules imported by each Python file (for forward
+  and reverse ``related_files`` lookups)
+
+Refresh is incremental: a directory walk compares ``(size, mtime_ns)``
+with the stored row and only re-reads files that changed.  Queries refresh
+first when the index is older than ``max_age`` seconds; writes made
+through :class:`~bantz.coding.files.FileManager` are applied immediately
+via :func:`notify_changed`.
+
+Content regexes are narrowed with the trigram index using the literals
+every match must contain (:mod:`bantz.text.regex_literals`) and then
+verified against the stored text, so no file is opened at query time.
+
+Default DB location: ``$BANTZ_DATA_DIR/workspace_index/<name>-<hash>.db``
+(``BANTZ_WORKSPACE_INDEX=memory`` keeps the index in memory only).
+
+Usage::
+
+    index = get_workspace_index("/path/to/repo")
+    index.find_files("*.py", directory="src")
+    index.search_content(r"def \\w+_tool\\(")
+    index.search_symbols("Router", symbol_type="class")
+    index.related_files("src/bantz/coding/files.py")
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+from typing import Iterator, Optional, Sequence, Union
+
+from bantz.text.regex_literals import literal_requirements
+
+from .context import SYMBOL_EXTENSIONS, Symbol, js_symbols, python_symbols, walk_statements
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "RefreshStats",
+    "WorkspaceIndex",
+    "get_workspace_index",
+    "notify_changed",
+]
+
+# Directories never indexed (hidden directories are always skipped).
+SKIP_DIRS = frozenset({"node_modules", "__pycache__", "venv"})
+# Larger files are listed but their content is read at query time.
+MAX_CONTENT_BYTES = 1 << 20
+DEFAULT_MAX_AGE = 2.0
+INDEX_VERSION = 1
+
+# files.content
+_TEXT, _LARGE, _BINARY = 1, 0, -1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id        INTEGER PRIMARY KEY,
+    path      TEXT NOT NULL UNIQUE,
+    name      TEXT NOT NULL,
+    ext       TEXT NOT NULL,
+    size      INTEGER NOT NULL,
+    mtime_ns  INTEGER NOT NULL,
+    content   INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_files_name ON files(name);
+
+CREATE TABLE IF NOT EXISTS symbols (
+    id         INTEGER PRIMARY KEY,
+    file_id    INTEGER NOT NULL,
+    name       TEXT NOT NULL,
+    type       TEXT NOT NULL,
+    line       INTEGER NOT NULL,
+    end_line   INTEGER,
+    parent     TEXT,
+    signature  TEXT,
+    docstring  TEXT,
+    decorators TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_symbols_file ON symbols(file_id);
+
+CREATE TABLE IF NOT EXISTS imports (
+    file_id INTEGER NOT NULL,
+    module  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_imports_file ON imports(file_id);
+CREATE INDEX IF NOT EXISTS idx_imports_module ON imports(module);
+"""
+
+_FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS content_fts USING fts5(body, tokenize='trigram');
+CREATE VIRTUAL TABLE IF NOT EXISTS symbol_fts USING fts5(name, tokenize='trigram');
+"""
+
+# Without FTS5 the same tables exist as plain rowid tables (scanned).
+_PLAIN_SCHEMA = """
+CREATE TABLE IF NOT EXISTS content_fts (id INTEGER PRIMARY KEY, body TEXT NOT NULL);
+"""
+
+_TABLES = ("files", "symbols", "imports", "content_fts", "symbol_fts")
+
+
+@dataclass
+class RefreshStats:
+    """Outcome of one :meth:`WorkspaceIndex.refresh`."""
+
+    scanned: int = 0
+    added: int = 0
+    updated: int = 0
+    removed: int = 0
+    elapsed_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "scanned": self.scanned,
+            "added": self.added,
+            "updated": self.updated,
+            "removed": self.removed,
+            "elapsed_ms": round(self.elapsed_ms, 3),
+        }
+
+
+class WorkspaceIndex:
+    """File list, content and symbol index for one workspace root.
+
+    Args:
+        root: Workspace root.
+        db_path: SQLite file (default under ``$BANTZ_DATA_DIR``), or
+            ``":memory:"``.
+        max_age: Seconds a refresh stays valid before queries re-scan
+            (default ``BANTZ_WORKSPACE_INDEX_MAX_AGE`` or 2.0).
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        *,
+        db_path: Optional[Union[str, Path]] = None,
+        max_age: Optional[float] = None,
+    ) -> None:
+        self.root = Path(root).resolve()
+        self.db_path = str(db_path) if db_path else _default_db_path(self.root)
+        self.max_age = _max_age_default() if max_age is None else max_age
+        self.last_refresh = RefreshStats()
+        self._lock = threading.RLock()
+        self._refreshed_at: Optional[float] = None
+        self._conn = self._open()
+
+    # ── Maintenance ──
+
+    def refresh(self) -> RefreshStats:
+        """Re-scan the workspace, re-indexing only new or changed files."""
+        t0 = time.perf_counter()
+        stats = RefreshStats()
+        with self._lock:
+            known = {
+                path: (file_id, size, mtime_ns)
+                for file_id, path, size, mtime_ns in self._conn.execute(
+                    "SELECT id, path, size, mtime_ns FROM files"
+                )
+            }
+            changed = []
+            for rel, st in self._walk():
+                stats.scanned += 1
+                row = known.pop(rel, None)
+                if row is None:
+                    changed.append((rel, st, None))
+                elif row[1] != st.st_size or row[2] != st.st_mtime_ns:
+                    changed.append((rel, st, row[0]))
+            with self._conn:
+                for file_id, _, _ in known.values():
+                    self._delete(file_id)
+                for rel, st, file_id in changed:
+                    if file_id is not None:
+                        self._delete(file_id)
+                    self._index_file(rel, st)
+            stats.removed = len(known)
+            stats.updated = sum(1 for _, _, file_id in changed if file_id is not None)
+            stats.added = len(changed) - stats.updated
+            self._refreshed_at = time.monotonic()
+        stats.elapsed_ms = (time.perf_counter() - t0) * 1000
+        self.last_refresh = stats
+        if changed or known:
+            logger.debug("[WorkspaceIndex] %s refreshed: %s", self.root, stats.to_dict())
+        return stats
+
+    def ensure_fresh(self) -> None:
+        """Refresh if the last scan is older than ``max_age``."""
+        at = self._refreshed_at
+        if at is None or time.monotonic() - at > self.max_age:
+            self.refresh()
+
+    def invalidate(self) -> None:
+        """Force a re-scan before the next query."""
+        self._refreshed_at = None
+
+    def note_changed(self, path: Union[str, Path]) -> None:
+        """Apply a single created/modified/deleted path immediately."""
+        rel = self._relative(path)
+        if rel is None or not rel or _skipped(rel):
+            return
+        full = self.root / rel
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT id, size, mtime_ns FROM files WHERE path = ?", (rel,)
+            ).fetchone()
+            try:
+                st = full.stat()
+            except OSError:
+                st = None
+            if st is None or not full.is_file():
+                if row is not None:
+                    self._delete(row[0])
+                # A removed directory takes its files with it.
+                if st is None:
+                    for (file_id,) in self._conn.execute(
+                        "SELECT id FROM files WHERE path > ? AND path < ?", _prefix_range(rel)
+                    ).fetchall():
+                        self._delete(file_id)
+                return
+            if row is not None:
+                if row[1] == st.st_size and row[2] == st.st_mtime_ns:
+                    return
+                self._delete(row[0])
+            self._index_file(rel, st)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ── Queries ──
+
+    def find_files(
+        self,
+        pattern: str = "*",
+        *,
+        extensions: Optional[Sequence[str]] = None,
+        directory: Optional[Union[str, Path]] = None,
+        max_results: int = 100,
+    ) -> list[str]:
+        """Relative paths whose name matches the glob *pattern*."""
+        where, params, path_match = self._file_filter(pattern, extensions, directory)
+        if where is None:
+            return []
+        self.ensure_fresh()
+        results: list[str] = []
+        with self._lock:
+            for (path,) in self._conn.execute(
+                f"SELECT f.path FROM files f WHERE {where} ORDER BY f.path", params
+            ):
+                if path_match and not path_match(path):
+                    continue
+                results.append(path)
+                if len(results) >= max_results:
+                    break
+        return results
+
+    def search_content(
+        self,
+        content_pattern: Union[str, "re.Pattern[str]"],
+        *,
+        pattern: str = "*",
+        extensions: Optional[Sequence[str]] = None,
+        directory: Optional[Union[str, Path]] = None,
+        max_results: int = 100,
+    ) -> list[str]:
+        """Relative paths of files whose text matches *content_pattern*."""
+        regex = re.compile(content_pattern) if isinstance(content_pattern, str) else content_pattern
+        where, params, path_match = self._file_filter(pattern, extensions, directory)
+        if where is None:
+            return []
+        self.ensure_fresh()
+        match = self._fts_match(regex)
+        if match is not None:
+            sql = (
+                "SELECT f.path, c.body FROM content_fts c JOIN files f ON f.id = c.rowid"
+                f" WHERE content_fts MATCH ? AND {where} ORDER BY f.path"
+            )
+            text_params = [match, *params]
+        else:
+            sql = (
+                "SELECT f.path, c.body FROM files f JOIN content_fts c ON c.rowid = f.id"
+                f" WHERE {where} ORDER BY f.path"
+            )
+            text_params = params
+        hits: list[str] = []
+        with self._lock:
+            for path, body in self._conn.execute(sql, text_params):
+                if path_match and not path_match(path):
+                    continue
+                if regex.search(body):
+                    hits.append(path)
+                    if len(hits) >= max_results:
+                        break
+            # Files too large for the content table are read from disk.
+            large = [
+                path for (path,) in self._conn.execute(
+                    f"SELECT f.path FROM files f WHERE f.content = {_LARGE} AND {where} ORDER BY f.path",
+                    params,
+                )
+                if not path_match or path_match(path)
+            ]
+        for path in large:
+            if len(hits) >= max_results and path > hits[-1]:
+                break
+            try:
+                text = (self.root / path).read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                continue
+            if regex.search(text):
+                hits.append(path)
+        hits.sort()
+        return hits[:max_results]
+
+    def search_symbols(
+        self,
+        name: str,
+        *,
+        symbol_type: Optional[Union[str, Sequence[str]]] = None,
+        extensions: Optional[Sequence[str]] = None,
+        max_results: int = 20,
+    ) -> list[dict]:
+        """Symbols whose name contains *name* (case-insensitive).
+
+        Returns dicts with ``file`` plus the fields of :class:`Symbol`.
+        """
+        clauses, params = ["1"], []
+        if symbol_type:
+            types = [symbol_type] if isinstance(symbol_type, str) else list(symbol_type)
+            clauses.append(f"s.type IN ({','.join('?' * len(types))})")
+            params.extend(types)
+        if extensions:
+            exts = [e.lower() for e in extensions]
+            clauses.append(f"f.ext IN ({','.join('?' * len(exts))})")
+            params.extend(exts)
+        where = " AND ".join(clauses)
+        columns = "f.path, s.name, s.type, s.line, s.end_line, s.docstring, s.signature, s.parent, s.decorators"
+        if self._fts and len(name) >= 3:
+            sql = (
+                f"SELECT {columns} FROM symbol_fts x JOIN symbols s ON s.id = x.rowid"
+                " JOIN files f ON f.id = s.file_id"
+                f" WHERE symbol_fts MATCH ? AND {where} ORDER BY f.path, s.id"
+            )
+            params = [_fts_phrase(name), *params]
+        else:
+            sql = (
+                f"SELECT {columns} FROM symbols s JOIN files f ON f.id = s.file_id"
+                f" WHERE {where} ORDER BY f.path, s.id"
+            )
+        self.ensure_fresh()
+        needle = name.lower()
+        results: list[dict] = []
+        with self._lock:
+            for path, sym_name, sym_type, line, end_line, docstring, signature, parent, decorators in (
+                self._conn.execute(sql, params)
+            ):
+                if needle not in sym_name.lower():
+                    continue
+                symbol = Symbol(
+                    name=sym_name,
+                    type=sym_type,
+                    line=line,
+                    end_line=end_line,
+                    docstring=docstring,
+                    signature=signature,
+                    parent=parent,
+                    decorators=json.loads(decorators) if decorators else [],
+                )
+                results.append({"file": path, **symbol.to_dict()})
+                if len(results) >= max_results:
+                    break
+        return results
+
+    def related_files(self, path: Union[str, Path]) -> list[str]:
+        """Tests for *path*, local modules it imports and files importing it."""
+        rel = self._relative(path)
+        if not rel:
+            return []
+        self.ensure_fresh()
+        p = PurePosixPath(rel)
+        stem, ext = p.stem, p.suffix.lower()
+        test_names = [f"test_{stem}{ext}", f"{stem}_test{ext}", f"{stem}.test{ext}", f"{stem}.spec{ext}"]
+        related: set[str] = set()
+        with self._lock:
+            related.update(self._paths_where("name IN (?, ?, ?, ?)", test_names))
+            if ext == ".py":
+                modules = [
+                    module for (module,) in self._conn.execute(
+                        "SELECT i.module FROM imports i JOIN files f ON f.id = i.file_id WHERE f.path = ?",
+                        (rel,),
+                    )
+                ]
+                candidates = []
+                for module in modules:
+                    for base in ("", "src/"):
+                        stem_path = base + module.replace(".", "/")
+                        candidates += [stem_path + ".py", stem_path + "/__init__.py"]
+                for chunk in _chunks(candidates, 500):
+                    related.update(self._paths_where(f"path IN ({','.join('?' * len(chunk))})", chunk))
+                names = _module_names(rel)
+                related.update(
+                    path for (path,) in self._conn.execute(
+                        "SELECT DISTINCT f.path FROM imports i JOIN files f ON f.id = i.file_id"
+                        f" WHERE i.module IN ({','.join('?' * len(names))})",
+                        names,
+                    )
+                )
+        related.discard(rel)
+        return sorted(related)
+
+    def stats(self) -> dict:
+        with self._lock:
+            files, text, symbols = self._conn.execute(
+                "SELECT COUNT(*), SUM(content = 1), (SELECT COUNT(*) FROM symbols) FROM files"
+            ).fetchone()
+        return {
+            "root": str(self.root),
+            "db_path": self.db_path,
+            "fts": self._fts,
+            "files": files,
+            "text_files": text or 0,
+            "symbols": symbols,
+            "last_refresh": self.last_refresh.to_dict(),
+        }
+
+    # ── Internal: storage ──
+
+    def _open(self) -> sqlite3.Connection:
+        if self.db_path != ":memory:":
+            try:
+                Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+                return self._init_db(sqlite3.connect(self.db_path, timeout=5.0, check_same_thread=False))
+            except (OSError, sqlite3.Error) as exc:
+                logger.warning("[WorkspaceIndex] %s unusable (%s) — indexing in memory", self.db_path, exc)
+                self.db_path = ":memory:"
+        return self._init_db(sqlite3.connect(":memory:", check_same_thread=False))
+
+    def _init_db(self, conn: sqlite3.Connection) -> sqlite3.Connection:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version != INDEX_VERSION:
+            for table in _TABLES:
+                conn.execute(f"DROP TABLE IF EXISTS {table}")
+        conn.executescript(_SCHEMA)
+        try:
+            conn.executescript(_FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            conn.executescript(_PLAIN_SCHEMA)
+        conn.execute(f"PRAGMA user_version={INDEX_VERSION}")
+        conn.commit()
+        self._fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'content_fts' AND sql LIKE '%fts5%'"
+        ).fetchone() is not None
+        return conn
+
+    def _walk(self) -> Iterator[tuple[str, os.stat_result]]:
+        stack = [(str(self.root), "")]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if name not in SKIP_DIRS:
+                                stack.append((entry.path, f"{prefix}{name}/"))
+                        elif entry.is_file():
+                            yield prefix + name, entry.stat()
+                    except OSError:
+                        continue
+
+    def _index_file(self, rel: str, st: os.stat_result) -> None:
+        name = rel.rsplit("/", 1)[-1]
+        ext = os.path.splitext(name)[1].lower()
+        text, kind = self._read(rel, st.st_size)
+        file_id = self._conn.execute(
+            "INSERT INTO files (path, name, ext, size, mtime_ns, content) VALUES (?, ?, ?, ?, ?, ?)",
+            (rel, name, ext, st.st_size, st.st_mtime_ns, kind),
+        ).lastrowid
+        if text is None:
+            return
+        self._conn.execute("INSERT INTO content_fts (rowid, body) VALUES (?, ?)", (file_id, text))
+        if ext in SYMBOL_EXTENSIONS:
+            self._index_symbols(file_id, rel, ext, text)
+
+    def _index_symbols(self, file_id: int, rel: str, ext: str, text: str) -> None:
+        modules: list[str] = []
+        if ext == ".py":
+            try:
+                tree = ast.parse(text)
+            except (SyntaxError, ValueError):
+                return
+            symbols = python_symbols(tree)
+            modules = _python_imports(tree, rel)
+        else:
+            symbols = js_symbols(text)
+        self._conn.executemany(
+            "INSERT INTO symbols (file_id, name, type, line, end_line, parent, signature, docstring, decorators)"
+            " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (file_id, sym.name, sym.type, sym.line, sym.end_line, sym.parent, sym.signature,
+                 sym.docstring, json.dumps(sym.decorators) if sym.decorators else None)
+                for sym in symbols
+            ],
+        )
+        if self._fts and symbols:
+            self._conn.execute(
+                "INSERT INTO symbol_fts (rowid, name) SELECT id, name FROM symbols WHERE file_id = ?", (file_id,)
+            )
+        self._conn.executemany(
+            "INSERT INTO imports (file_id, module) VALUES (?, ?)", [(file_id, m) for m in modules]
+        )
+
+    def _read(self, rel: str, size: int) -> tuple[Optional[str], int]:
+        if size > MAX_CONTENT_BYTES:
+            return None, _LARGE
+        try:
+            data = (self.root / rel).read_bytes()
+        except OSError:
+            return None, _BINARY
+        if b"\0" in data[:8192]:
+            return None, _BINARY
+        return data.decode("utf-8", errors="ignore"), _TEXT
+
+    def _delete(self, file_id: int) -> None:
+        conn = self._conn
+        if self._fts:
+            conn.execute(
+                "DELETE FROM symbol_fts WHERE rowid IN (SELECT id FROM symbols WHERE file_id = ?)", (file_id,)
+            )
+        conn.execute("DELETE FROM symbols WHERE file_id = ?", (file_id,))
+        conn.execute("DELETE FROM imports WHERE file_id = ?", (file_id,))
+        conn.execute("DELETE FROM content_fts WHERE rowid = ?", (file_id,))
+        conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    # ── Internal: queries ──
+
+    def _relative(self, path: Union[str, Path]) -> Optional[str]:
+        p = Path(path)
+        if not p.is_absolute():
+            p = self.root / p
+        try:
+            rel = p.resolve().relative_to(self.root)
+        except (ValueError, OSError):
+            return None
+        return rel.as_posix() if rel.parts else ""
+
+    def _file_filter(
+        self,
+        pattern: str,
+        extensions: Optional[Sequence[str]],
+        directory: Optional[Union[str, Path]],
+    ):
+        """SQL filter over ``files f`` plus an optional path predicate.
+
+        Returns ``(None, [], None)`` when *directory* is outside the root.
+        """
+        clauses, params = ["1"], []
+        path_match = None
+        pattern = pattern or "*"
+        while pattern.startswith("**/"):
+            pattern = pattern[3:]
+        if "/" in pattern:
+            path_match = lambda path, _pattern=pattern: PurePosixPath(path).match(_pattern)  # noqa: E731
+        elif pattern not in ("*", "**"):
+            clauses.append("f.name GLOB ?")
+            params.append(pattern.replace("[!", "[^"))
+        if extensions:
+            exts = [e.lower() for e in extensions]
+            clauses.append(f"f.ext IN ({','.join('?' * len(exts))})")
+            params.extend(exts)
+        if directory is not None:
+            rel = self._relative(directory)
+            if rel is None:
+                return None, [], None
+            if rel:
+                clauses.append("f.path > ? AND f.path < ?")
+                params.extend(_prefix_range(rel))
+        return " AND ".join(clauses), params, path_match
+
+    def _fts_match(self, regex: "re.Pattern[str]") -> Optional[str]:
+        """FTS5 query that every file matching *regex* satisfies, if any."""
+        if not self._fts:
+            return None
+        requirements = [
+            req for req in literal_requirements(regex.pattern, regex.flags)
+            if min(len(lit) for lit in req) >= 3  # trigram minimum
+        ]
+        if not requirements:
+            return None
+        return " AND ".join(
+            "(" + " OR ".join(_fts_phrase(lit) for lit in req) + ")" for req in requirements
+        )
+
+    def _paths_where(self, where: str, params: Sequence[str]) -> list[str]:
+        return [path for (path,) in self._conn.execute(f"SELECT path FROM files WHERE {where}", list(params))]
+
+
+# ── Shared instances ──────────────────────────────────────────────
+
+_indexes: "weakref.WeakValueDictionary[str, WorkspaceIndex]" = weakref.WeakValueDictionary()
+_indexes_lock = threading.Lock()
+
+
+def get_workspace_index(root: Union[str, Path]) -> WorkspaceIndex:
+    """Shared :class:`WorkspaceIndex` for *root* (one per process)."""
+    key = str(Path(root).resolve())
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = WorkspaceIndex(key)
+            _indexes[key] = index
+        return index
+
+
+def notify_changed(path: Union[str, Path]) -> None:
+    """Tell every open index containing *path* that it changed."""
+    p = Path(path).resolve()
+    for index in list(_indexes.values()):
+        if p == index.root or index.root in p.parents:
+            try:
+                index.note_changed(p)
+            except sqlite3.Error as exc:
+                logger.debug("[WorkspaceIndex] update failed for %s: %s", p, exc)
+                index.invalidate()
+
+
+# ── Helpers ───────────────────────────────────────────────────────
+
+
+def _default_db_path(root: Path) -> str:
+    if os.environ.get("BANTZ_WORKSPACE_INDEX", "").strip().lower() in ("memory", "0", "false", "no", "off"):
+        return ":memory:"
+    data_dir = os.environ.get("BANTZ_DATA_DIR", os.path.expanduser("~/.bantz/data"))
+    digest = hashlib.sha1(str(root).encode()).hexdigest()[:12]
+    return os.path.join(data_dir, "workspace_index", f"{root.name or 'root'}-{digest}.db")
+
+
+def _max_age_default() -> float:
+    try:
+        return float(os.environ.get("BANTZ_WORKSPACE_INDEX_MAX_AGE", DEFAULT_MAX_AGE))
+    except ValueError:
+        return DEFAULT_MAX_AGE
+
+
+def _skipped(rel: str) -> bool:
+    return any(part.startswith(".") or part in SKIP_DIRS for part in rel.split("/"))
+
+
+def _prefix_range(rel: str) -> tuple[str, str]:
+    # Every path under "dir/" sorts between "dir/" and "dir0" ('0' follows '/').
+    return rel + "/", rel + "0"
+
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _chunks(items: list, size: int) -> Iterator[list]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+def _module_names(rel: str) -> list[str]:
+    """Dotted names a Python file can be imported as."""
+    parts = rel[:-3].split("/") if rel.endswith(".py") else rel.split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    names = [".".join(parts)] if parts else []
+    if len(parts) > 1 and parts[0] == "src":
+        names.append(".".join(parts[1:]))
+    return names or [""]
+
+
+def _python_imports(tree: ast.AST, rel: str) -> list[str]:
+    """Absolute module names imported by a module (``from a import b`` adds ``a`` and ``a.b``)."""
+    package = rel.split("/")[:-1]
+    modules: dict[str, None] = {}
+    for node in walk_statements(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                modules[alias.name] = None
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                if node.level - 1 > len(package):
+                    continue
+                parts = package[:len(package) - (node.level - 1)]
+                if node.module:
+                    parts = parts + [node.module]
+                base = ".".join(parts)
+            else:
+                base = node.module or ""
+            if not base:
+                continue
+            modules[base] = None
+            for alias in node.names:
+                if alias.name != "*":
+                    modules[f"{base}.{alias.name}"] = None
+    return list(modules)
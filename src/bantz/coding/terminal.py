@@ -6,6 +6,8 @@ Features:
 - Timeout support
 - Background process management
 - Command history
+- Streaming capture: output is read as it arrives into bounded head+tail
+  buffers, optionally published live as ``terminal.output`` events
 """
 from __future__ import annotations
 
@@ -14,13 +16,18 @@ import os
 import shlex
 import signal
 import subprocess
+import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
+from .capture import READ_CHUNK, OutputPublisher, StreamCapture
 from .security import SecurityPolicy, SecurityError, ConfirmationRequired
 
+if TYPE_CHECKING:
+    from bantz.core.events import EventBus
+
 
 @dataclass
 class CommandResult:
@@ -33,6 +40,8 @@ class CommandResult:
     timed_out: bool = False
     killed: bool = False
     pid: Optional[int] = None
+    truncated: bool = False
+    output_bytes: Optional[int] = None  # stdout + stderr as produced, before truncation
     
     @property
     def ok(self) -> bool:
@@ -59,6 +68,8 @@ class CommandResult:
             "timed_out": self.timed_out,
             "killed": self.killed,
             "pid": self.pid,
+            "truncated": self.truncated,
+            "output_bytes": self.output_bytes,
             "ok": self.ok,
         }
 
@@ -84,6 +95,11 @@ class TerminalExecutor:
     - Configurable timeout
     - Background process support
     - Command history tracking
+    - Streaming capture (default): memory per stream is bounded by
+      ``max_output_size`` while the command runs, keeping the head and
+      tail of the output; ``max_total_output`` kills commands that write
+      more than that in total; with an ``event_bus``, output lines are
+      published as ``terminal.output`` events
     """
     
     def __init__(
@@ -94,10 +110,16 @@ class TerminalExecutor:
         max_output_size: int = 1024 * 1024,  # 1MB
         security: Optional[SecurityPolicy] = None,
         shell: str = "/bin/bash",
+        streaming: bool = True,
+        max_total_output: Optional[int] = None,
+        event_bus: Optional["EventBus"] = None,
     ):
         self.cwd = Path(working_dir).resolve()
         self.timeout = timeout
         self.max_output_size = max_output_size
+        self.streaming = streaming
+        self.max_total_output = max_total_output
+        self.event_bus = event_bus
         self._security = security or SecurityPolicy(workspace_root=self.cwd)
         self.shell = shell
         
@@ -149,6 +171,11 @@ class TerminalExecutor:
         if env:
             proc_env.update(env)
         
+        if self.streaming:
+            result = self._run_streaming(command, effective_cwd, proc_env, effective_timeout)
+            self.history.append(result)
+            return result
+        
         # Execute
         start_time = time.time()
         timed_out = False
@@ -246,6 +273,11 @@ class TerminalExecutor:
         effective_timeout = timeout if timeout is not None else self.timeout
         effective_cwd = Path(cwd).resolve() if cwd else self.cwd
         
+        if self.streaming:
+            result = await self._run_streaming_async(command, effective_cwd, effective_timeout)
+            self.history.append(result)
+            return result
+        
         start_time = time.time()
         timed_out = False
         killed = False
@@ -310,6 +342,184 @@ class TerminalExecutor:
         self.history.append(result)
         return result
     
+    # ─────────────────────────────────────────────────────────────────
+    # Streaming Capture
+    # ─────────────────────────────────────────────────────────────────
+    def _start_capture(
+        self, command: str
+    ) -> tuple[StreamCapture, StreamCapture, Optional[OutputPublisher]]:
+        publisher = OutputPublisher(self.event_bus, command) if self.event_bus is not None else None
+        on_lines = publisher.add if publisher else None
+        return (
+            StreamCapture("stdout", self.max_output_size, on_lines),
+            StreamCapture("stderr", self.max_output_size, on_lines),
+            publisher,
+        )
+    
+    def _capture_result(
+        self,
+        command: str,
+        captures: tuple[StreamCapture, StreamCapture],
+        publisher: Optional[OutputPublisher],
+        *,
+        return_code: int,
+        start_time: float,
+        pid: Optional[int],
+        timed_out: bool,
+        killed: bool,
+        over_limit: bool,
+    ) -> CommandResult:
+        out, err = captures
+        stderr = err.text()
+        if over_limit:
+            stderr += f"\n[output limit of {self.max_total_output} bytes exceeded, process killed]"
+        result = CommandResult(
+            command=command,
+            stdout=out.text(),
+            stderr=stderr,
+            return_code=return_code,
+            duration_ms=(time.time() - start_time) * 1000,
+            timed_out=timed_out,
+            killed=killed or over_limit,
+            pid=pid,
+            truncated=out.buffer.truncated or err.buffer.truncated,
+            output_bytes=out.total + err.total,
+        )
+        if publisher:
+            publisher.finish(
+                return_code=result.return_code,
+                ok=result.ok,
+                output_bytes=result.output_bytes,
+                duration_ms=result.duration_ms,
+            )
+        return result
+    
+    def _limit_check(self, captures: tuple[StreamCapture, StreamCapture], kill: Callable[[], None]):
+        """Return a callback that runs *kill* once total output passes the limit."""
+        fired = threading.Event()
+        
+        def check() -> bool:
+            if self.max_total_output is None or fired.is_set():
+                return fired.is_set()
+            if captures[0].total + captures[1].total > self.max_total_output:
+                fired.set()
+                kill()
+            return fired.is_set()
+        
+        return check
+    
+    def _run_streaming(self, command: str, cwd: Path, env: dict, timeout: float) -> CommandResult:
+        """Run with pipes drained by reader threads into bounded buffers."""
+        start_time = time.time()
+        out, err, publisher = self._start_capture(command)
+        pid = None
+        try:
+            proc = subprocess.Popen(
+                command,
+                shell=True,
+                executable=self.shell,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=str(cwd),
+                env=env,
+                preexec_fn=os.setsid if os.name != "nt" else None,
+            )
+        except Exception as e:
+            return CommandResult(
+                command=command,
+                stdout="",
+                stderr=str(e),
+                return_code=-1,
+                duration_ms=(time.time() - start_time) * 1000,
+            )
+        pid = proc.pid
+        if publisher:
+            publisher.pid = pid
+        over_limit = self._limit_check((out, err), lambda: _signal_group(proc, signal.SIGKILL))
+        
+        readers = [
+            threading.Thread(target=_pump, args=(pipe, capture, over_limit), daemon=True, name=f"terminal-{capture.name}")
+            for pipe, capture in ((proc.stdout, out), (proc.stderr, err))
+        ]
+        for reader in readers:
+            reader.start()
+        
+        timed_out = killed = False
+        try:
+            proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            timed_out = True
+            killed = _terminate(proc)
+        # Orphaned grandchildren may hold the pipes open; don't wait on them forever.
+        for reader in readers:
+            reader.join(timeout=5)
+        
+        return self._capture_result(
+            command, (out, err), publisher,
+            return_code=proc.returncode,
+            start_time=start_time,
+            pid=pid,
+            timed_out=timed_out,
+            killed=killed,
+            over_limit=over_limit(),
+        )
+    
+    async def _run_streaming_async(self, command: str, cwd: Path, timeout: float) -> CommandResult:
+        """Async counterpart of :meth:`_run_streaming`."""
+        start_time = time.time()
+        out, err, publisher = self._start_capture(command)
+        try:
+            proc = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(cwd),
+                start_new_session=os.name != "nt",
+            )
+        except Exception as e:
+            return CommandResult(
+                command=command,
+                stdout="",
+                stderr=str(e),
+                return_code=-1,
+                duration_ms=(time.time() - start_time) * 1000,
+            )
+        if publisher:
+            publisher.pid = proc.pid
+        over_limit = self._limit_check((out, err), lambda: _signal_group(proc, signal.SIGKILL))
+        
+        async def pump(stream: asyncio.StreamReader, capture: StreamCapture) -> None:
+            while chunk := await stream.read(READ_CHUNK):
+                capture.feed(chunk)
+                over_limit()
+            capture.close()
+        
+        timed_out = killed = False
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(pump(proc.stdout, out), pump(proc.stderr, err), proc.wait()),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            timed_out = True
+            _signal_group(proc, signal.SIGTERM)
+            try:
+                await asyncio.wait_for(proc.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                _signal_group(proc, signal.SIGKILL)
+                await proc.wait()
+                killed = True
+        
+        return self._capture_result(
+            command, (out, err), publisher,
+            return_code=proc.returncode if proc.returncode is not None else -1,
+            start_time=start_time,
+            pid=proc.pid,
+            timed_out=timed_out,
+            killed=killed,
+            over_limit=over_limit(),
+        )
+    
     # ─────────────────────────────────────────────────────────────────
     # Background Process Management
     # ─────────────────────────────────────────────────────────────────
@@ -514,3 +724,45 @@ class TerminalExecutor:
     def get_working_directory(self) -> str:
         """Get current working directory."""
         return str(self.cwd)
+
+
+
+# ─────────────────────────────────────────────────────────────────
+# Process helpers
+# ─────────────────────────────────────────────────────────────────
+def _signal_group(proc, sig: int) -> None:
+    """Send *sig* to the process group of *proc* (or the process on Windows)."""
+    try:
+        if os.name != "nt":
+            os.killpg(os.getpgid(proc.pid), sig)
+        elif sig == signal.SIGTERM:
+            proc.terminate()
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError, OSError):
+        pass
+
+
+def _terminate(proc: subprocess.Popen) -> bool:
+    """SIGTERM the group, escalating to a kill; returns True if killed."""
+    _signal_group(proc, signal.SIGTERM)
+    try:
+        proc.wait(timeout=5)
+        return False
+    except subprocess.TimeoutExpired:
+        _signal_group(proc, signal.SIGKILL)
+        proc.wait()
+        return True
+
+
+def _pump(pipe, capture: StreamCapture, check_limit: Callable[[], bool]) -> None:
+    """Drain *pipe* into *capture* until EOF (runs on a reader thread)."""
+    try:
+        while chunk := pipe.read1(READ_CHUNK):
+            capture.feed(chunk)
+            check_limit()
+    except (OSError, ValueError):
+        pass
+    finally:
+        capture.close()
+        pipe.close()
@@ -19,6 +19,15 @@ from bantz.coding.editor import CodeEditor
 from bantz.coding.context import ProjectContext
 
 
+def _get_event_bus_safe():
+    """Get the EventBus singleton (for live terminal output), or None."""
+    try:
+        from bantz.core.events import get_event_bus
+        return get_event_bus()
+    except Exception:
+        return None
+
+
 def register_coding_tools(
     registry: ToolRegistry,
     workspace_root: Optional[Path] = None,
@@ -483,7 +492,9 @@ class CodingToolExecutor:
         self.workspace_root = workspace_root
         self.security = security_policy
         self.file_manager = FileManager(workspace_root=workspace_root, security=security_policy)
-        self.terminal = TerminalExecutor(workspace_root, security=security_policy)
+        self.terminal = TerminalExecutor(
+            workspace_root, security=security_policy, event_bus=_get_event_bus_safe()
+        )
         self.editor = CodeEditor(file_manager=self.file_manager)
         self.context = ProjectContext(workspace_root)
         
@@ -614,7 +625,7 @@ class CodingToolExecutor:
             content = params.get("content")
             path = self._resolve_path(params.get("path", "."))
             
-            files = self.file_manager.search_files(path, pattern, content_pattern=content)
+            files = self.file_manager.search_files(pattern, content_pattern=content, directory=path)
             result = "\n".join(files)
             return True, result or "File not found"
         
@@ -628,6 +639,8 @@ class CodingToolExecutor:
                 cwd = self._resolve_path(cwd)
             
             result = self.terminal.run(command, confirmed=confirmed, timeout=timeout, cwd=cwd)
+            # The command may have created, moved or deleted files.
+            self.file_manager.index.invalidate()
             
             output = f"Exit code: {result.exit_code}\n"
             if result.stdout:
@@ -1,7 +1,8 @@
 """Local contacts (name → email) helpers.
 
-This module stores user-specific contacts outside the repo by default, under
-~/.config/bantz/contacts.json (or XDG_CONFIG_HOME).
+This module stores user-specific contacts outside the repo by default, in an
+indexed SQLite database at ~/.config/bantz/contacts.db (or XDG_CONFIG_HOME).
+A legacy contacts.json at the configured (or default) path is imported once.
 
 No contact data is shipped with the repository.
 """
@@ -12,14 +13,22 @@ from .store import (
     contacts_delete,
     contacts_list,
     contacts_resolve,
+    contacts_search,
     contacts_upsert,
+    get_contact_store,
+    get_contacts_db_path,
     get_contacts_path,
+    get_legacy_contacts_path,
 )
 
 __all__ = [
     "get_contacts_path",
+    "get_contacts_db_path",
+    "get_legacy_contacts_path",
+    "get_contact_store",
     "contacts_upsert",
     "contacts_resolve",
     "contacts_list",
+    "contacts_search",
     "contacts_delete",
 ]
@@ -1,15 +1,49 @@
+"""Local contacts store (SQLite, indexed).
+
+Contacts live in a SQLite database next to the legacy ``contacts.json``
+(``~/.config/bantz/contacts.db`` by default, or ``BANTZ_CONTACTS_PATH``
+with a ``.db`` suffix).  Every row carries three lookup keys:
+
+- ``key``    — the normalised name (lower-cased, whitespace collapsed);
+  primary key, also used for prefix listing
+- ``folded`` — Turkish-folded name (``ç→c ğ→g ı/İ→i ö→o ş→s ü→u``,
+  accents stripped, case suffixes after an apostrophe dropped), indexed
+- ``email_lc`` — lower-cased address, indexed
+
+plus per-word trigrams in ``contact_trigrams`` for fuzzy matching.
+Resolving ``"Ahmet'e"`` is therefore an indexed lookup (exact key →
+folded name → trigram candidates) instead of re-reading and re-parsing
+the whole JSON file, and writes touch one row instead of rewriting it.
+
+An existing ``contacts.json`` (the configured path, or the default one
+when the configured path is already a database) is imported once, the
+first time the database is opened with it present; the JSON file is left
+in place untouched.  Tool results report the configured path as ``path``
+and the database as ``db_path``.
+"""
+
 from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 import json
 import os
 import re
-import tempfile
+import sqlite3
+import threading
+import time
+import unicodedata
 
 
 _CONTACTS_VERSION = 1
+_SCHEMA_VERSION = 1
+
+# Fuzzy resolution: minimum score, and how far ahead of the runner-up the
+# best candidate must be to resolve without asking.
+FUZZY_THRESHOLD = 0.6
+FUZZY_MARGIN = 0.1
+_FUZZY_CANDIDATES = 32
 
 
 def _default_contacts_path() -> Path:
@@ -18,18 +52,96 @@ def _default_contacts_path() -> Path:
 
 
 def get_contacts_path(path: Optional[str] = None) -> Path:
+    """Configured contacts path (the legacy JSON location)."""
     raw = (path or "").strip() or (os.getenv("BANTZ_CONTACTS_PATH") or "").strip()
     if raw:
         return Path(os.path.expanduser(raw)).resolve()
     return _default_contacts_path()
 
 
+def get_legacy_contacts_path(path: Optional[str] = None) -> Path:
+    """``contacts.json`` to migrate from: the configured path, unless that
+    already names a database, in which case the default location."""
+    p = get_contacts_path(path)
+    if p.suffix in (".db", ".sqlite", ".sqlite3"):
+        return _default_contacts_path()
+    return p
+
+
+def get_contacts_db_path(path: Optional[str] = None) -> Path:
+    """SQLite database for the configured contacts path.
+
+    ``.db``/``.sqlite`` paths are used as-is; anything else (e.g. a
+    ``contacts.json`` path) maps to a sibling ``.db`` file.
+    """
+    p = get_contacts_path(path)
+    if p.suffix in (".db", ".sqlite", ".sqlite3"):
+        return p
+    return p.with_suffix(".db")
+
+
+# ── normalisation ────────────────────────────────────────────────────
+
+
 def _normalize_key(name: str) -> str:
     s = str(name or "").strip().lower()
     s = re.sub(r"\s+", " ", s)
     return s
 
 
+# Turkish letters folded to ASCII before lower-casing ("İ".lower() would
+# otherwise yield "i" + combining dot).
+_TR_FOLD = str.maketrans({
+    "ç": "c", "Ç": "c", "ğ": "g", "Ğ": "g", "ı": "i", "I": "i", "İ": "i",
+    "ö": "o", "Ö": "o", "ş": "s", "Ş": "s", "ü": "u", "Ü": "u",
+    "â": "a", "Â": "a", "î": "i", "Î": "i", "û": "u", "Û": "u",
+})
+
+# Case suffixes written after an apostrophe on proper nouns
+# ("Ahmet'e", "Ayşe'ye", "Ali'den", "Zeynep'in") — matched after folding.
+_APOSTROPHE_SUFFIX_RE = re.compile(
+    r"['’`´](?:y?[aeiu]|n?d[ae]n?|n?t[ae]n?|n?[iu]n|y?l[ae]|n[ae]|s?[iu])\b"
+)
+_NON_WORD_RE = re.compile(r"[^\w]+")
+
+
+def _fold(text: str) -> str:
+    """Turkish-insensitive search form of a name or query."""
+    s = str(text or "").translate(_TR_FOLD).lower()
+    s = unicodedata.normalize("NFKD", s)
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = _APOSTROPHE_SUFFIX_RE.sub("", s)
+    s = _NON_WORD_RE.sub(" ", s.replace("'", "").replace("’", ""))
+    return " ".join(s.split())
+
+
+def _trigrams(folded: str) -> set[str]:
+    """Per-word trigrams, each word padded as ``"  word "``."""
+    grams: set[str] = set()
+    for word in folded.split():
+        padded = f"  {word} "
+        for i in range(len(padded) - 2):
+            grams.add(padded[i : i + 3])
+    return grams
+
+
+def _score(shared: int, n_query: int, n_candidate: int) -> float:
+    """Mean of query containment and Dice similarity, in ``[0, 1]``.
+
+    Containment lets a first name match a full name ("ahmet" → "ahmet
+    yilmaz"); Dice prefers the candidate closest in length when several
+    contain the query.
+    """
+    if not n_query or not n_candidate:
+        return 0.0
+    containment = shared / n_query
+    dice = 2.0 * shared / (n_query + n_candidate)
+    return round((containment + dice) / 2.0, 4)
+
+
+# ── legacy JSON (migration source) ───────────────────────────────────
+
+
 def _read_contacts(path: Path) -> dict[str, Any]:
     if not path.exists():
         return {"version": _CONTACTS_VERSION, "contacts": {}}
@@ -45,22 +157,6 @@ def _read_contacts(path: Path) -> dict[str, Any]:
         return {"version": _CONTACTS_VERSION, "contacts": {}}
 
 
-def _atomic_write_json(path: Path, data: dict[str, Any]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    tmp_fd, tmp_name = tempfile.mkstemp(prefix="contacts_", suffix=".json", dir=str(path.parent))
-    try:
-        with os.fdopen(tmp_fd, "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-            f.write("\n")
-        Path(tmp_name).replace(path)
-    finally:
-        try:
-            if Path(tmp_name).exists() and Path(tmp_name) != path:
-                Path(tmp_name).unlink(missing_ok=True)
-        except Exception:
-            pass
-
-
 @dataclass(frozen=True)
 class Contact:
     key: str
@@ -75,6 +171,278 @@ class Contact:
         return out
 
 
+# ── store ────────────────────────────────────────────────────────────
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS contacts (
+    key        TEXT PRIMARY KEY,
+    name       TEXT NOT NULL,
+    email      TEXT NOT NULL,
+    email_lc   TEXT NOT NULL,
+    notes      TEXT,
+    folded     TEXT NOT NULL,
+    ntri       INTEGER NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_contacts_folded ON contacts(folded);
+CREATE INDEX IF NOT EXISTS idx_contacts_email ON contacts(email_lc);
+CREATE TABLE IF NOT EXISTS contact_trigrams (
+    trigram TEXT NOT NULL,
+    key     TEXT NOT NULL,
+    PRIMARY KEY (trigram, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_contact_trigrams_key ON contact_trigrams(key);
+CREATE TABLE IF NOT EXISTS meta (
+    k TEXT PRIMARY KEY,
+    v TEXT
+);
+"""
+
+_COLUMNS = "key, name, email, notes"
+
+
+def _row_dict(row: sqlite3.Row | tuple) -> dict[str, Any]:
+    return {"key": row[0], "name": row[1], "email": row[2], "notes": row[3]}
+
+
+def _prefix_upper(prefix: str) -> str:
+    # Exclusive upper bound for a ``col >= prefix AND col < upper`` range scan.
+    return prefix + "\U0010ffff"
+
+
+class ContactStore:
+    """SQLite-backed contacts with name, email and trigram indexes.
+
+    One instance per database file (see :func:`get_contact_store`); the
+    connection is shared across threads behind a lock.
+
+    Args:
+        db_path: SQLite file (created on first use).
+        legacy_json: ``contacts.json`` to import once, if present.
+    """
+
+    def __init__(self, db_path: Path, legacy_json: Optional[Path] = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, timeout=5.0)
+        try:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.OperationalError:
+            pass
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._lock, self._conn:
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute(
+                "INSERT OR IGNORE INTO meta (k, v) VALUES ('schema_version', ?)",
+                (str(_SCHEMA_VERSION),),
+            )
+        if legacy_json is not None:
+            self._migrate_json(Path(legacy_json))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    # ── migration ──
+
+    def _migrate_json(self, json_path: Path) -> int:
+        """Import *json_path* once; returns the number of contacts imported.
+
+        Nothing is recorded while the file does not exist, so a JSON file
+        that shows up later is still imported.
+        """
+        with self._lock:
+            done = self._conn.execute("SELECT v FROM meta WHERE k = 'json_migrated'").fetchone()
+            if done is not None or not json_path.is_file():
+                return 0
+            data = _read_contacts(json_path)
+            rows = []
+            for key, raw in (data.get("contacts") or {}).items():
+                if not isinstance(raw, dict):
+                    continue
+                name = str(raw.get("name") or key).strip()
+                email = str(raw.get("email") or "").strip()
+                k = _normalize_key(key) or _normalize_key(name)
+                if k:
+                    rows.append((k, name, email, raw.get("notes")))
+            with self._conn:
+                self._put_many(rows)
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (k, v) VALUES ('json_migrated', ?)",
+                    (str(json_path),),
+                )
+            return len(rows)
+
+    # ── writes ──
+
+    def _put_many(self, rows: Iterable[tuple[str, str, str, Optional[str]]]) -> None:
+        now = time.time()
+        conn = self._conn
+        for key, name, email, notes in rows:
+            folded = _fold(name)
+            grams = _trigrams(folded)
+            conn.execute(
+                "INSERT OR REPLACE INTO contacts "
+                "(key, name, email, email_lc, notes, folded, ntri, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, name, email, email.lower(), notes, folded, len(grams), now),
+            )
+            conn.execute("DELETE FROM contact_trigrams WHERE key = ?", (key,))
+            conn.executemany(
+                "INSERT OR IGNORE INTO contact_trigrams (trigram, key) VALUES (?, ?)",
+                [(g, key) for g in grams],
+            )
+
+    def upsert(self, contact: Contact) -> None:
+        with self._lock, self._conn:
+            self._put_many([(contact.key, contact.name, contact.email, contact.notes)])
+
+    def upsert_many(self, contacts: Iterable[Contact]) -> int:
+        """Upsert several contacts in one transaction (e.g. a Google sync)."""
+        rows = [(c.key, c.name, c.email, c.notes) for c in contacts]
+        with self._lock, self._conn:
+            self._put_many(rows)
+        return len(rows)
+
+    def delete(self, key: str) -> bool:
+        with self._lock, self._conn:
+            cur = self._conn.execute("DELETE FROM contacts WHERE key = ?", (key,))
+            self._conn.execute("DELETE FROM contact_trigrams WHERE key = ?", (key,))
+            return cur.rowcount > 0
+
+    # ── reads ──
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM contacts WHERE key = ?", (key,)
+            ).fetchone()
+        return _row_dict(row) if row else None
+
+    def by_email(self, email: str) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM contacts WHERE email_lc = ? ORDER BY key",
+                (email.strip().lower(),),
+            ).fetchall()
+        return [_row_dict(r) for r in rows]
+
+    def by_folded(self, folded: str) -> list[dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM contacts WHERE folded = ? ORDER BY key", (folded,)
+            ).fetchall()
+        return [_row_dict(r) for r in rows]
+
+    def fuzzy(self, folded: str, limit: int = _FUZZY_CANDIDATES) -> list[dict[str, Any]]:
+        """Trigram candidates for *folded*, best first, each with a ``score``."""
+        grams = sorted(_trigrams(folded))
+        if not grams:
+            return []
+        # Candidates must share at least a third of the query's trigrams.
+        min_shared = max(1, len(grams) // 3)
+        marks = ",".join("?" * len(grams))
+        sql = (
+            f"SELECT c.key, c.name, c.email, c.notes, c.ntri, t.n FROM ("
+            f"  SELECT key, COUNT(*) AS n FROM contact_trigrams"
+            f"  WHERE trigram IN ({marks}) GROUP BY key HAVING n >= ?"
+            f"  ORDER BY n DESC LIMIT ?"
+            f") AS t JOIN contacts AS c ON c.key = t.key"
+        )
+        with self._lock:
+            rows = self._conn.execute(sql, (*grams, min_shared, limit)).fetchall()
+        out = []
+        for row in rows:
+            item = _row_dict(row)
+            item["score"] = _score(row[5], len(grams), row[4])
+            out.append(item)
+        out.sort(key=lambda c: (-c["score"], c["key"]))
+        return out
+
+    def list_prefix(self, prefix: str = "", limit: int = 50) -> list[dict[str, Any]]:
+        with self._lock:
+            if prefix:
+                rows = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM contacts WHERE key >= ? AND key < ? "
+                    "ORDER BY key LIMIT ?",
+                    (prefix, _prefix_upper(prefix), limit),
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM contacts ORDER BY key LIMIT ?", (limit,)
+                ).fetchall()
+        return [_row_dict(r) for r in rows]
+
+    def search(self, query: str, limit: int = 10) -> list[dict[str, Any]]:
+        """Prefix matches on folded name / email, then fuzzy name matches."""
+        folded = _fold(query)
+        q_lc = str(query or "").strip().lower()
+        seen: dict[str, dict[str, Any]] = {}
+        with self._lock:
+            if folded:
+                for row in self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM contacts WHERE folded >= ? AND folded < ? "
+                    "ORDER BY folded LIMIT ?",
+                    (folded, _prefix_upper(folded), limit),
+                ):
+                    seen.setdefault(row[0], {**_row_dict(row), "score": 1.0})
+            if q_lc:
+                for row in self._conn.execute(
+                    f"SELECT {_COLUMNS} FROM contacts WHERE email_lc >= ? AND email_lc < ? "
+                    "ORDER BY email_lc LIMIT ?",
+                    (q_lc, _prefix_upper(q_lc), limit),
+                ):
+                    seen.setdefault(row[0], {**_row_dict(row), "score": 1.0})
+        if folded and len(seen) < limit:
+            for item in self.fuzzy(folded):
+                if item["key"] not in seen and item["score"] >= FUZZY_THRESHOLD:
+                    seen[item["key"]] = item
+        ranked = sorted(seen.values(), key=lambda c: (-c["score"], c["key"]))
+        return ranked[:limit]
+
+    def count(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM contacts").fetchone()[0])
+
+
+_stores: dict[Path, ContactStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_contact_store(path: Optional[str] = None) -> ContactStore:
+    """Shared :class:`ContactStore` for the configured contacts path."""
+    db_path = get_contacts_db_path(path)
+    store = _stores.get(db_path)
+    if store is not None:
+        return store
+    with _stores_lock:
+        store = _stores.get(db_path)
+        if store is None:
+            store = ContactStore(db_path, legacy_json=get_legacy_contacts_path(path))
+            _stores[db_path] = store
+    return store
+
+
+def reset_contact_stores() -> None:
+    """Close and forget all open stores (tests, path changes)."""
+    with _stores_lock:
+        for store in _stores.values():
+            try:
+                store.close()
+            except Exception:
+                pass
+        _stores.clear()
+
+
+# ── tool functions ───────────────────────────────────────────────────
+
+
+def _locations(path: Optional[str], store: ContactStore) -> dict[str, str]:
+    """``path`` (configured contacts path, as before) and ``db_path``."""
+    return {"path": str(get_contacts_path(path)), "db_path": str(store.db_path)}
+
+
 def contacts_upsert(
     *,
     name: str,
@@ -95,51 +463,108 @@ def contacts_upsert(
     if not addr or "@" not in addr:
         raise ValueError("email must look like an email address")
 
-    p = get_contacts_path(path)
-    data = _read_contacts(p)
-    contacts = data.get("contacts")
-    if not isinstance(contacts, dict):
-        contacts = {}
-        data["contacts"] = contacts
-
+    store = get_contact_store(path)
     contact = Contact(key=key, name=str(name).strip(), email=addr, notes=(str(notes).strip() if notes else None))
-    contacts[key] = contact.to_dict()
-    data["version"] = _CONTACTS_VERSION
+    store.upsert(contact)
+
+    return {"ok": True, "contact": {"key": key, **contact.to_dict()}, **_locations(path, store)}
+
+
+def _resolved(found: dict[str, Any], *, match: str, score: float, loc: dict[str, str]) -> dict[str, Any]:
+    email = str(found.get("email") or "").strip()
+    if not email:
+        return {
+            "ok": False,
+            "error": "contact_missing_email",
+            "name": found.get("name"),
+            "key": found["key"],
+            **loc,
+        }
+    return {
+        "ok": True,
+        "name": str(found.get("name") or found["key"]),
+        "key": found["key"],
+        "email": email,
+        "notes": found.get("notes"),
+        "match": match,
+        "score": score,
+        **loc,
+    }
+
 
-    _atomic_write_json(p, data)
+def _ambiguous(name: str, key: str, candidates: list[dict[str, Any]], loc: dict[str, str]) -> dict[str, Any]:
+    return {
+        "ok": False,
+        "error": "contact_ambiguous",
+        "name": name,
+        "key": key,
+        "candidates": [
+            {k: c.get(k) for k in ("key", "name", "email", "score") if k in c}
+            for c in candidates
+        ],
+        **loc,
+    }
 
-    return {"ok": True, "contact": {"key": key, **contact.to_dict()}, "path": str(p)}
 
+def contacts_resolve(*, name: str, path: Optional[str] = None, fuzzy: bool = True) -> dict[str, Any]:
+    """Resolve a contact name (or email) to an email address. SAFE.
 
-def contacts_resolve(*, name: str, path: Optional[str] = None) -> dict[str, Any]:
-    """Resolve a contact name to an email address. SAFE."""
+    Lookup order: email index (when *name* contains ``@``), exact
+    normalised key, Turkish-folded name, then — if *fuzzy* — trigram
+    similarity.  ``match`` in the result says which step hit.  Several
+    equally good folded/fuzzy hits return ``contact_ambiguous`` with the
+    ``candidates`` instead of guessing.
+    """
 
     key = _normalize_key(name)
     if not key:
         raise ValueError("name must be non-empty")
 
-    p = get_contacts_path(path)
-    data = _read_contacts(p)
-    contacts = data.get("contacts")
-    if not isinstance(contacts, dict):
-        contacts = {}
+    store = get_contact_store(path)
+    loc = _locations(path, store)
 
-    raw = contacts.get(key)
-    if not isinstance(raw, dict):
-        return {"ok": False, "error": "contact_not_found", "name": name, "key": key, "path": str(p)}
+    if "@" in key:
+        hits = store.by_email(key)
+        if len(hits) == 1:
+            return _resolved(hits[0], match="email", score=1.0, loc=loc)
 
-    email = str(raw.get("email") or "").strip()
-    if not email:
-        return {"ok": False, "error": "contact_missing_email", "name": name, "key": key, "path": str(p)}
+    hit = store.get(key)
+    if hit is not None:
+        return _resolved(hit, match="exact", score=1.0, loc=loc)
 
-    return {
-        "ok": True,
-        "name": str(raw.get("name") or name),
-        "key": key,
-        "email": email,
-        "notes": raw.get("notes"),
-        "path": str(p),
-    }
+    folded = _fold(name)
+    if folded:
+        hits = store.by_folded(folded)
+        if len(hits) == 1:
+            return _resolved(hits[0], match="folded", score=1.0, loc=loc)
+        if len(hits) > 1:
+            return _ambiguous(name, key, hits, loc)
+
+        if fuzzy:
+            scored = [c for c in store.fuzzy(folded) if c["score"] >= FUZZY_THRESHOLD]
+            if scored:
+                best = scored[0]
+                rivals = [c for c in scored[1:] if best["score"] - c["score"] < FUZZY_MARGIN]
+                if rivals:
+                    return _ambiguous(name, key, [best, *rivals], loc)
+                return _resolved(best, match="fuzzy", score=best["score"], loc=loc)
+
+    return {"ok": False, "error": "contact_not_found", "name": name, "key": key, **loc}
+
+
+def contacts_search(
+    *,
+    query: str,
+    limit: int = 10,
+    path: Optional[str] = None,
+) -> dict[str, Any]:
+    """Search contacts by name or email fragment (Turkish-insensitive). SAFE."""
+
+    if not isinstance(limit, int) or limit <= 0:
+        raise ValueError("limit must be a positive integer")
+
+    store = get_contact_store(path)
+    return {"ok": True, "contacts": store.search(query, limit=limit), **_locations(path, store)}
 
 
 def contacts_list(
@@ -153,33 +578,10 @@ def contacts_list(
     if not isinstance(limit, int) or limit <= 0:
         raise ValueError("limit must be a positive integer")
 
-    p = get_contacts_path(path)
-    data = _read_contacts(p)
-    contacts = data.get("contacts")
-    if not isinstance(contacts, dict):
-        contacts = {}
-
+    store = get_contact_store(path)
     pref = _normalize_key(prefix) if prefix else ""
 
-    out: list[dict[str, Any]] = []
-    for k in sorted(contacts.keys()):
-        if pref and not str(k).startswith(pref):
-            continue
-        raw = contacts.get(k)
-        if not isinstance(raw, dict):
-            continue
-        out.append(
-            {
-                "key": str(k),
-                "name": str(raw.get("name") or ""),
-                "email": str(raw.get("email") or ""),
-                "notes": raw.get("notes"),
-            }
-        )
-        if len(out) >= limit:
-            break
-
-    return {"ok": True, "contacts": out, "path": str(p)}
+    return {"ok": True, "contacts": store.list_prefix(pref, limit), **_locations(path, store)}
 
 
 def contacts_delete(*, name: str, path: Optional[str] = None) -> dict[str, Any]:
@@ -189,17 +591,7 @@ def contacts_delete(*, name: str, path: Optional[str] = None) -> dict[str, Any]:
     if not key:
         raise ValueError("name must be non-empty")
 
-    p = get_contacts_path(path)
-    data = _read_contacts(p)
-    contacts = data.get("contacts")
-    if not isinstance(contacts, dict):
-        contacts = {}
-        data["contacts"] = contacts
-
-    existed = key in contacts
-    if existed:
-        contacts.pop(key, None)
-        data["version"] = _CONTACTS_VERSION
-        _atomic_write_json(p, data)
-
-    return {"ok": True, "deleted": bool(existed), "key": key, "path": str(p)}
+    store = get_contact_store(path)
+    existed = store.delete(key)
+
+    return {"ok": True, "deleted": bool(existed), "key": key, **_locations(path, store)}
@@ -12,7 +12,7 @@ from __future__ import annotations
 import importlib
 from typing import Any
 
-from bantz.core.events import EventBus, Event, get_event_bus, EventType
+from bantz.core.events import EventBus, Event, get_event_bus, EventType, OverflowPolicy
 from bantz.core.subscriber_registry import (
     wire_subscribers,
     unwire_all,
@@ -79,6 +79,7 @@ __all__ = [
     "Event",
     "get_event_bus",
     "EventType",
+    "OverflowPolicy",
     # Subscriber Registry (Issue #1297)
     "wire_subscribers",
     "unwire_all",
@@ -10,6 +10,8 @@ Features:
 - Correlation ID for run tracking
 - Fire-and-forget error handling
 - Thread-safe history
+- Optional queued dispatch: per-subscriber bounded queues drained by
+  worker threads, so a slow subscriber never blocks the publisher
 
 Events flow:
 - tool_runner → publish("tool.executed", {...})
@@ -20,13 +22,16 @@ Events flow:
 from __future__ import annotations
 
 import asyncio
+import itertools
 import logging
+import os
 import threading
-from collections import deque
+import time
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -101,6 +106,7 @@ class EventType(Enum):
     TOOL_FAILED = "tool.failed"          # Tool encountered an error
     TOOL_CONFIRMED = "tool.confirmed"    # User confirmed
     TOOL_DENIED = "tool.denied"          # User denied
+    TERMINAL_OUTPUT = "terminal.output"  # Live command output lines
 
     # === Data Events (Issue #1297) ===
     MAIL_RECEIVED = "mail.received"      # New mail received
@@ -163,6 +169,188 @@ Middleware = Callable[[Event], Optional[Event]]  # Sync middleware
 AsyncMiddleware = Callable[[Event], Any]  # Async middleware (returns Event|None)
 
 
+# ─────────────────────────────────────────────────────────────────
+# Queued dispatch
+# ─────────────────────────────────────────────────────────────────
+
+DISPATCH_SYNC = "sync"
+DISPATCH_QUEUED = "queued"
+_DISPATCH_MODES = (DISPATCH_SYNC, DISPATCH_QUEUED)
+
+
+class OverflowPolicy(str, Enum):
+    """What a full subscriber queue does with a new event."""
+    DROP_OLDEST = "drop_oldest"  # evict the oldest pending event
+    DROP_NEWEST = "drop_newest"  # discard the incoming event
+    COALESCE = "coalesce"        # replace a pending event with the same key
+
+
+CoalesceKey = Callable[[Event], Optional[Hashable]]
+
+
+def progress_coalesce_key(event: Event) -> Optional[Hashable]:
+    """Coalesce progress-style events per run; everything else is kept.
+
+    ``progress`` and ``*.progress`` events only matter for their latest
+    value, so a pending one is overwritten by the next with the same
+    type and correlation ID.
+    """
+    et = event.event_type
+    if et == EventType.PROGRESS.value or et.endswith(".progress"):
+        return (et, event.correlation_id)
+    return None
+
+
+class SubscriberQueue:
+    """Bounded queue + worker thread for one subscriber (queued dispatch).
+
+    Calling the instance enqueues the event and returns immediately; a
+    daemon worker drains the queue and invokes the wrapped handler.
+    Pending events live in an ``OrderedDict`` so the COALESCE policy can
+    overwrite an entry in place without losing its queue position.
+
+    Args:
+        handler: The subscriber callback.
+        event_type: Pattern it was subscribed with (for stats).
+        maxsize: Max pending events.
+        overflow: Policy applied when the queue is full.
+        coalesce_key: Key function for COALESCE (``None`` from the key
+            function means "never coalesce this event").
+    """
+
+    def __init__(
+        self,
+        handler: EventHandler,
+        *,
+        event_type: str = "*",
+        maxsize: int = 256,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+        coalesce_key: Optional[CoalesceKey] = None,
+    ) -> None:
+        self.handler = handler
+        self.event_type = event_type
+        self.name = getattr(handler, "__qualname__", None) or repr(handler)
+        self.maxsize = max(1, int(maxsize))
+        self.overflow = OverflowPolicy(overflow)
+        self._coalesce_key = coalesce_key or (lambda e: (e.event_type, e.correlation_id))
+        self._pending: "OrderedDict[Hashable, tuple[Event, float]]" = OrderedDict()
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+        # metrics
+        self.enqueued = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.errors = 0
+        self.max_depth = 0
+        self.last_lag_ms = 0.0
+        self.max_lag_ms = 0.0
+        self._lag_total_ms = 0.0
+
+    def __call__(self, event: Event) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self.enqueued += 1
+            key: Hashable = None
+            if self.overflow is OverflowPolicy.COALESCE:
+                key = self._coalesce_key(event)
+                if key is not None and key in self._pending:
+                    self._pending[key] = (event, self._pending[key][1])
+                    self.coalesced += 1
+                    return
+            if key is None:
+                key = ("_seq", next(self._seq))
+            if len(self._pending) >= self.maxsize:
+                self.dropped += 1
+                if self.overflow is OverflowPolicy.DROP_NEWEST:
+                    return
+                self._pending.popitem(last=False)
+            self._pending[key] = (event, time.monotonic())
+            self.max_depth = max(self.max_depth, len(self._pending))
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name=f"eventbus-{self.name}"[:60], daemon=True,
+                )
+                self._worker.start()
+            self._cond.notify()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                _, (event, enqueued_at) = self._pending.popitem(last=False)
+                self._busy = True
+            lag_ms = (time.monotonic() - enqueued_at) * 1000
+            try:
+                self.handler(event)
+            except Exception as exc:
+                self.errors += 1
+                logger.error(
+                    "[EventBus] Handler %s error on %s: %s",
+                    self.name, event.event_type, exc,
+                )
+            with self._cond:
+                self._busy = False
+                self.delivered += 1
+                self.last_lag_ms = lag_ms
+                self.max_lag_ms = max(self.max_lag_ms, lag_ms)
+                self._lag_total_ms += lag_ms
+                self._cond.notify_all()
+
+    @property
+    def depth(self) -> int:
+        with self._cond:
+            return len(self._pending)
+
+    def join(self, timeout: Optional[float] = None) -> bool:
+        """Wait until the queue is empty and the handler idle."""
+        with self._cond:
+            return self._cond.wait_for(
+                lambda: not self._pending and not self._busy, timeout=timeout,
+            )
+
+    def close(self, timeout: Optional[float] = 1.0) -> None:
+        """Stop accepting events; let the worker drain and exit."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            worker = self._worker
+        if worker is not None and worker is not threading.current_thread():
+            worker.join(timeout)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "subscriber": self.name,
+                "event_type": self.event_type,
+                "overflow": self.overflow.value,
+                "depth": len(self._pending),
+                "max_depth": self.max_depth,
+                "enqueued": self.enqueued,
+                "delivered": self.delivered,
+                "dropped": self.dropped,
+                "coalesced": self.coalesced,
+                "errors": self.errors,
+                "last_lag_ms": round(self.last_lag_ms, 2),
+                "max_lag_ms": round(self.max_lag_ms, 2),
+                "avg_lag_ms": (
+                    round(self._lag_total_ms / self.delivered, 2) if self.delivered else 0.0
+                ),
+            }
+
+
+def _default_dispatch() -> str:
+    raw = os.getenv("BANTZ_EVENT_DISPATCH", DISPATCH_SYNC).strip().lower()
+    return raw if raw in _DISPATCH_MODES else DISPATCH_SYNC
+
+
 class EventBus:
     """Pub/sub event bus with wildcard matching, middleware, and async support.
 
@@ -174,9 +362,31 @@ class EventBus:
     - Middleware chain: transform/filter events before dispatch
     - Async publish: ``apublish()`` for coroutine handlers
     - Fire-and-forget: subscriber errors never block the publisher
+    - Dispatch modes:
+
+      - ``"sync"`` (default) — sync handlers run inline on the
+        publisher's thread; deterministic, used by tests
+      - ``"queued"`` — each sync subscriber gets a bounded
+        :class:`SubscriberQueue` and worker, so ``publish()`` only
+        enqueues.  ``subscribe(..., inline=True)`` opts a handler out.
+
+      The default comes from ``BANTZ_EVENT_DISPATCH``.
     """
 
-    def __init__(self, history_size: int = 100) -> None:
+    def __init__(
+        self,
+        history_size: int = 100,
+        *,
+        dispatch: Optional[str] = None,
+        queue_size: int = 256,
+        overflow: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        dispatch = dispatch or _default_dispatch()
+        if dispatch not in _DISPATCH_MODES:
+            raise ValueError(f"Unknown dispatch mode {dispatch!r}; expected one of {_DISPATCH_MODES}")
+        self._dispatch = dispatch
+        self._queue_size = queue_size
+        self._overflow = OverflowPolicy(overflow)
         self._subscribers: Dict[str, List[EventHandler]] = {}
         self._async_subscribers: Dict[str, List[AsyncEventHandler]] = {}
         self._global_subscribers: List[EventHandler] = []
@@ -186,20 +396,58 @@ class EventBus:
         self._history: deque[Event] = deque(maxlen=history_size)
         self._lock = threading.Lock()
 
+    @property
+    def dispatch(self) -> str:
+        """``"sync"`` or ``"queued"``."""
+        return self._dispatch
+
     # ── Subscribe ────────────────────────────────────────────────
 
-    def subscribe(self, event_type: str, handler: EventHandler) -> None:
+    def _wrap(
+        self,
+        event_type: str,
+        handler: EventHandler,
+        inline: bool,
+        maxsize: Optional[int],
+        overflow: Optional[OverflowPolicy],
+        coalesce_key: Optional[CoalesceKey],
+    ) -> EventHandler:
+        if inline or self._dispatch != DISPATCH_QUEUED:
+            return handler
+        return SubscriberQueue(
+            handler,
+            event_type=event_type,
+            maxsize=maxsize or self._queue_size,
+            overflow=overflow or self._overflow,
+            coalesce_key=coalesce_key,
+        )
+
+    def subscribe(
+        self,
+        event_type: str,
+        handler: EventHandler,
+        *,
+        inline: bool = False,
+        maxsize: Optional[int] = None,
+        overflow: Optional[OverflowPolicy] = None,
+        coalesce_key: Optional[CoalesceKey] = None,
+    ) -> None:
         """Subscribe to a specific event type.
 
         Supports wildcard prefix patterns:
         - ``"tool.executed"`` — exact match
         - ``"tool.*"`` — matches any event starting with ``tool.``
         - Use ``subscribe_all()`` for catch-all.
+
+        The keyword options only apply in queued dispatch: *inline* keeps
+        the handler on the publisher's thread; *maxsize*, *overflow* and
+        *coalesce_key* configure its queue (bus defaults otherwise).
         """
+        wrapped = self._wrap(event_type, handler, inline, maxsize, overflow, coalesce_key)
         with self._lock:
             if event_type not in self._subscribers:
                 self._subscribers[event_type] = []
-            self._subscribers[event_type].append(handler)
+            self._subscribers[event_type].append(wrapped)
 
     def subscribe_async(
         self, event_type: str, handler: AsyncEventHandler
@@ -213,10 +461,19 @@ class EventBus:
                 self._async_subscribers[event_type] = []
             self._async_subscribers[event_type].append(handler)
 
-    def subscribe_all(self, handler: EventHandler) -> None:
-        """Subscribe to ALL events (catch-all)."""
+    def subscribe_all(
+        self,
+        handler: EventHandler,
+        *,
+        inline: bool = False,
+        maxsize: Optional[int] = None,
+        overflow: Optional[OverflowPolicy] = None,
+        coalesce_key: Optional[CoalesceKey] = None,
+    ) -> None:
+        """Subscribe to ALL events (catch-all).  Options as in ``subscribe()``."""
+        wrapped = self._wrap("*", handler, inline, maxsize, overflow, coalesce_key)
         with self._lock:
-            self._global_subscribers.append(handler)
+            self._global_subscribers.append(wrapped)
 
     def subscribe_all_async(self, handler: AsyncEventHandler) -> None:
         """Subscribe an async handler to ALL events."""
@@ -225,22 +482,27 @@ class EventBus:
 
     # ── Unsubscribe ──────────────────────────────────────────────
 
+    @staticmethod
+    def _remove(handlers: List[EventHandler], handler: EventHandler) -> None:
+        for i, h in enumerate(handlers):
+            if h is handler or h == handler or (
+                isinstance(h, SubscriberQueue) and (h.handler is handler or h.handler == handler)
+            ):
+                del handlers[i]
+                if isinstance(h, SubscriberQueue):
+                    h.close(timeout=0)
+                return
+
     def unsubscribe(self, event_type: str, handler: EventHandler) -> None:
         """Unsubscribe from an event type."""
         with self._lock:
             if event_type in self._subscribers:
-                try:
-                    self._subscribers[event_type].remove(handler)
-                except ValueError:
-                    pass
+                self._remove(self._subscribers[event_type], handler)
 
     def unsubscribe_all(self, handler: EventHandler) -> None:
         """Unsubscribe from global subscription."""
         with self._lock:
-            try:
-                self._global_subscribers.remove(handler)
-            except ValueError:
-                pass
+            self._remove(self._global_subscribers, handler)
 
     # ── Middleware ────────────────────────────────────────────────
 
@@ -398,6 +660,35 @@ class EventBus:
         with self._lock:
             self._history.clear()
 
+    # ── Queued dispatch ──────────────────────────────────────────
+
+    def _queues(self) -> List[SubscriberQueue]:
+        with self._lock:
+            handlers = [h for subs in self._subscribers.values() for h in subs]
+            handlers.extend(self._global_subscribers)
+        return [h for h in handlers if isinstance(h, SubscriberQueue)]
+
+    def subscriber_stats(self) -> List[Dict[str, Any]]:
+        """Per-subscriber queue depth, drops, coalesces and lag (queued mode)."""
+        return [q.stats() for q in self._queues()]
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until every subscriber queue is drained.
+
+        Returns ``False`` if *timeout* elapsed first.  No-op in sync mode.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        for q in self._queues():
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not q.join(remaining):
+                return False
+        return True
+
+    def close(self, timeout: Optional[float] = 1.0) -> None:
+        """Drain and stop all subscriber workers."""
+        for q in self._queues():
+            q.close(timeout)
+
     # ── Internal ─────────────────────────────────────────────────
 
     def _collect_sync_handlers(self, event_type: str) -> List[EventHandler]:
@@ -468,4 +759,6 @@ def get_event_bus() -> EventBus:
 def reset_event_bus() -> None:
     """Reset singleton (for tests)."""
     global _event_bus
+    if _event_bus is not None:
+        _event_bus.close(timeout=0)
     _event_bus = None
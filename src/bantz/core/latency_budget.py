@@ -8,6 +8,8 @@ Provides:
 - Budget violation detection with degradation recommendations
 - Feedback phrase trigger points
 - Dashboard-ready metric export
+- Adaptive controller: streaming per-phase quantiles, remaining-turn
+  latency prediction and proactive degradation to hit a p95 target
 
 Typical budget (end-to-end ≤2000ms):
   ASR:        max 500ms  → timeout + partial result
@@ -59,6 +61,8 @@ class DegradationAction(str, Enum):
     SKIP_FINALIZER_USE_3B = "skip_finalizer_use_3b"
     USE_CACHED_TTS = "use_cached_tts"
     STREAM_FINALIZER = "stream_finalizer"
+    SKIP_REFLECTION = "skip_reflection"
+    REDUCE_MAX_TOKENS = "reduce_max_tokens"
 
 
 # Mapping: phase → default degradation action
@@ -414,3 +418,340 @@ def should_skip_finalizer(
     """
     remaining = config.end_to_end_max_ms - elapsed_so_far_ms
     return remaining < config.finalizer_max_ms
+
+
+# ─────────────────────────────────────────────────────────────────
+# Streaming quantiles (P² sketch)
+# ─────────────────────────────────────────────────────────────────
+
+
+class StreamingQuantile:
+    """
+    P² streaming quantile estimator (Jain & Chlamtac, 1985).
+
+    Tracks one quantile in O(1) memory with five markers — no sample
+    list is kept, so it is cheap enough to update on every phase of
+    every turn.  Exact for the first five observations.
+    """
+
+    def __init__(self, quantile: float):
+        if not 0.0 < quantile < 1.0:
+            raise ValueError(f"quantile must be in (0, 1), got {quantile}")
+        self.quantile = quantile
+        p = quantile
+        self._heights: List[float] = []
+        self._positions = [0.0, 1.0, 2.0, 3.0, 4.0]
+        self._desired = [0.0, 2 * p, 4 * p, 2 + 2 * p, 4.0]
+        self._increments = [0.0, p / 2, p, (1 + p) / 2, 1.0]
+        self.count = 0
+
+    def add(self, x: float) -> None:
+        self.count += 1
+        q = self._heights
+        if len(q) < 5:
+            q.append(x)
+            q.sort()
+            return
+
+        if x < q[0]:
+            q[0] = x
+            k = 0
+        elif x >= q[4]:
+            q[4] = x
+            k = 3
+        else:
+            k = 0
+            while x >= q[k + 1]:
+                k += 1
+
+        n = self._positions
+        for i in range(k + 1, 5):
+            n[i] += 1
+        for i in range(5):
+            self._desired[i] += self._increments[i]
+
+        for i in (1, 2, 3):
+            d = self._desired[i] - n[i]
+            if (d >= 1 and n[i + 1] - n[i] > 1) or (d <= -1 and n[i - 1] - n[i] < -1):
+                step = 1 if d > 0 else -1
+                candidate = self._parabolic(i, step)
+                if not q[i - 1] < candidate < q[i + 1]:
+                    candidate = q[i] + step * (q[i + step] - q[i]) / (n[i + step] - n[i])
+                q[i] = candidate
+                n[i] += step
+
+    def _parabolic(self, i: int, d: int) -> float:
+        q, n = self._heights, self._positions
+        return q[i] + d / (n[i + 1] - n[i - 1]) * (
+            (n[i] - n[i - 1] + d) * (q[i + 1] - q[i]) / (n[i + 1] - n[i])
+            + (n[i + 1] - n[i] - d) * (q[i] - q[i - 1]) / (n[i] - n[i - 1])
+        )
+
+    def value(self) -> float:
+        """Current estimate (0.0 when empty)."""
+        if not self._heights:
+            return 0.0
+        if self.count <= 5:
+            return _percentile(self._heights, self.quantile * 100)
+        return self._heights[2]
+
+
+class RollingQuantile:
+    """
+    Windowed view over :class:`StreamingQuantile`.
+
+    Two sketches alternate: once the current one has seen ``window``
+    samples it replaces the previous one and a fresh sketch starts, so
+    estimates follow latency drift (model swap, GPU contention) while
+    memory stays constant.
+    """
+
+    def __init__(self, quantile: float, window: int = _MAX_SAMPLES):
+        self.quantile = quantile
+        self.window = max(5, int(window))
+        self._current = StreamingQuantile(quantile)
+        self._previous: Optional[StreamingQuantile] = None
+
+    @property
+    def count(self) -> int:
+        prev = self._previous.count if self._previous else 0
+        return self._current.count + prev
+
+    def add(self, x: float) -> None:
+        self._current.add(x)
+        if self._current.count >= self.window:
+            self._previous = self._current
+            self._current = StreamingQuantile(self.quantile)
+
+    def value(self) -> float:
+        # A young sketch is noisy; lean on the last full window until
+        # the current one has a reasonable number of samples.
+        if self._previous is not None and self._current.count < self.window // 4:
+            return self._previous.value()
+        return self._current.value()
+
+
+@dataclass
+class PhaseDistribution:
+    """Rolling p50/p95 sketch for one phase (or phase variant)."""
+    window: int = _MAX_SAMPLES
+    p50: RollingQuantile = field(init=False)
+    p95: RollingQuantile = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.p50 = RollingQuantile(0.50, self.window)
+        self.p95 = RollingQuantile(0.95, self.window)
+
+    @property
+    def count(self) -> int:
+        return self.p50.count
+
+    def add(self, elapsed_ms: float) -> None:
+        self.p50.add(elapsed_ms)
+        self.p95.add(elapsed_ms)
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "p50": round(self.p50.value(), 1),
+            "p95": round(self.p95.value(), 1),
+            "count": self.count,
+        }
+
+
+# ─────────────────────────────────────────────────────────────────
+# Adaptive Latency Controller (orchestrator integration)
+# ─────────────────────────────────────────────────────────────────
+
+# Orchestrator phase keys.  Finalizer latency is tracked per strategy so
+# the controller knows what switching to the fast finalizer would save.
+PHASE_ROUTER = "router"
+PHASE_TOOL = "tool"
+PHASE_REFLECTION = "reflection"
+PHASE_FINALIZER_QUALITY = "finalizer_quality"
+PHASE_FINALIZER_FAST = "finalizer_fast"
+
+# Completion-token cap applied with REDUCE_MAX_TOKENS.
+_REDUCED_MAX_TOKENS = 160
+
+
+@dataclass
+class DegradationPlan:
+    """Strategy choice for the rest of a turn."""
+    skip_reflection: bool = False
+    use_fast_finalizer: bool = False
+    max_tokens: Optional[int] = None
+    predicted_ms: float = 0.0
+    target_ms: float = 0.0
+    actions: List[DegradationAction] = field(default_factory=list)
+
+    @property
+    def degraded(self) -> bool:
+        return bool(self.actions)
+
+    def to_trace_dict(self) -> Dict[str, Any]:
+        return {
+            "predicted_ms": round(self.predicted_ms, 1),
+            "target_ms": self.target_ms,
+            "actions": [a.value for a in self.actions],
+        }
+
+
+class AdaptiveLatencyController:
+    """
+    Predicts end-to-end turn latency and picks cheaper strategies early.
+
+    The static helpers above (:func:`check_budget`,
+    :func:`should_skip_finalizer`) react after a phase has already blown
+    its YAML threshold.  This controller keeps rolling p50/p95 sketches
+    per phase and, before each optional phase, predicts the turn total
+    as ``elapsed + Σ p50(remaining) + max(p95 − p50)`` — i.e. assuming
+    one remaining phase hits its tail.  While the prediction exceeds the
+    p95 target it degrades, cheapest loss first:
+
+    1. skip reflection
+    2. fast (local) finalizer instead of quality
+    3. smaller finalizer ``max_tokens``
+
+    Phases with fewer than ``min_samples`` observations predict 0ms and
+    are never degraded — there is no evidence that skipping them helps.
+
+    Usage::
+
+        ctl = AdaptiveLatencyController(target_p95_ms=4000)
+        ctl.observe(PHASE_ROUTER, 350)
+        plan = ctl.plan(elapsed_ms=1200, remaining=[PHASE_REFLECTION, "finalizer"])
+        ...
+        ctl.observe_turn(3100)
+    """
+
+    def __init__(
+        self,
+        target_p95_ms: Optional[float] = None,
+        *,
+        config: Optional[LatencyBudgetConfig] = None,
+        window: int = 200,
+        min_samples: int = 10,
+    ):
+        self._config = config or LatencyBudgetConfig()
+        self.target_p95_ms = float(target_p95_ms or self._config.end_to_end_max_ms)
+        self.min_samples = min_samples
+        self._window = window
+        self._phases: Dict[str, PhaseDistribution] = {}
+        self._e2e = PhaseDistribution(window)
+        self._plans = 0
+        self._degraded = 0
+        self._action_counts: Dict[str, int] = {}
+
+    # ── observations ─────────────────────────────────────────
+
+    def observe(self, phase: str | Phase, elapsed_ms: float) -> None:
+        """Record one phase's latency."""
+        key = phase.value if isinstance(phase, Phase) else str(phase)
+        dist = self._phases.get(key)
+        if dist is None:
+            dist = self._phases[key] = PhaseDistribution(self._window)
+        dist.add(max(0.0, float(elapsed_ms)))
+
+    def observe_turn(self, total_ms: float) -> None:
+        """Record an end-to-end turn latency."""
+        self._e2e.add(max(0.0, float(total_ms)))
+
+    def _is_warm(self, key: str) -> bool:
+        dist = self._phases.get(key)
+        return dist is not None and dist.count >= self.min_samples
+
+    def _estimate(self, key: str) -> Tuple[float, float]:
+        if not self._is_warm(key):
+            return 0.0, 0.0
+        dist = self._phases[key]
+        return dist.p50.value(), dist.p95.value()
+
+    def predict(self, elapsed_ms: float, remaining: List[str]) -> float:
+        """Predicted turn total if *remaining* phases run as given."""
+        estimates = [self._estimate(k) for k in remaining]
+        if not estimates:
+            return float(elapsed_ms)
+        tail = max(max(0.0, p95 - p50) for p50, p95 in estimates)
+        return float(elapsed_ms) + sum(p50 for p50, _ in estimates) + tail
+
+    # ── decisions ────────────────────────────────────────────
+
+    def plan(
+        self,
+        elapsed_ms: float,
+        remaining: List[str],
+        *,
+        max_tokens: int = 512,
+    ) -> DegradationPlan:
+        """
+        Choose strategies for the *remaining* phases of this turn.
+
+        Args:
+            elapsed_ms: Time spent in the turn so far.
+            remaining: Phase keys still to run.  ``"finalizer"`` stands
+                for the finalizer with the quality strategy.
+            max_tokens: Completion cap the finalizer would use.
+
+        Returns:
+            DegradationPlan (empty ``actions`` when on budget).
+        """
+        target = self.target_p95_ms
+        phases = [PHASE_FINALIZER_QUALITY if k == "finalizer" else k for k in remaining]
+        plan = DegradationPlan(target_ms=target)
+        predicted = self.predict(elapsed_ms, phases)
+
+        if predicted > target and PHASE_REFLECTION in phases and self._is_warm(PHASE_REFLECTION):
+            phases.remove(PHASE_REFLECTION)
+            plan.skip_reflection = True
+            plan.actions.append(DegradationAction.SKIP_REFLECTION)
+            predicted = self.predict(elapsed_ms, phases)
+
+        if (
+            predicted > target
+            and PHASE_FINALIZER_QUALITY in phases
+            and self._is_warm(PHASE_FINALIZER_QUALITY)
+            and self._is_warm(PHASE_FINALIZER_FAST)
+        ):
+            fast = [PHASE_FINALIZER_FAST if k == PHASE_FINALIZER_QUALITY else k for k in phases]
+            fast_predicted = self.predict(elapsed_ms, fast)
+            if fast_predicted < predicted:
+                phases, predicted = fast, fast_predicted
+                plan.use_fast_finalizer = True
+                plan.actions.append(DegradationAction.SKIP_FINALIZER_USE_3B)
+
+        finalizer = next((k for k in phases if k.startswith("finalizer")), None)
+        if (
+            predicted > target
+            and finalizer is not None
+            and self._is_warm(finalizer)
+            and max_tokens > _REDUCED_MAX_TOKENS
+        ):
+            # Decode time scales roughly with output length.
+            p50, _ = self._estimate(finalizer)
+            predicted -= p50 * (1.0 - _REDUCED_MAX_TOKENS / max_tokens)
+            plan.max_tokens = _REDUCED_MAX_TOKENS
+            plan.actions.append(DegradationAction.REDUCE_MAX_TOKENS)
+
+        plan.predicted_ms = predicted
+        self._plans += 1
+        if plan.degraded:
+            self._degraded += 1
+            for a in plan.actions:
+                self._action_counts[a.value] = self._action_counts.get(a.value, 0) + 1
+            logger.info(
+                "Latency controller: predicted %.0fms vs target %.0fms → %s",
+                predicted, target, [a.value for a in plan.actions],
+            )
+        return plan
+
+    # ── dashboard ────────────────────────────────────────────
+
+    def dashboard(self) -> Dict[str, Any]:
+        return {
+            "target_p95_ms": self.target_p95_ms,
+            "end_to_end": self._e2e.summary(),
+            "phases": {k: d.summary() for k, d in self._phases.items()},
+            "plans": self._plans,
+            "degraded_plans": self._degraded,
+            "actions": dict(self._action_counts),
+        }
@@ -0,0 +1,78 @@
+"""
+Shared helpers for incrementally maintained analytics rollups.
+
+Dashboards used to aggregate raw event rows over the whole query range on
+every load.  Stores now keep hourly rollup tables, updated by SQLite
+triggers in the same transaction as each insert/delete, and answer range
+queries as::
+
+    full hourly buckets inside the range   →  rollup rows
+    the partial bucket at the range start  →  raw rows (index range scan)
+
+Latency is tracked as a fixed histogram; each rollup row is keyed by its
+histogram bin so per-bin counts, sums and maxima are available without a
+second table.  Bin ``i`` holds ``LATENCY_EDGES_MS[i-1] < ms <= LATENCY_EDGES_MS[i]``;
+bin 0 also holds NULL latencies and the last bin everything above the
+final edge.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import List, Optional
+
+# Upper bounds (inclusive) of the latency histogram bins, in ms.
+LATENCY_EDGES_MS = (0, 50, 100, 250, 500, 1000, 2000, 5000, 10000, 30000)
+LATENCY_BINS = len(LATENCY_EDGES_MS) + 1
+
+HOUR_SECONDS = 3600
+
+
+def latency_bin(ms: Optional[float]) -> int:
+    """Histogram bin for a latency value (mirrors :func:`latency_bin_sql`)."""
+    if ms is None:
+        return 0
+    for i, edge in enumerate(LATENCY_EDGES_MS):
+        if ms <= edge:
+            return i
+    return len(LATENCY_EDGES_MS)
+
+
+def latency_bin_sql(column: str) -> str:
+    """SQL ``CASE`` expression computing the histogram bin of *column*."""
+    parts = [f"WHEN {column} IS NULL THEN 0"]
+    parts += [f"WHEN {column} <= {edge} THEN {i}" for i, edge in enumerate(LATENCY_EDGES_MS)]
+    return f"(CASE {' '.join(parts)} ELSE {len(LATENCY_EDGES_MS)} END)"
+
+
+def bins_above(threshold_ms: float) -> Optional[int]:
+    """First bin whose values are all ``> threshold_ms``.
+
+    Only defined when *threshold_ms* is a bin edge; returns None otherwise
+    (the caller must then fall back to raw rows).
+    """
+    try:
+        return LATENCY_EDGES_MS.index(threshold_ms) + 1
+    except ValueError:
+        return None
+
+
+def bin_labels() -> List[str]:
+    """Human-readable labels, one per bin (``"≤50"``, ``"50-100"``, …)."""
+    labels = [f"≤{LATENCY_EDGES_MS[0]}"]
+    labels += [f"{lo}-{hi}" for lo, hi in zip(LATENCY_EDGES_MS, LATENCY_EDGES_MS[1:])]
+    labels.append(f">{LATENCY_EDGES_MS[-1]}")
+    return labels
+
+
+def hour_ceil(ts: float) -> float:
+    """Start of the first whole hourly bucket at or after epoch *ts*."""
+    return float(math.ceil(ts / HOUR_SECONDS) * HOUR_SECONDS)
+
+
+def iso_hour_end(bucket: str) -> str:
+    """Exclusive upper bound for ISO timestamps inside an ``YYYY-MM-DDTHH`` bucket.
+
+    Timestamps continue with ``:`` after the hour; ``;`` sorts right after it.
+    """
+    return bucket + ";"
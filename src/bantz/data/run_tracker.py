@@ -39,6 +39,19 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 from uuid import uuid4
 
+from bantz.data.rollups import (
+    HOUR_SECONDS,
+    bin_labels,
+    bins_above,
+    hour_ceil,
+    latency_bin_sql,
+)
+from bantz.data.write_behind import (
+    DEFAULT_FLUSH_INTERVAL_MS,
+    DEFAULT_MAX_BATCH,
+    WriteBehindQueue,
+)
+
 logger = logging.getLogger(__name__)
 
 # ── SQL Schema ────────────────────────────────────────────────────
@@ -97,8 +110,140 @@ CREATE INDEX IF NOT EXISTS idx_tc_status      ON tool_calls(status);
 CREATE INDEX IF NOT EXISTS idx_tc_created     ON tool_calls(created_at);
 CREATE INDEX IF NOT EXISTS idx_art_run        ON artifacts(run_id);
 CREATE INDEX IF NOT EXISTS idx_art_type       ON artifacts(type);
+CREATE INDEX IF NOT EXISTS idx_tc_status_created ON tool_calls(status, created_at);
 """
 
+# ── Tool-call rollups ─────────────────────────────────────────────
+#
+# One row per (hour, tool, latency bin), maintained by triggers so the
+# write path (including the write-behind queue) needs no extra code.
+# INSERT OR REPLACE fires the delete trigger for the replaced row because
+# the connection enables recursive_triggers.  latency_max is never
+# lowered, so it can overstate the max after rows are replaced or deleted.
+
+_ROLLUP_VERSION = 1
+
+
+def _rollup_key_sql(r: str) -> str:
+    return (
+        f"bucket = CAST({r}.created_at / {HOUR_SECONDS} AS INTEGER) * {HOUR_SECONDS}"
+        f" AND tool_name = {r}.tool_name AND bin = {latency_bin_sql(r + '.latency_ms')}"
+    )
+
+
+def _rollup_add_sql(r: str) -> str:
+    """Trigger statements adding row *r* (``NEW``) to the rollup."""
+    return f"""
+    -- Not INSERT OR IGNORE: an outer INSERT OR REPLACE would override it.
+    INSERT INTO tool_rollup_hourly (bucket, tool_name, bin)
+    SELECT CAST({r}.created_at / {HOUR_SECONDS} AS INTEGER) * {HOUR_SECONDS},
+           {r}.tool_name, {latency_bin_sql(r + '.latency_ms')}
+    WHERE NOT EXISTS (SELECT 1 FROM tool_rollup_hourly WHERE {_rollup_key_sql(r)});
+    UPDATE tool_rollup_hourly SET
+        calls       = calls + 1,
+        success     = success + ({r}.status IS 'success'),
+        errors      = errors + ({r}.status IS 'error'),
+        timed       = timed + ({r}.latency_ms IS NOT NULL),
+        latency_sum = latency_sum + COALESCE({r}.latency_ms, 0),
+        latency_max = CASE
+            WHEN {r}.latency_ms IS NULL THEN latency_max
+            WHEN latency_max IS NULL OR {r}.latency_ms > latency_max THEN {r}.latency_ms
+            ELSE latency_max END,
+        retry_sum   = retry_sum + COALESCE({r}.retry_count, 0)
+    WHERE {_rollup_key_sql(r)};"""
+
+
+def _rollup_sub_sql(r: str) -> str:
+    """Trigger statements removing row *r* (``OLD``) from the rollup."""
+    return f"""
+    UPDATE tool_rollup_hourly SET
+        calls       = calls - 1,
+        success     = success - ({r}.status IS 'success'),
+        errors      = errors - ({r}.status IS 'error'),
+        timed       = timed - ({r}.latency_ms IS NOT NULL),
+        latency_sum = latency_sum - COALESCE({r}.latency_ms, 0),
+        retry_sum   = retry_sum - COALESCE({r}.retry_count, 0)
+    WHERE {_rollup_key_sql(r)};
+    DELETE FROM tool_rollup_hourly WHERE {_rollup_key_sql(r)} AND calls <= 0;"""
+
+
+_ROLLUP_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS tool_rollup_hourly (
+    bucket      INTEGER NOT NULL,
+    tool_name   TEXT NOT NULL,
+    bin         INTEGER NOT NULL,
+    calls       INTEGER NOT NULL DEFAULT 0,
+    success     INTEGER NOT NULL DEFAULT 0,
+    errors      INTEGER NOT NULL DEFAULT 0,
+    timed       INTEGER NOT NULL DEFAULT 0,
+    latency_sum INTEGER NOT NULL DEFAULT 0,
+    latency_max INTEGER,
+    retry_sum   INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (bucket, tool_name, bin)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_tc_rollup_insert AFTER INSERT ON tool_calls
+BEGIN {add_new} END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tc_rollup_delete AFTER DELETE ON tool_calls
+BEGIN {sub_old} END;
+
+CREATE TRIGGER IF NOT EXISTS trg_tc_rollup_update AFTER UPDATE ON tool_calls
+BEGIN {sub_old} {add_new} END;
+""".format(add_new=_rollup_add_sql("NEW"), sub_old=_rollup_sub_sql("OLD"))
+
+_ROLLUP_REBUILD_SQL = f"""
+INSERT INTO tool_rollup_hourly
+    (bucket, tool_name, bin, calls, success, errors, timed,
+     latency_sum, latency_max, retry_sum)
+SELECT
+    CAST(created_at / {HOUR_SECONDS} AS INTEGER) * {HOUR_SECONDS},
+    tool_name,
+    {latency_bin_sql("latency_ms")},
+    COUNT(*),
+    SUM(status IS 'success'),
+    SUM(status IS 'error'),
+    COUNT(latency_ms),
+    COALESCE(SUM(latency_ms), 0),
+    MAX(latency_ms),
+    COALESCE(SUM(retry_count), 0)
+FROM tool_calls
+GROUP BY 1, 2, 3
+"""
+
+# Whole buckets from the rollup (bucket >= :full) plus raw rows for the
+# partial bucket at the start of the range (:since <= created_at < :full).
+_TOOL_WINDOW_SQL = """
+WITH w AS (
+    SELECT tool_name, bin, calls, success, errors, timed,
+           latency_sum, latency_max, retry_sum
+    FROM tool_rollup_hourly WHERE bucket >= :full
+    UNION ALL
+    SELECT tool_name, {raw_bin}, 1, status IS 'success', status IS 'error',
+           latency_ms IS NOT NULL, COALESCE(latency_ms, 0), latency_ms,
+           COALESCE(retry_count, 0)
+    FROM tool_calls WHERE created_at >= :since AND created_at < :full
+)
+""".format(raw_bin=latency_bin_sql("latency_ms"))
+
+# Statement text is shared by every write so sqlite3's statement cache
+# prepares each one once per connection.
+_UPSERT_RUN_SQL = """INSERT OR REPLACE INTO runs
+   (run_id, user_input, route, intent, final_output, model,
+    total_tokens, latency_ms, status, error, session_id, created_at)
+   VALUES (?,?,?,?,?,?,?,?,?,?,?,?)"""
+
+_UPSERT_TOOL_CALL_SQL = """INSERT OR REPLACE INTO tool_calls
+   (call_id, run_id, tool_name, params, result_hash,
+    result_summary, latency_ms, status, error,
+    confirmation, retry_count, created_at)
+   VALUES (?,?,?,?,?,?,?,?,?,?,?,?)"""
+
+_INSERT_ARTIFACT_SQL = """INSERT INTO artifacts
+   (artifact_id, run_id, type, title, content, summary,
+    embedding, source_ref, mime_type, size_bytes, created_at)
+   VALUES (?,?,?,?,?,?,?,?,?,?,?)"""
+
 # ── Defaults ──────────────────────────────────────────────────────
 
 DEFAULT_DB_PATH = os.path.join(
@@ -107,6 +252,12 @@ DEFAULT_DB_PATH = os.path.join(
 )
 
 
+def _write_behind_default() -> bool:
+    return os.environ.get("BANTZ_RUN_TRACKER_WRITE_BEHIND", "1").strip().lower() not in (
+        "0", "false", "no", "off",
+    )
+
+
 # ── Data Classes ──────────────────────────────────────────────────
 
 
@@ -321,33 +472,64 @@ class RunTracker:
 
     Thread-safe via ``check_same_thread=False``.
     WAL mode for concurrent reads.
+
+    Writes go through a :class:`~bantz.data.write_behind.WriteBehindQueue`
+    by default: ``start_run`` / ``record_tool_call`` / ``end_run`` only
+    snapshot the row and return, and a background thread commits queued
+    rows in batches.  Every read flushes pending rows first, so queries
+    always see earlier writes.
+
+    Args:
+        db_path: SQLite file (default ``~/.bantz/data/observability.db``).
+        write_behind: Batch writes off-thread.  Defaults to on; set
+            ``BANTZ_RUN_TRACKER_WRITE_BEHIND=0`` to commit every row inline.
+        flush_interval_ms: Maximum time a row waits before being committed.
+        batch_size: Rows per transaction; reaching it flushes early.
     """
 
-    def __init__(self, db_path: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        db_path: Optional[str] = None,
+        *,
+        write_behind: Optional[bool] = None,
+        flush_interval_ms: float = DEFAULT_FLUSH_INTERVAL_MS,
+        batch_size: int = DEFAULT_MAX_BATCH,
+    ) -> None:
         self._db_path = db_path or DEFAULT_DB_PATH
         self._conn: Optional[sqlite3.Connection] = None
+        self._write_behind = _write_behind_default() if write_behind is None else write_behind
+        self._flush_interval_ms = flush_interval_ms
+        self._batch_size = batch_size
+        self._writer: Optional[WriteBehindQueue] = None
 
     async def initialise(self) -> None:
         """Create / open the database and ensure schema."""
-        path = Path(self._db_path)
-        if str(path) != ":memory:":
-            path.parent.mkdir(parents=True, exist_ok=True)
-        self._conn = sqlite3.connect(
-            str(path),
-            check_same_thread=False,
-            isolation_level="DEFERRED",
-        )
-        self._conn.execute("PRAGMA journal_mode=WAL")
-        self._conn.execute("PRAGMA foreign_keys=ON")
-        self._conn.executescript(_SCHEMA_SQL)
-        self._conn.commit()
+        self._open()
         logger.info("[RunTracker] DB ready at %s", self._db_path)
 
     async def close(self) -> None:
+        self.close_sync()
+
+    def close_sync(self) -> None:
+        """Flush queued writes and close the connection."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
         if self._conn:
             self._conn.close()
             self._conn = None
 
+    def flush(self) -> int:
+        """Commit queued writes now; returns the number of rows written."""
+        if self._writer is None:
+            return 0
+        return self._writer.flush()
+
+    @property
+    def write_stats(self) -> Dict[str, Any]:
+        """Write-behind counters (empty when writing inline)."""
+        return self._writer.stats.to_dict() if self._writer is not None else {}
+
     @property
     def db_path(self) -> str:
         return self._db_path
@@ -408,19 +590,14 @@ class RunTracker:
             mime_type=mime_type,
             size_bytes=len(content.encode()) if content else 0,
         )
-        conn = self._ensure_conn()
-        conn.execute(
-            """INSERT INTO artifacts
-               (artifact_id, run_id, type, title, content, summary,
-                embedding, source_ref, mime_type, size_bytes, created_at)
-               VALUES (?,?,?,?,?,?,?,?,?,?,?)""",
+        self._write(
+            _INSERT_ARTIFACT_SQL,
             (
                 art.artifact_id, art.run_id, art.type, art.title,
                 art.content, art.summary, art.embedding, art.source_ref,
                 art.mime_type, art.size_bytes, art.created_at,
             ),
         )
-        conn.commit()
         return art
 
     # ── Query: single run ──
@@ -545,22 +722,20 @@ class RunTracker:
     ) -> List[Dict[str, Any]]:
         """Per-tool aggregated statistics, sorted by call count desc."""
         conn = self._ensure_conn()
-        where = "WHERE created_at >= ?" if since else ""
-        params: list = [since] if since else []
-
         rows = conn.execute(
-            f"""SELECT
+            _TOOL_WINDOW_SQL
+            + """SELECT
                 tool_name,
-                COUNT(*) AS calls,
-                SUM(CASE WHEN status='success' THEN 1 ELSE 0 END) AS success,
-                SUM(CASE WHEN status='error' THEN 1 ELSE 0 END) AS errors,
-                AVG(latency_ms) AS avg_latency,
-                MAX(latency_ms) AS max_latency,
-                AVG(retry_count) AS avg_retries
-            FROM tool_calls {where}
+                SUM(calls) AS n,
+                SUM(success),
+                SUM(errors),
+                SUM(latency_sum) * 1.0 / NULLIF(SUM(timed), 0),
+                MAX(latency_max),
+                SUM(retry_sum) * 1.0 / SUM(calls)
+            FROM w
             GROUP BY tool_name
-            ORDER BY calls DESC""",
-            params,
+            ORDER BY n DESC""",
+            self._window(since),
         ).fetchall()
 
         return [
@@ -583,7 +758,61 @@ class RunTracker:
         since: Optional[float] = None,
         limit: int = 10,
     ) -> List[Dict[str, Any]]:
-        """Find tools exceeding the latency threshold."""
+        """Find tools exceeding the latency threshold.
+
+        Thresholds on a histogram edge (see
+        :data:`bantz.data.rollups.LATENCY_EDGES_MS`) are answered from the
+        rollup; any other threshold scans raw rows.
+        """
+        conn = self._ensure_conn()
+        first_bin = bins_above(threshold_ms)
+        if first_bin is None:
+            return self._slow_tools_raw(threshold_ms, since, limit)
+
+        params = self._window(since)
+        params.update(first_bin=first_bin, limit=limit)
+        rows = conn.execute(
+            _TOOL_WINDOW_SQL
+            + """SELECT
+                tool_name,
+                SUM(timed) AS slow_count,
+                SUM(latency_sum) * 1.0 / SUM(timed) AS avg_latency,
+                MAX(latency_max)
+            FROM w
+            WHERE bin >= :first_bin
+            GROUP BY tool_name
+            HAVING slow_count > 0
+            ORDER BY avg_latency DESC
+            LIMIT :limit""",
+            params,
+        ).fetchall()
+        return [self._slow_row(r) for r in rows]
+
+    async def latency_histogram(
+        self,
+        tool_name: Optional[str] = None,
+        since: Optional[float] = None,
+    ) -> Dict[str, int]:
+        """Tool-call counts per latency bin (label → count), from the rollup."""
+        conn = self._ensure_conn()
+        params = self._window(since)
+        params["tool"] = tool_name
+        rows = conn.execute(
+            _TOOL_WINDOW_SQL
+            + """SELECT bin, SUM(timed) FROM w
+            WHERE :tool IS NULL OR tool_name = :tool
+            GROUP BY bin""",
+            params,
+        ).fetchall()
+        counts = dict(rows)
+        return {label: counts.get(i, 0) or 0 for i, label in enumerate(bin_labels())}
+
+    def _slow_tools_raw(
+        self,
+        threshold_ms: float,
+        since: Optional[float],
+        limit: int,
+    ) -> List[Dict[str, Any]]:
         conn = self._ensure_conn()
         where_parts = ["latency_ms > ?"]
         params: List[Any] = [threshold_ms]
@@ -604,16 +833,23 @@ class RunTracker:
             LIMIT ?""",
             (*params, limit),
         ).fetchall()
+        return [self._slow_row(r) for r in rows]
 
-        return [
-            {
-                "tool_name": r[0],
-                "slow_count": r[1],
-                "avg_latency_ms": round(r[2] or 0, 1),
-                "max_latency_ms": r[3] or 0,
-            }
-            for r in rows
-        ]
+    @staticmethod
+    def _slow_row(r) -> Dict[str, Any]:
+        return {
+            "tool_name": r[0],
+            "slow_count": r[1],
+            "avg_latency_ms": round(r[2] or 0, 1),
+            "max_latency_ms": r[3] or 0,
+        }
+
+    @staticmethod
+    def _window(since: Optional[float]) -> Dict[str, float]:
+        """Query bounds: whole buckets from ``full``, raw rows in ``[since, full)``."""
+        if not since:
+            return {"since": 0.0, "full": 0.0}
+        return {"since": since, "full": hour_ceil(since)}
 
     async def error_breakdown(
         self,
@@ -667,36 +903,18 @@ class RunTracker:
     # ── Internal save methods ─────────────────────────────────────
 
     async def _save_run(self, run: Run) -> None:
-        conn = self._ensure_conn()
-        conn.execute(
-            """INSERT OR REPLACE INTO runs
-               (run_id, user_input, route, intent, final_output, model,
-                total_tokens, latency_ms, status, error, session_id, created_at)
-               VALUES (?,?,?,?,?,?,?,?,?,?,?,?)""",
-            (
-                run.run_id, run.user_input, run.route, run.intent,
-                run.final_output, run.model, run.total_tokens,
-                run.latency_ms, run.status, run.error,
-                run.session_id, run.created_at,
-            ),
-        )
-        conn.commit()
+        self._save_run_sync(run)
 
     async def _save_tool_call(self, tc: ToolCall) -> None:
+        self._save_tool_call_sync(tc)
+
+    def _write(self, sql: str, params: tuple) -> None:
+        """Queue (or, with write-behind off, commit) one statement."""
+        if self._writer is not None:
+            self._writer.submit(sql, params)
+            return
         conn = self._ensure_conn()
-        conn.execute(
-            """INSERT OR REPLACE INTO tool_calls
-               (call_id, run_id, tool_name, params, result_hash,
-                result_summary, latency_ms, status, error,
-                confirmation, retry_count, created_at)
-               VALUES (?,?,?,?,?,?,?,?,?,?,?,?)""",
-            (
-                tc.call_id, tc.run_id, tc.tool_name, tc.params,
-                tc.result_hash, tc.result_summary, tc.latency_ms,
-                tc.status, tc.error, tc.confirmation, tc.retry_count,
-                tc.created_at,
-            ),
-        )
+        conn.execute(sql, params)
         conn.commit()
 
     # ── Row mappers ───────────────────────────────────────────────
@@ -704,6 +922,11 @@ class RunTracker:
     def _ensure_conn(self) -> sqlite3.Connection:
         if self._conn is None:
             raise RuntimeError("RunTracker not initialised — call initialise() first")
+        if self._writer is not None:
+            # read-your-writes: flush() takes the writer's lock, so it also
+            # waits for a batch the writer thread has dequeued but not
+            # committed yet (``pending`` already reads 0 for those).
+            self._writer.flush()
         return self._conn
 
     @staticmethod
@@ -775,6 +998,12 @@ class RunTracker:
 
         Identical logic but callable from sync code (no event loop needed).
         """
+        self._open()
+        logger.info("[RunTracker] DB ready at %s (sync)", self._db_path)
+
+    def _open(self) -> None:
+        if self._conn is not None:
+            self.close_sync()
         path = Path(self._db_path)
         if str(path) != ":memory:":
             path.parent.mkdir(parents=True, exist_ok=True)
@@ -784,10 +1013,35 @@ class RunTracker:
             isolation_level="DEFERRED",
         )
         self._conn.execute("PRAGMA journal_mode=WAL")
+        # WAL + NORMAL only fsyncs at checkpoints; a crash can lose the
+        # last few commits but never corrupts the database.
+        self._conn.execute("PRAGMA synchronous=NORMAL")
         self._conn.execute("PRAGMA foreign_keys=ON")
+        # Lets INSERT OR REPLACE fire the rollup delete trigger.
+        self._conn.execute("PRAGMA recursive_triggers=ON")
         self._conn.executescript(_SCHEMA_SQL)
+        self._conn.executescript(_ROLLUP_SCHEMA_SQL)
         self._conn.commit()
-        logger.info("[RunTracker] DB ready at %s (sync)", self._db_path)
+        self._backfill_rollups()
+        if self._write_behind:
+            self._writer = WriteBehindQueue(
+                self._conn,
+                flush_interval_ms=self._flush_interval_ms,
+                max_batch=self._batch_size,
+                name="bantz-run-tracker-writer",
+            )
+
+    def _backfill_rollups(self) -> None:
+        """Build rollups for databases created before they existed."""
+        conn = self._conn
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= _ROLLUP_VERSION:
+            return
+        with conn:
+            conn.execute("DELETE FROM tool_rollup_hourly")
+            conn.execute(_ROLLUP_REBUILD_SQL)
+            conn.execute(f"PRAGMA user_version={_ROLLUP_VERSION}")
+        logger.info("[RunTracker] Tool-call rollups rebuilt")
 
     def start_run(
         self,
@@ -858,12 +1112,9 @@ class RunTracker:
         return tc
 
     def _save_run_sync(self, run: Run) -> None:
-        conn = self._ensure_conn()
-        conn.execute(
-            """INSERT OR REPLACE INTO runs
-               (run_id, user_input, route, intent, final_output, model,
-                total_tokens, latency_ms, status, error, session_id, created_at)
-               VALUES (?,?,?,?,?,?,?,?,?,?,?,?)""",
+        # Params are snapshotted here; later mutation of *run* is not seen.
+        self._write(
+            _UPSERT_RUN_SQL,
             (
                 run.run_id, run.user_input, run.route, run.intent,
                 run.final_output, run.model, run.total_tokens,
@@ -871,16 +1122,10 @@ class RunTracker:
                 run.session_id, run.created_at,
             ),
         )
-        conn.commit()
 
     def _save_tool_call_sync(self, tc: ToolCall) -> None:
-        conn = self._ensure_conn()
-        conn.execute(
-            """INSERT OR REPLACE INTO tool_calls
-               (call_id, run_id, tool_name, params, result_hash,
-                result_summary, latency_ms, status, error,
-                confirmation, retry_count, created_at)
-               VALUES (?,?,?,?,?,?,?,?,?,?,?,?)""",
+        self._write(
+            _UPSERT_TOOL_CALL_SQL,
             (
                 tc.call_id, tc.run_id, tc.tool_name, tc.params,
                 tc.result_hash, tc.result_summary, tc.latency_ms,
@@ -888,4 +1133,3 @@ class RunTracker:
                 tc.created_at,
             ),
         )
-        conn.commit()
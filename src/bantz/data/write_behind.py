@@ -0,0 +1,206 @@
+"""
+WriteBehindQueue — batched, off-thread SQLite writes.
+
+Callers hand over ``(sql, params)`` pairs and return immediately; a
+background thread commits them in one transaction every
+``flush_interval_ms`` or as soon as ``max_batch`` rows are waiting,
+whichever comes first.
+
+- Submitting is lock-free: items go onto a :class:`collections.deque`,
+  whose ``append``/``popleft`` are atomic.
+- Consecutive rows with the same statement are sent with a single
+  ``executemany``.  The SQL strings are module constants, so sqlite3
+  prepares each statement once and reuses it from its statement cache.
+- Order is preserved (FIFO), so a parent row queued before its children
+  is always inserted first.
+- :meth:`WriteBehindQueue.flush` drains synchronously (used for
+  read-your-writes); :meth:`WriteBehindQueue.close` and an ``atexit``
+  hook flush whatever is left on shutdown.
+
+Usage::
+
+    queue = WriteBehindQueue(conn, flush_interval_ms=50, max_batch=256)
+    queue.submit("INSERT INTO t VALUES (?, ?)", (1, "a"))
+    ...
+    queue.close()
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import sqlite3
+import threading
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_MS = 50
+DEFAULT_MAX_BATCH = 256
+
+_Item = Tuple[str, Sequence[Any]]
+
+
+@dataclass
+class WriteBehindStats:
+    """Counters for one queue."""
+
+    submitted: int = 0
+    written: int = 0
+    failed: int = 0
+    batches: int = 0
+    largest_batch: int = 0
+    last_flush_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "written": self.written,
+            "failed": self.failed,
+            "batches": self.batches,
+            "largest_batch": self.largest_batch,
+            "last_flush_ms": round(self.last_flush_ms, 3),
+        }
+
+
+class WriteBehindQueue:
+    """Batch ``(sql, params)`` writes onto a shared connection.
+
+    Args:
+        conn: Connection opened with ``check_same_thread=False``.
+        flush_interval_ms: Maximum time a row waits before being committed.
+        max_batch: Rows per transaction; reaching it wakes the writer early.
+        name: Writer thread name.
+    """
+
+    def __init__(
+        self,
+        conn: sqlite3.Connection,
+        *,
+        flush_interval_ms: float = DEFAULT_FLUSH_INTERVAL_MS,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        name: str = "bantz-write-behind",
+    ) -> None:
+        self._conn = conn
+        self.flush_interval = max(0.001, flush_interval_ms / 1000.0)
+        self.max_batch = max(1, int(max_batch))
+        self.stats = WriteBehindStats()
+        self._items: Deque[_Item] = deque()
+        self._wake = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+        _live_queues.add(self)
+
+    @property
+    def pending(self) -> int:
+        """Rows submitted but not yet committed."""
+        return len(self._items)
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def submit(self, sql: str, params: Sequence[Any]) -> None:
+        """Queue one statement.  Never blocks unless the queue is closed."""
+        self._items.append((sql, params))
+        self.stats.submitted += 1
+        if self._closed:
+            # Late writes after shutdown are committed inline.
+            self.flush()
+        elif len(self._items) >= self.max_batch:
+            self._wake.set()
+
+    def flush(self) -> int:
+        """Commit everything queued so far; returns the number of rows."""
+        with self._flush_lock:
+            return self._drain()
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the writer thread and flush the remaining rows."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+        self.flush()
+        _live_queues.discard(self)
+
+    # ── Internal ──
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            if self._items:
+                try:
+                    self.flush()
+                except Exception as exc:  # keep the writer alive
+                    logger.warning("[WriteBehind] flush failed: %s", exc)
+
+    def _drain(self) -> int:
+        total = 0
+        while self._items:
+            batch: List[_Item] = []
+            while self._items and len(batch) < self.max_batch:
+                batch.append(self._items.popleft())
+            self._commit(batch)
+            total += len(batch)
+        return total
+
+    def _commit(self, batch: List[_Item]) -> None:
+        t0 = time.perf_counter()
+        # Group consecutive rows sharing a statement (order is preserved).
+        groups: List[Tuple[str, List[Sequence[Any]]]] = []
+        for sql, params in batch:
+            if groups and groups[-1][0] == sql:
+                groups[-1][1].append(params)
+            else:
+                groups.append((sql, [params]))
+        try:
+            with self._conn:
+                for sql, rows in groups:
+                    self._conn.executemany(sql, rows)
+            self.stats.written += len(batch)
+        except sqlite3.Error as exc:
+            logger.warning(
+                "[WriteBehind] batch of %d failed (%s) — retrying row by row",
+                len(batch), exc,
+            )
+            self._commit_rows(batch)
+        stats = self.stats
+        stats.batches += 1
+        stats.largest_batch = max(stats.largest_batch, len(batch))
+        stats.last_flush_ms = (time.perf_counter() - t0) * 1000
+
+    def _commit_rows(self, batch: List[_Item]) -> None:
+        for sql, params in batch:
+            try:
+                with self._conn:
+                    self._conn.execute(sql, params)
+                self.stats.written += 1
+            except sqlite3.Error as exc:
+                self.stats.failed += 1
+                logger.warning("[WriteBehind] dropped row: %s", exc)
+
+
+# ── Shutdown hook ─────────────────────────────────────────────────
+
+_live_queues: "weakref.WeakSet[WriteBehindQueue]" = weakref.WeakSet()
+
+
+def _close_all() -> None:
+    for q in list(_live_queues):
+        try:
+            q.close(timeout=1.0)
+        except Exception as exc:
+            logger.debug("[WriteBehind] shutdown flush failed: %s", exc)
+
+
+atexit.register(_close_all)
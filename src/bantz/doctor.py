@@ -7,6 +7,7 @@ Checks:
 - LLM endpoint reachability (vLLM / Ollama)
 - Tool registry consistency
 - Dangerous mode warnings
+- Startup import time (``--importtime``: ``python -X importtime`` parsed)
 
 Each check returns a :class:`CheckResult` and the overall status is
 printed with actionable suggestions.
@@ -14,6 +15,7 @@ printed with actionable suggestions.
 Usage::
 
     $ bantz doctor
+    $ bantz doctor --importtime   # + slowest imports at startup
     $ python -m bantz.cli doctor
 """
 
@@ -23,6 +25,8 @@ import importlib
 import json
 import logging
 import os
+import re
+import subprocess
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -30,7 +34,14 @@ from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
-__all__ = ["run_doctor", "CheckResult"]
+__all__ = [
+    "run_doctor",
+    "CheckResult",
+    "ImportTiming",
+    "parse_importtime",
+    "profile_imports",
+    "format_importtime_report",
+]
 
 
 @dataclass
@@ -203,13 +214,127 @@ def _check_dangerous_mode() -> CheckResult:
     return CheckResult("Dangerous mode", "ok", "disabled (safe)")
 
 
+# ============================================================================
+# Startup import time
+# ============================================================================
+
+# What a CLI invocation / daemon boot imports before serving a turn.
+DEFAULT_IMPORT_PROFILE = (
+    "import bantz.cli\n"
+    "from bantz.agent.registry import build_default_registry\n"
+    "build_default_registry()\n"
+)
+DEFAULT_IMPORT_BUDGET_MS = 2000.0
+
+_IMPORTTIME_RE = re.compile(r"^import time:\s+(\d+)\s*\|\s+(\d+)\s*\|( *)(\S.*)$")
+
+
+@dataclass
+class ImportTiming:
+    """One line of ``python -X importtime`` output (times in µs)."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int   # 0 = imported directly by the profiled code
+
+
+def parse_importtime(text: str) -> List[ImportTiming]:
+    """Parse ``-X importtime`` stderr; non-matching lines are ignored."""
+    timings: List[ImportTiming] = []
+    for line in text.splitlines():
+        m = _IMPORTTIME_RE.match(line)
+        if not m:
+            continue
+        indent = len(m.group(3))
+        timings.append(ImportTiming(
+            module=m.group(4).strip(),
+            self_us=int(m.group(1)),
+            cumulative_us=int(m.group(2)),
+            depth=max(0, (indent - 1) // 2),
+        ))
+    return timings
+
+
+def profile_imports(
+    code: str = DEFAULT_IMPORT_PROFILE,
+    *,
+    python: Optional[str] = None,
+    timeout: float = 120.0,
+) -> List[ImportTiming]:
+    """Run *code* in a fresh interpreter with ``-X importtime`` and parse it."""
+    proc = subprocess.run(
+        [python or sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    timings = parse_importtime(proc.stderr)
+    if proc.returncode != 0 and not timings:
+        tail = proc.stderr.strip().splitlines()[-1:] or ["no output"]
+        raise RuntimeError(f"import profile failed: {tail[0]}")
+    return timings
+
+
+def total_import_ms(timings: List[ImportTiming]) -> float:
+    """Wall time spent importing (sum of top-level cumulative times)."""
+    return sum(t.cumulative_us for t in timings if t.depth == 0) / 1000.0
+
+
+def format_importtime_report(timings: List[ImportTiming], *, top: int = 15) -> str:
+    """Human-readable table of the slowest imports by cumulative time."""
+    lines = [f"  Startup imports: {len(timings)} modules, {total_import_ms(timings):.0f} ms total"]
+    lines.append(f"  {'cumulative':>11}  {'self':>9}  module")
+    for t in sorted(timings, key=lambda t: t.cumulative_us, reverse=True)[:top]:
+        lines.append(
+            f"  {t.cumulative_us / 1000:>8.1f} ms  {t.self_us / 1000:>6.1f} ms  "
+            f"{'  ' * min(t.depth, 6)}{t.module}"
+        )
+    return "\n".join(lines)
+
+
+def _check_import_time(
+    timings: Optional[List[ImportTiming]] = None,
+    budget_ms: Optional[float] = None,
+) -> CheckResult:
+    if budget_ms is None:
+        try:
+            budget_ms = float(os.getenv("BANTZ_IMPORT_BUDGET_MS", "") or DEFAULT_IMPORT_BUDGET_MS)
+        except ValueError:
+            budget_ms = DEFAULT_IMPORT_BUDGET_MS
+    try:
+        if timings is None:
+            timings = profile_imports()
+    except Exception as exc:
+        return CheckResult(
+            "Startup imports", "warn", f"Profile failed: {exc}",
+            action="Run: python -X importtime -c 'import bantz.cli'",
+        )
+    total = total_import_ms(timings)
+    slowest = max(timings, key=lambda t: t.cumulative_us, default=None)
+    detail = f"{total:.0f} ms"
+    if slowest is not None:
+        detail += f" (slowest: {slowest.module} {slowest.cumulative_us / 1000:.0f} ms)"
+    if total > budget_ms:
+        return CheckResult(
+            "Startup imports", "warn", f"{detail} — over {budget_ms:.0f} ms budget",
+            action="Defer heavy imports (see bantz doctor --importtime)",
+        )
+    return CheckResult("Startup imports", "ok", detail)
+
+
 # ============================================================================
 # Run all checks
 # ============================================================================
 
-def run_doctor(*, verbose: bool = False) -> int:
+def run_doctor(*, verbose: bool = False, importtime: bool = False) -> int:
     """Run all diagnostic checks and print results.
 
+    Args:
+        verbose: Show suggested actions for passing checks too.
+        importtime: Also profile startup imports (spawns an interpreter)
+            and print the slowest modules.
+
     Returns exit code: 0 if all ok/warn, 1 if any fail.
     """
     checks: List[CheckResult] = []
@@ -223,6 +348,14 @@ def run_doctor(*, verbose: bool = False) -> int:
     checks.append(_check_tool_registry())
     checks.append(_check_dangerous_mode())
 
+    import_timings: Optional[List[ImportTiming]] = None
+    if importtime:
+        try:
+            import_timings = profile_imports()
+        except Exception as exc:
+            logger.debug("import profile failed: %s", exc)
+        checks.append(_check_import_time(import_timings))
+
     # Print results
     print("\n╔══════════════════════════════════════╗")
     print("║        🏥 Bantz Doctor Report        ║")
@@ -251,6 +384,10 @@ def run_doctor(*, verbose: bool = False) -> int:
         else:
             ok_count += 1
 
+    if import_timings:
+        print()
+        print(format_importtime_report(import_timings))
+
     print(f"\n  Summary: {ok_count} ok, {warn_count} warnings, {fail_count} failures")
 
     if fail_count:
@@ -9,6 +9,8 @@ from bantz.document.ingestion import (
     DocumentType,
     DocumentMetadata,
     IngestedDocument,
+    PageChunk,
+    DocumentCache,
     DocumentIngester,
     create_document_ingester,
 )
@@ -49,6 +51,8 @@ __all__ = [
     "DocumentType",
     "DocumentMetadata",
     "IngestedDocument",
+    "PageChunk",
+    "DocumentCache",
     "DocumentIngester",
     "create_document_ingester",
     # Structure
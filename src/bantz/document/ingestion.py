@@ -4,20 +4,27 @@ Document ingestion module.
 Provides document type detection, metadata extraction, and unified ingestion pipeline.
 """
 
+import asyncio
+import dataclasses
+import hashlib
+import mmap
+import os
 import uuid
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, AsyncIterator, Optional
 
 from bantz.document.parsers.base import DocumentParser, ParseResult
-from bantz.document.parsers.pdf import PDFParser
+from bantz.document.parsers.pdf import PDFParser, extract_pdf_pages, probe_pdf
 from bantz.document.parsers.docx import DOCXParser
 from bantz.document.parsers.txt import TXTParser, MDParser
 
 if TYPE_CHECKING:
-    from bantz.document.structure import DocumentStructure
+    from bantz.document.structure import DocumentStructure, StructureExtractor
 
 
 class DocumentType(Enum):
@@ -148,6 +155,103 @@ class IngestedDocument:
         }
 
 
+@dataclass
+class PageChunk:
+    """One page of text yielded by streaming ingestion."""
+    
+    index: int
+    """Zero-based page index."""
+    
+    text: str
+    """Extracted page text (may be empty)."""
+    
+    offset: int
+    """Position of the page within the joined document text."""
+
+
+# Pages joined with a blank line, matching the non-streaming parsers.
+PAGE_SEPARATOR = "\n\n"
+
+# Lines per pseudo-page for plain text, matching TXTParser's estimate.
+TEXT_LINES_PER_PAGE = 50
+
+
+@dataclass
+class _CacheEntry:
+    """Cached result of ingesting one file's content."""
+    
+    document: IngestedDocument
+    pages: list[PageChunk]
+
+
+class DocumentCache:
+    """
+    Content-addressed LRU cache of ingested documents.
+    
+    Entries are keyed by the SHA-256 of the file content, so a renamed or
+    copied file is still a hit. A ``(path, size, mtime)`` index lets an
+    unchanged file skip hashing entirely.
+    """
+    
+    def __init__(self, max_entries: int = 32):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of documents to keep.
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._stat_index: dict[tuple[str, int, int], str] = {}
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def stat_key(file_path: Path) -> tuple[str, int, int]:
+        """Build the stat fast-path key for a file."""
+        st = file_path.stat()
+        return (str(file_path.absolute()), st.st_size, st.st_mtime_ns)
+    
+    def digest_for_stat(self, stat_key: tuple[str, int, int]) -> Optional[str]:
+        """Return the known content hash for an unchanged file."""
+        return self._stat_index.get(stat_key)
+    
+    def get(self, digest: str) -> Optional[_CacheEntry]:
+        """Look up an entry by content hash."""
+        entry = self._entries.get(digest)
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(digest)
+        self.hits += 1
+        return entry
+    
+    def put(
+        self,
+        digest: str,
+        entry: _CacheEntry,
+        stat_key: Optional[tuple[str, int, int]] = None,
+    ) -> None:
+        """Store an entry, evicting the least recently used if full."""
+        self._entries[digest] = entry
+        self._entries.move_to_end(digest)
+        if stat_key is not None:
+            self._stat_index[stat_key] = digest
+        while len(self._entries) > self._max_entries:
+            evicted, _ = self._entries.popitem(last=False)
+            self._stat_index = {
+                k: v for k, v in self._stat_index.items() if v != evicted
+            }
+    
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._stat_index.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class DocumentIngester:
     """
     Main document ingestion pipeline.
@@ -155,16 +259,31 @@ class DocumentIngester:
     Handles document type detection, parsing, and metadata extraction.
     """
     
-    def __init__(self, extract_structure: bool = True):
+    def __init__(
+        self,
+        extract_structure: bool = True,
+        page_workers: Optional[int] = None,
+        pages_per_task: int = 8,
+        cache: Optional[DocumentCache] = None,
+    ):
         """
         Initialize the document ingester.
         
         Args:
             extract_structure: Whether to extract document structure.
+            page_workers: Process pool size for streaming PDF ingestion
+                (default: CPU count; 1 disables the pool).
+            pages_per_task: Pages extracted per pool task.
+            cache: Content-hash cache for streaming ingestion
+                (default: a new in-memory cache).
         """
         self._extract_structure = extract_structure
         self._parsers: dict[DocumentType, DocumentParser] = {}
         self._structure_extractor = None
+        self._page_workers = page_workers or os.cpu_count() or 1
+        self._pages_per_task = max(1, pages_per_task)
+        self._cache = cache if cache is not None else DocumentCache()
+        self._pool: Optional[Executor] = None
         
         # Register default parsers
         self._register_default_parsers()
@@ -297,13 +416,34 @@ class DocumentIngester:
         # Parse document
         parse_result = await parser.parse(data)
         
+        document = self._build_document(
+            parse_result,
+            doc_type=doc_type,
+            filename=filename,
+            file_size=len(data),
+        )
+        
+        # Extract structure if enabled
+        if self._extract_structure and self._structure_extractor:
+            document.structure = self._structure_extractor.extract(parse_result.text)
+        
+        return document
+    
+    def _build_document(
+        self,
+        parse_result: ParseResult,
+        doc_type: DocumentType,
+        filename: str,
+        file_size: int,
+    ) -> IngestedDocument:
+        """Build an IngestedDocument (without structure) from a parse result."""
         # Build metadata
         metadata = DocumentMetadata(
             filename=filename,
             doc_type=doc_type,
             page_count=parse_result.page_count,
             word_count=parse_result.word_count,
-            file_size=len(data),
+            file_size=file_size,
             author=parse_result.metadata.get("author"),
             title=parse_result.metadata.get("title"),
             extra=parse_result.metadata,
@@ -326,19 +466,288 @@ class DocumentIngester:
             except (ValueError, TypeError):
                 pass
         
-        # Create document
-        document = IngestedDocument(
+        return IngestedDocument(
             id=str(uuid.uuid4()),
             metadata=metadata,
             raw_text=parse_result.text,
         )
+    
+    async def iter_pages(
+        self,
+        file_path: Path,
+        executor: Optional[Executor] = None,
+    ) -> AsyncIterator[PageChunk]:
+        """
+        Stream a document page by page, in order.
         
-        # Extract structure if enabled
-        if self._extract_structure and self._structure_extractor:
-            document.structure = self._structure_extractor.extract(parse_result.text)
+        The file is memory-mapped for type sniffing and content hashing.
+        PDF pages are extracted in batches of ``pages_per_task`` across a
+        process pool, plain text is split into pseudo-pages straight from
+        the mapping, and other formats fall back to a single page. An
+        unchanged file is replayed from the content-hash cache.
+        
+        Args:
+            file_path: Path to the document file.
+            executor: Executor for PDF page batches (default: the
+                ingester's process pool).
+            
+        Yields:
+            PageChunk for every page, in document order.
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist.
+            ValueError: If document type is not supported.
+        """
+        file_path = Path(file_path)
+        cached = self._cache_lookup(file_path)
+        if cached is not None:
+            for page in cached.pages:
+                yield page
+            return
         
+        async for page in self._stream_file(file_path, executor):
+            yield page
+    
+    async def ingest_streaming(
+        self,
+        file_path: Path,
+        executor: Optional[Executor] = None,
+    ) -> IngestedDocument:
+        """
+        Ingest a document from file using the streaming pipeline.
+        
+        Structure extraction is fed page by page as pages arrive, so it
+        overlaps with parsing of later pages. Results are cached by content
+        hash; re-ingesting an unchanged file returns without parsing.
+        
+        Args:
+            file_path: Path to the document file.
+            executor: Executor for PDF page batches.
+            
+        Returns:
+            Ingested document with extracted content.
+            
+        Raises:
+            FileNotFoundError: If file doesn't exist.
+            ValueError: If document type is not supported.
+        """
+        file_path = Path(file_path)
+        cached = self._cache_lookup(file_path)
+        if cached is not None:
+            return self._copy_cached(cached.document, file_path)
+        
+        from bantz.document.structure import DocumentStructure
+        
+        extractor = self._structure_extractor if self._extract_structure else None
+        structure = DocumentStructure() if extractor else None
+        pages: list[PageChunk] = []
+        info: dict = {}
+        
+        async for page in self._stream_file(file_path, executor, info):
+            pages.append(page)
+            if extractor and page.text:
+                extractor.extend(structure, page.text, page.offset)
+        
+        if "cached" in info:
+            return self._copy_cached(info["cached"].document, file_path)
+        
+        separator = info.get("separator", PAGE_SEPARATOR)
+        raw_text = separator.join(p.text for p in pages if p.text)
+        parse_result = ParseResult(
+            text=raw_text,
+            page_count=info.get("page_count", len(pages)),
+            metadata=info.get("metadata", {}),
+        )
+        document = self._build_document(
+            parse_result,
+            doc_type=info["doc_type"],
+            filename=file_path.name,
+            file_size=info["file_size"],
+        )
+        document.structure = structure
+        document.source_path = str(file_path.absolute())
+        
+        self._cache.put(
+            info["digest"],
+            _CacheEntry(document=document, pages=pages),
+            stat_key=info["stat_key"],
+        )
         return document
     
+    def _cache_lookup(self, file_path: Path) -> Optional[_CacheEntry]:
+        """Return the cache entry for an unchanged file, if any."""
+        if not file_path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        digest = self._cache.digest_for_stat(DocumentCache.stat_key(file_path))
+        if digest is None:
+            return None
+        return self._cache.get(digest)
+    
+    def _copy_cached(
+        self,
+        document: IngestedDocument,
+        file_path: Path,
+    ) -> IngestedDocument:
+        """Return a fresh document record sharing the cached content."""
+        return dataclasses.replace(
+            document,
+            id=str(uuid.uuid4()),
+            metadata=dataclasses.replace(document.metadata, filename=file_path.name),
+            ingested_at=datetime.now(),
+            source_path=str(file_path.absolute()),
+        )
+    
+    async def _stream_file(
+        self,
+        file_path: Path,
+        executor: Optional[Executor],
+        info: Optional[dict] = None,
+    ) -> AsyncIterator[PageChunk]:
+        """Parse a file page by page; fills ``info`` with file facts."""
+        info = info if info is not None else {}
+        stat_key = DocumentCache.stat_key(file_path)
+        
+        with open(file_path, "rb") as fh:
+            if stat_key[1] == 0:
+                mapped = b""
+            else:
+                mapped = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                digest = hashlib.sha256(mapped).hexdigest()
+                info.update(digest=digest, stat_key=stat_key, file_size=len(mapped))
+                
+                # Same content under another path: no need to parse again.
+                entry = self._cache.get(digest)
+                if entry is not None:
+                    self._cache.put(digest, entry, stat_key=stat_key)
+                    info["cached"] = entry
+                    for page in entry.pages:
+                        yield page
+                    return
+                
+                doc_type = self.detect_type(file_path)
+                if doc_type == DocumentType.UNKNOWN:
+                    doc_type = self.detect_type_by_magic(mapped[:1024])
+                info["doc_type"] = doc_type
+                
+                parser = self.get_parser(doc_type)
+                if parser is None:
+                    raise ValueError(f"No parser available for document type: {doc_type}")
+                
+                if isinstance(parser, PDFParser):
+                    pages = self._stream_pdf(file_path, executor, info)
+                elif type(parser) in (TXTParser, MDParser) and mapped[:2] not in (
+                    b"\xff\xfe", b"\xfe\xff"  # UTF-16 can't be split on b"\n"
+                ):
+                    pages = self._stream_text(mapped, parser, info)
+                else:
+                    pages = self._stream_whole(bytes(mapped), parser, info)
+                
+                async for page in pages:
+                    yield page
+            finally:
+                if isinstance(mapped, mmap.mmap):
+                    mapped.close()
+    
+    async def _stream_pdf(
+        self,
+        file_path: Path,
+        executor: Optional[Executor],
+        info: dict,
+    ) -> AsyncIterator[PageChunk]:
+        """Extract PDF pages in parallel batches, yielding them in order."""
+        loop = asyncio.get_running_loop()
+        path = str(file_path.absolute())
+        page_count, metadata = await loop.run_in_executor(None, probe_pdf, path)
+        info.update(page_count=page_count, metadata=metadata, separator=PAGE_SEPARATOR)
+        
+        if executor is None and self._page_workers > 1 and page_count > self._pages_per_task:
+            executor = self._get_pool()
+        
+        step = self._pages_per_task
+        ranges = [(s, min(s + step, page_count)) for s in range(0, page_count, step)]
+        # Keep a bounded window of batches in flight so memory stays flat.
+        window = max(2, self._page_workers * 2)
+        pending: list[asyncio.Future] = []
+        next_range = 0
+        index = 0
+        offset = 0
+        
+        while next_range < len(ranges) or pending:
+            while next_range < len(ranges) and len(pending) < window:
+                start, stop = ranges[next_range]
+                pending.append(
+                    loop.run_in_executor(executor, extract_pdf_pages, path, start, stop)
+                )
+                next_range += 1
+            
+            for text in await pending.pop(0):
+                yield PageChunk(index=index, text=text, offset=offset)
+                if text:
+                    offset += len(text) + len(PAGE_SEPARATOR)
+                index += 1
+    
+    async def _stream_text(
+        self,
+        mapped,
+        parser: TXTParser,
+        info: dict,
+    ) -> AsyncIterator[PageChunk]:
+        """Split memory-mapped text into fixed-size line pages."""
+        # Pages keep their trailing newlines and concatenate back to the file.
+        info["separator"] = ""
+        start = 0
+        size = len(mapped)
+        index = 0
+        offset = 0
+        
+        while start < size:
+            end = start
+            for _ in range(TEXT_LINES_PER_PAGE):
+                nl = mapped.find(b"\n", end)
+                if nl == -1:
+                    end = size
+                    break
+                end = nl + 1
+            text = parser._decode(mapped[start:end])
+            yield PageChunk(index=index, text=text, offset=offset)
+            offset += len(text)
+            index += 1
+            start = end
+        
+        info.update(
+            page_count=max(1, index),
+            metadata={"encoding": getattr(parser, "_detected_encoding", "utf-8")},
+        )
+    
+    async def _stream_whole(
+        self,
+        data: bytes,
+        parser: DocumentParser,
+        info: dict,
+    ) -> AsyncIterator[PageChunk]:
+        """Fallback for formats without page-level access."""
+        result = await parser.parse(data)
+        info.update(page_count=result.page_count, metadata=result.metadata, separator="")
+        yield PageChunk(index=0, text=result.text, offset=0)
+    
+    def _get_pool(self) -> Executor:
+        """Lazily create the page extraction process pool."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._page_workers)
+        return self._pool
+    
+    def close(self) -> None:
+        """Shut down the page extraction pool, if started."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+    
+    @property
+    def cache(self) -> DocumentCache:
+        """Content-hash cache used by streaming ingestion."""
+        return self._cache
+    
     def set_structure_extractor(self, extractor: "StructureExtractor") -> None:
         """
         Set the structure extractor.
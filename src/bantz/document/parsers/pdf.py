@@ -129,13 +129,7 @@ class PDFParser(DocumentParser):
     
     def _clean_metadata(self, metadata: dict) -> dict:
         """Clean metadata dictionary."""
-        cleaned = {}
-        for key, value in metadata.items():
-            if value is not None:
-                # Remove leading slash from keys (pdfplumber style)
-                clean_key = key.lstrip("/").lower()
-                cleaned[clean_key] = str(value) if value else ""
-        return cleaned
+        return _clean_pdf_metadata(metadata)
     
     def can_parse(self, data: bytes) -> bool:
         """
@@ -160,6 +154,95 @@ class PDFParser(DocumentParser):
         return ["application/pdf"]
 
 
+def _clean_pdf_metadata(metadata: dict) -> dict:
+    """Normalise PDF metadata keys and stringify values."""
+    cleaned = {}
+    for key, value in metadata.items():
+        if value is not None:
+            # Remove leading slash from keys (pdfplumber style)
+            clean_key = key.lstrip("/").lower()
+            cleaned[clean_key] = str(value) if value else ""
+    return cleaned
+
+
+def _load_pdf_backend() -> tuple[str, object]:
+    """Return ``(name, module)`` for the first available PDF library."""
+    try:
+        import pdfplumber
+        return "pdfplumber", pdfplumber
+    except ImportError:
+        pass
+    try:
+        import fitz  # PyMuPDF
+        return "pymupdf", fitz
+    except ImportError:
+        raise ImportError(
+            "No PDF library available. Install pdfplumber or PyMuPDF: "
+            "pip install pdfplumber or pip install PyMuPDF"
+        ) from None
+
+
+def probe_pdf(path: str) -> tuple[int, dict]:
+    """
+    Read page count and metadata without extracting any text.
+    
+    Args:
+        path: Path to the PDF file.
+        
+    Returns:
+        Tuple of (page_count, cleaned metadata).
+        
+    Raises:
+        ValueError: If the PDF cannot be opened.
+    """
+    name, lib = _load_pdf_backend()
+    try:
+        if name == "pdfplumber":
+            with lib.open(path) as pdf:
+                return len(pdf.pages), _clean_pdf_metadata(pdf.metadata or {})
+        doc = lib.open(path)
+        try:
+            return len(doc), _clean_pdf_metadata(doc.metadata or {})
+        finally:
+            doc.close()
+    except Exception as e:
+        raise ValueError(f"Failed to parse PDF: {e}") from e
+
+
+def extract_pdf_pages(path: str, start: int, stop: int) -> list[str]:
+    """
+    Extract text for pages ``[start, stop)`` of a PDF file.
+    
+    Module-level so it can be shipped to a process pool: each worker opens
+    the file by path instead of receiving the document bytes over a pipe.
+    
+    Args:
+        path: Path to the PDF file.
+        start: First page index (inclusive).
+        stop: Last page index (exclusive).
+        
+    Returns:
+        One string per page (empty string for pages without text).
+    """
+    name, lib = _load_pdf_backend()
+    pages: list[str] = []
+    try:
+        if name == "pdfplumber":
+            with lib.open(path, pages=list(range(start + 1, stop + 1))) as pdf:
+                for page in pdf.pages:
+                    pages.append(page.extract_text() or "")
+        else:
+            doc = lib.open(path)
+            try:
+                for index in range(start, min(stop, len(doc))):
+                    pages.append(doc[index].get_text() or "")
+            finally:
+                doc.close()
+    except Exception as e:
+        raise ValueError(f"Failed to parse PDF pages {start}-{stop}: {e}") from e
+    return pages
+
+
 def create_pdf_parser() -> PDFParser:
     """Factory function to create a PDF parser."""
     return PDFParser()
@@ -214,6 +214,45 @@ class StructureExtractor:
         
         return structure
     
+    def extend(
+        self,
+        structure: DocumentStructure,
+        text: str,
+        offset: int = 0,
+    ) -> DocumentStructure:
+        """
+        Extract structure from one chunk of a larger document.
+        
+        Used by streaming ingestion to build the structure page by page.
+        Chunks must be fed in document order; positions are shifted by
+        ``offset`` so they index into the fully joined text. Lists and
+        tables spanning a chunk boundary are reported as two groups.
+        
+        Args:
+            structure: Structure to append to (modified in place).
+            text: Chunk text.
+            offset: Position of the chunk within the full document text.
+            
+        Returns:
+            The updated structure.
+        """
+        partial = self.extract(text)
+        
+        if offset:
+            for element in partial.elements:
+                element.start_pos += offset
+                element.end_pos += offset
+            for table in partial.tables:
+                table.start_pos += offset
+                table.end_pos += offset
+        
+        structure.headings.extend(partial.headings)
+        structure.lists.extend(partial.lists)
+        structure.tables.extend(partial.tables)
+        structure.elements.extend(partial.elements)
+        
+        return structure
+    
     def find_headings(self, text: str) -> list[StructureElement]:
         """
         Find all headings in text.
@@ -3,7 +3,7 @@
 Provides:
 - OAuth2 authentication reusing Bantz's existing Google auth infra
 - Contact search: name → email, phone → name
-- Two-way sync: Google Contacts ↔ local contacts.json
+- Two-way sync: Google Contacts ↔ local contacts store
 - Resolution helper for "Ahmet'e mail at" → auto email lookup
 """
 
@@ -245,7 +245,7 @@ class GoogleContactsClient:
 
 
 class ContactSyncer:
-    """Two-way sync between Google Contacts and local contacts.json.
+    """Two-way sync between Google Contacts and the local contacts store.
 
     Example::
 
@@ -285,7 +285,10 @@ class ContactSyncer:
                 continue
 
             try:
-                existing = contacts_resolve(name=gc.display_name, path=self._contacts_path)
+                # Exact/folded lookup only — a fuzzy hit would merge distinct people.
+                existing = contacts_resolve(
+                    name=gc.display_name, path=self._contacts_path, fuzzy=False,
+                )
                 if existing.get("ok"):
                     if existing.get("email") != gc.primary_email:
                         contacts_upsert(
@@ -371,7 +374,7 @@ def resolve_contact_email(name: str, contacts_path: Optional[str] = None) -> Opt
 
     Args:
         name: Contact name to look up.
-        contacts_path: Optional path to contacts.json.
+        contacts_path: Optional contacts store path (see ``bantz.contacts.store``).
 
     Returns:
         Email address or None.
@@ -2,7 +2,8 @@
 Bantz IPC Module - Inter-Process Communication for Overlay
 v0.6.2.1
 
-Transport: Unix Domain Socket + JSONL (JSON Lines)
+Transport: Unix Domain Socket + JSONL (JSON Lines) or length-prefixed
+binary frames (msgpack when installed), with batched updates
 """
 
 from .protocol import (
@@ -15,8 +16,11 @@ from .protocol import (
     AckMessage,
     PingMessage,
     PongMessage,
+    BatchMessage,
     encode_message,
     decode_message,
+    encode_frame,
+    read_message,
     get_socket_path,
 )
 from .overlay_client import OverlayClient
@@ -32,8 +36,11 @@ __all__ = [
     "AckMessage",
     "PingMessage",
     "PongMessage",
+    "BatchMessage",
     "encode_message",
     "decode_message",
+    "encode_frame",
+    "read_message",
     "get_socket_path",
     "OverlayClient",
     "OverlayServer",
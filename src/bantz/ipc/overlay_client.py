@@ -8,14 +8,16 @@ Handles:
 - Receiving events (timeout, dismissed)
 - Ping/pong heartbeat
 - Auto-reconnect with backoff
+- Coalesced, batched updates per frame tick (``post``) with binary framing
 """
 
 import asyncio
 import logging
+import os
 import subprocess
 import sys
 from pathlib import Path
-from typing import Optional, Callable, Awaitable
+from typing import Optional, Callable, Awaitable, Union
 
 from .protocol import (
     StateMessage,
@@ -24,8 +26,10 @@ from .protocol import (
     PongMessage,
     AckMessage,
     EventMessage,
-    encode_message,
-    decode_message,
+    BaseMessage,
+    BatchMessage,
+    encode_for,
+    read_message,
     parse_message,
     get_socket_path,
     ensure_socket_dir,
@@ -37,6 +41,8 @@ from .protocol import (
     action_preview,
     action_cursor_dot,
     action_highlight_rect,
+    FRAMING_BINARY,
+    FRAMING_JSONL,
 )
 
 logger = logging.getLogger(__name__)
@@ -60,7 +66,21 @@ class OverlayClient:
     # Max pending acks before warning
     MAX_PENDING_ACKS = 10
     
-    def __init__(self):
+    # Posted updates are coalesced and flushed once per frame tick (seconds)
+    FRAME_INTERVAL = 1 / 60
+    
+    # Only wait for the socket to drain above this many buffered bytes
+    DRAIN_THRESHOLD = 64 * 1024
+    
+    def __init__(self, framing: Optional[str] = None, frame_interval: Optional[float] = None):
+        """
+        Args:
+            framing: ``binary`` (default) or ``jsonl``; env BANTZ_IPC_FRAMING
+            frame_interval: Coalescing window for ``post`` (seconds)
+        """
+        framing = (framing or os.getenv("BANTZ_IPC_FRAMING") or FRAMING_BINARY).strip().lower()
+        self._framing = framing if framing in (FRAMING_BINARY, FRAMING_JSONL) else FRAMING_BINARY
+        self._frame_interval = self.FRAME_INTERVAL if frame_interval is None else frame_interval
         self._reader: Optional[asyncio.StreamReader] = None
         self._writer: Optional[asyncio.StreamWriter] = None
         self._connected = False
@@ -85,12 +105,23 @@ class OverlayClient:
         # Reconnect state
         self._reconnect_attempt = 0
         self._auto_respawn = True
+        
+        # Coalescing (post → one batch per frame tick)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: dict[str, BaseMessage] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self.stats = {"posted": 0, "coalesced": 0, "frames": 0, "bytes": 0}
     
     @property
     def connected(self) -> bool:
         """Check if connected to overlay."""
         return self._connected and self._writer is not None
     
+    @property
+    def framing(self) -> str:
+        """Wire framing used for outgoing messages (binary or jsonl)."""
+        return self._framing
+    
     @property
     def current_state(self) -> str:
         """Get current overlay state."""
@@ -119,6 +150,7 @@ class OverlayClient:
             return True
         
         self._running = True
+        self._loop = asyncio.get_running_loop()
         logger.info("[OverlayClient] Starting...")
         
         # Ensure socket directory exists
@@ -156,7 +188,15 @@ class OverlayClient:
                 except asyncio.CancelledError:
                     pass
         
-        # Send idle state before disconnecting
+        # Flush coalesced updates, then send idle state before disconnecting
+        if self._flush_task:
+            self._flush_task.cancel()
+            self._flush_task = None
+        if self._connected:
+            try:
+                await self.flush()
+            except Exception:
+                pass
         if self._connected:
             try:
                 await self.send_state(state_idle())
@@ -186,17 +226,13 @@ class OverlayClient:
             return False
 
         try:
-            data = encode_message(msg)
-            self._writer.write(data)
-            await self._writer.drain()
+            await self._write(msg)
             
             # Track pending ack
             self._pending_acks[msg.id] = asyncio.get_event_loop().time()
             
             # Update local state
-            self._current_state = msg.state
-            if msg.position:
-                self._current_position = msg.position
+            self._track_state(msg)
             
             logger.debug(f"[OverlayClient] Sent state: {msg.state}, text: {msg.text[:30] if msg.text else 'None'}...")
             return True
@@ -213,9 +249,7 @@ class OverlayClient:
             return False
 
         try:
-            data = encode_message(msg)
-            self._writer.write(data)
-            await self._writer.drain()
+            await self._write(msg)
 
             # Track pending ack
             self._pending_acks[msg.id] = asyncio.get_event_loop().time()
@@ -230,6 +264,51 @@ class OverlayClient:
             await self._handle_disconnect()
             return False
 
+    def post(self, msg: Union[StateMessage, ActionMessage]) -> None:
+        """
+        Queue an update without waiting for the socket (thread-safe).
+        
+        Updates posted within one frame tick are coalesced — the latest
+        state wins, and the latest action of each kind (cursor dot,
+        highlight, preview) wins — and sent as a single batch frame that
+        the overlay acknowledges once.  A state posted with
+        ``position=None`` takes the client's position at flush time.
+        """
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._enqueue(msg)
+        else:
+            loop.call_soon_threadsafe(self._enqueue, msg)
+    
+    async def flush(self) -> bool:
+        """Send all coalesced updates now (one frame)."""
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return True
+        if not self._connected or not self._writer:
+            return False
+        msgs = list(pending.values())
+        for m in msgs:
+            if isinstance(m, StateMessage) and not m.position:
+                m.position = self._current_position
+        out: BaseMessage = msgs[0] if len(msgs) == 1 else BatchMessage(items=[m.to_dict() for m in msgs])
+        try:
+            await self._write(out)
+        except Exception as e:
+            logger.error(f"[OverlayClient] Batch send error: {e}")
+            await self._handle_disconnect()
+            return False
+        self._pending_acks[out.id] = asyncio.get_event_loop().time()
+        for m in msgs:
+            self._track_state(m)
+        return True
+    
     async def preview(self, text: str, duration_ms: int = 1200) -> bool:
         """Convenience: show a short action preview text."""
         return await self.send_action(action_preview(text=text, duration_ms=duration_ms))
@@ -276,12 +355,16 @@ class OverlayClient:
         """
         Update overlay position while keeping current state.
         
+        Coalesced updates are flushed first, so the state is current and
+        a state posted just before the move cannot revert it.
+        
         Args:
             position: One of center, top_right, top_left, bottom_right, bottom_left
             
         Returns:
             True if sent successfully
         """
+        await self.flush()
         msg = StateMessage(
             state=self._current_state,
             position=position,
@@ -294,6 +377,46 @@ class OverlayClient:
     
     # --- Internal methods ---
     
+    async def _write(self, msg: BaseMessage) -> None:
+        """Encode and write one message; drain only when the buffer is large."""
+        data = encode_for(msg, self._framing)
+        self._writer.write(data)
+        self.stats["frames"] += 1
+        self.stats["bytes"] += len(data)
+        transport = self._writer.transport
+        if transport is None or transport.get_write_buffer_size() > self.DRAIN_THRESHOLD:
+            await self._writer.drain()
+    
+    def _track_state(self, msg: BaseMessage) -> None:
+        """Mirror a sent state message locally."""
+        if isinstance(msg, StateMessage):
+            self._current_state = msg.state
+            if msg.position:
+                self._current_position = msg.position
+    
+    def _enqueue(self, msg: BaseMessage) -> None:
+        """Coalesce *msg* into the pending frame (runs on the client loop)."""
+        if isinstance(msg, StateMessage):
+            key = "state"
+        elif isinstance(msg, ActionMessage):
+            key = f"action:{msg.action}"
+        else:
+            key = msg.id
+        self.stats["posted"] += 1
+        if key in self._pending:
+            self.stats["coalesced"] += 1
+        self._pending[key] = msg
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.ensure_future(self._flush_later())
+    
+    async def _flush_later(self) -> None:
+        """Flush pending updates at the end of the current frame tick."""
+        try:
+            await asyncio.sleep(self._frame_interval)
+        except asyncio.CancelledError:
+            return
+        await self.flush()
+    
     async def _spawn_overlay(self) -> bool:
         """Spawn the overlay process."""
         if self._overlay_process and self._overlay_process.poll() is None:
@@ -458,10 +581,7 @@ class OverlayClient:
                 if not self._connected or not self._writer:
                     break
                 
-                ping = PingMessage()
-                data = encode_message(ping)
-                self._writer.write(data)
-                await self._writer.drain()
+                await self._write(PingMessage())
                 
                 logger.debug(f"[OverlayClient] Sent ping")
                 
@@ -485,16 +605,15 @@ class OverlayClient:
                 if not self._reader:
                     break
                 
-                # Read until newline (JSONL)
-                line = await self._reader.readline()
+                # Read one message (JSONL line or binary frame)
+                data, framing = await read_message(self._reader)
                 
-                if not line:
+                if framing is None:
                     logger.warning("[OverlayClient] Connection closed by overlay")
                     await self._handle_disconnect()
                     break
                 
                 # Parse message
-                data = decode_message(line)
                 if not data:
                     continue
                 
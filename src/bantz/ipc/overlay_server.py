@@ -7,6 +7,8 @@ Handles:
 - Receiving state updates from daemon
 - Sending acks and events
 - Responding to ping/pong
+- JSONL or binary frames (replies use the daemon's last framing); batch
+  messages are acked once and applied in order
 """
 
 import asyncio
@@ -21,8 +23,10 @@ from .protocol import (
     AckMessage,
     PingMessage,
     PongMessage,
-    encode_message,
-    decode_message,
+    BaseMessage,
+    BatchMessage,
+    encode_for,
+    read_message,
     parse_message,
     get_socket_path,
     ensure_socket_dir,
@@ -31,6 +35,7 @@ from .protocol import (
     event_dismissed,
     MessageType,
     EventReason,
+    FRAMING_JSONL,
 )
 
 logger = logging.getLogger(__name__)
@@ -42,6 +47,9 @@ class OverlayServer:
     Receives state updates from daemon and sends events back.
     """
     
+    # Only wait for the socket to drain above this many buffered bytes
+    DRAIN_THRESHOLD = 64 * 1024
+    
     def __init__(self):
         self._server: Optional[asyncio.AbstractServer] = None
         self._reader: Optional[asyncio.StreamReader] = None
@@ -56,6 +64,9 @@ class OverlayServer:
         
         # Receive task
         self._receive_task: Optional[asyncio.Task] = None
+        
+        # Reply framing follows whatever the daemon last sent
+        self._framing = FRAMING_JSONL
     
     @property
     def connected(self) -> bool:
@@ -165,9 +176,7 @@ class OverlayServer:
             return False
         
         try:
-            data = encode_message(event)
-            self._writer.write(data)
-            await self._writer.drain()
+            await self._write(event, drain=True)
             
             logger.debug(f"[OverlayServer] Sent event: {event.event}")
             return True
@@ -200,6 +209,7 @@ class OverlayServer:
         self._reader = reader
         self._writer = writer
         self._connected = True
+        self._framing = FRAMING_JSONL
         
         peer = writer.get_extra_info('peername')
         logger.info(f"[OverlayServer] Daemon connected: {peer}")
@@ -233,15 +243,15 @@ class OverlayServer:
                 if not self._reader:
                     break
                 
-                # Read until newline (JSONL)
-                line = await self._reader.readline()
+                # Read one message (JSONL line or binary frame)
+                data, framing = await read_message(self._reader)
                 
-                if not line:
+                if framing is None:
                     logger.warning("[OverlayServer] Connection closed by daemon")
                     break
+                self._framing = framing
                 
                 # Parse message
-                data = decode_message(line)
                 if not data:
                     continue
                 
@@ -258,14 +268,20 @@ class OverlayServer:
                 logger.error(f"[OverlayServer] Receive error: {e}")
                 break
     
-    async def _handle_message(self, msg) -> None:
-        """Handle received message."""
-        if isinstance(msg, StateMessage):
+    async def _handle_message(self, msg, ack: bool = True) -> None:
+        """Handle received message (batch items are not acked individually)."""
+        if isinstance(msg, BatchMessage):
+            logger.debug(f"[OverlayServer] Received batch of {len(msg.items)}")
+            await self._send_ack(AckMessage(id=msg.id))
+            for item in msg.messages():
+                await self._handle_message(item, ack=False)
+        
+        elif isinstance(msg, StateMessage):
             logger.debug(f"[OverlayServer] Received state: {msg.state}, text: {msg.text[:30] if msg.text else 'None'}...")
             
             # Send ack
-            ack = AckMessage(id=msg.id)
-            await self._send_ack(ack)
+            if ack:
+                await self._send_ack(AckMessage(id=msg.id))
             
             # Call state callback
             if self._on_state:
@@ -278,8 +294,8 @@ class OverlayServer:
             logger.debug(f"[OverlayServer] Received action: {msg.action}, text: {msg.text[:30] if msg.text else 'None'}...")
 
             # Send ack
-            ack = AckMessage(id=msg.id)
-            await self._send_ack(ack)
+            if ack:
+                await self._send_ack(AckMessage(id=msg.id))
 
             if self._on_action:
                 try:
@@ -297,15 +313,24 @@ class OverlayServer:
         else:
             logger.debug(f"[OverlayServer] Received unknown message type: {type(msg)}")
     
+    async def _write(self, msg: BaseMessage, drain: bool = False) -> None:
+        """Write one message in the daemon's framing.
+        
+        Acks and pongs are pipelined: the socket is only drained when its
+        buffer grows past DRAIN_THRESHOLD (or when *drain* is set).
+        """
+        self._writer.write(encode_for(msg, self._framing))
+        transport = self._writer.transport
+        if drain or transport is None or transport.get_write_buffer_size() > self.DRAIN_THRESHOLD:
+            await self._writer.drain()
+    
     async def _send_ack(self, ack: AckMessage) -> bool:
         """Send ack message."""
         if not self._connected or not self._writer:
             return False
         
         try:
-            data = encode_message(ack)
-            self._writer.write(data)
-            await self._writer.drain()
+            await self._write(ack)
             logger.debug(f"[OverlayServer] Sent ack for {ack.id}")
             return True
         except Exception as e:
@@ -318,9 +343,7 @@ class OverlayServer:
             return False
         
         try:
-            data = encode_message(pong)
-            self._writer.write(data)
-            await self._writer.drain()
+            await self._write(pong)
             logger.debug("[OverlayServer] Sent pong")
             return True
         except Exception as e:
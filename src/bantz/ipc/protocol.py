@@ -6,9 +6,20 @@ Spec:
 - Unix domain socket (stream) + JSONL (each message ends with \n)
 - Socket path: ~/.local/share/bantz/ipc/overlay.sock
 - Common fields: v, type, ts, id
+
+Binary framing (optional, mixed freely with JSONL on the same stream):
+- 6-byte header: magic 0xB7, codec byte (``M`` msgpack / ``J`` JSON),
+  uint32 big-endian payload length; then the payload
+- msgpack is used when installed, compact JSON otherwise
+- A ``batch`` message carries several coalesced messages in one frame and
+  is acknowledged once
+- Receivers sniff the first byte (``{`` = JSONL line) and reply in the
+  framing the peer last used
 """
 
+import asyncio
 import json
+import struct
 import time
 import uuid
 from dataclasses import dataclass, field, asdict
@@ -16,6 +27,13 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional, Any, Union
 
+try:
+    import msgpack
+    HAS_MSGPACK = True
+except ImportError:
+    msgpack = None
+    HAS_MSGPACK = False
+
 # Protocol version - increment on breaking changes
 IPC_VERSION = 1
 
@@ -28,6 +46,7 @@ class MessageType(str, Enum):
     PING = "ping"
     PONG = "pong"
     ACK = "ack"
+    BATCH = "batch"
 
 
 class ActionType(str, Enum):
@@ -170,8 +189,29 @@ class PongMessage(BaseMessage):
     type: str = MessageType.PONG.value
 
 
+@dataclass
+class BatchMessage(BaseMessage):
+    """
+    Daemon → Overlay: several messages delivered (and acked) together.
+    Items are plain message dicts, applied in order.
+    """
+    type: str = MessageType.BATCH.value
+    items: list = field(default_factory=list)
+
+    def messages(self) -> list:
+        """Parse the items into typed messages (invalid items are skipped)."""
+        out = []
+        for item in self.items:
+            msg = parse_message(item) if isinstance(item, dict) else None
+            if msg is not None and not isinstance(msg, BatchMessage):
+                out.append(msg)
+        return out
+
+
 # Type alias for all message types
-IPCMessage = Union[StateMessage, ActionMessage, EventMessage, AckMessage, PingMessage, PongMessage]
+IPCMessage = Union[
+    StateMessage, ActionMessage, EventMessage, AckMessage, PingMessage, PongMessage, BatchMessage,
+]
 
 
 def encode_message(msg: BaseMessage) -> bytes:
@@ -267,12 +307,105 @@ def parse_message(data: dict) -> Optional[IPCMessage]:
                 id=data.get('id', _generate_id()),
                 ts=data.get('ts', _now_ms()),
             )
+        elif msg_type == MessageType.BATCH.value:
+            items = data.get('items')
+            return BatchMessage(
+                v=data.get('v', IPC_VERSION),
+                id=data.get('id', _generate_id()),
+                ts=data.get('ts', _now_ms()),
+                items=list(items) if isinstance(items, list) else [],
+            )
     except Exception as e:
         print(f"[IPC] Parse error: {e}")
     
     return None
 
 
+# ── Binary framing ───────────────────────────────────────────────
+
+FRAME_MAGIC = 0xB7
+CODEC_MSGPACK = ord("M")
+CODEC_JSON = ord("J")
+FRAME_HEADER = struct.Struct(">BBI")  # magic, codec, payload length
+MAX_FRAME_BYTES = 1 << 20
+
+FRAMING_JSONL = "jsonl"
+FRAMING_BINARY = "binary"
+
+
+def default_codec() -> int:
+    """Payload codec for binary frames (msgpack when installed)."""
+    return CODEC_MSGPACK if HAS_MSGPACK else CODEC_JSON
+
+
+def encode_frame(msg: Union[BaseMessage, dict], codec: Optional[int] = None) -> bytes:
+    """
+    Encode a message as one binary frame (header + payload).
+    """
+    data = msg.to_dict() if isinstance(msg, BaseMessage) else msg
+    codec = default_codec() if codec is None else codec
+    if codec == CODEC_MSGPACK:
+        if not HAS_MSGPACK:
+            raise RuntimeError("msgpack not installed")
+        payload = msgpack.packb(data, use_bin_type=True)
+    else:
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return FRAME_HEADER.pack(FRAME_MAGIC, codec, len(payload)) + payload
+
+
+def decode_payload(codec: int, payload: bytes) -> Optional[dict]:
+    """
+    Decode a binary frame payload. Returns dict or None on error.
+    """
+    try:
+        if codec == CODEC_MSGPACK:
+            if not HAS_MSGPACK:
+                return None
+            data = msgpack.unpackb(payload, raw=False)
+        elif codec == CODEC_JSON:
+            data = json.loads(payload.decode('utf-8'))
+        else:
+            return None
+    except Exception as e:
+        print(f"[IPC] Frame decode error: {e}")
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def encode_for(msg: Union[BaseMessage, dict], framing: str) -> bytes:
+    """Encode *msg* in the given framing (``jsonl`` or ``binary``)."""
+    if framing == FRAMING_BINARY:
+        return encode_frame(msg)
+    if isinstance(msg, dict):
+        return (json.dumps(msg, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+    return encode_message(msg)
+
+
+async def read_message(reader: asyncio.StreamReader) -> tuple:
+    """
+    Read one message in either framing.
+
+    Returns ``(data, framing)``; ``data`` is None for an undecodable
+    message and ``framing`` is None at end of stream.
+    """
+    try:
+        first = await reader.readexactly(1)
+    except asyncio.IncompleteReadError:
+        return None, None
+    if first[0] != FRAME_MAGIC:
+        rest = await reader.readline()
+        return decode_message(first + rest), FRAMING_JSONL
+    try:
+        header = first + await reader.readexactly(FRAME_HEADER.size - 1)
+        _, codec, length = FRAME_HEADER.unpack(header)
+        if length > MAX_FRAME_BYTES:
+            raise ValueError(f"frame too large ({length} bytes)")
+        payload = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None, None
+    return decode_payload(codec, payload), FRAMING_BINARY
+
+
 def get_socket_path() -> Path:
     """
     Get the IPC socket path.
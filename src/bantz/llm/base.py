@@ -20,6 +20,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Dict, List, Optional, Protocol
 
+from bantz.llm.coalescer import Priority, gather, get_llm_coalescer
+
 
 @dataclass(frozen=True)
 class LLMMessage:
@@ -163,7 +165,37 @@ class LLMClient(ABC):
             Same as chat()
         """
         pass
-    
+
+    def chat_detailed_batch(
+        self,
+        batch: List[List[LLMMessage]],
+        *,
+        priority: Priority = Priority.BACKGROUND,
+        **kwargs,
+    ) -> List[LLMResponse]:
+        """Run independent chat completions concurrently.
+
+        Requests go through the shared :mod:`bantz.llm.coalescer`, so they
+        are in flight together (and batched by the server) while staying
+        under its concurrency cap.
+
+        Args:
+            batch: One message list per request
+            priority: Dispatch priority (default: background)
+            **kwargs: Passed to chat_detailed() for every request
+
+        Returns:
+            LLMResponse per request, in input order
+
+        Raises:
+            The first error raised by any request (after all have finished)
+        """
+        coalescer = get_llm_coalescer()
+        return gather([
+            coalescer.submit_chat(self, messages, priority=priority, **kwargs)
+            for messages in batch
+        ])
+
     @property
     @abstractmethod
     def model_name(self) -> str:
@@ -0,0 +1,267 @@
+"""LLM request coalescer.
+
+vLLM batches whatever requests are in flight at the same time
+(continuous batching), so N independent calls issued together finish in
+roughly the time of the slowest one instead of the sum of all of them.
+:class:`LLMRequestCoalescer` lets callers submit LLM calls as futures and
+dispatches them on a bounded set of worker threads:
+
+- at most ``max_concurrency`` calls are in flight per coalescer, so a
+  large batch cannot flood the server;
+- queued calls are started in :class:`Priority` order — a user-facing
+  call overtakes queued background work — and FIFO within a priority;
+- a call submitted from one of the coalescer's own workers runs inline,
+  so nested submissions can never deadlock the pool.
+
+Example::
+
+    coalescer = get_llm_coalescer()
+    futures = [
+        coalescer.submit_chat(client, messages, priority=Priority.BACKGROUND)
+        for messages in batch
+    ]
+    responses = gather(futures)
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import os
+import queue
+import threading
+from concurrent.futures import Future
+from enum import IntEnum
+from typing import Any, Callable, Dict, Iterable, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class Priority(IntEnum):
+    """Dispatch priority; lower values start first."""
+
+    USER = 0  # The user is waiting on this reply
+    INTERNAL = 1  # Guards, summaries and other in-turn helpers
+    BACKGROUND = 2  # Batch/offline work
+
+
+def default_max_concurrency() -> int:
+    """Concurrency cap from ``BANTZ_LLM_MAX_CONCURRENCY`` (default 8)."""
+    try:
+        return max(1, int(os.getenv("BANTZ_LLM_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_MAX_CONCURRENCY
+
+
+class LLMRequestCoalescer:
+    """Priority-ordered, concurrency-capped dispatcher for LLM calls.
+
+    Worker threads are started on demand up to ``max_concurrency`` and
+    then stay parked on the queue.
+
+    Args:
+        max_concurrency: Maximum calls in flight (``None`` reads
+            ``BANTZ_LLM_MAX_CONCURRENCY``).
+        name: Thread name prefix.
+    """
+
+    def __init__(self, max_concurrency: Optional[int] = None, name: str = "llm-coalescer"):
+        self.max_concurrency = max(1, max_concurrency or default_max_concurrency())
+        self.name = name
+        self._queue: "queue.PriorityQueue[tuple]" = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._threads: List[threading.Thread] = []
+        self._idle = 0
+        self._waiting = 0
+        self._closed = False
+        self.submitted = 0
+        self.completed = 0
+        self.inline = 0
+        self.peak_in_flight = 0
+        self._in_flight = 0
+
+    def submit(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        priority: Priority = Priority.INTERNAL,
+        **kwargs: Any,
+    ) -> "Future[T]":
+        """Schedule ``fn(*args, **kwargs)`` and return its future.
+
+        Raises:
+            RuntimeError: If the coalescer has been shut down.
+        """
+        future: "Future[T]" = Future()
+        if getattr(self._local, "worker", False):
+            # Already on one of our workers: waiting on the queue could deadlock.
+            with self._lock:
+                self.submitted += 1
+                self.inline += 1
+            self._run(future, fn, args, kwargs)
+            return future
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("LLM request coalescer is shut down")
+            self.submitted += 1
+            self._waiting += 1
+            self._queue.put((int(priority), next(self._seq), future, fn, args, kwargs))
+            if self._waiting > self._idle and len(self._threads) < self.max_concurrency:
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"{self.name}-{len(self._threads)}",
+                    daemon=True,
+                )
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def submit_chat(
+        self,
+        client: Any,
+        messages: List[Any],
+        *,
+        priority: Priority = Priority.INTERNAL,
+        **kwargs: Any,
+    ) -> "Future[Any]":
+        """Schedule ``client.chat_detailed(messages, **kwargs)``."""
+        return self.submit(client.chat_detailed, messages, priority=priority, **kwargs)
+
+    def submit_text(
+        self,
+        client: Any,
+        prompt: str,
+        *,
+        priority: Priority = Priority.INTERNAL,
+        **kwargs: Any,
+    ) -> "Future[str]":
+        """Schedule ``client.complete_text(prompt=prompt, **kwargs)``."""
+        return self.submit(client.complete_text, prompt=prompt, priority=priority, **kwargs)
+
+    def map(
+        self,
+        fn: Callable[[Any], T],
+        items: Iterable[Any],
+        *,
+        priority: Priority = Priority.BACKGROUND,
+    ) -> List[T]:
+        """Apply ``fn`` to every item concurrently; results in input order."""
+        return gather([self.submit(fn, item, priority=priority) for item in items])
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "max_concurrency": self.max_concurrency,
+                "workers": len(self._threads),
+                "queued": self._queue.qsize(),
+                "in_flight": self._in_flight,
+                "peak_in_flight": self.peak_in_flight,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "inline": self.inline,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the workers after the queued calls have run."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads = list(self._threads)
+        for _ in threads:
+            # Sorts after every real priority, so queued work drains first.
+            self._queue.put((len(Priority) + 1, next(self._seq), None, None, (), {}))
+        if wait:
+            for thread in threads:
+                thread.join()
+
+    # ----- private helpers -----
+
+    def _worker(self) -> None:
+        self._local.worker = True
+        while True:
+            with self._lock:
+                self._idle += 1
+            _, _, future, fn, args, kwargs = self._queue.get()
+            with self._lock:
+                self._idle -= 1
+                if future is None:
+                    return
+                self._waiting -= 1
+            if not future.set_running_or_notify_cancel():
+                continue
+            with self._lock:
+                self._in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+            try:
+                self._run(future, fn, args, kwargs, notified=True)
+            finally:
+                with self._lock:
+                    self._in_flight -= 1
+
+    def _run(self, future: Future, fn: Callable, args: tuple, kwargs: dict, notified: bool = False) -> None:
+        if not notified:
+            future.set_running_or_notify_cancel()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                self.completed += 1
+
+
+def gather(futures: Iterable["Future[T]"]) -> List[T]:
+    """Wait for all futures and return their results in order.
+
+    Every future is awaited before the first failure (if any) is raised,
+    so no call is left running unobserved.
+    """
+    futures = list(futures)
+    error: Optional[BaseException] = None
+    results: List[Any] = []
+    for future in futures:
+        try:
+            results.append(future.result())
+        except BaseException as e:
+            results.append(None)
+            if error is None:
+                error = e
+    if error is not None:
+        raise error
+    return results
+
+
+# =============================================================================
+# Shared Coalescer
+# =============================================================================
+
+_coalescer: Optional[LLMRequestCoalescer] = None
+_coalescer_lock = threading.Lock()
+
+
+def get_llm_coalescer() -> LLMRequestCoalescer:
+    """Process-wide coalescer shared by all LLM clients."""
+    global _coalescer
+    with _coalescer_lock:
+        if _coalescer is None:
+            _coalescer = LLMRequestCoalescer()
+            logger.debug("[LLM] Request coalescer started (max_concurrency=%d)", _coalescer.max_concurrency)
+        return _coalescer
+
+
+def reset_llm_coalescer() -> None:
+    """Shut down the shared coalescer (tests, config reloads)."""
+    global _coalescer
+    with _coalescer_lock:
+        coalescer, _coalescer = _coalescer, None
+    if coalescer is not None:
+        coalescer.shutdown(wait=False)
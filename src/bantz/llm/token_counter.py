@@ -0,0 +1,385 @@
+"""Tokenizer-accurate token counting with memoised counts.
+
+``token_utils.estimate_tokens`` historically used ``len(text) // 4``, which
+undercounts Turkish badly (agglutinative words and ç/ğ/ı/ö/ş/ü split into
+more sub-word tokens).  This module adds pluggable exact-count backends and
+a calibrated per-language fallback:
+
+- ``tokenizer`` — a local ``tokenizer.json`` loaded with the HF
+  ``tokenizers`` package (``BANTZ_TOKENIZER_PATH``)
+- ``vllm`` — the vLLM ``/tokenize`` endpoint (``BANTZ_TOKEN_BACKEND=vllm``,
+  base URL from ``BANTZ_VLLM_URL``)
+- calibrated heuristic — chars-per-token ratio per detected language,
+  refined from exact counts whenever a backend is available
+
+Exact counts are memoised in an LRU keyed by the text itself, so the
+system prompt and other repeated sections cost one lookup per turn.
+A failing backend is skipped for ``retry_after`` seconds and the
+heuristic answers in the meantime.
+
+Remote backends (``vllm``) are never called on the caller's thread: a
+miss is answered by the heuristic while the exact count is fetched in the
+background, so the next count of the same text is exact.  The heuristic
+stays the default; an exact backend is used only when configured.
+
+Usage::
+
+    from bantz.llm.token_counter import get_token_counter
+
+    n = get_token_counter().count(prompt)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Protocol
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "TokenCountBackend",
+    "TokenizerFileBackend",
+    "VLLMTokenizeBackend",
+    "TokenCounter",
+    "detect_language",
+    "turkish_weight",
+    "DEFAULT_CHARS_PER_TOKEN",
+    "get_token_counter",
+    "set_token_counter",
+]
+
+# Chars-per-token for Qwen/Llama-style BPE tokenizers.  English prose is
+# ~4 chars/token; Turkish is closer to 3.
+DEFAULT_CHARS_PER_TOKEN: dict[str, float] = {
+    "en": 4.0,
+    "tr": 3.0,
+}
+
+_TR_CHARS = frozenset("çğıöşüÇĞİÖŞÜâîû")
+# Density of Turkish-specific letters in plain Turkish prose (~6%+).
+# Mixed text (Turkish prompt with JSON/English) sits in between and gets
+# an interpolated ratio.
+_TR_FULL_DENSITY = 0.06
+
+
+def turkish_weight(text: str) -> float:
+    """How Turkish *text* looks, 0.0 (none) … 1.0 (plain Turkish prose)."""
+    if not text:
+        return 0.0
+    hits = sum(1 for ch in text if ch in _TR_CHARS)
+    return min(1.0, hits / len(text) / _TR_FULL_DENSITY)
+
+
+def detect_language(text: str) -> str:
+    """Dominant language bucket: ``"tr"`` or ``"en"``."""
+    return "tr" if turkish_weight(text) > 0.5 else "en"
+
+
+class TokenCountBackend(Protocol):
+    """Anything that can count tokens exactly.
+
+    A backend with a true ``remote`` attribute makes network calls and is
+    only queried off the hot path (see :class:`TokenCounter`).
+    """
+
+    name: str
+
+    def count(self, text: str) -> int:
+        ...
+
+
+class TokenizerFileBackend:
+    """Count with a local HF ``tokenizer.json`` (requires ``tokenizers``)."""
+
+    def __init__(self, path: str):
+        try:
+            from tokenizers import Tokenizer
+        except ImportError as e:
+            raise RuntimeError(
+                "The 'tokenizers' package is required for BANTZ_TOKENIZER_PATH. "
+                "Install it with: pip install tokenizers"
+            ) from e
+        self._tokenizer = Tokenizer.from_file(os.path.expanduser(path))
+        self.name = f"tokenizer:{os.path.basename(path)}"
+
+    def count(self, text: str) -> int:
+        return len(self._tokenizer.encode(text, add_special_tokens=False).ids)
+
+
+class VLLMTokenizeBackend:
+    """Count via vLLM's ``POST /tokenize`` endpoint."""
+
+    remote = True
+
+    def __init__(
+        self,
+        base_url: str,
+        model: Optional[str] = None,
+        timeout_seconds: float = 1.0,
+    ):
+        base = base_url.rstrip("/")
+        if base.endswith("/v1"):
+            base = base[:-3]
+        self._url = f"{base}/tokenize"
+        self._model = model
+        self._timeout = timeout_seconds
+        self.name = "vllm"
+
+    def count(self, text: str) -> int:
+        import requests
+
+        payload: dict = {"prompt": text, "add_special_tokens": False}
+        if self._model:
+            payload["model"] = self._model
+        resp = requests.post(self._url, json=payload, timeout=self._timeout)
+        resp.raise_for_status()
+        data = resp.json()
+        if "count" in data:
+            return int(data["count"])
+        return len(data.get("tokens") or [])
+
+
+class TokenCounter:
+    """Memoising token counter with an optional exact backend.
+
+    Args:
+        backend: Exact-count backend, or ``None`` for heuristic only.
+        cache_size: Max memoised texts (LRU).
+        retry_after: Seconds to skip the backend after a failure.
+        ratios: Initial chars-per-token per language.
+    """
+
+    # Weight of a new exact sample in the running ratio (EMA).
+    CALIBRATION_ALPHA = 0.1
+    # Ignore tiny texts for calibration; their ratio is mostly noise.
+    CALIBRATION_MIN_CHARS = 200
+    # Remote counts queued at most; further misses just use the heuristic.
+    MAX_PENDING = 64
+
+    def __init__(
+        self,
+        backend: Optional[TokenCountBackend] = None,
+        *,
+        cache_size: int = 4096,
+        retry_after: float = 30.0,
+        ratios: Optional[dict[str, float]] = None,
+    ):
+        self.backend = backend
+        self._cache: OrderedDict[str, int] = OrderedDict()
+        self._cache_size = cache_size
+        self._retry_after = retry_after
+        self._backend_down_until = 0.0
+        self._ratios = dict(DEFAULT_CHARS_PER_TOKEN)
+        if ratios:
+            self._ratios.update(ratios)
+        self._lock = threading.Lock()
+        self._remote = bool(getattr(backend, "remote", False))
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: dict[str, Future[Optional[int]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.fallbacks = 0
+
+    # ── heuristic ────────────────────────────────────────────────────
+
+    def chars_per_token(self, text: str) -> float:
+        """Calibrated chars-per-token ratio, interpolated by Turkish weight."""
+        w = turkish_weight(text)
+        en, tr = self._ratios["en"], self._ratios["tr"]
+        return en + (tr - en) * w
+
+    def estimate(self, text: str) -> int:
+        """Heuristic count using the calibrated ratio (no backend call)."""
+        if not text:
+            return 0
+        return int(len(text) / self.chars_per_token(text))
+
+    def calibrate(self, text: str, exact: int) -> None:
+        """Fold an exact count for *text* into the dominant language's ratio.
+
+        The sample is mapped back to an endpoint by inverting the
+        interpolation in :meth:`chars_per_token`, holding the other
+        language's ratio fixed.
+        """
+        if exact <= 0 or len(text) < self.CALIBRATION_MIN_CHARS:
+            return
+        w = turkish_weight(text)
+        sample = len(text) / exact
+        with self._lock:
+            en, tr = self._ratios["en"], self._ratios["tr"]
+            if w > 0.5:
+                lang, target = "tr", en + (sample - en) / w
+            else:
+                lang, target = "en", (sample - tr * w) / (1.0 - w)
+            if target <= 0:
+                return
+            current = self._ratios[lang]
+            self._ratios[lang] = current + self.CALIBRATION_ALPHA * (target - current)
+
+    @property
+    def ratios(self) -> dict[str, float]:
+        """Current chars-per-token ratios (copy)."""
+        with self._lock:
+            return dict(self._ratios)
+
+    # ── counting ─────────────────────────────────────────────────────
+
+    @property
+    def has_backend(self) -> bool:
+        return self.backend is not None
+
+    def count(self, text: str) -> int:
+        """Exact count when known or a local backend is up, else the
+        calibrated estimate.
+
+        With a remote backend a miss returns the estimate at once and
+        queues the exact count in the background.
+        """
+        if not text:
+            return 0
+        if self.backend is None:
+            return self.estimate(text)
+
+        with self._lock:
+            cached = self._cache.get(text)
+            if cached is not None:
+                self._cache.move_to_end(text)
+                self.hits += 1
+                return cached
+            self.misses += 1
+            backend_down = time.monotonic() < self._backend_down_until
+
+        if backend_down:
+            self.fallbacks += 1
+            return self.estimate(text)
+
+        if self._remote:
+            self._submit(text)
+            return self.estimate(text)
+
+        n = self._count_exact(text)
+        return n if n is not None else self.estimate(text)
+
+    def flush(self, timeout: Optional[float] = None) -> None:
+        """Wait for queued remote counts to land in the cache."""
+        with self._lock:
+            futures = list(self._pending.values())
+        for future in futures:
+            try:
+                future.result(timeout=timeout)
+            except Exception:
+                pass
+
+    def _count_exact(self, text: str) -> Optional[int]:
+        """Query the backend and memoise; ``None`` if it failed."""
+        assert self.backend is not None
+        try:
+            n = self.backend.count(text)
+        except Exception as e:
+            logger.warning(
+                "[TokenCounter] %s backend failed, using heuristic for %.0fs: %s",
+                self.backend.name, self._retry_after, e,
+            )
+            with self._lock:
+                self._backend_down_until = time.monotonic() + self._retry_after
+            self.fallbacks += 1
+            return None
+
+        self.calibrate(text, n)
+        with self._lock:
+            self._cache[text] = n
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return n
+
+    def _submit(self, text: str) -> None:
+        with self._lock:
+            if text in self._pending or len(self._pending) >= self.MAX_PENDING:
+                return
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="token-count")
+            future = self._executor.submit(self._count_exact, text)
+            self._pending[text] = future
+        future.add_done_callback(lambda _f: self._done(text))
+
+    def _done(self, text: str) -> None:
+        with self._lock:
+            self._pending.pop(text, None)
+
+    def stats(self) -> dict:
+        """Cache and fallback counters."""
+        with self._lock:
+            return {
+                "backend": self.backend.name if self.backend else None,
+                "cache_size": len(self._cache),
+                "hits": self.hits,
+                "misses": self.misses,
+                "fallbacks": self.fallbacks,
+                "pending": len(self._pending),
+                "ratios": dict(self._ratios),
+            }
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+# ── process-wide counter ─────────────────────────────────────────────
+
+_counter: Optional[TokenCounter] = None
+_counter_lock = threading.Lock()
+
+
+def _ratios_from_env() -> dict[str, float]:
+    ratios: dict[str, float] = {}
+    for lang in DEFAULT_CHARS_PER_TOKEN:
+        raw = os.getenv(f"BANTZ_TOKEN_RATIO_{lang.upper()}", "").strip()
+        try:
+            if raw and float(raw) > 0:
+                ratios[lang] = float(raw)
+        except ValueError:
+            logger.warning("[TokenCounter] Ignoring invalid BANTZ_TOKEN_RATIO_%s=%r", lang.upper(), raw)
+    return ratios
+
+
+def _backend_from_env() -> Optional[TokenCountBackend]:
+    """Build the exact backend selected by env, or ``None``.
+
+    ``BANTZ_TOKENIZER_PATH`` wins; otherwise ``BANTZ_TOKEN_BACKEND=vllm``
+    enables the ``/tokenize`` endpoint at ``BANTZ_VLLM_URL``.
+    """
+    path = os.getenv("BANTZ_TOKENIZER_PATH", "").strip()
+    if path:
+        try:
+            return TokenizerFileBackend(path)
+        except Exception as e:
+            logger.warning("[TokenCounter] Tokenizer file unavailable (%s): %s", path, e)
+
+    if os.getenv("BANTZ_TOKEN_BACKEND", "").strip().lower() == "vllm":
+        base = os.getenv("BANTZ_VLLM_URL", "http://localhost:8001").strip()
+        model = os.getenv("BANTZ_VLLM_MODEL", "").strip() or None
+        return VLLMTokenizeBackend(base, model=model)
+
+    return None
+
+
+def get_token_counter() -> TokenCounter:
+    """Return the process-wide counter, configured from env on first use."""
+    global _counter
+    if _counter is None:
+        with _counter_lock:
+            if _counter is None:
+                _counter = TokenCounter(_backend_from_env(), ratios=_ratios_from_env())
+    return _counter
+
+
+def set_token_counter(counter: Optional[TokenCounter]) -> None:
+    """Replace the process-wide counter (``None`` → rebuild from env)."""
+    global _counter
+    with _counter_lock:
+        _counter = counter
@@ -9,13 +9,15 @@ with two inconsistent heuristics:
 This module provides a single ``estimate_tokens()`` function that every
 module should use, plus a ``trim_to_tokens()`` helper.
 
-Default method is ``chars4`` (~4 chars per token) which is a reasonable
-approximation for Qwen/GPT-style tokenizers on Turkish+English text.
+Default method is ``auto``: an exact count from the configured tokenizer
+backend (see :mod:`bantz.llm.token_counter`), falling back to a calibrated
+chars-per-token ratio per language (~4 for English, ~3 for Turkish).
 The method can be overridden via ``BANTZ_TOKEN_METHOD`` env var.
 
 Supported methods
 -----------------
-- ``chars4`` — ``len(text) // 4``  (default, fast, good for mixed content)
+- ``auto``   — exact backend count, else calibrated per-language ratio (default)
+- ``chars4`` — ``len(text) // 4``  (legacy, fast)
 - ``chars3`` — ``len(text) // 3``  (conservative, overestimates slightly)
 - ``words``  — ``len(text.split())``  (word-count, for very rough estimates)
 """
@@ -26,15 +28,15 @@ import json
 import os
 from typing import Any, Literal
 
-TokenMethod = Literal["chars4", "chars3", "words"]
+TokenMethod = Literal["auto", "chars4", "chars3", "words"]
 
-_DEFAULT_METHOD: TokenMethod = "chars4"
+_DEFAULT_METHOD: TokenMethod = "auto"
 
 
 def _get_method() -> TokenMethod:
     """Read method from env, cached on first call."""
     raw = os.getenv("BANTZ_TOKEN_METHOD", "").strip().lower()
-    if raw in {"chars4", "chars3", "words"}:
+    if raw in {"auto", "chars4", "chars3", "words"}:
         return raw  # type: ignore[return-value]
     return _DEFAULT_METHOD
 
@@ -45,7 +47,7 @@ def estimate_tokens(text: str | None, *, method: TokenMethod | None = None) -> i
     Args:
         text: The text to estimate. ``None`` / empty → 0.
         method: Override the estimation method. If ``None``, uses
-                ``BANTZ_TOKEN_METHOD`` env var or the default ``chars4``.
+                ``BANTZ_TOKEN_METHOD`` env var or the default ``auto``.
 
     Returns:
         Non-negative estimated token count.
@@ -56,7 +58,10 @@ def estimate_tokens(text: str | None, *, method: TokenMethod | None = None) -> i
 
     m = method or _get_method()
 
-    if m == "chars4":
+    if m == "auto":
+        from bantz.llm.token_counter import get_token_counter
+        return max(0, get_token_counter().count(t))
+    elif m == "chars4":
         return max(0, len(t) // 4)
     elif m == "chars3":
         return max(0, len(t) // 3)
@@ -82,8 +87,10 @@ def estimate_tokens_json(obj: Any, *, method: TokenMethod | None = None) -> int:
 def trim_to_tokens(text: str | None, max_tokens: int, *, method: TokenMethod | None = None) -> str:
     """Trim *text* so that its estimated token count ≤ *max_tokens*.
 
-    Uses a character-level cut (since the estimation is char-based) and
-    appends an ellipsis if trimming occurred.
+    Uses a character-level cut and appends an ellipsis if trimming
+    occurred.  With ``auto`` the cut is sized from the calibrated ratio and
+    re-checked against the counter (a few shrink steps); if that still
+    overshoots, the cut is bisected until it fits.
     """
     t = str(text or "")
     if max_tokens <= 0:
@@ -97,6 +104,30 @@ def trim_to_tokens(text: str | None, max_tokens: int, *, method: TokenMethod | N
         words = t.split()
         return " ".join(words[:max_tokens])
 
+    if m == "auto":
+        from bantz.llm.token_counter import get_token_counter
+        counter = get_token_counter()
+        max_chars = int(max_tokens * counter.chars_per_token(t))
+        for _ in range(4):
+            if max_chars <= 1:
+                return "…"[:max(0, max_chars)]
+            cut = t[: max_chars - 1] + "…"
+            n = counter.count(cut)
+            if n <= max_tokens:
+                return cut
+            max_chars = int(max_chars * max_tokens / n) - 1
+        # Counts are not linear in length, so the shrink steps can stop
+        # short; bisect on the kept prefix so the result always fits.
+        lo, hi = 0, len(cut) - 1
+        while lo < hi:
+            mid = (lo + hi + 1) // 2
+            if counter.count(t[:mid] + "…") <= max_tokens:
+                lo = mid
+            else:
+                hi = mid - 1
+        cut = t[:lo] + "…"
+        return cut if counter.count(cut) <= max_tokens else ""
+
     # chars4 / chars3
     chars_per_token = 4 if m != "chars3" else 3
     max_chars = max_tokens * chars_per_token
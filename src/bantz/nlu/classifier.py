@@ -30,6 +30,7 @@ from bantz.nlu.types import (
 )
 
 from bantz.llm.base import LLMClientProtocol, LLMMessage, create_client
+from bantz.llm.coalescer import Priority, get_llm_coalescer
 
 
 # ============================================================================
@@ -403,16 +404,80 @@ class LLMIntentClassifier:
             
         except Exception as e:
             # Log error and return unknown
-            processing_time = (time.time() - start_time) * 1000
-            return IntentResult(
-                intent="unknown",
-                slots={},
-                confidence=0.0,
-                original_text=text,
-                source="llm",
-                processing_time_ms=processing_time,
-                metadata={"error": str(e)},
+            return self._error_result(text, start_time, e)
+    
+    def classify_batch(
+        self,
+        texts: List[str],
+        context: Optional[Dict[str, Any]] = None,
+        *,
+        priority: Priority = Priority.BACKGROUND,
+    ) -> List[IntentResult]:
+        """Classify multiple texts with their LLM calls in flight together.
+        
+        Cache hits and empty inputs are answered directly; each remaining
+        distinct text is sent once through the shared LLM coalescer, so
+        the server batches the calls instead of serving them one by one.
+        
+        Args:
+            texts: User input texts
+            context: Optional context shared by all texts
+            priority: Coalescer priority (default: background)
+        
+        Returns:
+            IntentResults in input order
+        """
+        start_time = time.time()
+        results: List[Optional[IntentResult]] = [None] * len(texts)
+        pending: Dict[str, Tuple[str, Any, List[int]]] = {}  # key -> (text, future, indexes)
+        coalescer = get_llm_coalescer()
+        
+        for i, raw in enumerate(texts):
+            text = raw.strip()
+            if not text:
+                results[i] = IntentResult.unknown("", source="llm")
+                continue
+            cache_key = self._cache_key(text, context)
+            if cache_key in pending:
+                pending[cache_key][2].append(i)
+                continue
+            cached = self._get_cached(cache_key)
+            if cached is not None:
+                results[i] = cached
+                continue
+            future = coalescer.submit(
+                self.client.chat,
+                messages=self._build_messages(text, context),
+                temperature=self.config.temperature,
+                max_tokens=self.config.max_tokens,
+                priority=priority,
             )
+            pending[cache_key] = (text, future, [i])
+        
+        # Parse and cache on the calling thread; the cache is not thread-safe.
+        for cache_key, (text, future, indexes) in pending.items():
+            try:
+                result = self._parse_response(future.result(), text, start_time)
+                self._put_cache(cache_key, result)
+            except Exception as e:
+                result = self._error_result(text, start_time, e)
+            for i in indexes:
+                results[i] = result
+        
+        return results  # type: ignore[return-value]
+    
+    def _error_result(self, text: str, start_time: float, error: Exception) -> IntentResult:
+        """Unknown result for a failed LLM call."""
+        processing_time = (time.time() - start_time) * 1000
+        return IntentResult(
+            intent="unknown",
+            slots={},
+            confidence=0.0,
+            original_text=text,
+            source="llm",
+            processing_time_ms=processing_time,
+            metadata={"error": str(error)},
+        )
     
     def _build_messages(
         self,
@@ -718,19 +783,19 @@ def classify_batch(
     texts: List[str],
     classifier: Optional[LLMIntentClassifier] = None,
 ) -> List[IntentResult]:
-    """Classify multiple texts.
+    """Classify multiple texts concurrently.
     
     Args:
         texts: List of texts to classify
         classifier: Classifier instance (created if not provided)
     
     Returns:
-        List of IntentResults
+        List of IntentResults, in input order
     """
     if classifier is None:
         classifier = get_classifier()
     
-    return [classifier.classify(text) for text in texts]
+    return classifier.classify_batch(texts)
 
 
 # ============================================================================
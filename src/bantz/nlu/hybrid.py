@@ -36,6 +36,7 @@ from bantz.nlu.types import (
 from bantz.nlu.classifier import LLMIntentClassifier, ClassifierConfig
 from bantz.nlu.slots import SlotExtractor
 from bantz.nlu.clarification import ClarificationManager, ClarificationConfig
+from bantz.text.regex_literals import LiteralPrefilter, best_requirement, literal_requirements
 
 
 # ============================================================================
@@ -88,12 +89,17 @@ class RegexPatterns:
     
     Patterns are ordered by specificity and frequency.
     Each pattern returns an IntentResult when matched.
+    
+    A literal prefilter (one Aho–Corasick scan over the literals each
+    pattern requires) skips patterns that cannot match the input.
     """
     
     def __init__(self):
         """Initialize patterns."""
         self.patterns: List[Tuple[re.Pattern, PatternHandler]] = []
         self._build_patterns()
+        self._prefilter: Optional[LiteralPrefilter] = None
+        self._prefilter_for: Tuple[re.Pattern, ...] = ()
     
     def _build_patterns(self):
         """Build all regex patterns."""
@@ -467,7 +473,8 @@ class RegexPatterns:
         """
         text_stripped = text.strip()
         
-        for pattern, handler in self.patterns:
+        for i in self._candidates(text_stripped):
+            pattern, handler = self.patterns[i]
             match = pattern.match(text_stripped)
             if match:
                 return handler(match, text_stripped)
@@ -479,6 +486,18 @@ class RegexPatterns:
                     return handler(match, text_stripped)
         
         return None
+    
+    def _candidates(self, text: str) -> List[int]:
+        """Indices of patterns whose required literals occur in text."""
+        compiled = tuple(pattern for pattern, _ in self.patterns)
+        if self._prefilter is None or compiled != self._prefilter_for:
+            # self.patterns is public and may be extended; rebuild on change.
+            self._prefilter = LiteralPrefilter([
+                best_requirement(literal_requirements(p.pattern, p.flags), min_len=2)
+                for p in compiled
+            ])
+            self._prefilter_for = compiled
+        return self._prefilter.candidates(text)
 
 
 # ============================================================================
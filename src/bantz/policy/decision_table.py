@@ -0,0 +1,106 @@
+"""Compiled pattern tables for policy lookups.
+
+Policy rules and risk maps are keyed by tool-name patterns (``gmail.send``,
+``calendar.*``, ``*.list_*``).  Scanning them with :func:`fnmatch.fnmatch`
+on every check costs one regex translation + match per rule per call.
+
+:class:`GlobTable` compiles an ordered ``pattern → value`` list once:
+
+- exact patterns (no ``*``, ``?`` or ``[``) go into a hash map
+- glob patterns go into a prefix trie keyed by their literal prefix
+  (``calendar.*`` lives under ``c-a-l-…-.``), each with a precompiled
+  regex
+
+A lookup walks the trie along the tool name, so only globs whose literal
+prefix matches are ever tested, and results come back in the original
+rule order (first-match-wins semantics are preserved).
+
+Usage::
+
+    from bantz.policy.decision_table import GlobTable
+
+    table = GlobTable([("calendar.*", "MED"), ("*", "LOW")])
+    table.first("calendar.create_event")  # → "MED"
+"""
+
+from __future__ import annotations
+
+import re
+from fnmatch import translate
+from typing import Any, Callable, Dict, Generic, Iterable, List, Optional, Pattern, Tuple, TypeVar
+
+__all__ = ["GlobTable", "is_glob"]
+
+V = TypeVar("V")
+
+_GLOB_CHARS = frozenset("*?[")
+
+
+def is_glob(pattern: str) -> bool:
+    """True if *pattern* contains fnmatch wildcards."""
+    return any(ch in _GLOB_CHARS for ch in pattern)
+
+
+def _literal_prefix(pattern: str) -> str:
+    for i, ch in enumerate(pattern):
+        if ch in _GLOB_CHARS:
+            return pattern[:i]
+    return pattern
+
+
+class _TrieNode:
+    __slots__ = ("children", "entries")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, _TrieNode] = {}
+        self.entries: List[Tuple[int, Pattern[str], Any]] = []
+
+
+class GlobTable(Generic[V]):
+    """Ordered ``pattern → value`` table with exact-hash + prefix-trie lookup.
+
+    Args:
+        entries: ``(pattern, value)`` pairs; order is the match priority.
+    """
+
+    def __init__(self, entries: Iterable[Tuple[str, V]]):
+        self._exact: Dict[str, List[Tuple[int, V]]] = {}
+        self._root = _TrieNode()
+        self._size = 0
+        for order, (pattern, value) in enumerate(entries):
+            self._size += 1
+            if not is_glob(pattern):
+                self._exact.setdefault(pattern, []).append((order, value))
+                continue
+            node = self._root
+            for ch in _literal_prefix(pattern):
+                node = node.children.setdefault(ch, _TrieNode())
+            node.entries.append((order, re.compile(translate(pattern)), value))
+
+    def __len__(self) -> int:
+        return self._size
+
+    def matches(self, name: str) -> List[V]:
+        """All values whose pattern matches *name*, in table order."""
+        found: List[Tuple[int, V]] = list(self._exact.get(name, ()))
+        node: Optional[_TrieNode] = self._root
+        i = 0
+        n = len(name)
+        while node is not None:
+            for order, rx, value in node.entries:
+                if rx.match(name):
+                    found.append((order, value))
+            if i == n:
+                break
+            node = node.children.get(name[i])
+            i += 1
+        if len(found) > 1:
+            found.sort(key=lambda item: item[0])
+        return [value for _, value in found]
+
+    def first(self, name: str, where: Optional[Callable[[V], bool]] = None) -> Optional[V]:
+        """First matching value (optionally the first satisfying *where*)."""
+        for value in self.matches(name):
+            if where is None or where(value):
+                return value
+        return None
@@ -40,9 +40,10 @@ import threading
 import time
 from dataclasses import dataclass, field
 from enum import Enum
-from fnmatch import fnmatch
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, Set
+from typing import Any, Callable, Dict, FrozenSet, List, Literal, Optional, Set
+
+from bantz.policy.decision_table import GlobTable, is_glob
 
 logger = logging.getLogger(__name__)
 
@@ -91,7 +92,8 @@ class PolicyDecision:
         action: "execute" | "confirm" | "confirm_with_edit" | "deny"
         tier: The risk tier of the tool.
         prompt: Confirmation prompt text (Turkish).
-        display_params: Redacted params safe for display.
+        display_params: Redacted params safe for display (empty on
+            auto-execute decisions; see :meth:`get_display_params`).
         original_params: Unredacted original params.
         editable_fields: List of param keys the user may edit (HIGH only).
         editable: Whether the user can edit params before confirming.
@@ -110,13 +112,30 @@ class PolicyDecision:
     requires_explicit_confirm: bool = False
     cooldown_seconds: int = 0
     reason: str = ""
+    # Deferred redaction, set by the engine on auto-execute decisions:
+    # they are rarely shown, so redaction waits for get_display_params().
+    _redactor: Optional[Callable[[], Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False,
+    )
+
+    def get_display_params(self) -> Dict[str, Any]:
+        """Redacted params safe for display.
+
+        Auto-execute decisions leave ``display_params`` empty; this redacts
+        the params as they were at decision time on first call.
+        """
+        redactor = self._redactor
+        if redactor is not None:
+            self._redactor = None
+            self.display_params = redactor()
+        return self.display_params
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "action": self.action,
             "tier": self.tier.value,
             "prompt": self.prompt,
-            "display_params": self.display_params,
+            "display_params": self.get_display_params(),
             "editable_fields": self.editable_fields,
             "editable": self.editable,
             "requires_explicit_confirm": self.requires_explicit_confirm,
@@ -280,6 +299,13 @@ def _load_editable_fields(
     return result
 
 
+def _mtime(path: Path) -> Optional[float]:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return None
+
+
 # ── Session permits (confirm-once-per-session for MED) ────────────
 
 
@@ -323,6 +349,13 @@ class PolicyEngineV2:
 
     Thread-safe for read operations. Mutable state (_permits, _preset)
     should be coordinated externally if multi-threaded.
+
+    Risk tiers and redact-field sets are resolved through compiled glob
+    tables and memoised per tool; the memo is rebuilt when policy.json
+    changes on disk or the maps are changed through :meth:`set_risk_tier`,
+    :meth:`set_redact_fields` or :meth:`invalidate`.  Auto-execute
+    decisions redact their params only when
+    :meth:`PolicyDecision.get_display_params` is called.
     """
 
     def __init__(
@@ -343,11 +376,15 @@ class PolicyEngineV2:
             self._preset = preset
 
         # Risk map: policy.json → tool_levels
+        self._policy_json_path = policy_json_path or _DEFAULT_POLICY_JSON
+        self._risk_overrides = dict(risk_overrides or {})
         self._risk_map: Dict[str, RiskTier] = _load_risk_map_from_policy_json(
             policy_json_path
         )
         if risk_overrides:
             self._risk_map.update(risk_overrides)
+        self._policy_mtime = _mtime(self._policy_json_path)
+        self._policy_checked_at = time.monotonic()
 
         # Per-tool redact fields from permissions.yaml
         self._redact_fields: Dict[str, Set[str]] = (
@@ -366,6 +403,12 @@ class PolicyEngineV2:
         # Session permits (MED-risk confirm-once)
         self._permits = _SessionPermits()
 
+        # Compiled lookups, memoised per tool until the maps change.
+        # _generation is bumped on every map change; the memos are
+        # rebuilt when it differs from the compiled one.
+        self._generation = 0
+        self._compile()
+
         logger.info(
             "[PolicyEngineV2] preset=%s, risk_map=%d tools, redact=%d tools",
             self._preset.value,
@@ -384,6 +427,53 @@ class PolicyEngineV2:
         self._preset = value
         logger.info("[PolicyEngineV2] Preset changed to %s", value.value)
 
+    # ── Compiled lookups ──
+
+    # Seconds between policy.json mtime checks.
+    POLICY_CHECK_INTERVAL = 1.0
+
+    def _compile(self) -> None:
+        """(Re)build the glob tables and drop the per-tool memos."""
+        self._risk_globs: GlobTable[RiskTier] = GlobTable(
+            (pattern, tier) for pattern, tier in self._risk_map.items() if is_glob(pattern)
+        )
+        self._redact_table: GlobTable[Set[str]] = GlobTable(self._redact_fields.items())
+        self._compiled_generation = self._generation
+        self._tier_memo: Dict[str, RiskTier] = {}
+        self._redact_memo: Dict[str, FrozenSet[str]] = {}
+
+    def _refresh(self) -> None:
+        """Recompile if the maps were changed or policy.json was modified."""
+        now = time.monotonic()
+        if now - self._policy_checked_at >= self.POLICY_CHECK_INTERVAL:
+            self._policy_checked_at = now
+            mtime = _mtime(self._policy_json_path)
+            if mtime is not None and mtime != self._policy_mtime:
+                self._policy_mtime = mtime
+                risk_map = _load_risk_map_from_policy_json(self._policy_json_path)
+                risk_map.update(self._risk_overrides)
+                self._risk_map = risk_map
+                logger.info("[PolicyEngineV2] policy.json changed — %d tools", len(risk_map))
+                self._compile()
+                return
+        if self._generation != self._compiled_generation:
+            self._compile()
+
+    def set_risk_tier(self, tool_name: str, tier: RiskTier) -> None:
+        """Override the risk tier for a tool (or glob pattern)."""
+        self._risk_overrides[tool_name] = tier
+        self._risk_map[tool_name] = tier
+        self._generation += 1
+
+    def set_redact_fields(self, tool_name: str, fields: Set[str]) -> None:
+        """Replace the extra redact fields for a tool (or glob pattern)."""
+        self._redact_fields[tool_name] = set(fields)
+        self._generation += 1
+
+    def invalidate(self) -> None:
+        """Drop the per-tool memos after editing the maps directly."""
+        self._generation += 1
+
     # ── Core evaluation ──
 
     def get_risk_tier(self, tool_name: str) -> RiskTier:
@@ -395,18 +485,19 @@ class PolicyEngineV2:
         3. Wildcard match in risk_map (e.g. "system.*" → HIGH)
         4. Default: MED (safe default — requires confirmation)
         """
-        # Exact match
-        tier = self._risk_map.get(tool_name)
+        self._refresh()
+        tier = self._tier_memo.get(tool_name)
         if tier is not None:
             return tier
 
-        # Wildcard match (e.g. "system.*" → all system tools)
-        for pattern, t in self._risk_map.items():
-            if "*" in pattern or "?" in pattern:
-                if fnmatch(tool_name, pattern):
-                    return t
-
-        return RiskTier.MED  # Safe default: confirm before execute
+        # Exact match, then wildcard match (e.g. "system.*" → all system tools)
+        tier = self._risk_map.get(tool_name)
+        if tier is None:
+            tier = self._risk_globs.first(tool_name)
+        if tier is None:
+            tier = RiskTier.MED  # Safe default: confirm before execute
+        self._tier_memo[tool_name] = tier
+        return tier
 
     def evaluate(
         self,
@@ -430,24 +521,19 @@ class PolicyEngineV2:
 
         # ── Autopilot: always execute ──
         if effective_preset == PolicyPreset.AUTOPILOT:
-            return PolicyDecision(
-                action="execute",
-                tier=tier,
-                reason="AUTOPILOT_ALLOW",
-                original_params=params,
-                display_params=self._redact(params, tool_name),
-            )
+            return self._execute_decision(tool_name, tier, params, "AUTOPILOT_ALLOW")
 
         # ── Paranoid: confirm everything ──
         if effective_preset == PolicyPreset.PARANOID:
             if tier == RiskTier.HIGH:
                 return self._high_decision(tool_name, params, session_id)
             # LOW and MED both require confirmation in paranoid
+            redacted = self._redact(params, tool_name)
             return PolicyDecision(
                 action="confirm",
                 tier=tier,
-                prompt=self._build_prompt(tool_name, tier, params),
-                display_params=self._redact(params, tool_name),
+                prompt=self._build_prompt(tool_name, tier, params, redacted=redacted),
+                display_params=redacted,
                 original_params=params,
                 editable=False,
                 reason="PARANOID_CONFIRM",
@@ -456,29 +542,18 @@ class PolicyEngineV2:
         # ── Balanced (default) ──
 
         if tier == RiskTier.LOW:
-            return PolicyDecision(
-                action="execute",
-                tier=tier,
-                reason="LOW_AUTO_EXECUTE",
-                original_params=params,
-                display_params=self._redact(params, tool_name),
-            )
+            return self._execute_decision(tool_name, tier, params, "LOW_AUTO_EXECUTE")
 
         if tier == RiskTier.MED:
             # Confirm-once-per-session
             if self._permits.is_confirmed(session_id, tool_name):
-                return PolicyDecision(
-                    action="execute",
-                    tier=tier,
-                    reason="MED_SESSION_CONFIRMED",
-                    original_params=params,
-                    display_params=self._redact(params, tool_name),
-                )
+                return self._execute_decision(tool_name, tier, params, "MED_SESSION_CONFIRMED")
+            redacted = self._redact(params, tool_name)
             return PolicyDecision(
                 action="confirm",
                 tier=tier,
-                prompt=self._build_prompt(tool_name, tier, params),
-                display_params=self._redact(params, tool_name),
+                prompt=self._build_prompt(tool_name, tier, params, redacted=redacted),
+                display_params=redacted,
                 original_params=params,
                 editable=False,
                 reason="MED_REQUIRE_CONFIRMATION",
@@ -525,21 +600,43 @@ class PolicyEngineV2:
 
         Combines global sensitive keys + per-tool config.
         """
-        extra = set(_GLOBAL_SENSITIVE_KEYS)
-        tool_specific = self._redact_fields.get(tool_name, set())
-        extra |= tool_specific
-
-        # Wildcard match
-        for pattern, fields in self._redact_fields.items():
-            if ("*" in pattern or "?" in pattern) and fnmatch(tool_name, pattern):
-                extra |= fields
-
-        return extra
+        return set(self._redact_fields_for(tool_name))
+
+    def _redact_fields_for(self, tool_name: str) -> FrozenSet[str]:
+        self._refresh()
+        fields = self._redact_memo.get(tool_name)
+        if fields is None:
+            extra = set(_GLOBAL_SENSITIVE_KEYS)
+            # Exact + wildcard matches
+            for matched in self._redact_table.matches(tool_name):
+                extra |= matched
+            fields = self._redact_memo[tool_name] = frozenset(extra)
+        return fields
 
     def _redact(self, params: Dict[str, Any], tool_name: str) -> Dict[str, Any]:
         """Redact sensitive fields in params for display."""
-        extra = self.get_redact_fields(tool_name)
-        return redact_sensitive(params, tool_name, extra)
+        if not params:
+            return {}
+        return redact_sensitive(params, tool_name, self._redact_fields_for(tool_name))
+
+    def _execute_decision(
+        self,
+        tool_name: str,
+        tier: RiskTier,
+        params: Dict[str, Any],
+        reason: str,
+    ) -> PolicyDecision:
+        """Auto-execute decision; params are redacted only if displayed."""
+        decision = PolicyDecision(
+            action="execute",
+            tier=tier,
+            reason=reason,
+            original_params=params,
+        )
+        if params:
+            snapshot = dict(params)
+            decision._redactor = lambda: self._redact(snapshot, tool_name)
+        return decision
 
     # ── Internal helpers ──
 
@@ -551,11 +648,12 @@ class PolicyEngineV2:
     ) -> PolicyDecision:
         """Build a HIGH-risk policy decision with edit capability."""
         editable = self._editable_fields.get(tool_name, [])
+        redacted = self._redact(params, tool_name)
         return PolicyDecision(
             action="confirm_with_edit",
             tier=RiskTier.HIGH,
-            prompt=self._build_prompt(tool_name, RiskTier.HIGH, params),
-            display_params=self._redact(params, tool_name),
+            prompt=self._build_prompt(tool_name, RiskTier.HIGH, params, redacted=redacted),
+            display_params=redacted,
             original_params=params,
             editable_fields=editable,
             editable=bool(editable),
@@ -569,9 +667,12 @@ class PolicyEngineV2:
         tool_name: str,
         tier: RiskTier,
         params: Dict[str, Any],
+        *,
+        redacted: Optional[Dict[str, Any]] = None,
     ) -> str:
         """Build a Turkish confirmation prompt based on tier."""
-        redacted = self._redact(params, tool_name)
+        if redacted is None:
+            redacted = self._redact(params, tool_name)
 
         if tier == RiskTier.HIGH:
             param_lines = "\n".join(
@@ -10,22 +10,29 @@ Features:
 - Wildcard matching (``calendar.*``, ``*``)
 - Rate limiting (``max_per_day``, ``max_per_session``)
 - Risk-level lookup
+
+Rules are compiled into a :class:`~bantz.policy.decision_table.GlobTable`
+(exact hash map + prefix trie) and the matching rule is memoised per
+``(tool, action)``.  The memo is dropped whenever the rules change —
+including when a loaded policy file is modified on disk.
 """
 
 from __future__ import annotations
 
 import logging
+import os
 import time
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from fnmatch import fnmatch
+from typing import Any, Dict, List, Optional, Tuple
 
 from bantz.policy.dsl import (
     PermissionDecision,
     PermissionRule,
     load_policy,
     load_policy_str,
-    match_rule,
 )
+from bantz.policy.decision_table import GlobTable
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +80,15 @@ class PermissionEngine:
         self._session_counts: Dict[str, int] = defaultdict(int)
         self._day_start: float = time.time()
         self._DAY_SECONDS = 86_400
+        # Compiled rules + per-(tool, action) memo of the first matching rule
+        self._table: Optional[GlobTable[PermissionRule]] = None
+        self._table_rules: Optional[List[PermissionRule]] = None
+        self._table_len = -1
+        self._memo: Dict[Tuple[str, Optional[str]], Optional[PermissionRule]] = {}
+        # Loaded policy file, watched for changes
+        self._policy_path: Optional[str] = None
+        self._policy_mtime: Optional[float] = None
+        self._policy_checked_at = 0.0
 
     # ── policy loading ────────────────────────────────────────────────
 
@@ -82,14 +98,71 @@ class PermissionEngine:
         Custom rules are prepended before the built-in defaults so they
         take priority (first-match-wins).
         """
+        mtime = _mtime(path)
         custom = load_policy(path)
         self._rules = custom + list(_DEFAULT_RULES)
+        self._policy_path = path
+        self._policy_mtime = mtime
+        self._policy_checked_at = time.monotonic()
         logger.info("Loaded %d custom rules from %s", len(custom), path)
 
     def load_policy_str(self, text: str) -> None:
         """Load rules from a raw YAML/JSON string (for tests)."""
         custom = load_policy_str(text)
         self._rules = custom + list(_DEFAULT_RULES)
+        self._policy_path = None
+
+    # ── compiled lookup ───────────────────────────────────────────────
+
+    # Seconds between policy-file mtime checks.
+    POLICY_CHECK_INTERVAL = 1.0
+
+    def _maybe_reload_policy(self) -> None:
+        path = self._policy_path
+        if path is None:
+            return
+        now = time.monotonic()
+        if now - self._policy_checked_at < self.POLICY_CHECK_INTERVAL:
+            return
+        self._policy_checked_at = now
+        mtime = _mtime(path)
+        if mtime is None or mtime == self._policy_mtime:
+            return
+        try:
+            self.load_policy(path)
+        except Exception as exc:
+            # Keep the last good rules; retry on the next change
+            self._policy_mtime = mtime
+            logger.warning("Policy reload failed for %s: %s", path, exc)
+
+    def _compiled(self) -> GlobTable[PermissionRule]:
+        rules = self._rules
+        table = self._table
+        if table is None or self._table_rules is not rules or self._table_len != len(rules):
+            table = self._table = GlobTable((rule.tool, rule) for rule in rules)
+            self._table_rules = rules
+            self._table_len = len(rules)
+            self._memo = {}
+        return table
+
+    def match(self, tool: str, action: Optional[str] = "*") -> Optional[PermissionRule]:
+        """First rule matching *tool* and *action* (memoised).
+
+        ``action=None`` matches on the tool pattern alone (risk lookup).
+        """
+        self._maybe_reload_policy()
+        table = self._compiled()
+        key = (tool, action)
+        try:
+            return self._memo[key]
+        except KeyError:
+            pass
+        if action is None:
+            rule = table.first(tool)
+        else:
+            rule = table.first(tool, lambda r: r.action == "*" or fnmatch(action, r.action))
+        self._memo[key] = rule
+        return rule
 
     # ── evaluation ────────────────────────────────────────────────────
 
@@ -118,39 +191,34 @@ class PermissionEngine:
         """
         self._maybe_reset_day()
 
-        for rule in self._rules:
-            if not match_rule(rule, tool, action):
-                continue
-
-            # Check rate-limit conditions
-            key = f"{tool}:{action}"
-            max_day = rule.conditions.get("max_per_day")
-            max_sess = rule.conditions.get("max_per_session")
+        rule = self.match(tool, action)
+        if rule is None:
+            # Fallback (should never happen because catch-all is last)
+            return PermissionDecision.CONFIRM
 
-            if max_day is not None and self._day_counts[key] >= max_day:
-                logger.warning("Rate limit (day) hit for %s", key)
-                return PermissionDecision.DENY
+        # Check rate-limit conditions
+        key = f"{tool}:{action}"
+        max_day = rule.conditions.get("max_per_day")
+        max_sess = rule.conditions.get("max_per_session")
 
-            if max_sess is not None and self._session_counts[key] >= max_sess:
-                logger.warning("Rate limit (session) hit for %s", key)
-                return PermissionDecision.DENY
+        if max_day is not None and self._day_counts[key] >= max_day:
+            logger.warning("Rate limit (day) hit for %s", key)
+            return PermissionDecision.DENY
 
-            # Bump counters
-            self._day_counts[key] += 1
-            self._session_counts[key] += 1
+        if max_sess is not None and self._session_counts[key] >= max_sess:
+            logger.warning("Rate limit (session) hit for %s", key)
+            return PermissionDecision.DENY
 
-            return rule.decision
+        # Bump counters
+        self._day_counts[key] += 1
+        self._session_counts[key] += 1
 
-        # Fallback (should never happen because catch-all is last)
-        return PermissionDecision.CONFIRM
+        return rule.decision
 
     def get_risk(self, tool: str) -> str:
         """Return the risk level for a tool (first matching rule with a specific tool pattern)."""
-        from fnmatch import fnmatch as _fnmatch
-        for rule in self._rules:
-            if _fnmatch(tool, rule.tool):
-                return rule.risk
-        return "medium"
+        rule = self.match(tool, None)
+        return rule.risk if rule is not None else "medium"
 
     # ── rate limiting helpers ─────────────────────────────────────────
 
@@ -163,3 +231,10 @@ class PermissionEngine:
         if now - self._day_start > self._DAY_SECONDS:
             self._day_counts.clear()
             self._day_start = now
+
+
+def _mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
@@ -0,0 +1,415 @@
+"""Single-pass redaction engine shared by all PII redactors.
+
+Bantz had four redactors (:mod:`bantz.security.pii_redaction`,
+:mod:`bantz.security.masking`, :mod:`bantz.privacy.redaction` and
+:func:`bantz.security.audit_log.redact_pii`), each running one ``re.sub``
+pass per pattern, plus extra ``findall`` passes to count.  They now
+describe their patterns as :class:`RedactionRule` lists and hand them to
+:func:`compile_engine`, which:
+
+- joins all rules into one alternation ``(?P<_r0>…)|(?P<_r1>…)|…`` and
+  scans each string once; at a given position the earliest rule in the
+  list wins, so list order is priority order;
+- falls back to one pass per rule, in list order, when a match taken by
+  the scan overlaps a match of an earlier rule (the alternation prefers
+  the leftmost match, which would let a later rule swallow it);
+- leaves out of that scan any rule whose required literal (``@``,
+  ``http``, ``mah`` …, derived from the parsed pattern) does not occur in
+  the string — sre has no prefilter of its own and would otherwise try
+  every branch at every position;
+- returns the redacted text together with the matched spans and per-rule
+  counts from that same scan (:class:`ScanResult`);
+- keeps an LRU cache of recent results, so the same tool output redacted
+  again (retries, context rebuilds, audit + cloud paths) costs a lookup;
+- is itself cached by rule set, so redactors that are constructed per
+  call still share one compiled engine.
+
+Per-rule flags are turned into scoped inline flags (``(?i:…)``); a leading
+global flag group such as ``(?i)`` is folded in the same way.  Rules that
+cannot share an alternation (backreferences, clashing group names) get a
+separate scan, applied in order after the preceding group.
+
+Usage::
+
+    engine = compile_engine((
+        RedactionRule("email", r"[\\w.+-]+@[\\w.-]+\\.\\w+", "[EMAIL]"),
+        RedactionRule("phone", r"\\+\\d{10,15}", "[PHONE]"),
+    ))
+    result = engine.scan("mail a@b.co or call +905321234567")
+    result.redacted   # 'mail [EMAIL] or call [PHONE]'
+    result.counts     # {'email': 1, 'phone': 1}
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from bantz.text.regex_literals import FOLD_FIXES, best_requirement, literal_requirements
+
+__all__ = [
+    "RedactionRule",
+    "RedactionSpan",
+    "ScanResult",
+    "RedactionEngine",
+    "compile_engine",
+]
+
+Replacement = Union[str, Callable[["re.Match[str]"], str]]
+
+DEFAULT_CACHE_SIZE = 256
+# Longer strings are redacted but not cached.
+MAX_CACHED_CHARS = 1 << 20
+
+_FLAG_LETTERS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+    (re.VERBOSE, "x"),
+    (re.ASCII, "a"),
+)
+_LEADING_FLAGS_RE = re.compile(r"^\(\?([aiLmsux]+)\)")
+_BACKREF_RE = re.compile(r"\\[1-9]|\(\?P=")
+# Subsets of a segment's rules compiled on demand (see _Segment.apply).
+MAX_SUBSET_REGEXES = 64
+
+
+@dataclass(frozen=True)
+class RedactionRule:
+    """One redaction pattern.
+
+    Attributes:
+        name: Identifier reported in spans and counts.
+        pattern: Regex source (a compiled pattern's source and flags are
+            used as-is).
+        replacement: Literal text, an ``re.sub`` template (``\\1``), or a
+            callable receiving the rule's own match.
+        flags: ``re`` flags for this rule only.
+    """
+
+    name: str
+    pattern: Union[str, "re.Pattern[str]"]
+    replacement: Replacement
+    flags: int = 0
+
+    def source(self) -> Tuple[str, int]:
+        """Regex source and flags with any leading global flag group folded in."""
+        if isinstance(self.pattern, re.Pattern):
+            src, flags = self.pattern.pattern, self.pattern.flags
+        else:
+            src, flags = self.pattern, self.flags
+        m = _LEADING_FLAGS_RE.match(src)
+        if m:
+            src = src[m.end():]
+            for flag, letter in _FLAG_LETTERS:
+                if letter in m.group(1):
+                    flags |= flag
+        return src, flags
+
+
+@dataclass(frozen=True)
+class RedactionSpan:
+    """A redacted region in the *original* text."""
+
+    start: int
+    end: int
+    rule: str
+    replacement: str
+
+
+@dataclass(frozen=True)
+class ScanResult:
+    """Outcome of one engine scan."""
+
+    original: str
+    redacted: str
+    spans: Tuple[RedactionSpan, ...] = ()
+    counts: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def total(self) -> int:
+        return sum(self.counts.values())
+
+    @property
+    def rules_matched(self) -> List[str]:
+        """Names of rules that matched, in order of first match."""
+        return list(self.counts)
+
+
+class _Segment:
+    """Rules sharing one combined regex."""
+
+    def __init__(self, rules: Sequence[RedactionRule]):
+        self.rules = list(rules)
+        sources = [r.source() for r in self.rules]
+        self.own = [re.compile(src, flags) for src, flags in sources]
+        self.fold = [bool(flags & re.IGNORECASE) for _, flags in sources]
+        self.required = [_required_literals(src, flags) for src, flags in sources]
+        self._subsets: "OrderedDict[Tuple[int, ...], re.Pattern[str]]" = OrderedDict()
+        self.literal: List[Optional[str]] = []
+        for rule in self.rules:
+            repl = rule.replacement
+            self.literal.append(repl if isinstance(repl, str) and "\\" not in repl else None)
+        # Branches are non-capturing and shared flags are hoisted out of
+        # the branches: both capture groups and scoped flags make sre's
+        # alternation markedly slower.
+        self._sources = sources
+        self.regex = self._combine(range(len(sources)))
+
+    def apply(self, text: str, counts: Dict[str, int], spans: List[RedactionSpan]) -> str:
+        active = self._active(text)
+        if not active:
+            return text
+        regex = self.regex if len(active) == len(self.rules) else self._subset(active)
+        matches: List[Tuple[int, int, int, "re.Match[str]"]] = []
+        for m in regex.finditer(text):
+            start, end = m.span()
+            if start == end:
+                continue
+            # The first branch that matches here is the one the alternation
+            # took; re-matching it also gives templates and callables the
+            # groups they were written for.
+            for i in active:
+                own = self.own[i].match(text, start)
+                if own is not None:
+                    break
+            matches.append((start, end, i, own))
+        if not matches:
+            return text
+        if self._conflicts(text, active, matches):
+            return self._apply_in_order(text, active, counts, spans)
+        out: List[str] = []
+        last = 0
+        for start, end, i, own in matches:
+            repl = self._replacement(i, own)
+            out.append(text[last:start])
+            out.append(repl)
+            last = end
+            name = self.rules[i].name
+            counts[name] = counts.get(name, 0) + 1
+            spans.append(RedactionSpan(start, end, name, repl))
+        out.append(text[last:])
+        return "".join(out)
+
+    def _replacement(self, i: int, own: "re.Match[str]") -> str:
+        repl = self.literal[i]
+        if repl is None:
+            rule = self.rules[i]
+            repl = rule.replacement(own) if callable(rule.replacement) else own.expand(rule.replacement)
+        return repl
+
+    def _conflicts(
+        self,
+        text: str,
+        active: Tuple[int, ...],
+        matches: Sequence[Tuple[int, int, int, "re.Match[str]"]],
+    ) -> bool:
+        """Whether a taken match overlaps a match of a higher-priority rule.
+
+        The alternation takes the leftmost match, so a later rule matching
+        earlier in the string (an IBAN run starting at a passport number)
+        hides the earlier rule's match.  Run one after the other, the
+        earlier rule would have redacted first.
+        """
+        rule_spans: Dict[int, Tuple[List[int], List[int]]] = {}
+        for start, end, i, _ in matches:
+            for j in active:
+                if j >= i:
+                    break
+                found = rule_spans.get(j)
+                if found is None:
+                    starts: List[int] = []
+                    ends: List[int] = []
+                    for m in self.own[j].finditer(text):
+                        if m.end() > m.start():
+                            starts.append(m.start())
+                            ends.append(m.end())
+                    found = rule_spans[j] = (starts, ends)
+                starts, ends = found
+                k = bisect_right(ends, start)
+                if k < len(starts) and starts[k] < end:
+                    return True
+        return False
+
+    def _apply_in_order(
+        self,
+        text: str,
+        active: Tuple[int, ...],
+        counts: Dict[str, int],
+        spans: List[RedactionSpan],
+    ) -> str:
+        """One pass per rule, in priority order (what the redactors did
+        before they shared an engine).  Spans are reported in original
+        coordinates only until the text first changes."""
+        report: Optional[List[RedactionSpan]] = spans
+        for i in active:
+            name = self.rules[i].name
+            n = 0
+            out: List[str] = []
+            last = 0
+            for own in self.own[i].finditer(text):
+                start, end = own.span()
+                if start == end:
+                    continue
+                repl = self._replacement(i, own)
+                out.append(text[last:start])
+                out.append(repl)
+                last = end
+                n += 1
+                if report is not None:
+                    report.append(RedactionSpan(start, end, name, repl))
+            if n:
+                out.append(text[last:])
+                text = "".join(out)
+                counts[name] = counts.get(name, 0) + n
+                report = None
+        return text
+
+    def _combine(self, indices: Sequence[int]) -> "re.Pattern[str]":
+        # Branches are non-capturing and shared flags are hoisted out of
+        # them: both capture groups and scoped flags make sre's
+        # alternation markedly slower.
+        sources = [self._sources[i] for i in indices]
+        common = {flags for _, flags in sources}
+        if len(common) == 1:
+            return re.compile("|".join(f"(?:{src})" for src, _ in sources), common.pop())
+        return re.compile("|".join(_scoped(src, flags) for src, flags in sources))
+
+    def _active(self, text: str) -> Tuple[int, ...]:
+        """Rules that can match *text*: a rule whose required literal is
+        missing is left out of the scan, since sre would otherwise try it
+        at every position."""
+        folded: Optional[str] = None
+        active = []
+        for i, required in enumerate(self.required):
+            if required is not None:
+                if self.fold[i]:
+                    if folded is None:
+                        folded = text.lower()
+                        if not folded.isascii():
+                            folded = folded.translate(FOLD_FIXES)
+                    haystack = folded
+                else:
+                    haystack = text
+                if not any(lit in haystack for lit in required):
+                    continue
+            active.append(i)
+        return tuple(active)
+
+    def _subset(self, active: Tuple[int, ...]) -> "re.Pattern[str]":
+        regex = self._subsets.get(active)
+        if regex is None:
+            regex = self._subsets[active] = self._combine(active)
+            if len(self._subsets) > MAX_SUBSET_REGEXES:
+                self._subsets.popitem(last=False)
+        return regex
+
+
+class RedactionEngine:
+    """Compiled rule set; use :func:`compile_engine` to get a shared instance.
+
+    Args:
+        rules: Rules in priority order.
+        cache_size: Number of recent results kept (0 disables the cache).
+    """
+
+    def __init__(self, rules: Sequence[RedactionRule], cache_size: int = DEFAULT_CACHE_SIZE):
+        self.rules = tuple(rules)
+        self._segments = _build_segments(self.rules)
+        self._cache: "OrderedDict[str, ScanResult]" = OrderedDict()
+        self._cache_size = cache_size
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def passes(self) -> int:
+        """Number of scans per string (1 unless some rules had to be split out)."""
+        return len(self._segments)
+
+    def scan(self, text: str) -> ScanResult:
+        """Redact *text*, returning spans and per-rule counts."""
+        if not text:
+            return ScanResult(original=text, redacted=text)
+        cacheable = self._cache_size > 0 and len(text) <= MAX_CACHED_CHARS
+        if cacheable:
+            with self._lock:
+                hit = self._cache.get(text)
+                if hit is not None:
+                    self._cache.move_to_end(text)
+                    self.hits += 1
+                    return hit
+
+        counts: Dict[str, int] = {}
+        spans: List[RedactionSpan] = []
+        redacted = text
+        for n, segment in enumerate(self._segments):
+            # Spans are only reported in original coordinates for the
+            # first scan; later segments run on already-redacted text.
+            redacted = segment.apply(redacted, counts, spans if n == 0 else [])
+        result = ScanResult(original=text, redacted=redacted, spans=tuple(spans), counts=counts)
+
+        if cacheable:
+            with self._lock:
+                self.misses += 1
+                self._cache[text] = result
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+        return result
+
+    def redact(self, text: str) -> str:
+        """Return only the redacted text."""
+        return self.scan(text).redacted
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+@lru_cache(maxsize=64)
+def compile_engine(rules: Tuple[RedactionRule, ...]) -> RedactionEngine:
+    """Shared :class:`RedactionEngine` for a rule tuple (compiled once)."""
+    return RedactionEngine(rules)
+
+
+# ── Internal ──────────────────────────────────────────────────────
+
+
+def _scoped(src: str, flags: int) -> str:
+    letters = "".join(letter for flag, letter in _FLAG_LETTERS if flags & flag)
+    return f"(?{letters}:{src})" if letters else f"(?:{src})"
+
+
+def _required_literals(src: str, flags: int) -> Optional[Tuple[str, ...]]:
+    """Literals of which at least one must occur in any match, or None."""
+    return best_requirement(literal_requirements(src, flags))
+
+
+def _build_segments(rules: Sequence[RedactionRule]) -> List[_Segment]:
+    segments: List[_Segment] = []
+    current: List[RedactionRule] = []
+    for rule in rules:
+        src, _ = rule.source()
+        if _BACKREF_RE.search(src):
+            if current:
+                segments.append(_Segment(current))
+            segments.append(_Segment([rule]))
+            current = []
+            continue
+        try:
+            _Segment(current + [rule])
+        except re.error:
+            if not current:
+                raise  # the rule itself is invalid
+            segments.append(_Segment(current))
+            current = [rule]
+        else:
+            current.append(rule)
+    if current:
+        segments.append(_Segment(current))
+    return segments
@@ -22,8 +22,11 @@ from __future__ import annotations
 import logging
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple
 
+from bantz.privacy.engine import RedactionEngine, RedactionRule, compile_engine
+
 logger = logging.getLogger(__name__)
 
 __all__ = ["redact_pii", "REDACTION_PATTERNS", "RedactionStats"]
@@ -141,21 +144,32 @@ def redact_pii(
             return text, RedactionStats()
         return text
 
-    result = str(text)
-    stats = RedactionStats() if collect_stats else None
     patterns = list(REDACTION_PATTERNS)
     if extra_patterns:
         patterns.extend(extra_patterns)
 
-    for pattern, replacement, description in patterns:
-        new_result, count = pattern.subn(replacement, result)
-        if count > 0:
-            logger.debug("PII redacted: %s (%d match(es))", description, count)
-            if stats:
-                stats.total_redactions += count
-                stats.patterns_matched.append(description)
-            result = new_result
+    engine = _engine_for(tuple(patterns))
+    scan = engine.scan(str(text))
+    stats = RedactionStats() if collect_stats else None
+
+    if scan.counts:
+        for rule in engine.rules:
+            count = scan.counts.get(rule.name, 0)
+            if count > 0:
+                logger.debug("PII redacted: %s (%d match(es))", rule.name, count)
+                if stats:
+                    stats.total_redactions += count
+                    stats.patterns_matched.append(rule.name)
 
     if collect_stats:
-        return result, stats
-    return result
+        return scan.redacted, stats
+    return scan.redacted
+
+
+@lru_cache(maxsize=32)
+def _engine_for(patterns: Tuple[Tuple[re.Pattern, str, str], ...]) -> RedactionEngine:
+    """Single-pass engine for (pattern, replacement, description) tuples."""
+    return compile_engine(tuple(
+        RedactionRule(description, pattern, replacement)
+        for pattern, replacement, description in patterns
+    ))
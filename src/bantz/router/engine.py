@@ -2356,7 +2356,7 @@ class Router:
         # Page Summarization commands (Jarvis-style)
         # ─────────────────────────────────────────────────────────────
         if intent == "page_summarize":
-            from bantz.skills.summarizer import PageSummarizer
+            from bantz.skills.summarizer import PageSummarizer, get_default_content_cache
             from bantz.llm.persona import JarvisPersona
             from bantz.browser.extension_bridge import get_bridge
             from bantz.llm import create_quality_client
@@ -2375,7 +2375,11 @@ class Router:
             # Create LLM client and summarizer
             try:
                 llm = create_quality_client()
-                summarizer = PageSummarizer(extension_bridge=bridge, llm_client=llm)
+                summarizer = PageSummarizer(
+                    extension_bridge=bridge,
+                    llm_client=llm,
+                    content_cache=get_default_content_cache(),
+                )
                 
                 # Store in context for follow-up commands
                 ctx.set_page_summarizer(summarizer)
@@ -2400,7 +2404,7 @@ class Router:
                 )
 
         if intent == "page_summarize_detailed":
-            from bantz.skills.summarizer import PageSummarizer
+            from bantz.skills.summarizer import PageSummarizer, get_default_content_cache
             from bantz.llm.persona import JarvisPersona
             from bantz.browser.extension_bridge import get_bridge
             from bantz.llm import create_quality_client
@@ -2434,7 +2438,11 @@ class Router:
             
             try:
                 llm = create_quality_client()
-                summarizer = PageSummarizer(extension_bridge=bridge, llm_client=llm)
+                summarizer = PageSummarizer(
+                    extension_bridge=bridge,
+                    llm_client=llm,
+                    content_cache=get_default_content_cache(),
+                )
                 ctx.set_page_summarizer(summarizer)
                 
                 thinking_msg = persona.get_response("thinking")
@@ -2456,7 +2464,7 @@ class Router:
                 )
 
         if intent == "page_question":
-            from bantz.skills.summarizer import PageSummarizer
+            from bantz.skills.summarizer import PageSummarizer, get_default_content_cache
             from bantz.llm.persona import JarvisPersona
             from bantz.browser.extension_bridge import get_bridge
             from bantz.llm import create_quality_client
@@ -2486,7 +2494,11 @@ class Router:
                 
                 try:
                     llm = create_quality_client()
-                    summarizer = PageSummarizer(extension_bridge=bridge, llm_client=llm)
+                    summarizer = PageSummarizer(
+                        extension_bridge=bridge,
+                        llm_client=llm,
+                        content_cache=get_default_content_cache(),
+                    )
                     ctx.set_page_summarizer(summarizer)
                 except Exception as e:
                     logger.error(f"[Router] Page question setup error: {e}")
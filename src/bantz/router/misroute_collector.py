@@ -15,9 +15,11 @@ import os
 import time
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Any, Callable, Iterator, List, Literal, Optional
 
+from bantz.router.replay_engine import ReplayEngine
 from bantz.security.masking import DataMasker
 
 
@@ -433,7 +435,11 @@ class ReplayResult:
 
 @dataclass
 class ReplaySummary:
-    """Summary of replay run."""
+    """Summary of replay run.
+    
+    Counters are updated record by record via :meth:`add` / :meth:`add_error`,
+    so a summary is meaningful while a replay is still running.
+    """
     
     total: int = 0
     improved: int = 0
@@ -442,8 +448,44 @@ class ReplaySummary:
     route_accuracy: float = 0.0
     intent_accuracy: float = 0.0
     
+    errors: int = 0
+    cache_hits: int = 0
+    route_correct: int = 0
+    intent_correct: int = 0
+    elapsed_s: float = 0.0
+    
     results: List[ReplayResult] = field(default_factory=list)
     
+    def add(self, result: ReplayResult, cached: bool = False) -> None:
+        """Count one replayed record."""
+        self.total += 1
+        if cached:
+            self.cache_hits += 1
+        if result.route_match:
+            self.route_correct += 1
+        if result.intent_match:
+            self.intent_correct += 1
+        
+        if result.improved:
+            self.improved += 1
+        elif result.regression:
+            self.regressed += 1
+        else:
+            self.unchanged += 1
+        
+        self.results.append(result)
+        self._update_accuracy()
+    
+    def add_error(self) -> None:
+        """Count a record whose replay failed (counts against accuracy)."""
+        self.total += 1
+        self.errors += 1
+        self._update_accuracy()
+    
+    def _update_accuracy(self) -> None:
+        self.route_accuracy = self.route_correct / self.total
+        self.intent_accuracy = self.intent_correct / self.total
+    
     def to_dict(self) -> dict:
         """Convert to dictionary."""
         return {
@@ -451,10 +493,13 @@ class ReplaySummary:
             "improved": self.improved,
             "regressed": self.regressed,
             "unchanged": self.unchanged,
+            "errors": self.errors,
+            "cache_hits": self.cache_hits,
             "improvement_rate": self.improved / self.total if self.total > 0 else 0,
             "regression_rate": self.regressed / self.total if self.total > 0 else 0,
             "route_accuracy": self.route_accuracy,
             "intent_accuracy": self.intent_accuracy,
+            "elapsed_s": round(self.elapsed_s, 3),
         }
     
     def format_markdown(self) -> str:
@@ -502,96 +547,104 @@ class ReplaySummary:
 # ============================================================================
 
 RouterFunction = Callable[[str], dict]
+ProgressCallback = Callable[[ReplaySummary], None]
+
+
+def compare_replay(record: MisrouteRecord, result: dict) -> ReplayResult:
+    """Compare a router result with the record's expected route/intent.
+    
+    Args:
+        record: Replayed record
+        result: Router output with route, intent, slots, confidence keys
+        
+    Returns:
+        ReplayResult with match/improvement/regression flags
+    """
+    new_route = result.get("route", "")
+    new_intent = result.get("intent", "")
+    
+    # Determine expected route/intent
+    expected_route = record.expected_route or record.router_route
+    expected_intent = record.expected_intent or record.router_intent
+    
+    # Check matches
+    route_match = new_route == expected_route
+    intent_match = new_intent == expected_intent if expected_intent else True
+    
+    # Determine improvement/regression
+    was_correct = record.router_route == expected_route
+    
+    return ReplayResult(
+        record=record,
+        new_route=new_route,
+        new_intent=new_intent,
+        new_slots=result.get("slots", {}),
+        new_confidence=result.get("confidence", 0.0),
+        route_match=route_match,
+        intent_match=intent_match,
+        improved=not was_correct and route_match,
+        regression=was_correct and not route_match,
+    )
 
 
 def replay_dataset(
     router_fn: RouterFunction,
     dataset_path: str = DEFAULT_DATASET_PATH,
     limit: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    cache: bool = True,
+    on_progress: Optional[ProgressCallback] = None,
 ) -> ReplaySummary:
     """Replay dataset through a router function.
     
+    Records are streamed from the dataset and routed concurrently (see
+    :class:`bantz.router.replay_engine.ReplayEngine`); repeated user texts
+    are routed once.
+    
     Args:
         router_fn: Function that takes user_text and returns dict with
-                   route, intent, slots, confidence keys
+                   route, intent, slots, confidence keys. Must be
+                   thread-safe when max_in_flight > 1.
         dataset_path: Path to dataset JSONL
         limit: Optional limit on number of records to replay
+        max_in_flight: Maximum concurrent router calls (default:
+                       BANTZ_REPLAY_CONCURRENCY or 8; 1 = sequential)
+        cache: Reuse results for identical user texts
+        on_progress: Called with the running summary after each record
         
     Returns:
-        ReplaySummary with results
+        ReplaySummary with results in dataset order
     """
     dataset = MisrouteDataset(path=dataset_path, redact=False)
-    records = dataset.read_all()
-    
+    records: Iterator[MisrouteRecord] = dataset.iter_records()
     if limit:
-        records = records[:limit]
+        records = islice(records, limit)
     
+    engine = ReplayEngine(router_fn, max_in_flight=max_in_flight, cache=cache)
     summary = ReplaySummary()
-    summary.total = len(records)
+    order: List[int] = []
+    start = time.perf_counter()
     
-    route_correct = 0
-    intent_correct = 0
-    
-    for record in records:
-        try:
-            result = router_fn(record.user_text)
-            
-            new_route = result.get("route", "")
-            new_intent = result.get("intent", "")
-            new_slots = result.get("slots", {})
-            new_confidence = result.get("confidence", 0.0)
-            
-            # Determine expected route/intent
-            expected_route = record.expected_route or record.router_route
-            expected_intent = record.expected_intent or record.router_intent
-            
-            # Check matches
-            route_match = new_route == expected_route
-            intent_match = new_intent == expected_intent if expected_intent else True
-            
-            if route_match:
-                route_correct += 1
-            if intent_match:
-                intent_correct += 1
-            
-            # Determine improvement/regression
-            was_correct = record.router_route == expected_route
-            now_correct = route_match
-            
-            improved = not was_correct and now_correct
-            regressed = was_correct and not now_correct
-            
-            replay_result = ReplayResult(
-                record=record,
-                new_route=new_route,
-                new_intent=new_intent,
-                new_slots=new_slots,
-                new_confidence=new_confidence,
-                route_match=route_match,
-                intent_match=intent_match,
-                improved=improved,
-                regression=regressed,
-            )
-            
-            summary.results.append(replay_result)
-            
-            if improved:
-                summary.improved += 1
-            elif regressed:
-                summary.regressed += 1
-            else:
-                summary.unchanged += 1
-                
-        except Exception as e:
+    for call in engine.run(records, key=lambda r: r.user_text):
+        if call.error is not None:
             # Log error but continue
-            print(f"Error replaying record: {e}")
-            continue
-    
-    # Calculate accuracies
-    if summary.total > 0:
-        summary.route_accuracy = route_correct / summary.total
-        summary.intent_accuracy = intent_correct / summary.total
-    
+            print(f"Error replaying record: {call.error}")
+            summary.add_error()
+        else:
+            try:
+                replay_result = compare_replay(call.item, call.result)
+            except Exception as e:
+                print(f"Error replaying record: {e}")
+                summary.add_error()
+            else:
+                summary.add(replay_result, cached=call.cached)
+                order.append(call.index)
+        summary.elapsed_s = time.perf_counter() - start
+        if on_progress is not None:
+            on_progress(summary)
+    
+    # Calls finish out of order; report results in dataset order.
+    summary.results = [r for _, r in sorted(zip(order, summary.results), key=lambda p: p[0])]
     return summary
 
 
@@ -0,0 +1,179 @@
+"""Concurrent replay engine for router evaluation.
+
+Replaying a misroute dataset or the golden traces one prompt at a time
+leaves a vLLM server idle between requests.  :class:`ReplayEngine` keeps
+up to ``max_in_flight`` router calls running at once (so the server can
+batch them), answers repeated prompts from a cache instead of routing
+them again, and yields each :class:`ReplayCall` as soon as it finishes
+so callers can update their statistics incrementally.
+
+The input is consumed lazily: at most ``max_in_flight`` items are held
+in memory besides the prompt cache, so a dataset can be streamed
+straight from :meth:`MisrouteDataset.iter_records`.
+
+Example::
+
+    engine = ReplayEngine(router_fn, max_in_flight=16)
+    for call in engine.run(records, key=lambda r: r.user_text):
+        if call.error is None:
+            handle(call.item, call.result)
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_IN_FLIGHT = 8
+DEFAULT_CACHE_SIZE = 10_000
+
+
+def default_max_in_flight() -> int:
+    """In-flight limit from ``BANTZ_REPLAY_CONCURRENCY`` (default 8)."""
+    try:
+        return max(1, int(os.getenv("BANTZ_REPLAY_CONCURRENCY", DEFAULT_MAX_IN_FLIGHT)))
+    except ValueError:
+        return DEFAULT_MAX_IN_FLIGHT
+
+
+@dataclass
+class ReplayCall(Generic[T]):
+    """One finished router call."""
+
+    index: int
+    item: T
+    prompt: str
+    result: Optional[dict] = None
+    error: Optional[BaseException] = None
+    cached: bool = False
+
+
+class ReplayEngine:
+    """Run router calls concurrently with a bounded window and a prompt cache.
+
+    Args:
+        router_fn: Function that takes a prompt and returns a dict.  It is
+            called from worker threads when ``max_in_flight > 1``.
+        max_in_flight: Maximum number of unfinished calls.  ``None`` reads
+            ``BANTZ_REPLAY_CONCURRENCY``; ``1`` runs calls inline.
+        cache: Reuse the result of an identical earlier prompt.
+        cache_size: Maximum number of prompts kept in the cache.
+    """
+
+    def __init__(
+        self,
+        router_fn: Callable[[str], dict],
+        max_in_flight: Optional[int] = None,
+        cache: bool = True,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+    ):
+        self.router_fn = router_fn
+        self.max_in_flight = max(1, max_in_flight or default_max_in_flight())
+        self.cache_enabled = cache
+        self.cache_size = max(1, cache_size)
+        self._cache: "OrderedDict[str, Future]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.cache_hits = 0
+
+    def run(
+        self,
+        items: Iterable[T],
+        key: Callable[[T], str] = str,
+    ) -> Iterator[ReplayCall[T]]:
+        """Route every item, yielding calls in completion order.
+
+        Args:
+            items: Items to replay; consumed lazily.
+            key: Maps an item to the prompt passed to ``router_fn``.
+
+        Yields:
+            ReplayCall for each item (``error`` is set if the router raised).
+        """
+        if self.max_in_flight <= 1:
+            for index, item in enumerate(items):
+                call = ReplayCall(index, item, key(item))
+                future, call.cached = self._lookup(call.prompt, None)
+                yield self._finish(call, future)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="replay") as pool:
+            waiting: Dict[Future, List[ReplayCall[T]]] = {}
+            unfinished = 0
+            for index, item in enumerate(items):
+                prompt = key(item)
+                call = ReplayCall(index, item, prompt)
+                future, call.cached = self._lookup(prompt, pool)
+                if future.done():
+                    yield self._finish(call, future)
+                    continue
+                waiting.setdefault(future, []).append(call)
+                unfinished += 1
+                while unfinished >= self.max_in_flight:
+                    for done_call in self._collect(waiting):
+                        unfinished -= 1
+                        yield done_call
+            while waiting:
+                for done_call in self._collect(waiting):
+                    yield done_call
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_in_flight": self.max_in_flight,
+            "calls": self.calls,
+            "cache_hits": self.cache_hits,
+            "cached_prompts": len(self._cache),
+        }
+
+    # ----- private helpers -----
+
+    def _lookup(self, prompt: str, pool: Optional[ThreadPoolExecutor]) -> "tuple[Future, bool]":
+        """Return the future answering ``prompt`` and whether it was shared."""
+        with self._lock:
+            if self.cache_enabled:
+                future = self._cache.get(prompt)
+                if future is not None:
+                    self._cache.move_to_end(prompt)
+                    self.cache_hits += 1
+                    return future, True
+            self.calls += 1
+            if pool is None:
+                future = Future()
+                future.set_running_or_notify_cancel()
+            else:
+                future = pool.submit(self.router_fn, prompt)
+            if self.cache_enabled:
+                self._cache[prompt] = future
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        if pool is None:
+            try:
+                future.set_result(self.router_fn(prompt))
+            except Exception as e:
+                future.set_exception(e)
+        return future, False
+
+    def _collect(self, waiting: Dict[Future, List[ReplayCall[T]]]) -> List[ReplayCall[T]]:
+        done, _ = wait(list(waiting), return_when=FIRST_COMPLETED)
+        finished: List[ReplayCall[T]] = []
+        for future in done:
+            finished.extend(self._finish(call, future) for call in waiting.pop(future))
+        return finished
+
+    def _finish(self, call: ReplayCall[T], future: Future) -> ReplayCall[T]:
+        error = future.exception()
+        if error is None:
+            call.result = future.result()
+        else:
+            call.error = error
+            # Failures are not cached: a later identical prompt is retried.
+            with self._lock:
+                if self._cache.get(call.prompt) is future:
+                    del self._cache[call.prompt]
+        return call
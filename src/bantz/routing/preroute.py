@@ -19,6 +19,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Optional
 
+from bantz.text.regex_literals import LiteralPrefilter, best_requirement, literal_requirements
+
 
 # =============================================================================
 # Intent Categories
@@ -218,6 +220,26 @@ class PreRouteRule(ABC):
         """
         pass
 
+    def trigger_literals(self) -> Optional[tuple[str, ...]]:
+        """Literals of which at least one occurs in every text this rule matches.
+
+        Compared case-insensitively. ``None`` means unknown: the rule is
+        always evaluated. Subclasses overriding :meth:`match` must keep
+        this consistent (or return ``None``).
+        """
+        return None
+
+
+def _pattern_literals(patterns: list[re.Pattern]) -> Optional[tuple[str, ...]]:
+    """Union of each pattern's required literals, or None if any has none."""
+    literals: set[str] = set()
+    for pattern in patterns:
+        required = best_requirement(literal_requirements(pattern.pattern, pattern.flags), min_len=2)
+        if required is None:
+            return None
+        literals.update(required)
+    return tuple(sorted(literals))
+
 
 class PatternRule(PreRouteRule):
     """Rule based on regex patterns."""
@@ -261,6 +283,9 @@ class PatternRule(PreRouteRule):
         
         return PreRouteMatch.no_match()
 
+    def trigger_literals(self) -> Optional[tuple[str, ...]]:
+        return _pattern_literals(self.compiled)
+
 
 class KeywordRule(PreRouteRule):
     """Rule based on keyword matching."""
@@ -329,6 +354,9 @@ class KeywordRule(PreRouteRule):
         
         return PreRouteMatch.no_match()
 
+    def trigger_literals(self) -> Optional[tuple[str, ...]]:
+        return tuple(self.keywords)
+
 
 class CompositeRule(PreRouteRule):
     """Rule combining multiple sub-rules."""
@@ -377,6 +405,18 @@ class CompositeRule(PreRouteRule):
         
         return PreRouteMatch.no_match()
 
+    def trigger_literals(self) -> Optional[tuple[str, ...]]:
+        if not self.rules:
+            return None
+        sub = [r.trigger_literals() for r in self.rules]
+        if self.require_all:
+            # Every sub-rule must match, so any one requirement will do.
+            known = [t for t in sub if t is not None]
+            return min(known, key=len) if known else None
+        if any(t is None for t in sub):
+            return None
+        return tuple(sorted({lit for t in sub for lit in t}))
+
 
 # =============================================================================
 # Default Rules - Turkish
@@ -684,6 +724,14 @@ class ThresholdRule(PreRouteRule):
             )
         return PreRouteMatch.no_match()
 
+    def trigger_literals(self) -> Optional[tuple[str, ...]]:
+        if self.threshold <= 0:
+            return None
+        patterns = _pattern_literals(self.patterns)
+        if patterns is None:
+            return None
+        return tuple(sorted(set(self.keywords) | set(patterns)))
+
 
 def create_gmail_keyword_rule() -> PreRouteRule:
     """Gmail read/list keyword rule (Issue #906)."""
@@ -739,6 +787,34 @@ def create_smalltalk_rule() -> PreRouteRule:
     )
 
 
+# =============================================================================
+# Compiled Matcher
+# =============================================================================
+
+class CompiledRuleMatcher:
+    """Single-pass candidate selection over a rule list.
+
+    All rules' trigger literals (keywords and the literals their regexes
+    require) are merged into one Aho–Corasick scan; only rules whose
+    triggers occur in the text — plus rules without known triggers — are
+    evaluated. Results are identical to trying every rule.
+    """
+
+    def __init__(self, rules: list[PreRouteRule]) -> None:
+        self.rules = list(rules)
+        self._prefilter = LiteralPrefilter([r.trigger_literals() for r in self.rules])
+
+    def candidates(self, text: str) -> list[PreRouteRule]:
+        """Rules that may match *text*, in rule order."""
+        return [self.rules[i] for i in self._prefilter.candidates(text)]
+
+    def match_all(self, text: str) -> list[PreRouteMatch]:
+        """Every matching rule's result, in rule order."""
+        text = text.strip()
+        results = (rule.match(text) for rule in self.candidates(text))
+        return [m for m in results if m.matched]
+
+
 # =============================================================================
 # Pre-Router
 # =============================================================================
@@ -766,15 +842,20 @@ class PreRouter:
         self,
         rules: Optional[list[PreRouteRule]] = None,
         min_confidence: float = 0.8,
+        compiled: bool = True,
     ) -> None:
         """Initialize pre-router.
         
         Args:
             rules: Custom rules (uses defaults if None).
             min_confidence: Minimum confidence for bypass.
+            compiled: Select candidate rules with a single literal scan
+                instead of evaluating every rule.
         """
         self.rules = rules or self._default_rules()
         self.min_confidence = min_confidence
+        self.compiled = compiled
+        self._matcher: Optional[CompiledRuleMatcher] = None
         
         # Stats tracking
         self._total_queries = 0
@@ -856,7 +937,7 @@ class PreRouter:
         # Try each rule
         best_match: Optional[PreRouteMatch] = None
         
-        for rule in self.rules:
+        for rule in self._candidate_rules(text):
             # Skip affirmative/negative rules when confirmation is pending
             if has_pending_confirmation and rule.intent in _CONFIRMATION_INTENTS:
                 continue
@@ -886,6 +967,17 @@ class PreRouter:
         
         return best_match or PreRouteMatch.no_match()
     
+    def _candidate_rules(self, text: str) -> list[PreRouteRule]:
+        if not self.compiled:
+            return self.rules
+        matcher = self._matcher
+        # self.rules is public and may be edited in place; rebuild on change.
+        if matcher is None or len(matcher.rules) != len(self.rules) or any(
+            a is not b for a, b in zip(matcher.rules, self.rules)
+        ):
+            matcher = self._matcher = CompiledRuleMatcher(self.rules)
+        return matcher.candidates(text)
+
     def should_bypass(self, text: str) -> bool:
         """Quick check if text should bypass router.
         
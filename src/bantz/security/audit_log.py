@@ -30,6 +30,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
+from bantz.privacy.engine import RedactionRule, compile_engine
+
 logger = logging.getLogger(__name__)
 
 __all__ = [
@@ -74,11 +76,7 @@ def redact_pii(text: str) -> str:
     """
     if not text:
         return text
-    text = _EMAIL_RE.sub(_redact_email, text)
-    text = _PHONE_RE.sub("[PHONE]", text)
-    text = _TOKEN_RE.sub("[REDACTED]", text)
-    text = _PATH_RE.sub("~/.../", text)
-    return text
+    return _AUDIT_ENGINE.redact(text)
 
 
 def _redact_email(match: re.Match) -> str:
@@ -88,6 +86,14 @@ def _redact_email(match: re.Match) -> str:
     return f"{local[0]}***@***.{tld}"
 
 
+_AUDIT_ENGINE = compile_engine((
+    RedactionRule("email", _EMAIL_RE, _redact_email),
+    RedactionRule("phone", _PHONE_RE, "[PHONE]"),
+    RedactionRule("token", _TOKEN_RE, "[REDACTED]"),
+    RedactionRule("path", _PATH_RE, "~/.../"),
+))
+
+
 def hash_value(value: Any) -> str:
     """SHA-256 hash of a JSON-serialised value (for args/result hashing)."""
     raw = json.dumps(value, sort_keys=True, default=str)
@@ -16,6 +16,8 @@ import re
 import logging
 import copy
 
+from bantz.privacy.engine import RedactionEngine, RedactionRule, compile_engine
+
 logger = logging.getLogger(__name__)
 
 
@@ -47,6 +49,10 @@ class MaskingPattern:
         if not self.enabled:
             return text
         return self.compile().sub(self.replacement, text)
+    
+    def to_rule(self) -> RedactionRule:
+        """Rule for the shared single-pass engine."""
+        return RedactionRule(self.name, self.pattern, self.replacement, self.flags)
 
 
 # =============================================================================
@@ -201,6 +207,20 @@ class DataMasker:
         self.sensitive_field_names = SENSITIVE_FIELD_NAMES.copy()
         if custom_field_names:
             self.sensitive_field_names.update(custom_field_names)
+        self._engine: Optional[RedactionEngine] = None
+        self._engine_key: tuple = ()
+    
+    @property
+    def engine(self) -> RedactionEngine:
+        """Compiled engine for the enabled patterns (rebuilt when they change)."""
+        key = tuple(
+            (p.name, p.pattern, p.replacement, p.flags)
+            for p in self.patterns if p.enabled
+        )
+        if self._engine is None or key != self._engine_key:
+            self._engine = compile_engine(tuple(RedactionRule(*k) for k in key))
+            self._engine_key = key
+        return self._engine
     
     def mask(self, text: str) -> str:
         """
@@ -215,12 +235,7 @@ class DataMasker:
         if not text:
             return text
         
-        result = text
-        for pattern in self.patterns:
-            if pattern.enabled:
-                result = pattern.mask(result)
-        
-        return result
+        return self.engine.redact(text)
     
     def mask_dict(
         self,
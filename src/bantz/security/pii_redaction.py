@@ -23,6 +23,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional, Pattern
 
+from bantz.privacy.engine import RedactionEngine, RedactionRule, compile_engine
+
 
 class RedactionMode(Enum):
     """Redaction mode for cloud operations."""
@@ -60,6 +62,10 @@ class RedactionPattern:
         if not self.enabled or not text:
             return text
         return self.compile().sub(self.replacement, text)
+    
+    def to_rule(self) -> RedactionRule:
+        """Rule for the shared single-pass engine."""
+        return RedactionRule(self.name, self.pattern, self.replacement, self.flags)
 
 
 @dataclass(frozen=True)
@@ -377,6 +383,17 @@ class PIIRedactor:
         self.patterns = get_patterns_for_level(level)
         if custom_patterns:
             self.patterns.extend(custom_patterns)
+        self._engine: Optional[RedactionEngine] = None
+        self._engine_key: tuple = ()
+    
+    @property
+    def engine(self) -> RedactionEngine:
+        """Compiled engine for the current pattern list (rebuilt if it changed)."""
+        key = tuple(self.patterns)
+        if self._engine is None or key != self._engine_key:
+            self._engine = compile_engine(tuple(p.to_rule() for p in key if p.enabled))
+            self._engine_key = key
+        return self._engine
     
     def redact(self, text: str) -> RedactionResult:
         """Redact PII from text.
@@ -404,25 +421,12 @@ class PIIRedactor:
                 redaction_count=0,
             )
         
-        result = text
-        patterns_matched: list[str] = []
-        redaction_count = 0
-        
-        for pattern in self.patterns:
-            before = result
-            result = pattern.redact(result)
-            
-            if result != before:
-                patterns_matched.append(pattern.name)
-                # Count replacements
-                count = before.count(pattern.replacement) if pattern.replacement in result else 1
-                redaction_count += max(1, len(pattern.compile().findall(before)))
-        
+        scan = self.engine.scan(text)
         return RedactionResult(
             original=text,
-            redacted=result,
-            patterns_matched=list(set(patterns_matched)),
-            redaction_count=redaction_count,
+            redacted=scan.redacted,
+            patterns_matched=scan.rules_matched,
+            redaction_count=scan.total,
         )
     
     def redact_text(self, text: str) -> str:
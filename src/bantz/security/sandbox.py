@@ -71,6 +71,9 @@ class SandboxConfig:
     # Execution
     allow_subprocesses: bool = False
     environment: Dict[str, str] = field(default_factory=dict)
+    
+    # Warm fork-server workers for execute_python (0 = one process per snippet)
+    python_pool_size: int = 2
 
 
 # =============================================================================
@@ -104,6 +107,11 @@ class SandboxError(Exception):
     pass
 
 
+class SandboxDispatchError(SandboxError):
+    """A job could not be handed to a pooled worker; it never started."""
+    pass
+
+
 class SandboxTimeoutError(SandboxError):
     """Execution exceeded time limit."""
     pass
@@ -188,6 +196,25 @@ class Sandbox:
             clean[key] = value
         return clean
     
+    def _run_env(self, env: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """Sanitized process environment plus config and call overrides."""
+        run_env = self._sanitize_env(os.environ)
+        run_env.update(self._sanitize_env(self.config.environment))
+        if env:
+            run_env.update(self._sanitize_env(env))
+        return run_env
+    
+    def _python_pool(self):
+        """Shared warm interpreter pool for this config, or None."""
+        if self.config.python_pool_size <= 0:
+            return None
+        from bantz.security.sandbox_pool import WorkerLimits, get_interpreter_pool
+        return get_interpreter_pool(
+            self.config.python_pool_size,
+            WorkerLimits.from_config(self.config),
+            self._run_env(),
+        )
+    
     @property
     def temp_dir(self) -> Path:
         """Get or create temporary directory for sandbox."""
@@ -291,10 +318,7 @@ class Sandbox:
         result = SandboxResult(success=False)
         
         # Prepare environment — filter dangerous variables
-        run_env = self._sanitize_env(os.environ)
-        run_env.update(self._sanitize_env(self.config.environment))
-        if env:
-            run_env.update(self._sanitize_env(env))
+        run_env = self._run_env(env)
         
         # Working directory
         work_dir = cwd or self.temp_dir
@@ -347,6 +371,12 @@ class Sandbox:
         """
         Execute Python code in sandbox.
         
+        Runs in a child forked from a warm pool worker when
+        ``config.python_pool_size`` > 0 (POSIX), otherwise — or if no
+        pooled worker could take the job — in a fresh ``sys.executable``
+        process.  A pooled job that fails after it was handed over is
+        reported as failed, never run a second time.
+        
         Args:
             code: Python code to execute
             timeout: Override default timeout
@@ -358,6 +388,22 @@ class Sandbox:
         script_path = self.temp_dir / "sandbox_script.py"
         script_path.write_text(code)
         
+        pool = self._python_pool()
+        if pool is not None:
+            with self._lock:
+                self._active = True
+            try:
+                return pool.run(script_path, self.temp_dir, timeout or self.config.max_time_seconds)
+            except SandboxDispatchError as e:
+                logger.warning("[SANDBOX] Interpreter pool unavailable, using a fresh process: %s", e)
+            except Exception as e:
+                # The job may already have run (partly); do not execute it again.
+                logger.warning("[SANDBOX] Interpreter pool job failed: %s", e)
+                return SandboxResult(success=False, exit_code=-1, error=str(e))
+            finally:
+                with self._lock:
+                    self._active = False
+        
         # Execute with python
         old_timeout = self.config.max_time_seconds
         if timeout:
@@ -682,6 +728,10 @@ class MockSandbox(Sandbox):
         """Set a mock result for a key."""
         self._mock_results[key] = result
     
+    def _python_pool(self):
+        """execute_python goes through the mocked execute_command."""
+        return None
+    
     def run(
         self,
         func: Callable,
@@ -0,0 +1,345 @@
+"""
+Warm interpreter pool for ``Sandbox.execute_python``.
+
+Launching a fresh ``sys.executable`` per snippet costs tens of
+milliseconds of interpreter startup.  The pool keeps a few pre-started
+fork-server workers (see :mod:`bantz.security.sandbox_worker`); each job
+is run in a child forked from a warm worker, so it starts in about a
+millisecond yet shares no state with earlier jobs.
+
+The children get the ``SandboxConfig`` limits as rlimits (address space,
+file size, open files, plus a CPU-time backstop) and are killed with
+their whole session when ``max_time_seconds`` runs out.  POSIX only —
+:func:`get_interpreter_pool` returns ``None`` where ``os.fork`` is
+unavailable and the sandbox falls back to one process per snippet.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import select
+import signal
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from bantz.security.sandbox import SandboxConfig, SandboxDispatchError, SandboxError, SandboxResult
+
+logger = logging.getLogger(__name__)
+
+_HEADER = struct.Struct(">I")
+
+# Seconds to wait for a worker to start, and on top of a job's own
+# timeout before the worker itself is considered hung.
+STARTUP_TIMEOUT = 10.0
+REPLY_GRACE = 5.0
+
+# Shared pools kept alive at once; the least recently used is shut down.
+MAX_SHARED_POOLS = 4
+
+
+@dataclass(frozen=True)
+class WorkerLimits:
+    """Per-job resource limits applied in the forked child."""
+
+    max_memory_mb: float = 512
+    max_file_size_mb: float = 10
+    max_open_files: int = 100
+
+    @classmethod
+    def from_config(cls, config: SandboxConfig) -> "WorkerLimits":
+        return cls(
+            max_memory_mb=config.max_memory_mb,
+            max_file_size_mb=config.max_file_size_mb,
+            max_open_files=config.max_open_files,
+        )
+
+
+def _worker_source() -> str:
+    from bantz.security import sandbox_worker
+    return Path(sandbox_worker.__file__).read_text()
+
+
+# =============================================================================
+# Worker Handle
+# =============================================================================
+
+
+class _Worker:
+    """Parent-side handle for one fork-server process."""
+
+    def __init__(self, source: str, env: Dict[str, str]):
+        self.proc = subprocess.Popen(
+            [sys.executable, "-c", source],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=env,
+            cwd=tempfile.gettempdir(),
+            start_new_session=True,
+        )
+        try:
+            hello = self._recv(STARTUP_TIMEOUT)
+        except Exception:
+            self.close()
+            raise
+        if not hello.get("ready"):
+            self.close()
+            raise SandboxError(f"Sandbox worker failed to start: {hello}")
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def request(self, job: dict, timeout: float) -> dict:
+        body = json.dumps(job).encode()
+        try:
+            self.proc.stdin.write(_HEADER.pack(len(body)) + body)
+            self.proc.stdin.flush()
+        except (BrokenPipeError, OSError) as e:
+            raise SandboxDispatchError(f"Sandbox worker died: {e}") from e
+        return self._recv(timeout)
+
+    def _recv(self, timeout: float) -> dict:
+        header = self._read_exact(_HEADER.size, timeout)
+        return json.loads(self._read_exact(_HEADER.unpack(header)[0], timeout))
+
+    def _read_exact(self, size: int, timeout: float) -> bytes:
+        fd = self.proc.stdout.fileno()
+        chunks, remaining = [], size
+        while remaining:
+            ready, _, _ = select.select([fd], [], [], timeout)
+            if not ready:
+                raise SandboxError("Sandbox worker did not answer in time")
+            chunk = os.read(fd, min(remaining, 1 << 20))
+            if not chunk:
+                raise SandboxError("Sandbox worker exited unexpectedly")
+            chunks.append(chunk)
+            remaining -= len(chunk)
+        return b"".join(chunks)
+
+    def close(self) -> None:
+        try:
+            self.proc.stdin.close()
+            self.proc.wait(timeout=1)
+        except Exception:
+            try:
+                os.killpg(self.proc.pid, signal.SIGKILL)
+            except OSError:
+                pass
+            self.proc.wait()
+        finally:
+            self.proc.stdout.close()
+
+
+# =============================================================================
+# Pool
+# =============================================================================
+
+
+class InterpreterPool:
+    """
+    Pool of warm fork-server workers.
+
+    Workers are started lazily (or up front with :meth:`warm`) up to
+    ``size``; a caller that finds them all busy waits for one.  A worker
+    that fails is discarded and replaced on demand.
+
+    Example:
+        pool = InterpreterPool(2, WorkerLimits(), env)
+        result = pool.run(Path("/tmp/x/script.py"), Path("/tmp/x"), timeout=5)
+    """
+
+    def __init__(self, size: int, limits: WorkerLimits, env: Dict[str, str]):
+        self.size = max(1, size)
+        self.limits = limits
+        self._env = dict(env)
+        self._source = _worker_source()
+        self._idle: "queue.LifoQueue[_Worker]" = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._workers = 0
+        self._closed = False
+        self.jobs = 0
+        self.started = 0
+        self.failures = 0
+
+    def warm(self, count: Optional[int] = None) -> None:
+        """Start workers until ``count`` (default: ``size``) exist."""
+        target = min(self.size, count or self.size)
+        while True:
+            with self._lock:
+                if self._closed or self._workers >= target:
+                    return
+                self._workers += 1
+            self._idle.put(self._spawn())
+
+    def run(self, script: Path, cwd: Path, timeout: float) -> SandboxResult:
+        """
+        Run ``script`` as ``__main__`` in a fresh child of a warm worker.
+
+        Raises:
+            SandboxDispatchError: If no worker could take the job; it
+                never started, so the caller may fall back to a plain
+                subprocess.
+            SandboxError: If the worker failed after the job was sent.
+        """
+        try:
+            worker = self._acquire()
+        except SandboxDispatchError:
+            raise
+        except Exception as e:
+            raise SandboxDispatchError(f"No sandbox worker available: {e}") from e
+        job = {
+            "script": str(script),
+            "cwd": str(cwd),
+            "timeout": timeout,
+            "limits": asdict(self.limits),
+        }
+        try:
+            reply = worker.request(job, timeout + REPLY_GRACE)
+        except Exception:
+            self._discard(worker, failed=True)
+            raise
+        self._release(worker)
+        if "error" in reply:
+            raise SandboxError(f"Sandbox worker error: {reply['error']}")
+        self.jobs += 1
+        return self._to_result(reply, timeout)
+
+    def close(self) -> None:
+        """Stop all idle workers; busy ones are stopped when released."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(worker)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": self.size,
+            "workers": self._workers,
+            "idle": self._idle.qsize(),
+            "jobs": self.jobs,
+            "started": self.started,
+            "failures": self.failures,
+        }
+
+    # ----- private helpers -----
+
+    def _spawn(self) -> _Worker:
+        try:
+            worker = _Worker(self._source, self._env)
+        except Exception:
+            with self._lock:
+                self._workers -= 1
+            raise
+        self.started += 1
+        return worker
+
+    def _acquire(self) -> _Worker:
+        with self._lock:
+            if self._closed:
+                raise SandboxDispatchError("Interpreter pool is closed")
+            spawn = self._idle.empty() and self._workers < self.size
+            if spawn:
+                self._workers += 1
+        if spawn:
+            return self._spawn()
+        worker = self._idle.get()
+        if not worker.alive:
+            self._discard(worker, failed=True)
+            return self._acquire()
+        return worker
+
+    def _release(self, worker: _Worker) -> None:
+        if self._closed or not worker.alive:
+            self._discard(worker)
+        else:
+            self._idle.put(worker)
+
+    def _discard(self, worker: _Worker, failed: bool = False) -> None:
+        if failed:
+            self.failures += 1
+            logger.warning("[SANDBOX] Discarding failed interpreter worker (pid %s)", worker.proc.pid)
+        worker.close()
+        with self._lock:
+            self._workers -= 1
+
+    @staticmethod
+    def _to_result(reply: dict, timeout: float) -> SandboxResult:
+        exit_code = reply["exit_code"]
+        cpu_limit = exit_code == -getattr(signal, "SIGXCPU", 0)
+        result = SandboxResult(
+            success=exit_code == 0 and not reply["timed_out"],
+            stdout=reply["stdout"],
+            stderr=reply["stderr"],
+            exit_code=exit_code,
+            execution_time=reply["elapsed"],
+            memory_used_mb=reply["maxrss_kb"] / 1024,
+        )
+        if reply["timed_out"] or cpu_limit:
+            result.terminated = True
+            result.termination_reason = "timeout"
+            result.error = f"Command exceeded {timeout}s limit"
+        return result
+
+
+# =============================================================================
+# Shared Pools
+# =============================================================================
+
+
+_pools: "OrderedDict[Tuple, InterpreterPool]" = OrderedDict()
+_pools_lock = threading.Lock()
+
+
+def get_interpreter_pool(
+    size: int,
+    limits: WorkerLimits,
+    env: Dict[str, str],
+) -> Optional[InterpreterPool]:
+    """
+    Shared pool for the given size, limits and environment.
+
+    At most :data:`MAX_SHARED_POOLS` pools are kept; the least recently
+    used one is closed when another is needed.
+
+    Returns ``None`` when pooling is disabled (``size <= 0``) or the
+    platform cannot fork.
+    """
+    if size <= 0 or not hasattr(os, "fork"):
+        return None
+    key = (size, limits, tuple(sorted(env.items())))
+    stale = []
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = InterpreterPool(size, limits, env)
+            while len(_pools) > MAX_SHARED_POOLS:
+                stale.append(_pools.popitem(last=False)[1])
+        else:
+            _pools.move_to_end(key)
+    for old in stale:
+        old.close()
+    return pool
+
+
+@atexit.register
+def shutdown_pools() -> None:
+    """Stop every shared pool's workers."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for pool in pools:
+        pool.close()
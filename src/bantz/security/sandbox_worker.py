@@ -0,0 +1,220 @@
+"""
+Sandbox fork-server worker.
+
+Started by :class:`bantz.security.sandbox_pool.InterpreterPool` as
+``python -c <this file's source>`` so it needs nothing but the standard
+library (``PYTHONPATH`` is stripped from sandbox environments).
+
+The worker is a warm "zygote": it imports what jobs need once, then for
+every job forks a child that applies the resource limits, runs the
+script as ``__main__`` and exits.  Nothing a job does survives into the
+next one.
+
+Protocol (stdin/stdout of the worker, 4-byte big-endian length + JSON):
+
+- worker → parent, once: ``{"ready": true, "pid": ...}``
+- parent → worker: ``{"script", "cwd", "timeout", "limits": {...}}``
+- worker → parent: ``{"exit_code", "stdout", "stderr", "timed_out",
+  "elapsed", "maxrss_kb"}``
+
+EOF on stdin ends the worker.
+"""
+
+import json
+import math
+import os
+import signal
+import struct
+import sys
+import tempfile
+import time
+import traceback
+import types
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not POSIX
+    resource = None
+
+_HEADER = struct.Struct(">I")
+_child_pid = 0
+_timed_out = False
+_proto_fds = ()
+
+
+def _read_exact(fd, size):
+    data = b""
+    while len(data) < size:
+        chunk = os.read(fd, size - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    return data
+
+
+def _recv(fd):
+    header = _read_exact(fd, _HEADER.size)
+    if header is None:
+        return None
+    body = _read_exact(fd, _HEADER.unpack(header)[0])
+    return None if body is None else json.loads(body)
+
+
+def _send(fd, message):
+    body = json.dumps(message).encode()
+    view = memoryview(_HEADER.pack(len(body)) + body)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def _on_alarm(signum, frame):
+    global _timed_out
+    if _child_pid:
+        _timed_out = True
+        try:
+            os.killpg(_child_pid, signal.SIGKILL)
+        except OSError:
+            pass
+
+
+def _set_limit(name, value):
+    limit = getattr(resource, name, None)
+    if limit is None or value is None:
+        return
+    soft, hard = resource.getrlimit(limit)
+    if hard != resource.RLIM_INFINITY:
+        value = min(value, hard)
+    try:
+        resource.setrlimit(limit, (value, hard))
+    except (ValueError, OSError):
+        pass
+
+
+def _apply_limits(limits, timeout):
+    if resource is None:
+        return
+    mb = 1024 * 1024
+    if limits.get("max_memory_mb"):
+        _set_limit("RLIMIT_AS", int(limits["max_memory_mb"] * mb))
+    if limits.get("max_file_size_mb"):
+        _set_limit("RLIMIT_FSIZE", int(limits["max_file_size_mb"] * mb))
+    if limits.get("max_open_files"):
+        _set_limit("RLIMIT_NOFILE", int(limits["max_open_files"]))
+    # Backstop for the wall-clock timer: CPU-bound code is killed by the kernel too.
+    _set_limit("RLIMIT_CPU", int(math.ceil(timeout)) + 1)
+
+
+def _run_child(job, out, err):
+    """Runs in the forked child; never returns."""
+    code = 1
+    try:
+        os.setsid()
+        for fd in _proto_fds:
+            os.close(fd)
+        signal.signal(signal.SIGALRM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+        os.chdir(job["cwd"])
+        _apply_limits(job.get("limits") or {}, job["timeout"])
+        script = job["script"]
+        sys.argv = [script]
+        sys.path[0] = os.path.dirname(script)
+        with open(script, "rb") as f:
+            source = f.read()
+        # A real module in sys.modules so classes defined by the script
+        # resolve as __main__.X (pickle, multiprocessing), as with `python script.py`.
+        main_module = types.ModuleType("__main__")
+        main_module.__file__ = script
+        main_module.__builtins__ = __builtins__
+        sys.modules["__main__"] = main_module
+        try:
+            exec(compile(source, script, "exec"), main_module.__dict__)
+            code = 0
+        except SystemExit as exc:
+            if exc.code is None:
+                code = 0
+            elif isinstance(exc.code, int):
+                code = exc.code
+            else:
+                print(exc.code, file=sys.stderr)
+                code = 1
+        except BaseException as exc:
+            # Skip this frame so the traceback matches `python script.py`.
+            traceback.print_exception(type(exc), exc, exc.__traceback__.tb_next)
+            code = 1
+        import atexit
+        atexit._run_exitfuncs()
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except Exception:
+                pass
+        os._exit(code & 0xFF)
+
+
+def _run_job(job):
+    global _child_pid, _timed_out
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        _timed_out = False
+        start = time.perf_counter()
+        pid = os.fork()
+        if pid == 0:
+            _run_child(job, out, err)
+        _child_pid = pid
+        signal.setitimer(signal.ITIMER_REAL, max(job["timeout"], 0.001))
+        try:
+            _, status, usage = os.wait4(pid, 0)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            _child_pid = 0
+        elapsed = time.perf_counter() - start
+        # Reap anything the job left in its session.
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except OSError:
+            pass
+        out.seek(0)
+        err.seek(0)
+        return {
+            "exit_code": os.waitstatus_to_exitcode(status),
+            "stdout": out.read().decode("utf-8", errors="replace"),
+            "stderr": err.read().decode("utf-8", errors="replace"),
+            "timed_out": _timed_out,
+            "elapsed": elapsed,
+            "maxrss_kb": usage.ru_maxrss,
+        }
+
+
+def main():
+    global _proto_fds
+    # Keep the protocol off fds 0/1 so jobs inherit /dev/null and their own files.
+    proto_in = os.dup(0)
+    proto_out = os.dup(1)
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    os.close(devnull)
+    os.set_inheritable(proto_in, False)
+    os.set_inheritable(proto_out, False)
+    _proto_fds = (proto_in, proto_out)
+    signal.signal(signal.SIGALRM, _on_alarm)
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    _send(proto_out, {"ready": True, "pid": os.getpid()})
+    while True:
+        job = _recv(proto_in)
+        if job is None:
+            return
+        try:
+            reply = _run_job(job)
+        except Exception as exc:
+            reply = {"error": f"{type(exc).__name__}: {exc}"}
+        _send(proto_out, reply)
+
+
+if __name__ == "__main__":
+    main()
@@ -201,7 +201,10 @@ class IPCOverlayHook(OverlayStateHook):
     """
     Overlay state hook implementation using IPC.
     
-    Communicates with overlay process via Unix socket.
+    Communicates with overlay process via Unix socket. State and action
+    updates are posted to the client without waiting: updates within one
+    frame tick are coalesced into a single batch frame (see
+    ``OverlayClient.post``).
     """
     
     def __init__(self):
@@ -301,42 +304,57 @@ class IPCOverlayHook(OverlayStateHook):
         except Exception:
             return None
     
-    async def wake(self, text: str = "Sizi dinliyorum efendim.") -> None:
-        """Show wake state."""
+    def _post_state(self, state: str, text: Optional[str] = None, timeout_ms: Optional[int] = None) -> None:
+        """Queue a state update (coalesced per frame tick, no round trip)."""
         if self._client:
-            from bantz.ipc.protocol import OverlayState
-            await self._client.set_state(
-                OverlayState.WAKE.value,
+            from bantz.ipc.protocol import StateMessage
+            self._client.post(StateMessage(
+                state=state,
                 text=text,
-                timeout_ms=15000,  # 15 seconds timeout
-            )
+                position=None,  # resolved when the frame is flushed
+                timeout_ms=timeout_ms,
+            ))
+    
+    def _post_action(self, msg) -> None:
+        """Queue an action visual (latest per kind wins within a frame tick)."""
+        if self._client:
+            try:
+                self._client.post(msg)
+            except Exception:
+                return
+    
+    async def wake(self, text: str = "Sizi dinliyorum efendim.") -> None:
+        """Show wake state."""
+        from bantz.ipc.protocol import OverlayState
+        self._post_state(
+            OverlayState.WAKE.value,
+            text=text,
+            timeout_ms=15000,  # 15 seconds timeout
+        )
     
     async def listening(self, text: str = "Dinliyorum...") -> None:
         """Show listening state."""
-        if self._client:
-            from bantz.ipc.protocol import OverlayState
-            await self._client.set_state(OverlayState.LISTENING.value, text=text)
+        from bantz.ipc.protocol import OverlayState
+        self._post_state(OverlayState.LISTENING.value, text=text)
     
     async def thinking(self, text: str = "Anlıyorum...") -> None:
         """Show thinking state."""
-        if self._client:
-            from bantz.ipc.protocol import OverlayState
-            await self._client.set_state(OverlayState.THINKING.value, text=text)
+        from bantz.ipc.protocol import OverlayState
+        self._post_state(OverlayState.THINKING.value, text=text)
     
     async def speaking(self, text: str = "") -> None:
         """Show speaking state with response text."""
-        if self._client:
-            from bantz.ipc.protocol import OverlayState
-            await self._client.set_state(
-                OverlayState.SPEAKING.value,
-                text=text,
-                timeout_ms=10000,  # 10 seconds timeout
-            )
+        from bantz.ipc.protocol import OverlayState
+        self._post_state(
+            OverlayState.SPEAKING.value,
+            text=text,
+            timeout_ms=10000,  # 10 seconds timeout
+        )
     
     async def idle(self) -> None:
         """Hide overlay (return to idle)."""
-        if self._client:
-            await self._client.hide()
+        from bantz.ipc.protocol import OverlayState
+        self._post_state(OverlayState.IDLE.value)
     
     async def set_position(self, position: str) -> bool:
         """Update overlay position."""
@@ -346,56 +364,56 @@ class IPCOverlayHook(OverlayStateHook):
 
     async def preview_action(self, text: str, duration_ms: int = 1200) -> None:
         """Show a transient action preview on the overlay."""
-        if self._client:
-            try:
-                await self._client.preview(text=text, duration_ms=duration_ms)
-            except Exception:
-                return
+        from bantz.ipc.protocol import action_preview
+        self._post_action(action_preview(text=text, duration_ms=duration_ms))
 
     async def cursor_dot(self, x: int, y: int, duration_ms: int = 800) -> None:
         """Show a transient cursor dot at screen coordinate."""
-        if self._client:
-            try:
-                await self._client.cursor_dot(x=x, y=y, duration_ms=duration_ms)
-            except Exception:
-                return
+        from bantz.ipc.protocol import action_cursor_dot
+        self._post_action(action_cursor_dot(x=x, y=y, duration_ms=duration_ms))
 
     async def highlight_rect(self, x: int, y: int, w: int, h: int, duration_ms: int = 1200) -> None:
         """Highlight a rectangle region on screen."""
-        if self._client:
-            try:
-                await self._client.highlight_rect(x=x, y=y, w=w, h=h, duration_ms=duration_ms)
-            except Exception:
-                return
+        from bantz.ipc.protocol import action_highlight_rect
+        self._post_action(action_highlight_rect(x=x, y=y, w=w, h=h, duration_ms=duration_ms))
     
-    # Sync wrappers for use from engine (sync context)
+    # Sync wrappers for use from engine (sync context). State and action
+    # updates are posted to the client loop without waiting for it.
     def wake_sync(self, text: str = "Sizi dinliyorum efendim.") -> None:
-        self._run_async(self.wake(text))
+        from bantz.ipc.protocol import OverlayState
+        self._post_state(OverlayState.WAKE.value, text=text, timeout_ms=15000)
     
     def listening_sync(self, text: str = "Dinliyorum...") -> None:
-        self._run_async(self.listening(text))
+        from bantz.ipc.protocol import OverlayState
+        self._post_state(OverlayState.LISTENING.value, text=text)
     
     def thinking_sync(self, text: str = "Anlıyorum...") -> None:
-        self._run_async(self.thinking(text))
+        from bantz.ipc.protocol import OverlayState
+        self._post_state(OverlayState.THINKING.value, text=text)
     
     def speaking_sync(self, text: str = "") -> None:
-        self._run_async(self.speaking(text))
+        from bantz.ipc.protocol import OverlayState
+        self._post_state(OverlayState.SPEAKING.value, text=text, timeout_ms=10000)
     
     def idle_sync(self) -> None:
-        self._run_async(self.idle())
+        from bantz.ipc.protocol import OverlayState
+        self._post_state(OverlayState.IDLE.value)
     
     def set_position_sync(self, position: str) -> bool:
         result = self._run_async(self.set_position(position))
         return result if result is not None else False
 
     def preview_action_sync(self, text: str, duration_ms: int = 1200) -> None:
-        self._run_async(self.preview_action(text=text, duration_ms=duration_ms))
+        from bantz.ipc.protocol import action_preview
+        self._post_action(action_preview(text=text, duration_ms=duration_ms))
 
     def cursor_dot_sync(self, x: int, y: int, duration_ms: int = 800) -> None:
-        self._run_async(self.cursor_dot(x=x, y=y, duration_ms=duration_ms))
+        from bantz.ipc.protocol import action_cursor_dot
+        self._post_action(action_cursor_dot(x=x, y=y, duration_ms=duration_ms))
 
     def highlight_rect_sync(self, x: int, y: int, w: int, h: int, duration_ms: int = 1200) -> None:
-        self._run_async(self.highlight_rect(x=x, y=y, w=w, h=h, duration_ms=duration_ms))
+        from bantz.ipc.protocol import action_highlight_rect
+        self._post_action(action_highlight_rect(x=x, y=y, w=w, h=h, duration_ms=duration_ms))
     
     def is_connected(self) -> bool:
         """Check if overlay is connected."""
@@ -582,8 +600,8 @@ class BantzServer:
                 tasks = parse_overnight_tasks(command)
                 if not tasks:
                     return {"ok": False, "text": "Gece modu için görev belirtmelisin. Örnek: 'gece şunları yap: 1. X  2. Y'"}
-                from bantz.automation.overnight import OvernightRunner
-                runner = OvernightRunner(bantz_server=self)
+                from bantz.automation.overnight import create_overnight_runner
+                runner = create_overnight_runner(self)
                 runner.add_tasks(tasks)
                 import threading
                 t = threading.Thread(target=runner.run, daemon=True, name="overnight-runner")
@@ -37,6 +37,7 @@ from bantz.skills.summarizer import (
     CacheEntry,
     # Core Classes
     SummaryCache,
+    ContentSummaryCache,
     SummaryHistory,
     RateLimiter,
     PageSummarizer,
@@ -44,6 +45,7 @@ from bantz.skills.summarizer import (
     # Helper Functions
     extract_question,
     parse_summary_length,
+    derive_summary,
 )
 
 __all__ = [
@@ -70,6 +72,7 @@ __all__ = [
     "CacheEntry",
     # Summarizer skills - Core Classes
     "SummaryCache",
+    "ContentSummaryCache",
     "SummaryHistory",
     "RateLimiter",
     "PageSummarizer",
@@ -77,4 +80,5 @@ __all__ = [
     # Summarizer skills - Helper Functions
     "extract_question",
     "parse_summary_length",
+    "derive_summary",
 ]
@@ -390,7 +390,8 @@ def resolve_contact_email(name: str) -> Optional[str]:
     """Resolve a contact name to email using contacts store."""
     try:
         from bantz.contacts.store import contacts_resolve
-        return contacts_resolve(name)
+        result = contacts_resolve(name=name)
+        return result.get("email") if result.get("ok") else None
     except Exception:
         return None
 
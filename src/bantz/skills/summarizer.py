@@ -9,6 +9,8 @@ Jarvis-style page summarization using LLM:
 
 Enhanced Features (Issue #61):
 - Caching: Avoid duplicate LLM calls for same URL
+- Content Cache: Persistent, keyed by page content + length + model, so the
+  same article under another URL or after a restart is not re-summarised
 - Progress Indicator: "Sayfa okunuyor... Özetleniyor..."
 - Summary History: Keep last N summaries
 - Summary Length: tweet-size, paragraph, full
@@ -34,9 +36,15 @@ from datetime import datetime, timedelta
 from enum import Enum
 import asyncio
 import hashlib
+import json
 import logging
+import os
 import re
+import sqlite3
+import threading
 import time
+import unicodedata
+from pathlib import Path
 
 from bantz.llm.base import LLMClientProtocol, LLMMessage
 
@@ -332,16 +340,29 @@ class SummaryCache:
         """
         Cache summary for URL.
         
+        A live entry of a longer length (e.g. FULL) is kept rather than
+        replaced by a summary that can be derived from it.
+        
         Args:
             url: Page URL
             summary: PageSummary to cache
         """
         async with self._lock:
+            url_hash = self._hash_url(url)
+            current = self._cache.get(url_hash)
+            if (
+                current is not None
+                and not current.is_expired(self.ttl_seconds)
+                and current.summary.length_type != summary.length_type
+                and current.summary.length_type in _DERIVABLE_FROM[summary.length_type]
+            ):
+                logger.debug(f"[Cache] Kept {current.summary.length_type.value} entry for {url_hash}")
+                return
+            
             # Evict oldest entries if at capacity
             if len(self._cache) >= self.max_size:
                 await self._evict_oldest()
             
-            url_hash = self._hash_url(url)
             entry = CacheEntry(
                 url_hash=url_hash,
                 summary=summary,
@@ -386,6 +407,314 @@ class SummaryCache:
         }
 
 
+# =============================================================================
+# Content-Addressed Summary Cache
+# =============================================================================
+
+
+TWEET_MAX_CHARS = 280
+
+# Which cached lengths can stand in for a requested one. FULL summaries carry
+# the same short summary a PARAGRAPH request generates, and any short summary
+# can be trimmed to tweet size.
+_DERIVABLE_FROM: Dict[SummaryLength, tuple] = {
+    SummaryLength.FULL: (SummaryLength.FULL,),
+    SummaryLength.PARAGRAPH: (SummaryLength.PARAGRAPH, SummaryLength.FULL),
+    SummaryLength.TWEET: (SummaryLength.TWEET, SummaryLength.PARAGRAPH, SummaryLength.FULL),
+}
+
+
+def normalize_content(content: str) -> str:
+    """Normalise page content for hashing (Unicode NFC, collapsed whitespace)."""
+    return " ".join(unicodedata.normalize("NFC", content).split())
+
+
+def content_hash(content: str) -> str:
+    """Stable hash of normalised page content."""
+    return hashlib.sha256(normalize_content(content).encode("utf-8")).hexdigest()[:32]
+
+
+def trim_to_tweet(text: str) -> str:
+    """Trim text to tweet size, preferring a sentence boundary."""
+    text = text.strip()
+    if len(text) <= TWEET_MAX_CHARS:
+        return text
+    head = text[:TWEET_MAX_CHARS]
+    cut = max(head.rfind(". "), head.rfind("! "), head.rfind("? "))
+    if cut >= TWEET_MAX_CHARS // 2:
+        return head[:cut + 1]
+    return text[:TWEET_MAX_CHARS - 3] + "..."
+
+
+def derive_summary(summary: PageSummary, length: SummaryLength) -> Optional[PageSummary]:
+    """
+    Derive a summary of the requested length from a cached one.
+    
+    Args:
+        summary: Cached summary
+        length: Requested length
+        
+    Returns:
+        New PageSummary, or None if ``summary`` is too short to derive from
+    """
+    if summary.length_type not in _DERIVABLE_FROM[length]:
+        return None
+    
+    short_summary = summary.short_summary
+    detailed_summary = summary.detailed_summary
+    key_points = list(summary.key_points)
+    
+    if length != SummaryLength.FULL:
+        detailed_summary = ""
+        key_points = []
+    if length == SummaryLength.TWEET:
+        short_summary = trim_to_tweet(short_summary)
+    
+    return PageSummary(
+        title=summary.title,
+        url=summary.url,
+        short_summary=short_summary,
+        detailed_summary=detailed_summary,
+        key_points=key_points,
+        source_content=summary.source_content,
+        generated_at=summary.generated_at,
+        length_type=length,
+        from_cache=summary.from_cache,
+    )
+
+
+_CONTENT_CACHE_SCHEMA = """\
+CREATE TABLE IF NOT EXISTS summary_cache (
+    key             TEXT PRIMARY KEY,
+    content_hash    TEXT NOT NULL,
+    length          TEXT NOT NULL,
+    model           TEXT NOT NULL,
+    payload         TEXT NOT NULL,
+    size_bytes      INTEGER NOT NULL,
+    created_at      REAL NOT NULL,
+    accessed_at     REAL NOT NULL,
+    access_count    INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_summary_cache_content  ON summary_cache(content_hash, model);
+CREATE INDEX IF NOT EXISTS idx_summary_cache_accessed ON summary_cache(accessed_at);
+"""
+
+
+class ContentSummaryCache:
+    """
+    Persistent summary cache keyed by page content, length and model.
+    
+    Unlike :class:`SummaryCache` (in-memory, keyed by URL), this survives
+    restarts and hits for the same article reached through a different
+    URL. A request for a shorter length is answered from a cached longer
+    summary via :func:`derive_summary`. Entries are evicted least recently
+    used first once ``max_entries`` or ``max_bytes`` is exceeded.
+    
+    Source content is not stored; callers re-attach it from the page.
+    """
+    
+    def __init__(
+        self,
+        db_path: str | Path = "~/.bantz/data/summaries.db",
+        max_entries: int = 2000,
+        max_bytes: int = 20 * 1024 * 1024,
+        ttl_seconds: Optional[int] = 30 * 24 * 3600,
+    ):
+        """
+        Initialize cache.
+        
+        Args:
+            db_path: SQLite database path (``:memory:`` for tests)
+            max_entries: Maximum number of cached summaries
+            max_bytes: Maximum total payload size in bytes
+            ttl_seconds: Entry lifetime in seconds (None = no expiry)
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.derived_hits = 0
+        self.misses = 0
+        
+        db = str(db_path)
+        if db != ":memory:":
+            path = Path(db).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = str(path)
+        self._db_path = db
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db, check_same_thread=False)
+        self._conn.executescript(_CONTENT_CACHE_SCHEMA)
+    
+    @staticmethod
+    def _key(digest: str, length: SummaryLength, model: str) -> str:
+        return f"{digest}:{length.value}:{model}"
+    
+    def get(
+        self,
+        content: str,
+        length: SummaryLength,
+        model: str = "",
+    ) -> Optional[PageSummary]:
+        """
+        Look up a summary for page content.
+        
+        Args:
+            content: Page content
+            length: Requested summary length
+            model: Model identifier the summary must come from
+            
+        Returns:
+            PageSummary (exact or derived) or None on miss
+        """
+        digest = content_hash(content)
+        now = time.time()
+        
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT key, length, payload, created_at FROM summary_cache "
+                "WHERE content_hash = ? AND model = ?",
+                (digest, model),
+            ).fetchall()
+            
+            by_length: Dict[str, tuple] = {}
+            for key, row_length, payload, created_at in rows:
+                if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+                    self._conn.execute("DELETE FROM summary_cache WHERE key = ?", (key,))
+                    continue
+                by_length[row_length] = (key, payload)
+            
+            for candidate in _DERIVABLE_FROM[length]:
+                hit = by_length.get(candidate.value)
+                if hit is None:
+                    continue
+                key, payload = hit
+                self._conn.execute(
+                    "UPDATE summary_cache SET accessed_at = ?, "
+                    "access_count = access_count + 1 WHERE key = ?",
+                    (now, key),
+                )
+                self._conn.commit()
+                
+                summary = derive_summary(PageSummary.from_dict(json.loads(payload)), length)
+                summary.from_cache = True
+                if candidate == length:
+                    self.hits += 1
+                else:
+                    self.derived_hits += 1
+                logger.info(f"[ContentCache] Hit {digest[:12]} ({candidate.value} -> {length.value})")
+                return summary
+            
+            self._conn.commit()
+            self.misses += 1
+            return None
+    
+    def set(self, content: str, summary: PageSummary, model: str = "") -> None:
+        """
+        Store a summary for page content.
+        
+        Args:
+            content: Page content the summary was generated from
+            summary: Generated summary
+            model: Model identifier
+        """
+        digest = content_hash(content)
+        data = summary.to_dict()
+        data["from_cache"] = False
+        payload = json.dumps(data, ensure_ascii=False)
+        now = time.time()
+        
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO summary_cache "
+                "(key, content_hash, length, model, payload, size_bytes, "
+                "created_at, accessed_at, access_count) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)",
+                (
+                    self._key(digest, summary.length_type, model),
+                    digest,
+                    summary.length_type.value,
+                    model,
+                    payload,
+                    len(payload.encode("utf-8")),
+                    now,
+                    now,
+                ),
+            )
+            self._evict()
+            self._conn.commit()
+    
+    def _evict(self) -> None:
+        """Drop least recently used entries beyond the size limits (lock held)."""
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM summary_cache"
+        ).fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        
+        rows = self._conn.execute(
+            "SELECT key, size_bytes FROM summary_cache ORDER BY accessed_at ASC"
+        ).fetchall()
+        doomed = []
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            doomed.append((key,))
+            count -= 1
+            total -= size
+        self._conn.executemany("DELETE FROM summary_cache WHERE key = ?", doomed)
+        logger.debug(f"[ContentCache] Evicted {len(doomed)} entries")
+    
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM summary_cache")
+            self._conn.commit()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM summary_cache"
+            ).fetchone()
+        return {
+            "size": count,
+            "bytes": total,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "derived_hits": self.derived_hits,
+            "misses": self.misses,
+        }
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+_default_content_cache: Optional[ContentSummaryCache] = None
+
+
+def get_default_content_cache() -> Optional[ContentSummaryCache]:
+    """
+    Shared on-disk content cache (``$BANTZ_DATA_DIR/summaries.db``).
+    
+    Returns None if the database cannot be opened, so callers degrade to
+    URL-only caching.
+    """
+    global _default_content_cache
+    if _default_content_cache is None:
+        data_dir = os.environ.get("BANTZ_DATA_DIR", "~/.bantz/data")
+        try:
+            _default_content_cache = ContentSummaryCache(Path(data_dir) / "summaries.db")
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"[ContentCache] Disabled: {e}")
+            return None
+    return _default_content_cache
+
+
 # =============================================================================
 # Summary History
 # =============================================================================
@@ -594,6 +923,7 @@ class PageSummarizer:
         history_size: int = 10,
         max_retries: int = 3,
         rate_limit: int = 10,
+        content_cache: Optional[ContentSummaryCache] = None,
     ):
         """
         Initialize page summarizer.
@@ -608,6 +938,7 @@ class PageSummarizer:
             history_size: Maximum history entries
             max_retries: Maximum retry attempts on failure
             rate_limit: Maximum requests per minute
+            content_cache: Persistent content-addressed cache (optional)
         """
         self.bridge = extension_bridge
         self.llm = llm_client
@@ -623,12 +954,66 @@ class PageSummarizer:
         self._cache = SummaryCache(max_size=cache_size, ttl_seconds=cache_ttl)
         self._history = SummaryHistory(max_size=history_size)
         self._rate_limiter = RateLimiter(max_requests=rate_limit, window_seconds=60.0)
+        self._content_cache = content_cache
     
     @property
     def cache(self) -> SummaryCache:
         """Access to summary cache."""
         return self._cache
     
+    @property
+    def content_cache(self) -> Optional[ContentSummaryCache]:
+        """Access to the persistent content cache (if configured)."""
+        return self._content_cache
+    
+    @property
+    def _model_id(self) -> str:
+        """Model identifier used in content cache keys."""
+        try:
+            return str(getattr(self.llm, "model_name", "") or "")
+        except Exception:
+            return ""
+    
+    async def _lookup_cached(
+        self,
+        page: ExtractedPage,
+        length: SummaryLength,
+    ) -> Optional[PageSummary]:
+        """Check URL cache, then content cache, for a usable summary."""
+        cached = await self._cache.get(page.url)
+        if cached:
+            derived = derive_summary(cached, length)
+            if derived:
+                derived.from_cache = True
+                return derived
+        
+        if self._content_cache is None:
+            return None
+        
+        try:
+            summary = self._content_cache.get(page.content, length, self._model_id)
+        except sqlite3.Error as e:
+            logger.warning(f"[Summarizer] Content cache read failed: {e}")
+            return None
+        if summary is None:
+            return None
+        
+        # Same content may have been cached under another URL/title.
+        summary.url = page.url
+        summary.title = page.title
+        summary.source_content = page.content
+        await self._cache.set(page.url, summary)
+        return summary
+    
+    def _store_content_cache(self, page: ExtractedPage, summary: PageSummary) -> None:
+        """Persist a freshly generated summary in the content cache."""
+        if self._content_cache is None:
+            return
+        try:
+            self._content_cache.set(page.content, summary, self._model_id)
+        except sqlite3.Error as e:
+            logger.warning(f"[Summarizer] Content cache write failed: {e}")
+    
     @property
     def history(self) -> SummaryHistory:
         """Access to summary history."""
@@ -743,7 +1128,7 @@ class PageSummarizer:
         
         # Check cache first
         if use_cache:
-            cached = await self._cache.get(page.url)
+            cached = await self._lookup_cached(page, length)
             if cached:
                 logger.info(f"[Summarizer] Cache hit for: {page.url[:50]}")
                 self._notify_progress(progress_callback, ProgressStage.CACHED, "Önbellekten alındı")
@@ -773,6 +1158,7 @@ class PageSummarizer:
                 # Cache the result
                 if use_cache:
                     await self._cache.set(page.url, summary)
+                    self._store_content_cache(page, summary)
                 
                 # Add to history
                 self._history.add(summary)
@@ -840,8 +1226,8 @@ class PageSummarizer:
         summary = response.strip()
         
         # Ensure max 280 chars
-        if len(summary) > 280:
-            summary = summary[:277] + "..."
+        if len(summary) > TWEET_MAX_CHARS:
+            summary = summary[:TWEET_MAX_CHARS - 3] + "..."
         
         return summary
     
@@ -1098,13 +1484,16 @@ class PageSummarizer:
     
     def get_stats(self) -> Dict[str, Any]:
         """Get summarizer statistics."""
-        return {
+        stats = {
             "cache": self._cache.stats(),
             "history_count": self._history.count,
             "rate_limiter_usage": self._rate_limiter.current_usage,
             "has_summary": self.has_summary,
             "has_content": self.has_content,
         }
+        if self._content_cache is not None:
+            stats["content_cache"] = self._content_cache.stats()
+        return stats
 
 
 # =============================================================================
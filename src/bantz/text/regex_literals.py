@@ -0,0 +1,191 @@
+"""Literal prefilters derived from regular expressions.
+
+A regex such as ``\\bapi[_-]?key=\\S+`` can only match text containing
+``key=``; checking that with ``str.__contains__`` (or a trigram index) is
+far cheaper than running the regex.  :func:`literal_requirements` walks
+the parsed pattern and returns every such requirement as an *any-of* set
+of literals — ``(?:Sokak|Cadde)`` yields ``("Cadde", "Sokak")`` — and
+:func:`best_requirement` picks the most selective one.
+
+Case-insensitive patterns keep the longest ASCII run of each literal,
+lower-cased; callers compare against lower-cased text (see
+:data:`FOLD_FIXES` for what ``str.lower`` gets wrong).
+
+:class:`LiteralPrefilter` applies such requirements to a whole rule set
+at once: an Aho–Corasick scan finds every required literal present in
+the text in one pass, and only rules whose requirement is met (or that
+have none) need their regex run.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+try:  # Python 3.11+
+    from re import _parser as _sre_parse
+except ImportError:  # pragma: no cover - Python 3.10
+    import sre_parse as _sre_parse  # type: ignore[no-redef]
+
+__all__ = [
+    "FOLD_FIXES",
+    "LiteralPrefilter",
+    "LiteralScanner",
+    "best_requirement",
+    "fold_case",
+    "literal_requirements",
+]
+
+# re.IGNORECASE equivalences that str.lower() does not produce.  "İ"
+# lowers to "i" + U+0307, so the combining dot is dropped as well.
+FOLD_FIXES = str.maketrans({"ſ": "s", "ı": "i", "\u0307": None})
+
+Requirement = Tuple[str, ...]
+
+_ASCII_RUN_RE = re.compile(r"[\x00-\x7f]+")
+_REPEATS = {
+    _sre_parse.MAX_REPEAT,
+    _sre_parse.MIN_REPEAT,
+    getattr(_sre_parse, "POSSESSIVE_REPEAT", _sre_parse.MAX_REPEAT),
+}
+
+
+def literal_requirements(pattern: str, flags: int = 0) -> List[Requirement]:
+    """Any-of literal sets that every match of *pattern* must satisfy.
+
+    Returns an empty list when nothing can be derived (or the pattern does
+    not parse).
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except Exception:
+        return []
+    found = _requirements(list(parsed))
+    if flags & re.IGNORECASE:
+        folded = []
+        for requirement in found:
+            runs = tuple(max(_ASCII_RUN_RE.findall(lit), key=len, default="").lower() for lit in requirement)
+            if all(runs):
+                folded.append(tuple(sorted(set(runs))))
+        found = folded
+    return found
+
+
+def best_requirement(requirements: Sequence[Requirement], min_len: int = 1) -> Optional[Requirement]:
+    """The requirement whose shortest literal is longest (most selective)."""
+    candidates = [r for r in requirements if min(len(lit) for lit in r) >= min_len]
+    if not candidates:
+        return None
+    return max(candidates, key=lambda r: (min(len(lit) for lit in r), -len(r)))
+
+
+def fold_case(text: str) -> str:
+    """Lower-case *text* the way requirements of case-insensitive patterns are."""
+    folded = text.lower()
+    return folded if folded.isascii() else folded.translate(FOLD_FIXES)
+
+
+class LiteralScanner:
+    """Aho–Corasick automaton over a fixed set of literals.
+
+    :meth:`scan` reports every literal occurring in a text, overlapping
+    occurrences included, in a single left-to-right pass.
+    """
+
+    def __init__(self, literals: Iterable[str]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._out: List[Tuple[str, ...]] = [()]
+        for literal in set(literals):
+            if not literal:
+                continue
+            state = 0
+            for ch in literal:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][ch] = nxt
+                    self._goto.append({})
+                    self._out.append(())
+                state = nxt
+            self._out[state] += (literal,)
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] += self._out[self._fail[nxt]]
+
+    def scan(self, text: str) -> Set[str]:
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[str] = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class LiteralPrefilter:
+    """Select which of a list of rules can match a text.
+
+    Args:
+        requirements: Per rule, an any-of literal set (compared
+            case-insensitively via :func:`fold_case`) or ``None`` for a
+            rule that must always be tried.
+    """
+
+    def __init__(self, requirements: Sequence[Optional[Requirement]]) -> None:
+        self._always: List[int] = []
+        self._by_literal: Dict[str, List[int]] = {}
+        for i, requirement in enumerate(requirements):
+            if requirement is None:
+                self._always.append(i)
+                continue
+            for literal in {fold_case(lit) for lit in requirement}:
+                self._by_literal.setdefault(literal, []).append(i)
+        self._scanner = LiteralScanner(self._by_literal)
+
+    def candidates(self, text: str) -> List[int]:
+        """Indices of rules that may match *text*, in rule order."""
+        hits = set(self._always)
+        for literal in self._scanner.scan(fold_case(text)):
+            hits.update(self._by_literal[literal])
+        return sorted(hits)
+
+
+# ── Internal ──────────────────────────────────────────────────────
+
+
+def _requirements(items: list) -> List[Requirement]:
+    found: List[Requirement] = []
+    run: List[str] = []
+    for op, arg in items:
+        if op is _sre_parse.LITERAL:
+            run.append(chr(arg))
+            continue
+        if run:
+            found.append(("".join(run),))
+            run = []
+        if op is _sre_parse.SUBPATTERN:
+            _group, add_flags, del_flags, sub = arg
+            if not add_flags and not del_flags:
+                found.extend(_requirements(list(sub)))
+        elif op is _sre_parse.BRANCH:
+            alternatives = [best_requirement(_requirements(list(alt))) for alt in arg[1]]
+            if all(alternatives):
+                found.append(tuple(sorted({lit for alt in alternatives for lit in alt})))
+        elif op in _REPEATS and arg[0] >= 1:
+            found.extend(_requirements(list(arg[2])))
+    if run:
+        found.append(("".join(run),))
+    return found
@@ -36,6 +36,13 @@ def _workspace_root() -> Path:
     return Path.cwd()
 
 
+def _notify_changed(fpath: Path) -> None:
+    """Keep open workspace indexes in step with an in-place edit."""
+    from bantz.coding.index import notify_changed
+
+    notify_changed(fpath)
+
+
 # ── code_format ─────────────────────────────────────────────────────
 
 def code_format_tool(*, path: str = "", **_: Any) -> Dict[str, Any]:
@@ -64,6 +71,7 @@ def code_format_tool(*, path: str = "", **_: Any) -> Dict[str, Any]:
                     timeout=30,
                 )
                 if result.returncode == 0:
+                    _notify_changed(fpath)
                     return {"ok": True, "path": str(fpath), "formatter": "black", "formatted": True}
                 return {"ok": False, "error": f"black_error: {result.stderr.strip()[:200]}"}
 
@@ -76,6 +84,7 @@ def code_format_tool(*, path: str = "", **_: Any) -> Dict[str, Any]:
                     timeout=30,
                 )
                 if result.returncode == 0:
+                    _notify_changed(fpath)
                     return {"ok": True, "path": str(fpath), "formatter": "autopep8", "formatted": True}
 
             return {"ok": False, "error": "no_python_formatter_installed (try: pip install black)"}
@@ -89,6 +98,7 @@ def code_format_tool(*, path: str = "", **_: Any) -> Dict[str, Any]:
                     timeout=30,
                 )
                 if result.returncode == 0:
+                    _notify_changed(fpath)
                     return {"ok": True, "path": str(fpath), "formatter": "prettier", "formatted": True}
             return {"ok": False, "error": "prettier_not_installed"}
 
@@ -148,6 +158,7 @@ def code_replace_function_tool(*, path: str = "", function_name: str = "", new_c
             new_content = "\n".join(new_lines)
 
             fpath.write_text(new_content, encoding="utf-8")
+            _notify_changed(fpath)
             return {
                 "ok": True,
                 "path": str(fpath),
@@ -341,50 +352,35 @@ def project_symbols_tool(*, path: str = "", **_: Any) -> Dict[str, Any]:
 
 # ── project_search_symbol ──────────────────────────────────────────
 
+_FUNCTION_SYMBOL_TYPES = ("function", "method", "property", "classmethod", "staticmethod")
+
+
 def project_search_symbol_tool(*, name: str = "", type: str | None = None, **_: Any) -> Dict[str, Any]:
-    """Search for a symbol across the project."""
+    """Search for a symbol across the project (served by the workspace index)."""
     if not name:
         return {"ok": False, "error": "name_required"}
 
-    ws = _workspace_root()
-    name_lower = name.lower()
-    results = []
-
-    skip_dirs = {"__pycache__", "node_modules", ".venv", "venv", ".git"}
-
-    for py_file in ws.rglob("*.py"):
-        # Skip excluded dirs
-        if any(sd in py_file.parts for sd in skip_dirs):
-            continue
+    from bantz.coding.index import get_workspace_index
 
-        if len(results) >= 50:
-            break
-
-        try:
-            content = py_file.read_text(encoding="utf-8", errors="ignore")
-            tree = ast.parse(content)
+    kind = type.lower() if type else None
+    if kind == "class":
+        types: tuple[str, ...] | None = ("class",)
+    elif kind in ("function", "method"):
+        types = _FUNCTION_SYMBOL_TYPES
+    else:
+        types = None
 
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef) and name_lower in node.name.lower():
-                    if type and type.lower() != "class":
-                        continue
-                    results.append({
-                        "file": str(py_file.relative_to(ws)),
-                        "name": node.name,
-                        "type": "class",
-                        "line": node.lineno,
-                    })
-                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and name_lower in node.name.lower():
-                    if type and type.lower() not in ("function", "method"):
-                        continue
-                    results.append({
-                        "file": str(py_file.relative_to(ws)),
-                        "name": node.name,
-                        "type": "function",
-                        "line": node.lineno,
-                    })
-        except Exception:
-            continue
+    results = []
+    if kind is None or types is not None:
+        for sym in get_workspace_index(_workspace_root()).search_symbols(
+            name, symbol_type=types, extensions=[".py"], max_results=50,
+        ):
+            results.append({
+                "file": sym["file"],
+                "name": sym["name"],
+                "type": "class" if sym["type"] == "class" else "function",
+                "line": sym["line"],
+            })
 
     return {
         "ok": True,
@@ -17,16 +17,11 @@ def contacts_search_tool(*, query: str = "", **_: Any) -> Dict[str, Any]:
     if not query:
         return {"ok": False, "error": "query_required"}
     try:
-        from bantz.contacts.store import contacts_list as _list
+        from bantz.contacts.store import contacts_search
     except ImportError:
         return {"ok": False, "error": "contacts_module_not_available"}
     try:
-        all_contacts = _list()
-        q = query.lower()
-        matches = [
-            c for c in all_contacts
-            if q in c.get("name", "").lower() or q in c.get("email", "").lower()
-        ]
+        matches = contacts_search(query=query, limit=20)["contacts"]
         return {"ok": True, "results": matches, "count": len(matches)}
     except Exception as e:
         logger.error(f"[Contacts] search error: {e}", exc_info=True)
@@ -42,10 +37,13 @@ def contacts_get_tool(*, name: str = "", **_: Any) -> Dict[str, Any]:
     except ImportError:
         return {"ok": False, "error": "contacts_module_not_available"}
     try:
-        result = contacts_resolve(name)
-        if result is None:
+        result = contacts_resolve(name=name)
+        if result.get("error") == "contact_ambiguous":
+            return {"ok": False, "error": f"Birden fazla kişi eşleşti: {name}",
+                    "candidates": result.get("candidates", [])}
+        if not result.get("ok"):
             return {"ok": False, "error": f"Kişi bulunamadı: {name}"}
-        return {"ok": True, "name": name, "email": result}
+        return {"ok": True, "name": result.get("name", name), "email": result["email"]}
     except Exception as e:
         logger.error(f"[Contacts] get error: {e}", exc_info=True)
         return {"ok": False, "error": str(e)}
@@ -54,12 +52,12 @@ def contacts_get_tool(*, name: str = "", **_: Any) -> Dict[str, Any]:
 def contacts_list_tool(*, limit: int = 50, **_: Any) -> Dict[str, Any]:
     """List all contacts."""
     try:
-        from bantz.contacts.store import contacts_list as _list
+        from bantz.contacts.store import contacts_list as _list, get_contact_store
     except ImportError:
         return {"ok": False, "error": "contacts_module_not_available"}
     try:
-        all_contacts = _list()
-        return {"ok": True, "contacts": all_contacts[:limit], "total": len(all_contacts)}
+        contacts = _list(limit=max(1, int(limit)))["contacts"]
+        return {"ok": True, "contacts": contacts, "total": get_contact_store().count()}
     except Exception as e:
         logger.error(f"[Contacts] list error: {e}", exc_info=True)
         return {"ok": False, "error": str(e)}
@@ -0,0 +1,112 @@
+"""Lazy tool handlers — import handler modules on first invocation.
+
+Tool names, descriptions and schemas are declared statically in
+``agent/registry.py`` and ``tools/register_all.py``; only the handler
+functions live in the heavier ``bantz.tools.*`` modules (Google API
+wrappers, browser bridge, AST/code tools …).  Binding each tool to a
+:class:`LazyHandler` instead of the imported function means building a
+registry no longer pays for that import graph — a module is imported the
+first time one of its tools is actually called.
+
+Set ``BANTZ_LAZY_TOOLS=0`` to restore eager imports (handler import
+errors then surface at registration time, as before).
+
+Usage::
+
+    from bantz.tools.lazy import lazy_handlers
+
+    (calendar_list_events_tool,) = lazy_handlers(
+        "bantz.tools.calendar_tools", "calendar_list_events_tool",
+    )
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import os
+import sys
+import threading
+from typing import Any, Callable, Optional
+
+__all__ = [
+    "LazyHandler",
+    "lazy_handlers",
+    "lazy_tools_enabled",
+    "resolve_handler",
+]
+
+
+def lazy_tools_enabled() -> bool:
+    """Whether handlers are bound lazily (``BANTZ_LAZY_TOOLS``, default on)."""
+    return os.getenv("BANTZ_LAZY_TOOLS", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+class LazyHandler:
+    """Callable proxy for ``module:attr`` that imports on first call.
+
+    The resolved function is cached; the attribute is looked up at
+    resolution time, so patches applied to the module before the first
+    call are honoured.
+    """
+
+    __slots__ = ("module", "attr", "_target", "_lock", "__name__", "__qualname__")
+
+    def __init__(self, module: str, attr: str):
+        self.module = module
+        self.attr = attr
+        self._target: Optional[Callable[..., Any]] = None
+        self._lock = threading.Lock()
+        self.__name__ = attr
+        self.__qualname__ = attr
+
+    @property
+    def loaded(self) -> bool:
+        """True once the handler module has been imported."""
+        return self._target is not None
+
+    def resolve(self) -> Callable[..., Any]:
+        """Import the module (once) and return the real handler."""
+        target = self._target
+        if target is None:
+            with self._lock:
+                target = self._target
+                if target is None:
+                    target = getattr(importlib.import_module(self.module), self.attr)
+                    self._target = target
+        return target
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "pending"
+        return f"<LazyHandler {self.module}:{self.attr} ({state})>"
+
+
+def resolve_handler(fn: Any) -> Any:
+    """Return the real function behind *fn* (imports a pending lazy handler)."""
+    return fn.resolve() if isinstance(fn, LazyHandler) else fn
+
+
+def lazy_handlers(module: str, *names: str) -> tuple[Callable[..., Any], ...]:
+    """Handlers for *names* in *module*, lazily bound when enabled.
+
+    In lazy mode the module is located with ``find_spec`` (no import) when
+    its parent package is already loaded, so a missing module still raises
+    ``ImportError`` at registration time.
+    In eager mode (``BANTZ_LAZY_TOOLS=0``) the module is imported and the
+    real functions are returned.
+    """
+    if not lazy_tools_enabled():
+        mod = importlib.import_module(module)
+        try:
+            return tuple(getattr(mod, name) for name in names)
+        except AttributeError as e:
+            raise ImportError(str(e)) from e
+    # Locating a submodule imports its parent package; only check when
+    # that is free, so e.g. bantz.google's __init__ stays deferred too.
+    parent = module.rpartition(".")[0]
+    if (not parent or parent in sys.modules) and importlib.util.find_spec(module) is None:
+        raise ImportError(f"No module named {module!r}")
+    return tuple(LazyHandler(module, name) for name in names)
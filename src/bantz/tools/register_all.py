@@ -66,6 +66,12 @@ _RISK_NORMALIZE: dict[str, str] = {
 }
 
 
+def _handlers(module: str, *names: str) -> tuple:
+    """Handler functions from *module*, imported on first call (lazy.py)."""
+    from bantz.tools.lazy import lazy_handlers
+    return lazy_handlers(module, *names)
+
+
 def _reg(registry: "ToolRegistry", name: str, desc: str, params: dict,
          fn, *, risk: str = "low", confirm: bool = False) -> bool:
     """Register a single tool, returning True on success."""
@@ -113,17 +119,32 @@ def _register_web(registry: "ToolRegistry") -> int:
 
 def _register_browser(registry: "ToolRegistry") -> int:
     try:
-        from bantz.tools.browser_tools import (browser_back_tool,
-                                               browser_click_tool,
-                                               browser_detail_tool,
-                                               browser_info_tool,
-                                               browser_open_tool,
-                                               browser_scan_tool,
-                                               browser_scroll_down_tool,
-                                               browser_scroll_up_tool,
-                                               browser_search_tool,
-                                               browser_type_tool,
-                                               browser_wait_tool)
+        (
+            browser_back_tool,
+            browser_click_tool,
+            browser_detail_tool,
+            browser_info_tool,
+            browser_open_tool,
+            browser_scan_tool,
+            browser_scroll_down_tool,
+            browser_scroll_up_tool,
+            browser_search_tool,
+            browser_type_tool,
+            browser_wait_tool,
+        ) = _handlers(
+            "bantz.tools.browser_tools",
+            "browser_back_tool",
+            "browser_click_tool",
+            "browser_detail_tool",
+            "browser_info_tool",
+            "browser_open_tool",
+            "browser_scan_tool",
+            "browser_scroll_down_tool",
+            "browser_scroll_up_tool",
+            "browser_search_tool",
+            "browser_type_tool",
+            "browser_wait_tool",
+        )
     except ImportError as e:
         logger.warning(f"[ToolGap] browser import: {e}")
         return 0
@@ -174,11 +195,24 @@ def _register_browser(registry: "ToolRegistry") -> int:
 
 def _register_pc(registry: "ToolRegistry") -> int:
     try:
-        from bantz.tools.pc_tools import (clipboard_get_tool,
-                                          clipboard_set_tool, pc_hotkey_tool,
-                                          pc_mouse_click_tool,
-                                          pc_mouse_move_tool,
-                                          pc_mouse_scroll_tool, pc_type_tool)
+        (
+            clipboard_get_tool,
+            clipboard_set_tool,
+            pc_hotkey_tool,
+            pc_mouse_click_tool,
+            pc_mouse_move_tool,
+            pc_mouse_scroll_tool,
+            pc_type_tool,
+        ) = _handlers(
+            "bantz.tools.pc_tools",
+            "clipboard_get_tool",
+            "clipboard_set_tool",
+            "pc_hotkey_tool",
+            "pc_mouse_click_tool",
+            "pc_mouse_move_tool",
+            "pc_mouse_scroll_tool",
+            "pc_type_tool",
+        )
     except ImportError as e:
         logger.warning(f"[ToolGap] pc import: {e}")
         return 0
@@ -212,9 +246,22 @@ def _register_pc(registry: "ToolRegistry") -> int:
 
 def _register_file(registry: "ToolRegistry") -> int:
     try:
-        from bantz.tools.file_tools import (file_create_tool, file_edit_tool,
-                                            file_read_tool, file_search_tool,
-                                            file_undo_tool, file_write_tool)
+        (
+            file_create_tool,
+            file_edit_tool,
+            file_read_tool,
+            file_search_tool,
+            file_undo_tool,
+            file_write_tool,
+        ) = _handlers(
+            "bantz.tools.file_tools",
+            "file_create_tool",
+            "file_edit_tool",
+            "file_read_tool",
+            "file_search_tool",
+            "file_undo_tool",
+            "file_write_tool",
+        )
     except ImportError as e:
         logger.warning(f"[ToolGap] file import: {e}")
         return 0
@@ -253,10 +300,18 @@ def _register_file(registry: "ToolRegistry") -> int:
 
 def _register_terminal(registry: "ToolRegistry") -> int:
     try:
-        from bantz.tools.terminal_tools import (terminal_background_kill_tool,
-                                                terminal_background_list_tool,
-                                                terminal_background_tool,
-                                                terminal_run_tool)
+        (
+            terminal_background_kill_tool,
+            terminal_background_list_tool,
+            terminal_background_tool,
+            terminal_run_tool,
+        ) = _handlers(
+            "bantz.tools.terminal_tools",
+            "terminal_background_kill_tool",
+            "terminal_background_list_tool",
+            "terminal_background_tool",
+            "terminal_run_tool",
+        )
     except ImportError as e:
         logger.warning(f"[ToolGap] terminal import: {e}")
         return 0
@@ -282,12 +337,22 @@ def _register_terminal(registry: "ToolRegistry") -> int:
 
 def _register_code(registry: "ToolRegistry") -> int:
     try:
-        from bantz.tools.code_tools import (code_format_tool,
-                                            code_replace_function_tool,
-                                            project_info_tool,
-                                            project_search_symbol_tool,
-                                            project_symbols_tool,
-                                            project_tree_tool)
+        (
+            code_format_tool,
+            code_replace_function_tool,
+            project_info_tool,
+            project_search_symbol_tool,
+            project_symbols_tool,
+            project_tree_tool,
+        ) = _handlers(
+            "bantz.tools.code_tools",
+            "code_format_tool",
+            "code_replace_function_tool",
+            "project_info_tool",
+            "project_search_symbol_tool",
+            "project_symbols_tool",
+            "project_tree_tool",
+        )
     except ImportError as e:
         logger.warning(f"[ToolGap] code import: {e}")
         return 0
@@ -322,12 +387,22 @@ def _register_code(registry: "ToolRegistry") -> int:
 
 def _register_gmail(registry: "ToolRegistry") -> int:
     try:
-        from bantz.tools.gmail_tools import (gmail_get_message_tool,
-                                             gmail_list_categories_tool,
-                                             gmail_list_messages_tool,
-                                             gmail_send_tool,
-                                             gmail_smart_search_tool,
-                                             gmail_unread_count_tool)
+        (
+            gmail_get_message_tool,
+            gmail_list_categories_tool,
+            gmail_list_messages_tool,
+            gmail_send_tool,
+            gmail_smart_search_tool,
+            gmail_unread_count_tool,
+        ) = _handlers(
+            "bantz.tools.gmail_tools",
+            "gmail_get_message_tool",
+            "gmail_list_categories_tool",
+            "gmail_list_messages_tool",
+            "gmail_send_tool",
+            "gmail_smart_search_tool",
+            "gmail_unread_count_tool",
+        )
     except ImportError as e:
         logger.warning(f"[ToolGap] gmail import: {e}")
         return 0
@@ -361,14 +436,38 @@ def _register_gmail(registry: "ToolRegistry") -> int:
 
 def _register_gmail_extended(registry: "ToolRegistry") -> int:
     try:
-        from bantz.tools.gmail_extended_tools import (
-            gmail_add_label_tool, gmail_archive_tool, gmail_batch_modify_tool,
-            gmail_create_draft_tool, gmail_delete_draft_tool,
-            gmail_download_attachment_tool, gmail_generate_reply_tool,
-            gmail_list_drafts_tool, gmail_list_labels_tool,
-            gmail_mark_read_tool, gmail_mark_unread_tool,
-            gmail_remove_label_tool, gmail_send_draft_tool,
-            gmail_update_draft_tool)
+        (
+            gmail_add_label_tool,
+            gmail_archive_tool,
+            gmail_batch_modify_tool,
+            gmail_create_draft_tool,
+            gmail_delete_draft_tool,
+            gmail_download_attachment_tool,
+            gmail_generate_reply_tool,
+            gmail_list_drafts_tool,
+            gmail_list_labels_tool,
+            gmail_mark_read_tool,
+            gmail_mark_unread_tool,
+            gmail_remove_label_tool,
+            gmail_send_draft_tool,
+            gmail_update_draft_tool,
+        ) = _handlers(
+            "bantz.tools.gmail_extended_tools",
+            "gmail_add_label_tool",
+            "gmail_archive_tool",
+            "gmail_batch_modify_tool",
+            "gmail_create_draft_tool",
+            "gmail_delete_draft_tool",
+            "gmail_download_attachment_tool",
+            "gmail_generate_reply_tool",
+            "gmail_list_drafts_tool",
+            "gmail_list_labels_tool",
+            "gmail_mark_read_tool",
+            "gmail_mark_unread_tool",
+            "gmail_remove_label_tool",
+            "gmail_send_draft_tool",
+            "gmail_update_draft_tool",
+        )
     except ImportError as e:
         logger.warning(f"[ToolGap] gmail_extended import: {e}")
         return 0
@@ -433,10 +532,18 @@ def _register_gmail_extended(registry: "ToolRegistry") -> int:
 
 def _register_contacts(registry: "ToolRegistry") -> int:
     try:
-        from bantz.tools.contacts_tools import (contacts_add_tool,
-                                                contacts_get_tool,
-                                                contacts_list_tool,
-                                                contacts_search_tool)
+        (
+            contacts_add_tool,
+            contacts_get_tool,
+            contacts_list_tool,
+            contacts_search_tool,
+        ) = _handlers(
+            "bantz.tools.contacts_tools",
+            "contacts_add_tool",
+            "contacts_get_tool",
+            "contacts_list_tool",
+            "contacts_search_tool",
+        )
     except ImportError as e:
         logger.warning(f"[ToolGap] contacts import: {e}")
         return 0
@@ -474,10 +581,18 @@ def _register_coding_skill(registry: "ToolRegistry") -> int:
 
 def _register_calendar(registry: "ToolRegistry") -> int:
     try:
-        from bantz.tools.calendar_tools import (calendar_create_event_tool,
-                                                calendar_delete_event_tool,
-                                                calendar_list_events_tool,
-                                                calendar_update_event_tool)
+        (
+            calendar_create_event_tool,
+            calendar_delete_event_tool,
+            calendar_list_events_tool,
+            calendar_update_event_tool,
+        ) = _handlers(
+            "bantz.tools.calendar_tools",
+            "calendar_create_event_tool",
+            "calendar_delete_event_tool",
+            "calendar_list_events_tool",
+            "calendar_update_event_tool",
+        )
     except ImportError:
         return 0
 
@@ -516,9 +631,16 @@ def _register_calendar(registry: "ToolRegistry") -> int:
 
 def _register_system(registry: "ToolRegistry") -> int:
     try:
-        from bantz.tools.system_tools import (system_notify_tool,
-                                              system_screenshot_tool,
-                                              system_status)
+        (
+            system_notify_tool,
+            system_screenshot_tool,
+            system_status,
+        ) = _handlers(
+            "bantz.tools.system_tools",
+            "system_notify_tool",
+            "system_screenshot_tool",
+            "system_status",
+        )
     except ImportError:
         return 0
 
@@ -538,7 +660,7 @@ def _register_system(registry: "ToolRegistry") -> int:
 
 def _register_time(registry: "ToolRegistry") -> int:
     try:
-        from bantz.tools.time_tools import time_now_tool
+        time_now_tool, = _handlers("bantz.tools.time_tools", "time_now_tool")
     except ImportError:
         return 0
 
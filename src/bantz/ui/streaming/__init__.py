@@ -31,6 +31,10 @@ from .recorder import (
     RecordingConfig,
     RecordingState,
 )
+from .frame_pipeline import (
+    FramePipeline,
+    PipelineStats,
+)
 from .manager import (
     StreamingManager,
     StreamingConfig,
@@ -60,6 +64,8 @@ __all__ = [
     "RecordingAnnotation",
     "RecordingConfig",
     "RecordingState",
+    "FramePipeline",
+    "PipelineStats",
     # Manager
     "StreamingManager",
     "StreamingConfig",
@@ -0,0 +1,350 @@
+"""Frame-diffed capture → encode pipeline for ActionRecorder (Issue #7).
+
+The recorder used to convert and encode every grabbed screenshot, even
+when nothing on screen moved.  :class:`FramePipeline` sits between the
+grab and the ``cv2.VideoWriter``:
+
+- Change detection: each BGRA frame is compared with the previous one
+  tile by tile (default 64×64).  Unchanged frames are either
+  duplicated (the encoder re-writes its last frame, keeping the
+  constant-fps timeline) or skipped entirely.
+- Preallocated buffers: the previous frame and a small pool of BGR frame
+  buffers are allocated once per recording and reused.  No per-frame
+  ``np.array()``/``cvtColor`` allocations.
+- Encoding on a separate thread, fed through a bounded queue.  When the
+  encoder falls behind, new frames are dropped and counted instead of
+  stalling capture.
+- Damage-region mode: only the changed tiles are copied and sent.  The
+  encoder patches them onto its own canvas.
+
+:class:`PipelineStats` reports captured/encoded/duplicated/skipped/dropped
+frames and the achieved encode FPS.
+
+Usage::
+
+    pipe = FramePipeline(writer.write, width, height, fps=20)
+    pipe.start()
+    pipe.submit(np.asarray(sct.grab(region)))
+    ...
+    stats = pipe.stop()
+"""
+from __future__ import annotations
+
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+UNCHANGED_MODES = ("duplicate", "skip")
+
+# Queue item kinds
+_FRAME = 0    # (kind, buffer, timestamp)  full BGR frame from the pool
+_REPEAT = 1   # (kind, None, timestamp)    unchanged: write the last frame again
+_PATCH = 2    # (kind, [(y, x, bgr)], ts)  damaged tiles only
+_STOP = 3
+
+
+@dataclass
+class PipelineStats:
+    """Counters for one recording."""
+    captured: int = 0      # frames submitted
+    changed: int = 0       # frames with at least one damaged tile
+    encoded: int = 0       # frames written (including duplicates)
+    duplicated: int = 0    # unchanged frames re-written from the last frame
+    skipped: int = 0       # unchanged frames not written at all
+    dropped: int = 0       # frames lost because the encoder queue was full
+    damaged_tiles: int = 0
+    total_tiles: int = 0
+    started_at: float = 0.0
+    stopped_at: float = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        end = self.stopped_at or time.time()
+        return max(0.0, end - self.started_at) if self.started_at else 0.0
+
+    @property
+    def achieved_fps(self) -> float:
+        """Frames written per second of wall-clock recording time."""
+        elapsed = self.elapsed
+        return self.encoded / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def damage_ratio(self) -> float:
+        """Fraction of tiles that changed, over all captured frames."""
+        return self.damaged_tiles / self.total_tiles if self.total_tiles else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "captured": self.captured,
+            "changed": self.changed,
+            "encoded": self.encoded,
+            "duplicated": self.duplicated,
+            "skipped": self.skipped,
+            "dropped": self.dropped,
+            "achieved_fps": round(self.achieved_fps, 2),
+            "damage_ratio": round(self.damage_ratio, 4),
+        }
+
+
+class TileDiff:
+    """Per-tile change detection against the previous frame.
+
+    Frames are compared as one 32-bit word per BGRA pixel.  Edge tiles may
+    be smaller than ``tile``.  The previous frame is kept in a single
+    preallocated buffer.
+
+    Args:
+        width: Frame width in pixels.
+        height: Frame height in pixels.
+        tile: Tile edge length in pixels.
+    """
+
+    def __init__(self, width: int, height: int, tile: int = 64):
+        if not HAS_NUMPY:
+            raise RuntimeError("numpy not installed")
+        self.width = width
+        self.height = height
+        self.tile = max(1, int(tile))
+        self.rows = -(-height // self.tile)
+        self.cols = -(-width // self.tile)
+        self._row_starts = np.arange(0, height, self.tile)
+        self._col_starts = np.arange(0, width, self.tile)
+        self._prev = np.empty((height, width), dtype=np.uint32)
+        self._diff = np.empty((height, width), dtype=bool)
+        self._primed = False
+
+    def reset(self) -> None:
+        """Forget the previous frame (the next frame is fully damaged)."""
+        self._primed = False
+
+    def update(self, bgra: "np.ndarray") -> "np.ndarray":
+        """Return the ``(rows, cols)`` bool mask of changed tiles.
+
+        *bgra* must be an ``(height, width, 4)`` uint8 array; it becomes
+        the new reference frame.
+        """
+        cur = _as_words(bgra)
+        if not self._primed:
+            np.copyto(self._prev, cur)
+            self._primed = True
+            return np.ones((self.rows, self.cols), dtype=bool)
+        np.not_equal(cur, self._prev, out=self._diff)
+        mask = np.logical_or.reduceat(self._diff, self._row_starts, axis=0)
+        mask = np.logical_or.reduceat(mask, self._col_starts, axis=1)
+        np.copyto(self._prev, cur)
+        return mask
+
+    def regions(self, mask: "np.ndarray") -> List[Tuple[int, int, int, int]]:
+        """Damaged ``(y0, y1, x0, x1)`` rectangles: horizontal runs per tile row."""
+        out: List[Tuple[int, int, int, int]] = []
+        t = self.tile
+        for r in np.flatnonzero(mask.any(axis=1)):
+            row = mask[r]
+            y0, y1 = int(r) * t, min(self.height, (int(r) + 1) * t)
+            c = 0
+            while c < self.cols:
+                if not row[c]:
+                    c += 1
+                    continue
+                start = c
+                while c < self.cols and row[c]:
+                    c += 1
+                out.append((y0, y1, start * t, min(self.width, c * t)))
+        return out
+
+
+def _as_words(bgra: "np.ndarray") -> "np.ndarray":
+    """View an ``(h, w, 4)`` uint8 frame as ``(h, w)`` uint32 without copying."""
+    if bgra.flags.c_contiguous:
+        return bgra.view(np.uint32).reshape(bgra.shape[0], bgra.shape[1])
+    return np.ascontiguousarray(bgra).view(np.uint32).reshape(bgra.shape[0], bgra.shape[1])
+
+
+class FramePipeline:
+    """Diff, convert and hand frames to an encoder thread.
+
+    Args:
+        write: Encoder sink, called on the encoder thread with a contiguous
+            ``(height, width, 3)`` BGR uint8 frame (e.g.
+            ``cv2.VideoWriter.write``).
+        width: Frame width.
+        height: Frame height.
+        fps: Target frame rate (informational; pacing is the caller's).
+        unchanged: ``"duplicate"`` re-writes the last frame for unchanged
+            captures (keeps constant-fps timing), ``"skip"`` writes nothing.
+        damage_regions: Send only damaged tiles to the encoder instead of
+            whole frames.
+        tile: Tile size for change detection.
+        queue_size: Bounded encoder queue length.
+        render: Optional overlay hook run on the encoder thread before
+            each write, ``render(frame, timestamp) -> frame``; it must not
+            modify *frame* in place.
+        diff: Set to False to disable change detection (every frame is
+            treated as changed).
+    """
+
+    def __init__(
+        self,
+        write: Callable[["np.ndarray"], Any],
+        width: int,
+        height: int,
+        fps: float = 20.0,
+        unchanged: str = "duplicate",
+        damage_regions: bool = False,
+        tile: int = 64,
+        queue_size: int = 8,
+        render: Optional[Callable[["np.ndarray", float], "np.ndarray"]] = None,
+        diff: bool = True,
+    ):
+        if not HAS_NUMPY:
+            raise RuntimeError("numpy not installed")
+        if unchanged not in UNCHANGED_MODES:
+            raise ValueError(f"unchanged must be one of {UNCHANGED_MODES}")
+        self._write = write
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.unchanged = unchanged
+        self.damage_regions = damage_regions
+        self.render = render
+        self.stats = PipelineStats()
+
+        self._differ = TileDiff(width, height, tile) if diff else None
+        self._queue: "queue.Queue[tuple]" = queue.Queue(maxsize=max(1, queue_size))
+        # Whole-frame buffers cycle between capture (fill) and encoder
+        # (write, then release once a newer frame replaces it).  Needed
+        # unless every changed frame goes out as damaged tiles, which
+        # requires change detection.
+        self._free: "queue.Queue[np.ndarray]" = queue.Queue()
+        if not damage_regions or self._differ is None:
+            for _ in range(max(1, queue_size) + 2):
+                self._free.put(np.empty((height, width, 3), dtype=np.uint8))
+        self._canvas: Optional["np.ndarray"] = None
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    @property
+    def error(self) -> Optional[BaseException]:
+        """Last exception raised by the encoder sink, if any."""
+        return self._error
+
+    def start(self) -> None:
+        """Start the encoder thread."""
+        if self._thread is not None:
+            return
+        self.stats = PipelineStats(started_at=time.time())
+        if self._differ is not None:
+            self._differ.reset()
+        self._thread = threading.Thread(target=self._encode_loop, name="bantz-recorder-encode", daemon=True)
+        self._thread.start()
+
+    def submit(self, bgra: "np.ndarray", timestamp: Optional[float] = None) -> bool:
+        """Offer one captured BGRA frame; returns False if it was dropped."""
+        stats = self.stats
+        stats.captured += 1
+        ts = time.time() if timestamp is None else timestamp
+
+        if self._differ is not None:
+            mask = self._differ.update(bgra)
+            damaged = int(np.count_nonzero(mask))
+            stats.total_tiles += mask.size
+            stats.damaged_tiles += damaged
+        else:
+            mask, damaged = None, 1
+
+        if not damaged:
+            if self.unchanged == "skip":
+                stats.skipped += 1
+                return True
+            return self._put((_REPEAT, None, ts))
+
+        stats.changed += 1
+        if self.damage_regions and mask is not None:
+            patches = [
+                (y0, x0, np.ascontiguousarray(bgra[y0:y1, x0:x1, :3]))
+                for y0, y1, x0, x1 in self._differ.regions(mask)
+            ]
+            return self._put((_PATCH, patches, ts))
+
+        try:
+            buf = self._free.get_nowait()
+        except queue.Empty:
+            stats.dropped += 1
+            self._invalidate()
+            return False
+        np.copyto(buf, bgra[:, :, :3])
+        if not self._put((_FRAME, buf, ts)):
+            self._free.put(buf)
+            return False
+        return True
+
+    def stop(self, timeout: float = 5.0) -> PipelineStats:
+        """Drain the queue, stop the encoder thread and return the stats."""
+        if self._thread is not None:
+            self._queue.put((_STOP, None, 0.0))
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self.stats.stopped_at = time.time()
+        return self.stats
+
+    # === Internal Methods ===
+
+    def _put(self, item: tuple) -> bool:
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except queue.Full:
+            self.stats.dropped += 1
+            if item[0] != _REPEAT:
+                self._invalidate()
+            return False
+
+    def _invalidate(self) -> None:
+        # Change detection is relative to the previous capture; once a
+        # changed frame is lost the next one must be sent in full, or the
+        # encoder would keep duplicating stale content.
+        if self._differ is not None:
+            self._differ.reset()
+
+    def _encode_loop(self) -> None:
+        last: Optional["np.ndarray"] = None
+        while True:
+            kind, payload, ts = self._queue.get()
+            if kind == _STOP:
+                break
+            if kind == _FRAME:
+                if last is not None and last is not self._canvas:
+                    self._free.put(last)
+                last = payload
+            elif kind == _PATCH:
+                if self._canvas is None:
+                    self._canvas = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+                for y, x, patch in payload:
+                    self._canvas[y:y + patch.shape[0], x:x + patch.shape[1]] = patch
+                last = self._canvas
+            elif last is None:
+                continue  # nothing to duplicate yet
+            frame = last
+            if self.render is not None:
+                try:
+                    frame = self.render(frame, ts)
+                except Exception as e:
+                    self._error = e
+            try:
+                self._write(frame)
+            except Exception as e:
+                self._error = e
+                continue
+            self.stats.encoded += 1
+            if kind == _REPEAT:
+                self.stats.duplicated += 1
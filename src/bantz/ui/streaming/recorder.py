@@ -4,7 +4,8 @@ Provides screen recording capabilities:
 - Record screen/window/region
 - Add timestamped annotations
 - Multiple output formats
-- Low resource usage
+- Low resource usage (frame diffing, off-thread encoding — see
+  ``frame_pipeline``)
 - Pause/resume support
 """
 from __future__ import annotations
@@ -39,6 +40,8 @@ try:
 except ImportError:
     HAS_PIL = False
 
+from .frame_pipeline import FramePipeline, PipelineStats
+
 
 class RecordingState(Enum):
     """Recording state."""
@@ -93,6 +96,7 @@ class RecordingConfig:
     fps: int = 20
     quality: int = 85  # 0-100
     codec: str = "mp4v"  # mp4v, XVID, avc1
+    hw_accel: bool = True  # Ask OpenCV for a hardware encoder when available
     
     # Capture
     monitor: int = 0
@@ -104,6 +108,13 @@ class RecordingConfig:
     include_annotations: bool = True
     include_audio: bool = False  # Future feature
     
+    # Pipeline
+    frame_diff: bool = True  # Detect unchanged frames by tile comparison
+    unchanged_frames: str = "duplicate"  # duplicate (constant fps) or skip
+    damage_regions: bool = False  # Send only changed tiles to the encoder
+    tile_size: int = 64
+    encode_queue_size: int = 8  # Frames beyond this are dropped, not queued
+    
     # Limits
     max_duration: int = 3600  # 1 hour max
     max_file_size_mb: int = 500
@@ -133,6 +144,10 @@ class RecordingMetadata:
     file_size: int = 0
     resolution: Tuple[int, int] = (0, 0)
     fps: float = 0.0
+    achieved_fps: float = 0.0
+    duplicated_frames: int = 0
+    skipped_frames: int = 0
+    dropped_frames: int = 0
     annotations: List[RecordingAnnotation] = field(default_factory=list)
     
     def to_dict(self) -> Dict[str, Any]:
@@ -145,6 +160,10 @@ class RecordingMetadata:
             "file_size": self.file_size,
             "resolution": list(self.resolution),
             "fps": self.fps,
+            "achieved_fps": self.achieved_fps,
+            "duplicated_frames": self.duplicated_frames,
+            "skipped_frames": self.skipped_frames,
+            "dropped_frames": self.dropped_frames,
             "annotations": [a.to_dict() for a in self.annotations],
         }
     
@@ -179,6 +198,7 @@ class ActionRecorder:
         # Recording state
         self._output_path: Optional[str] = None
         self._video_writer = None
+        self._pipeline: Optional[FramePipeline] = None
         self._sct = None
         self._start_time: float = 0.0
         self._pause_start: float = 0.0
@@ -290,13 +310,7 @@ class ActionRecorder:
         
         # Initialize video writer
         try:
-            fourcc = cv2.VideoWriter_fourcc(*self._config.codec)
-            self._video_writer = cv2.VideoWriter(
-                self._output_path,
-                fourcc,
-                self._config.fps,
-                (region["width"], region["height"])
-            )
+            self._video_writer = self._open_writer((region["width"], region["height"]))
             
             if not self._video_writer.isOpened():
                 raise RuntimeError("Failed to open video writer")
@@ -319,6 +333,26 @@ class ActionRecorder:
             fps=self._config.fps,
         )
         
+        # Frame diffing + encoder thread
+        try:
+            self._pipeline = FramePipeline(
+                self._video_writer.write,
+                region["width"],
+                region["height"],
+                fps=self._config.fps,
+                unchanged=self._config.unchanged_frames,
+                damage_regions=self._config.damage_regions,
+                tile=self._config.tile_size,
+                queue_size=self._config.encode_queue_size,
+                render=self._render_annotations if self._config.include_annotations else None,
+                diff=self._config.frame_diff,
+            )
+        except Exception as e:
+            self._cleanup()
+            self._set_error(f"Failed to initialize frame pipeline: {e}")
+            return False
+        self._pipeline.start()
+        
         # Start recording thread
         self._recording_thread = threading.Thread(
             target=self._recording_loop,
@@ -349,7 +383,14 @@ class ActionRecorder:
         if self._recording_thread:
             self._recording_thread.join(timeout=5.0)
         
-        # Cleanup
+        # Flush queued frames, then cleanup
+        if self._pipeline:
+            self._record_stats(self._pipeline.stop())
+            if self._pipeline.error is not None and self._on_error:
+                try:
+                    self._on_error(f"Frame encode error: {self._pipeline.error}")
+                except Exception:
+                    pass
         self._cleanup()
         
         # Update metadata
@@ -418,6 +459,32 @@ class ActionRecorder:
     
     # === Internal Methods ===
     
+    def _open_writer(self, size: Tuple[int, int]):
+        """Open the video writer, preferring a hardware encoder."""
+        fourcc = cv2.VideoWriter_fourcc(*self._config.codec)
+        hw_prop = getattr(cv2, "VIDEOWRITER_PROP_HW_ACCELERATION", None)
+        hw_any = getattr(cv2, "VIDEO_ACCELERATION_ANY", None)
+        if self._config.hw_accel and hw_prop is not None and hw_any is not None:
+            try:
+                writer = cv2.VideoWriter(
+                    self._output_path, cv2.CAP_ANY, fourcc, self._config.fps, size,
+                    [hw_prop, hw_any],
+                )
+                if writer.isOpened():
+                    return writer
+                writer.release()
+            except Exception:
+                pass  # OpenCV without the params overload / no HW encoder
+        return cv2.VideoWriter(self._output_path, fourcc, self._config.fps, size)
+    
+    def _record_stats(self, stats: PipelineStats):
+        """Copy pipeline counters into the recording metadata."""
+        self._metadata.frame_count = stats.captured
+        self._metadata.achieved_fps = round(stats.achieved_fps, 2)
+        self._metadata.duplicated_frames = stats.duplicated
+        self._metadata.skipped_frames = stats.skipped
+        self._metadata.dropped_frames = stats.dropped
+    
     def _recording_loop(self, region: Dict):
         """Main recording loop (runs in thread)."""
         frame_interval = 1.0 / self._config.fps
@@ -440,21 +507,11 @@ class ActionRecorder:
             last_frame_time = now
             
             try:
-                # Capture frame
+                # Capture frame (BGRA view over the grab buffer, no copy);
+                # diffing, BGR conversion, annotations and encoding happen
+                # in the pipeline
                 screenshot = self._sct.grab(region)
-                
-                # Convert to numpy array
-                frame = np.array(screenshot)
-                
-                # Convert BGRA to BGR
-                frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
-                
-                # Add annotations if enabled
-                if self._config.include_annotations:
-                    frame = self._render_annotations(frame)
-                
-                # Write frame
-                self._video_writer.write(frame)
+                self._pipeline.submit(np.asarray(screenshot), self.elapsed_time)
                 self._metadata.frame_count += 1
                 
                 # Callback
@@ -476,9 +533,15 @@ class ActionRecorder:
                 if self._on_error:
                     self._on_error(f"Frame capture error: {e}")
     
-    def _render_annotations(self, frame: np.ndarray) -> np.ndarray:
-        """Render annotations onto frame."""
-        current_time = self.elapsed_time
+    def _render_annotations(self, frame: np.ndarray, current_time: float = None) -> np.ndarray:
+        """Render annotations onto a copy of frame (frame is not modified).
+        
+        Args:
+            frame: BGR frame
+            current_time: Recording time of the frame (None = now)
+        """
+        if current_time is None:
+            current_time = self.elapsed_time
         height, width = frame.shape[:2]
         
         # Find active annotations
@@ -549,6 +612,10 @@ class ActionRecorder:
     
     def _cleanup(self):
         """Cleanup resources."""
+        if self._pipeline:
+            self._pipeline.stop()
+            self._pipeline = None
+        
         if self._video_writer:
             self._video_writer.release()
             self._video_writer = None
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import re
 import socket
 import threading
 import time
@@ -37,6 +38,15 @@ def _restore_orchestrator_class_state():
     _Orch._tool_registry = None
 
 
+@pytest.fixture(autouse=True, scope="session")
+def _isolate_workspace_index():
+    """Keep WorkspaceIndex DBs out of ~/.bantz/data during the test run."""
+    mp = pytest.MonkeyPatch()
+    mp.setenv("BANTZ_WORKSPACE_INDEX", "memory")
+    yield
+    mp.undo()
+
+
 @pytest.fixture(autouse=True)
 def _ensure_event_loop_for_sync_tests():
     """Ensure asyncio.get_event_loop() works in sync tests.
@@ -118,9 +128,25 @@ def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item
         items[:] = selected
 
 
+_MOCK_TOKEN_RE = re.compile(r"\w{1,4}|[^\w\s]")
+
+
 class _OpenAIMockHandler(BaseHTTPRequestHandler):
     server_version = "bantz-vllm-mock/1.0"
 
+    def _handle_tokenize(self) -> None:
+        """vLLM-style /tokenize: words split into ≤4-char pieces."""
+        length = int(self.headers.get("Content-Length", "0") or "0")
+        raw = self.rfile.read(length) if length > 0 else b"{}"
+        try:
+            req = json.loads(raw.decode("utf-8"))
+        except Exception:
+            self._send_json(400, {"error": {"message": "invalid json"}})
+            return
+        pieces = _MOCK_TOKEN_RE.findall(str(req.get("prompt") or ""))
+        tokens = [abs(hash(p)) % 50_000 for p in pieces]
+        self._send_json(200, {"count": len(tokens), "max_model_len": 4096, "tokens": tokens})
+
     def log_message(self, format: str, *args: Any) -> None:  # noqa: A003
         # Keep pytest output clean.
         return
@@ -155,6 +181,9 @@ class _OpenAIMockHandler(BaseHTTPRequestHandler):
         self._send_json(404, {"error": {"message": "not found"}})
 
     def do_POST(self) -> None:  # noqa: N802
+        if self.path.rstrip("/") == "/tokenize":
+            self._handle_tokenize()
+            return
         if self.path.rstrip("/") != "/v1/chat/completions":
             self._send_json(404, {"error": {"message": "not found"}})
             return
@@ -0,0 +1,206 @@
+"""
+Tests for hourly analytics rollups (UsageAnalytics and RunTracker).
+
+Covers:
+- Latency histogram bins in Python and SQL agree
+- Range queries combine whole rollup buckets with the partial raw bucket
+- Deletes, replaces, out-of-order inserts and pre-existing databases
+"""
+
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from bantz.analytics.tracker import CommandEvent, UsageAnalytics
+from bantz.data.rollups import (
+    LATENCY_EDGES_MS,
+    bin_labels,
+    bins_above,
+    hour_ceil,
+    latency_bin,
+    latency_bin_sql,
+)
+from bantz.data.run_tracker import RunTracker
+
+
+def _event(ts, intent="a", ok=True, ms=100, error=None):
+    return CommandEvent(
+        timestamp=ts,
+        intent=intent,
+        raw_transcript="x",
+        corrected_transcript="x",
+        success=ok,
+        execution_time_ms=ms,
+        error_message=error,
+    )
+
+
+class TestRollupHelpers:
+    @pytest.mark.parametrize("ms", [None, -5, 0, 1, 50, 51, 2000, 2001, 30000, 99999])
+    def test_bin_sql_matches_python(self, ms):
+        conn = sqlite3.connect(":memory:")
+        (sql_bin,) = conn.execute(f"SELECT {latency_bin_sql('v')} FROM (SELECT ? AS v)", (ms,)).fetchone()
+        assert sql_bin == latency_bin(ms)
+
+    def test_bins_above_only_on_edges(self):
+        assert bins_above(2000) == LATENCY_EDGES_MS.index(2000) + 1
+        assert bins_above(1234) is None
+        assert len(bin_labels()) == len(LATENCY_EDGES_MS) + 1
+
+    def test_hour_ceil(self):
+        assert hour_ceil(7200.0) == 7200.0
+        assert hour_ceil(7200.5) == 10800.0
+
+
+class TestUsageAnalyticsRollups:
+    @pytest.fixture
+    def analytics(self, tmp_path):
+        return UsageAnalytics(db_path=tmp_path / "analytics.db")
+
+    def test_window_mixes_rollup_and_partial_bucket(self, analytics):
+        now = datetime.now()
+        cutoff = now - timedelta(days=1)
+        # Same hour as the cutoff: one row before it, one after.
+        analytics.record(_event(cutoff - timedelta(seconds=1), "old", ms=10))
+        analytics.record(_event(cutoff + timedelta(seconds=1), "edge", ms=300))
+        for i in range(4):
+            analytics.record(_event(now - timedelta(hours=i), "recent", ok=i != 0, ms=1000,
+                                    error="boom" if i == 0 else None))
+
+        stats = analytics.get_stats(days=1)
+        assert stats.total_commands == 5
+        assert stats.success_count == 4
+        assert stats.top_intents == {"recent": 4, "edge": 1}
+        assert stats.top_errors == {"boom": 1}
+        assert stats.avg_execution_time_ms == pytest.approx((300 + 4000) / 5)
+
+        assert analytics.get_intent_stats("edge", days=1)["total"] == 1
+        assert sum(analytics.get_hourly_distribution(days=1).values()) == 5
+        hist = analytics.get_latency_histogram(days=1)
+        assert hist["250-500"] == 1
+        assert hist["500-1000"] == 4
+
+    def test_cleanup_updates_rollups_and_sequences(self, analytics):
+        base = datetime.now() - timedelta(days=10)
+        for i, intent in enumerate(["a", "b", "a", "b", "a", "b"]):
+            analytics.record(_event(base + timedelta(days=i * 2), intent))
+        assert analytics.get_sequence_patterns(min_support=1) == [("a", "b", 3), ("b", "a", 2)]
+
+        assert analytics.cleanup_old_events(days=7) == 2
+        assert analytics.get_stats(days=30).total_commands == 4
+        assert analytics.get_sequence_patterns(min_support=1) == [("a", "b", 2), ("b", "a", 1)]
+
+    def test_out_of_order_insert_rebuilds_sequences(self, analytics):
+        now = datetime.now()
+        analytics.record(_event(now, "b"))
+        analytics.record(_event(now - timedelta(minutes=5), "a"))  # older
+        analytics.record(_event(now + timedelta(minutes=1), "c"))
+        patterns = analytics.get_sequence_patterns(min_support=1)
+        assert sorted(patterns) == [("a", "b", 1), ("b", "c", 1)]
+
+    def test_clear_all_resets_rollups(self, analytics):
+        analytics.record(_event(datetime.now(), "a"))
+        analytics.clear_all()
+        assert analytics.get_stats(days=1).total_commands == 0
+        assert analytics.get_sequence_patterns(min_support=1) == []
+
+    def test_existing_database_is_backfilled(self, tmp_path):
+        path = tmp_path / "old.db"
+        conn = sqlite3.connect(path)
+        conn.execute("""CREATE TABLE events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT NOT NULL,
+            intent TEXT NOT NULL, raw_transcript TEXT NOT NULL,
+            corrected_transcript TEXT NOT NULL, success INTEGER NOT NULL,
+            execution_time_ms INTEGER NOT NULL, error_message TEXT, metadata TEXT)""")
+        ts = datetime.now().isoformat()
+        conn.executemany(
+            "INSERT INTO events (timestamp, intent, raw_transcript, corrected_transcript,"
+            " success, execution_time_ms, error_message) VALUES (?, ?, 'x', 'x', ?, 5, ?)",
+            [(ts, "a", 1, None), (ts, "b", 0, "err")],
+        )
+        conn.commit()
+        conn.close()
+
+        analytics = UsageAnalytics(db_path=path)
+        stats = analytics.get_stats(days=1)
+        assert stats.total_commands == 2
+        assert stats.top_errors == {"err": 1}
+        assert analytics.get_sequence_patterns(min_support=1) == [("a", "b", 1)]
+
+
+class TestRunTrackerRollups:
+    @pytest.fixture
+    def tracker(self, tmp_path):
+        t = RunTracker(db_path=str(tmp_path / "obs.db"), write_behind=False)
+        t.initialise_sync()
+        yield t
+        t.close_sync()
+
+    def _tool_call(self, tracker, run_id, name, latency, created_at, error=None):
+        tc = tracker.record_tool_call(run_id, name, latency_ms=latency, error=error)
+        tracker._ensure_conn().execute(
+            "UPDATE tool_calls SET created_at = ? WHERE call_id = ?", (created_at, tc.call_id)
+        )
+        return tc
+
+    async def test_tool_stats_with_partial_bucket(self, tracker):
+        run = tracker.start_run("q")
+        since = time.time() - 2 * 3600 + 10  # mid-hour
+        self._tool_call(tracker, run.run_id, "web.search", 100, since - 5)  # excluded
+        self._tool_call(tracker, run.run_id, "web.search", 3000, since + 5)  # partial bucket
+        self._tool_call(tracker, run.run_id, "web.search", 200, time.time(), error="x")
+        tracker.record_tool_call(run.run_id, "calendar.list", latency_ms=50)
+
+        stats = {s["tool_name"]: s for s in await tracker.tool_stats(since=since)}
+        web = stats["web.search"]
+        assert web["calls"] == 2
+        assert web["errors"] == 1
+        assert web["avg_latency_ms"] == 1600.0
+        assert web["max_latency_ms"] == 3000
+        assert stats["calendar.list"]["calls"] == 1
+        assert (await tracker.tool_stats())[0]["calls"] == 3
+
+    async def test_slow_tools_rollup_matches_raw(self, tracker):
+        run = tracker.start_run("q")
+        for ms in (100, 2000, 2500, 9000):
+            tracker.record_tool_call(run.run_id, "slow.tool", latency_ms=ms)
+        from_rollup = await tracker.slow_tools(threshold_ms=2000)
+        from_raw = tracker._slow_tools_raw(2000, None, 10)
+        assert from_rollup == from_raw
+        assert from_rollup[0]["slow_count"] == 2
+        assert from_rollup[0]["max_latency_ms"] == 9000
+        # Non-edge thresholds fall back to raw rows.
+        assert (await tracker.slow_tools(threshold_ms=2400))[0]["slow_count"] == 2
+
+    async def test_replace_does_not_double_count(self, tracker):
+        run = tracker.start_run("q")
+        tc = tracker.record_tool_call(run.run_id, "web.search", latency_ms=10)
+        tc.status = "error"
+        tracker._save_tool_call_sync(tc)
+        (stats,) = await tracker.tool_stats()
+        assert stats["calls"] == 1
+        assert stats["errors"] == 1
+        hist = await tracker.latency_histogram("web.search")
+        assert hist["0-50"] == 1
+        assert sum(hist.values()) == 1
+
+    def test_existing_database_is_backfilled(self, tmp_path):
+        db = str(tmp_path / "obs.db")
+        t = RunTracker(db_path=db, write_behind=False)
+        t.initialise_sync()
+        run = t.start_run("q")
+        t.record_tool_call(run.run_id, "web.search", latency_ms=10)
+        conn = t._ensure_conn()
+        conn.execute("DELETE FROM tool_rollup_hourly")
+        conn.execute("PRAGMA user_version=0")
+        conn.commit()
+        t.close_sync()
+
+        t = RunTracker(db_path=db, write_behind=False)
+        t.initialise_sync()
+        assert t._ensure_conn().execute(
+            "SELECT SUM(calls) FROM tool_rollup_hourly"
+        ).fetchone()[0] == 1
+        t.close_sync()
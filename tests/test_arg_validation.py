@@ -0,0 +1,118 @@
+"""Tests for compiled tool-argument validators."""
+
+from __future__ import annotations
+
+from bantz.agent.arg_validation import (
+    ArgTypeError,
+    CompiledArgValidator,
+    clear_compiled_cache,
+    compile_schema,
+)
+from bantz.agent.tools import Tool, ToolRegistry
+from bantz.brain.safety_guard import SafetyGuard
+
+
+SCHEMA = {
+    "type": "object",
+    "properties": {
+        "title": {"type": "string"},
+        "duration": {"type": "integer"},
+        "ratio": {"type": "number"},
+        "all_day": {"type": "boolean"},
+        "mode": {"type": "string", "enum": ["fast", "slow"]},
+        "extra": {},
+    },
+    "required": ["title"],
+}
+
+
+def _registry() -> ToolRegistry:
+    reg = ToolRegistry()
+    reg.register(Tool(name="t", description="d", parameters=SCHEMA))
+    return reg
+
+
+class TestCompileSchema:
+    def test_cached_by_identity(self):
+        assert compile_schema(SCHEMA) is compile_schema(SCHEMA)
+        assert compile_schema(dict(SCHEMA)) is not compile_schema(SCHEMA)
+
+    def test_clear_cache(self):
+        first = compile_schema(SCHEMA)
+        clear_compiled_cache()
+        assert compile_schema(SCHEMA) is not first
+
+    def test_empty_schema(self):
+        v = compile_schema(None)
+        assert v.required == ()
+        assert v.check_call({"anything": 1}) == (True, "ok")
+
+    def test_compiled_shape(self):
+        v = CompiledArgValidator(SCHEMA)
+        assert v.required == ("title",)
+        assert "duration" in v.properties
+        assert v.rules["mode"].enum == ("fast", "slow")
+        assert v.rules["extra"].type is None
+
+    def test_integer_coercion(self):
+        coerce = compile_schema(SCHEMA).rules["duration"].coerce
+        assert coerce(5) == 5
+        assert coerce("30") == 30
+        assert coerce("1:30") == 90
+        for bad in (True, "abc", 1.5):
+            try:
+                coerce(bad)
+            except ArgTypeError:
+                continue
+            raise AssertionError(f"{bad!r} accepted")
+
+
+class TestRegistryValidateCall:
+    def test_ok_does_not_mutate(self):
+        params = {"title": "x", "duration": "30", "mode": ""}
+        assert _registry().validate_call("t", params) == (True, "ok")
+        assert params == {"title": "x", "duration": "30", "mode": ""}
+
+    def test_error_codes(self):
+        reg = _registry()
+        assert reg.validate_call("nope", {}) == (False, "unknown_tool:nope")
+        assert reg.validate_call("t", {}) == (False, "missing_param:title")
+        assert reg.validate_call("t", {"title": 1}) == (False, "bad_type:title:expected_string")
+        assert reg.validate_call("t", {"title": "x", "duration": True}) == (
+            False, "bad_type:duration:expected_int",
+        )
+        assert reg.validate_call("t", {"title": "x", "ratio": "1"}) == (
+            False, "bad_type:ratio:expected_number",
+        )
+        assert reg.validate_call("t", {"title": "x", "all_day": 1}) == (
+            False, "bad_type:all_day:expected_boolean",
+        )
+        assert reg.validate_call("t", {"title": "x", "mode": "medium"}) == (
+            False, "bad_enum:mode:expected_one_of:['fast', 'slow']",
+        )
+
+    def test_validator_compiled_at_register(self):
+        reg = _registry()
+        assert reg.validator("t") is compile_schema(SCHEMA)
+        reg.unregister("t")
+        assert reg.validator("t") is None
+
+
+class TestSafetyGuardSharesValidator:
+    def test_guard_messages_and_coercion(self):
+        guard = SafetyGuard()
+        tool = Tool(name="t", description="d", parameters=SCHEMA)
+
+        assert guard.validate_tool_args(tool, {}) == (False, "Missing required field: title")
+        assert guard.validate_tool_args(tool, {"title": "x", "duration": "abc"}) == (
+            False, "Field 'duration' must be integer, got non-numeric string",
+        )
+        assert guard.validate_tool_args(tool, {"title": "x", "ratio": True}) == (
+            False, "Field 'ratio' must be number, got bool",
+        )
+
+        params = {"title": "x", "duration": "0:45", "natural_query": "q"}
+        ok, _ = guard.validate_tool_args(tool, params)
+        assert ok
+        assert params["duration"] == 45
+        assert "natural_query" not in params
@@ -0,0 +1,156 @@
+"""Tests for the end-to-end turn benchmark (scripts/bench_turns.py).
+
+Covers:
+    - Recorded turn fixtures and the fixture LLM / tool registry
+    - Exclusive per-phase timing
+    - Benchmark aggregation (phases, LLM wait vs overhead, CPU, allocations)
+    - Baseline comparison and the CLI regression gate
+"""
+from __future__ import annotations
+
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from bench_turns import (  # noqa: E402
+    PHASES,
+    FixtureLLM,
+    PhaseTimer,
+    RecordedTurn,
+    TurnBench,
+    build_fixture_registry,
+    compare_to_baseline,
+    load_turns,
+    main,
+    run_benchmark,
+)
+
+
+@pytest.fixture(scope="module")
+def turns() -> dict[str, RecordedTurn]:
+    return {t.name: t for t in load_turns()}
+
+
+class TestFixtures:
+
+    def test_recorded_turns(self, turns):
+        assert {"greeting_preroute", "calendar_list", "gmail_unread"} <= set(turns)
+        assert turns["calendar_list"].tools["calendar.list_events"]["count"] == 3
+
+    def test_fixture_llm_answers_by_prompt_kind(self, turns):
+        llm = FixtureLLM("router")
+        llm.turn = turns["calendar_list"]
+        assert json.loads(llm.complete_text(prompt="...\nUSER: x\nASSISTANT (sadece JSON):"))["route"] == "calendar"
+        reflection = llm.complete_text(prompt='Yanıt (sadece JSON):\n{"satisfied": true/false}')
+        assert json.loads(reflection)["satisfied"] is True
+        assert llm.complete_text(prompt="USER: x\nASSISTANT:").startswith("Bugün üç etkinliğiniz")
+
+    def test_fixture_llm_latency_is_measured(self):
+        llm = FixtureLLM("router", latency_ms=20)
+        llm.complete_text(prompt="x")
+        assert llm.wait_s >= 0.02
+
+    def test_registry_returns_current_turn_results(self, turns):
+        current = turns["gmail_unread"]
+        registry = build_fixture_registry(list(turns.values()), lambda: current)
+        result = registry.get("gmail.list_messages").function(query="is:unread")
+        assert result["estimated_count"] == 2
+        result["messages"].clear()  # callers get a copy
+        assert registry.get("gmail.list_messages").function()["estimated_count"] == 2
+
+
+class TestPhaseTimer:
+
+    def test_nested_phases_are_exclusive(self):
+        class Loop:
+            def outer(self):
+                time.sleep(0.02)
+                return self.inner()
+
+            def inner(self):
+                time.sleep(0.03)
+                return "ok"
+
+        loop, timer = Loop(), PhaseTimer()
+        timer.wrap(loop, "outer", "route")
+        timer.wrap(loop, "inner", "preroute")
+        assert loop.outer() == "ok"
+        assert 0.03 <= timer.current["preroute"] < 0.045
+        assert 0.02 <= timer.current["route"] < 0.03
+
+
+class TestRunBenchmark:
+
+    def test_phase_breakdown(self, turns):
+        result = run_benchmark(
+            [turns["greeting_preroute"], turns["calendar_list"]], iterations=2, warmup=1,
+        )
+        metrics = result["metrics"]
+        assert set(PHASES) | {"total", "overhead", "llm_wait", "cpu", "alloc_peak", "alloc_retained"} <= set(metrics)
+        for stats in metrics.values():
+            assert stats["p50"] <= stats["p95"] <= stats["p99"]
+        # Preroute bypass never reaches the router, tools or finalizer.
+        greeting = result["turns"]["greeting_preroute"]
+        assert greeting["route"]["p99"] < 5
+        assert greeting["tools"]["p99"] == 0
+        assert result["turns"]["calendar_list"]["tools"]["p50"] > 0
+        assert metrics["alloc_peak"]["p50"] > 0
+
+    def test_llm_wait_separated_from_overhead(self, turns):
+        result = run_benchmark([turns["calendar_list"]], iterations=2, warmup=0, latency_ms=25, allocations=False)
+        m = result["metrics"]
+        assert m["llm_wait"]["p50"] >= 25
+        assert m["overhead"]["p50"] == pytest.approx(m["total"]["p50"] - m["llm_wait"]["p50"], abs=0.01)
+        assert m["cpu"]["p50"] < m["total"]["p50"]
+        assert result["meta"]["latency_ms"] == 25
+
+    def test_empty_turns_rejected(self):
+        with pytest.raises(ValueError):
+            TurnBench([])
+
+
+class TestBaseline:
+
+    @staticmethod
+    def make(overhead_p50: float, alloc_p50: float = 50.0, llm_wait_p50: float = 100.0) -> dict:
+        def stats(v):
+            return {"p50": v, "p95": v, "p99": v, "mean": v}
+        return {
+            "metrics": {"overhead": stats(overhead_p50), "alloc_peak": stats(alloc_p50), "llm_wait": stats(llm_wait_p50)},
+            "turns": {"t": {"overhead": stats(overhead_p50)}},
+        }
+
+    def test_detects_regression(self):
+        regressions = compare_to_baseline(self.make(20.0), self.make(10.0), max_regression_pct=20)
+        assert {(r["scope"], r["metric"], r["stat"]) for r in regressions} == {
+            ("all", "overhead", "p50"), ("all", "overhead", "p95"),
+            ("t", "overhead", "p50"), ("t", "overhead", "p95"),
+        }
+        assert regressions[0]["change_pct"] == 100.0
+
+    def test_ignores_noise_and_llm_wait(self):
+        # +40% but only 0.4 ms; LLM wait is fixture-controlled.
+        assert compare_to_baseline(self.make(1.4, llm_wait_p50=500), self.make(1.0)) == []
+        assert compare_to_baseline(self.make(10.0, alloc_p50=60.0), self.make(10.0)) == []
+        assert compare_to_baseline(self.make(10.0, alloc_p50=200.0), self.make(10.0))
+
+    def test_cli_saves_and_gates(self, tmp_path, capsys):
+        base = tmp_path / "baseline.json"
+        args = ["--turn", "greeting_preroute", "--iterations", "2", "--warmup", "0", "--no-alloc"]
+        assert main(args + ["--save-baseline", str(base), "--format", "json"]) == 0
+        saved = json.loads(base.read_text(encoding="utf-8"))
+        assert saved["meta"]["turns"] == ["greeting_preroute"]
+
+        for scope in [saved["metrics"], *saved["turns"].values()]:
+            for stats in scope.values():
+                for key in stats:
+                    stats[key] = 0.001
+        base.write_text(json.dumps(saved), encoding="utf-8")
+        capsys.readouterr()
+        assert main(args + ["--baseline", str(base)]) == 1
+        assert "REGRESSION all/overhead" in capsys.readouterr().out
@@ -34,13 +34,69 @@ def test_contacts_upsert_resolve_list_delete(monkeypatch, tmp_path: Path):
     assert r2["error"] == "contact_not_found"
 
 
-def test_contacts_file_is_valid_json(monkeypatch, tmp_path: Path):
+def test_contacts_stored_in_sqlite_next_to_json_path(monkeypatch, tmp_path: Path):
+    import sqlite3
+
     from bantz.contacts.store import contacts_upsert
 
     p = tmp_path / "contacts.json"
     monkeypatch.setenv("BANTZ_CONTACTS_PATH", str(p))
 
-    contacts_upsert(name="Test", email="t@example.com")
-    data = json.loads(p.read_text(encoding="utf-8"))
-    assert data["version"] == 1
-    assert isinstance(data["contacts"], dict)
+    out = contacts_upsert(name="Test", email="t@example.com")
+    db = tmp_path / "contacts.db"
+    assert out["path"] == str(p)
+    assert out["db_path"] == str(db)
+    assert not p.exists()
+    with sqlite3.connect(db) as conn:
+        rows = conn.execute("SELECT key, email FROM contacts").fetchall()
+    assert rows == [("test", "t@example.com")]
+
+
+def test_legacy_json_is_migrated_once(tmp_path: Path):
+    from bantz.contacts.store import contacts_delete, contacts_list, contacts_resolve, reset_contact_stores
+
+    p = tmp_path / "contacts.json"
+    p.write_text(json.dumps({"version": 1, "contacts": {
+        "ali yılmaz": {"name": "Ali Yılmaz", "email": "ali@example.com", "notes": "friend"},
+        "ayşe": {"name": "Ayşe", "email": "ayse@example.com"},
+    }}), encoding="utf-8")
+
+    r = contacts_resolve(name="Ali Yılmaz", path=str(p))
+    assert r["ok"] is True
+    assert r["notes"] == "friend"
+    assert len(contacts_list(path=str(p))["contacts"]) == 2
+
+    # A deletion must not be undone by re-importing the JSON on reopen.
+    contacts_delete(name="Ayşe", path=str(p))
+    reset_contact_stores()
+    assert [c["key"] for c in contacts_list(path=str(p))["contacts"]] == ["ali yılmaz"]
+    assert p.exists()
+
+
+def test_legacy_json_found_at_default_path_for_db_config(monkeypatch, tmp_path: Path):
+    from bantz.contacts.store import contacts_resolve
+
+    legacy = tmp_path / "config" / "bantz" / "contacts.json"
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(json.dumps({"version": 1, "contacts": {
+        "ali": {"name": "Ali", "email": "ali@example.com"},
+    }}), encoding="utf-8")
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    monkeypatch.setenv("BANTZ_CONTACTS_PATH", str(tmp_path / "data" / "contacts.db"))
+
+    r = contacts_resolve(name="Ali")
+    assert r["ok"] is True
+    assert r["path"] == str(tmp_path / "data" / "contacts.db")
+
+
+def test_migration_waits_for_legacy_json(tmp_path: Path):
+    from bantz.contacts.store import contacts_list, reset_contact_stores
+
+    p = tmp_path / "contacts.json"
+    assert contacts_list(path=str(p))["contacts"] == []
+
+    p.write_text(json.dumps({"version": 1, "contacts": {
+        "ayşe": {"name": "Ayşe", "email": "ayse@example.com"},
+    }}), encoding="utf-8")
+    reset_contact_stores()
+    assert [c["key"] for c in contacts_list(path=str(p))["contacts"]] == ["ayşe"]
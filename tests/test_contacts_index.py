@@ -0,0 +1,132 @@
+"""Tests for the indexed contacts store (Turkish folding, fuzzy lookup)."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from bantz.contacts.store import (
+    _fold,
+    contacts_list,
+    contacts_resolve,
+    contacts_search,
+    contacts_upsert,
+    get_contact_store,
+    get_contacts_db_path,
+)
+
+
+@pytest.fixture
+def path(tmp_path: Path, monkeypatch) -> str:
+    # A .db path migrates from the default contacts.json; keep that empty.
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "config"))
+    return str(tmp_path / "contacts.db")
+
+
+def _add(path: str, name: str, email: str) -> None:
+    contacts_upsert(name=name, email=email, path=path)
+
+
+class TestFold:
+    @pytest.mark.parametrize("text, expected", [
+        ("Ahmet'e", "ahmet"),
+        ("Ayşe'ye", "ayse"),
+        ("Ali'den", "ali"),
+        ("Zeynep’in", "zeynep"),
+        ("İsmail IŞIK", "ismail isik"),
+        ("ÇAĞLA  Öztürk", "cagla ozturk"),
+        ("O'Brien", "obrien"),
+    ])
+    def test_fold(self, text, expected):
+        assert _fold(text) == expected
+
+    def test_db_path_mapping(self, tmp_path: Path):
+        assert get_contacts_db_path(str(tmp_path / "c.json")) == tmp_path / "c.db"
+        assert get_contacts_db_path(str(tmp_path / "c.db")) == tmp_path / "c.db"
+
+
+class TestResolve:
+    def test_folded_match(self, path):
+        _add(path, "Çağla Öztürk", "cagla@example.com")
+        r = contacts_resolve(name="cagla ozturk", path=path)
+        assert r["ok"] is True
+        assert r["match"] == "folded"
+        assert r["email"] == "cagla@example.com"
+
+    def test_apostrophe_suffix_resolves(self, path):
+        _add(path, "Ahmet", "ahmet@example.com")
+        r = contacts_resolve(name="Ahmet'e", path=path)
+        assert r["ok"] is True
+        assert r["email"] == "ahmet@example.com"
+
+    def test_first_name_fuzzy(self, path):
+        _add(path, "Ahmet Yılmaz", "ahmet@example.com")
+        _add(path, "Mehmet Kaya", "mehmet@example.com")
+        r = contacts_resolve(name="Ahmet'e", path=path)
+        assert r["ok"] is True
+        assert r["match"] == "fuzzy"
+        assert r["email"] == "ahmet@example.com"
+
+    def test_typo_fuzzy(self, path):
+        _add(path, "Zeynep Demir", "zeynep@example.com")
+        r = contacts_resolve(name="zeynep demr", path=path)
+        assert r["ok"] is True
+        assert r["key"] == "zeynep demir"
+
+    def test_ambiguous_returns_candidates(self, path):
+        _add(path, "Ahmet Yılmaz", "a1@example.com")
+        _add(path, "Ahmet Kaya", "a2@example.com")
+        r = contacts_resolve(name="Ahmet", path=path)
+        assert r["ok"] is False
+        assert r["error"] == "contact_ambiguous"
+        assert {c["email"] for c in r["candidates"]} == {"a1@example.com", "a2@example.com"}
+
+    def test_fuzzy_disabled(self, path):
+        _add(path, "Ahmet Yılmaz", "ahmet@example.com")
+        r = contacts_resolve(name="Ahmet", path=path, fuzzy=False)
+        assert r["error"] == "contact_not_found"
+
+    def test_unrelated_name_not_found(self, path):
+        _add(path, "Ahmet Yılmaz", "ahmet@example.com")
+        assert contacts_resolve(name="Fatma", path=path)["error"] == "contact_not_found"
+
+    def test_email_index(self, path):
+        _add(path, "Ali", "Ali@Example.com")
+        r = contacts_resolve(name="ali@example.com", path=path)
+        assert r["ok"] is True
+        assert r["match"] == "email"
+
+    def test_upsert_reindexes_name(self, path):
+        _add(path, "Ali", "ali@example.com")
+        _add(path, "Ali", "ali2@example.com")
+        assert contacts_resolve(name="ali", path=path)["email"] == "ali2@example.com"
+        store = get_contact_store(path)
+        assert store.count() == 1
+
+
+class TestListAndSearch:
+    def test_prefix_listing_uses_keys(self, path):
+        for name in ("Ali", "Alper", "Burak"):
+            _add(path, name, f"{name.lower()}@example.com")
+        keys = [c["key"] for c in contacts_list(prefix="al", path=path)["contacts"]]
+        assert keys == ["ali", "alper"]
+        assert len(contacts_list(limit=2, path=path)["contacts"]) == 2
+
+    def test_search_name_and_email(self, path):
+        _add(path, "Şule Çelik", "sule@firma.com")
+        _add(path, "Burak", "burak@example.com")
+        assert [c["key"] for c in contacts_search(query="sule", path=path)["contacts"]] == ["şule çelik"]
+        assert [c["key"] for c in contacts_search(query="burak@", path=path)["contacts"]] == ["burak"]
+
+    def test_many_contacts(self, path):
+        from bantz.contacts.store import Contact, _normalize_key
+
+        store = get_contact_store(path)
+        store.upsert_many(
+            Contact(key=_normalize_key(f"Kişi {i}"), name=f"Kişi {i}", email=f"k{i}@example.com")
+            for i in range(2000)
+        )
+        _add(path, "Ahmet Yılmaz", "ahmet@example.com")
+        assert store.count() == 2001
+        assert contacts_resolve(name="Ahmet'e", path=path)["email"] == "ahmet@example.com"
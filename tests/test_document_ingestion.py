@@ -278,3 +278,150 @@ class TestDocumentIngester:
         
         assert isinstance(ingester, DocumentIngester)
         assert ingester._extract_structure is False
+
+
+class TestStreamingIngestion:
+    """Tests for page-streaming ingestion and the content-hash cache."""
+    
+    @pytest.mark.asyncio
+    async def test_iter_pages_text_in_order(self, tmp_path):
+        """Test text files are split into ordered line pages."""
+        path = tmp_path / "notes.txt"
+        lines = [f"line {i}" for i in range(120)]
+        path.write_text("\n".join(lines), encoding="utf-8")
+        ingester = DocumentIngester()
+        
+        pages = [p async for p in ingester.iter_pages(path)]
+        
+        assert [p.index for p in pages] == [0, 1, 2]
+        assert "".join(p.text for p in pages) == path.read_text(encoding="utf-8")
+        assert pages[1].offset == len(pages[0].text)
+    
+    @pytest.mark.asyncio
+    async def test_ingest_streaming_matches_ingest(self, tmp_path):
+        """Test streaming ingestion produces the same text as ingest."""
+        path = tmp_path / "doc.md"
+        path.write_text("# Title\n\n- a\n- b\n" * 40, encoding="utf-8")
+        ingester = DocumentIngester()
+        
+        streamed = await ingester.ingest_streaming(path)
+        regular = await ingester.ingest(path)
+        
+        assert streamed.raw_text == regular.raw_text
+        assert streamed.metadata.doc_type == DocumentType.MD
+        assert streamed.metadata.file_size == path.stat().st_size
+    
+    @pytest.mark.asyncio
+    async def test_structure_fed_incrementally(self, tmp_path):
+        """Test structure positions index into the full text."""
+        from bantz.document.structure import StructureExtractor
+        
+        path = tmp_path / "doc.md"
+        body = ["filler"] * 60 + ["# Late Heading"]
+        path.write_text("\n".join(body), encoding="utf-8")
+        ingester = DocumentIngester()
+        ingester.set_structure_extractor(StructureExtractor())
+        
+        doc = await ingester.ingest_streaming(path)
+        
+        assert doc.structure.get_outline() == [(1, "Late Heading")]
+        heading = doc.structure.headings[0]
+        assert doc.raw_text[heading.start_pos:heading.end_pos] == "# Late Heading"
+    
+    @pytest.mark.asyncio
+    async def test_reingest_unchanged_file_hits_cache(self, tmp_path):
+        """Test re-ingesting an unchanged file skips parsing."""
+        path = tmp_path / "a.txt"
+        path.write_text("hello cache", encoding="utf-8")
+        ingester = DocumentIngester()
+        
+        first = await ingester.ingest_streaming(path)
+        with patch.object(ingester, "_stream_file") as stream:
+            second = await ingester.ingest_streaming(path)
+        
+        stream.assert_not_called()
+        assert second.raw_text == first.raw_text
+        assert second.id != first.id
+        assert ingester.cache.hits == 1
+    
+    @pytest.mark.asyncio
+    async def test_same_content_other_path_hits_cache(self, tmp_path):
+        """Test the cache is keyed by content, not path."""
+        first_path = tmp_path / "a.txt"
+        copy_path = tmp_path / "b.txt"
+        first_path.write_text("same content", encoding="utf-8")
+        copy_path.write_text("same content", encoding="utf-8")
+        ingester = DocumentIngester()
+        
+        await ingester.ingest_streaming(first_path)
+        copy = await ingester.ingest_streaming(copy_path)
+        
+        assert copy.metadata.filename == "b.txt"
+        assert copy.source_path == str(copy_path.absolute())
+        assert len(ingester.cache) == 1
+    
+    @pytest.mark.asyncio
+    async def test_changed_file_is_reparsed(self, tmp_path):
+        """Test a modified file is not served from cache."""
+        path = tmp_path / "a.txt"
+        path.write_text("version one", encoding="utf-8")
+        ingester = DocumentIngester()
+        
+        await ingester.ingest_streaming(path)
+        path.write_text("version two!", encoding="utf-8")
+        doc = await ingester.ingest_streaming(path)
+        
+        assert doc.raw_text == "version two!"
+    
+    @pytest.mark.asyncio
+    async def test_pdf_pages_batched_across_executor(self, tmp_path):
+        """Test PDF pages are extracted in batches and yielded in order."""
+        from concurrent.futures import ThreadPoolExecutor
+        
+        path = tmp_path / "big.pdf"
+        path.write_bytes(b"%PDF-1.4 fake")
+        calls = []
+        
+        def fake_extract(p, start, stop):
+            calls.append((start, stop))
+            return [f"page {i}" if i != 3 else "" for i in range(start, stop)]
+        
+        ingester = DocumentIngester(page_workers=2, pages_per_task=4)
+        with patch("bantz.document.ingestion.probe_pdf", return_value=(10, {"title": "Big"})), \
+                patch("bantz.document.ingestion.extract_pdf_pages", side_effect=fake_extract), \
+                ThreadPoolExecutor(max_workers=2) as pool:
+            doc = await ingester.ingest_streaming(path, executor=pool)
+        
+        assert sorted(calls) == [(0, 4), (4, 8), (8, 10)]
+        assert doc.metadata.page_count == 10
+        assert doc.metadata.title == "Big"
+        expected = "\n\n".join(f"page {i}" for i in range(10) if i != 3)
+        assert doc.raw_text == expected
+    
+    @pytest.mark.asyncio
+    async def test_iter_pages_file_not_found(self):
+        """Test streaming a missing file raises."""
+        ingester = DocumentIngester()
+        
+        with pytest.raises(FileNotFoundError):
+            async for _ in ingester.iter_pages(Path("/non/existent/file.txt")):
+                pass
+
+
+class TestDocumentCache:
+    """Tests for DocumentCache eviction."""
+    
+    def test_lru_eviction(self):
+        """Test least recently used entries are evicted."""
+        from bantz.document.ingestion import DocumentCache, _CacheEntry
+        
+        cache = DocumentCache(max_entries=2)
+        entry = _CacheEntry(document=Mock(), pages=[])
+        cache.put("a", entry, stat_key=("a", 1, 1))
+        cache.put("b", entry)
+        cache.get("a")
+        cache.put("c", entry)
+        
+        assert cache.get("b") is None
+        assert cache.get("a") is entry
+        assert cache.digest_for_stat(("a", 1, 1)) == "a"
@@ -8,11 +8,13 @@ Covers:
 - FinalizationPipeline (ask_user, hard failures, quality, fast, defaults)
 - decide_finalization_tier (smalltalk, tiering, fallback)
 - Factory helpers (build_finalization_context, create_pipeline)
+- Hedged quality/fast racing (FinalizerHedge)
 """
 
 from __future__ import annotations
 
 import json
+import time
 from dataclasses import dataclass, field, replace
 from typing import Any, Optional
 from unittest.mock import Mock, MagicMock, patch
@@ -27,6 +29,7 @@ from bantz.brain.finalization_pipeline import (
     QualityFinalizer,
     FastFinalizer,
     FinalizationPipeline,
+    FinalizerHedge,
     build_finalization_context,
     create_pipeline,
     decide_finalization_tier,
@@ -822,3 +825,130 @@ class TestPipelineIntegration:
 
         # Should have fallen back — either fast output or default
         assert result.assistant_reply is not None
+
+
+# =============================================================================
+# Hedged finalization
+# =============================================================================
+
+def _slow_llm(reply: str, delay: float) -> Mock:
+    llm = Mock()
+
+    def _complete(**kwargs):
+        time.sleep(delay)
+        return reply
+
+    llm.complete_text = Mock(side_effect=_complete)
+    return llm
+
+
+class TestFinalizerHedge:
+    def test_initial_delay_until_enough_samples(self):
+        hedge = FinalizerHedge(initial_delay=1.0, min_samples=3)
+        hedge.record_latency(0.4)
+        hedge.record_latency(0.6)
+        assert hedge.delay() == 1.0
+        hedge.record_latency(0.5)
+        assert hedge.delay() == pytest.approx(0.5)
+
+    def test_delay_clamped(self):
+        hedge = FinalizerHedge(min_delay=0.2, max_delay=2.0, min_samples=1)
+        hedge.record_latency(0.01)
+        assert hedge.delay() == 0.2
+        hedge = FinalizerHedge(min_delay=0.2, max_delay=2.0, min_samples=1)
+        hedge.record_latency(9.0)
+        assert hedge.delay() == 2.0
+
+    def test_win_rates_per_route(self):
+        hedge = FinalizerHedge()
+        hedge.record("calendar", fired=True, winner="fast")
+        hedge.record("calendar", fired=True, winner="quality")
+        hedge.record("calendar", fired=False, winner="quality")
+        hedge.record("gmail", fired=True, winner="none")
+        routes = hedge.stats()["routes"]
+        assert routes["calendar"]["turns"] == 3
+        assert routes["calendar"]["fast_win_rate"] == 0.5
+        assert routes["calendar"]["hedge_rate"] == pytest.approx(0.667)
+        assert routes["gmail"]["no_winner"] == 1
+
+
+class TestHedgedPipeline:
+    def _pipeline(self, quality_llm, planner_llm, **hedge_kwargs):
+        hedge = FinalizerHedge(**{"initial_delay": 0.05, "min_delay": 0.01, **hedge_kwargs})
+        return FinalizationPipeline(
+            quality=QualityFinalizer(finalizer_llm=quality_llm, guard=None),
+            fast=FastFinalizer(planner_llm=planner_llm),
+            hedge=hedge,
+        )
+
+    @staticmethod
+    def _ctx() -> FinalizationContext:
+        # web_search bypasses the deterministic calendar guards
+        return _make_ctx(
+            orchestrator_output=_make_output(route="web_search", calendar_intent="none", tool_plan=["web.search"]),
+            tool_results=[{"tool": "web.search", "success": True, "result": "yarın 2 toplantı"}],
+        )
+
+    def test_fast_wins_when_quality_slow(self, mock_planner_llm):
+        pipeline = self._pipeline(
+            _slow_llm("Efendim, yarın 2 toplantınız var.", 1.0), mock_planner_llm,
+        )
+        ctx = self._ctx()
+        started = time.monotonic()
+        result = pipeline.run(ctx)
+
+        assert time.monotonic() - started < 0.9
+        assert result.assistant_reply == "Yarın 2 toplantı var efendim."
+        assert ctx.state.trace["finalizer_hedge_winner"] == "fast"
+        assert ctx.state.trace["finalizer_strategy"] == "hedged_fast"
+        assert pipeline.hedge.stats()["routes"]["web_search"]["fast_wins"] == 1
+
+    def test_quality_within_delay_does_not_hedge(self, mock_llm, mock_planner_llm):
+        pipeline = self._pipeline(mock_llm, mock_planner_llm, initial_delay=2.0)
+        ctx = self._ctx()
+        result = pipeline.run(ctx)
+
+        assert result.assistant_reply == "Efendim, yarın 2 toplantınız var."
+        assert ctx.state.trace["finalizer_hedge_fired"] is False
+        mock_planner_llm.complete_text.assert_not_called()
+
+    def test_fast_reply_must_pass_guard(self):
+        quality_llm = _slow_llm("Efendim, yarın 2 toplantınız var.", 0.3)
+        planner_llm = _slow_llm("Yarın 999 toplantı var efendim.", 0.0)
+        pipeline = self._pipeline(quality_llm, planner_llm)
+
+        fake_mod = Mock()
+        fake_mod.find_new_numeric_facts = Mock(
+            side_effect=lambda *, allowed_texts, candidate_text: (
+                ("999" in candidate_text), {"999"} if "999" in candidate_text else set()
+            )
+        )
+        with patch.dict("sys.modules", {"bantz.llm.no_new_facts": fake_mod}):
+            ctx = self._ctx()
+            result = pipeline.run(ctx)
+
+        assert result.assistant_reply == "Efendim, yarın 2 toplantınız var."
+        assert ctx.state.trace["finalizer_hedge_fired"] is True
+        assert ctx.state.trace["finalizer_hedge_winner"] == "quality"
+
+    def test_quality_failure_reuses_hedged_fast_reply(self, mock_planner_llm):
+        pipeline = self._pipeline(_slow_llm("", 0.3), mock_planner_llm)
+
+        fake_mod = Mock()
+        fake_mod.find_new_numeric_facts = Mock(return_value=(True, {"2"}))
+        with patch.dict("sys.modules", {"bantz.llm.no_new_facts": fake_mod}):
+            ctx = self._ctx()
+            result = pipeline.run(ctx)
+
+        assert result.assistant_reply == "Yarın 2 toplantı var efendim."
+        assert ctx.state.trace["finalizer_hedge_winner"] == "none"
+        assert mock_planner_llm.complete_text.call_count == 1
+
+    def test_create_pipeline_hedge_flag(self, mock_llm, mock_planner_llm):
+        pipeline = create_pipeline(
+            finalizer_llm=mock_llm, planner_llm=mock_planner_llm, hedge=True,
+            quality_timeout=4.0,
+        )
+        assert isinstance(pipeline.hedge, FinalizerHedge)
+        assert pipeline.hedge.max_delay == 2.0
+        assert create_pipeline(finalizer_llm=mock_llm).hedge is None
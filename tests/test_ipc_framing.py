@@ -0,0 +1,223 @@
+"""
+Tests for binary IPC framing, batch messages and coalesced overlay updates.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from bantz.ipc.overlay_client import OverlayClient
+from bantz.ipc.overlay_server import OverlayServer
+from bantz.ipc.protocol import (
+    CODEC_JSON,
+    FRAME_HEADER,
+    FRAME_MAGIC,
+    FRAMING_BINARY,
+    FRAMING_JSONL,
+    HAS_MSGPACK,
+    AckMessage,
+    BatchMessage,
+    StateMessage,
+    action_cursor_dot,
+    action_highlight_rect,
+    decode_payload,
+    encode_for,
+    encode_frame,
+    encode_message,
+    parse_message,
+    read_message,
+    state_thinking,
+)
+
+
+def _reader(data: bytes) -> asyncio.StreamReader:
+    reader = asyncio.StreamReader()
+    reader.feed_data(data)
+    reader.feed_eof()
+    return reader
+
+
+class _Transport:
+    def get_write_buffer_size(self):
+        return 0
+
+
+class _Writer:
+    """Minimal StreamWriter stand-in that records written bytes."""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.transport = _Transport()
+        self.drains = 0
+
+    def write(self, data):
+        self.data += data
+
+    async def drain(self):
+        self.drains += 1
+
+    async def read_all(self):
+        reader = _reader(bytes(self.data))
+        out = []
+        while True:
+            data, framing = await read_message(reader)
+            if framing is None:
+                return out
+            out.append((data, framing))
+
+
+# ── framing ─────────────────────────────────────────────────────
+
+
+class TestBinaryFraming:
+    def test_header_layout(self):
+        raw = encode_frame(StateMessage(text="x"), codec=CODEC_JSON)
+        magic, codec, length = FRAME_HEADER.unpack(raw[:FRAME_HEADER.size])
+        assert magic == FRAME_MAGIC
+        assert codec == CODEC_JSON
+        assert length == len(raw) - FRAME_HEADER.size
+        assert json.loads(raw[FRAME_HEADER.size:])["text"] == "x"
+
+    def test_json_payload_roundtrip(self):
+        raw = encode_frame({"type": "ping", "id": "a"}, codec=CODEC_JSON)
+        assert decode_payload(CODEC_JSON, raw[FRAME_HEADER.size:]) == {"type": "ping", "id": "a"}
+
+    def test_unknown_codec(self):
+        assert decode_payload(0, b"{}") is None
+
+    @pytest.mark.skipif(not HAS_MSGPACK, reason="msgpack not installed")
+    def test_msgpack_is_smaller(self):
+        msg = action_cursor_dot(100, 200)
+        assert len(encode_frame(msg)) < len(encode_message(msg))
+
+    async def test_read_mixed_stream(self):
+        stream = (
+            encode_message(state_thinking())
+            + encode_frame(action_cursor_dot(1, 2), codec=CODEC_JSON)
+            + encode_for({"type": "ping", "id": "p"}, FRAMING_JSONL)
+        )
+        reader = _reader(stream)
+        results = [await read_message(reader) for _ in range(4)]
+        assert [f for _, f in results] == [FRAMING_JSONL, FRAMING_BINARY, FRAMING_JSONL, None]
+        assert results[0][0]["state"] == "thinking"
+        assert results[1][0]["x"] == 1
+        assert results[2][0]["id"] == "p"
+
+    async def test_truncated_frame_is_eof(self):
+        raw = encode_frame(state_thinking(), codec=CODEC_JSON)
+        assert await read_message(_reader(raw[:-3])) == (None, None)
+
+
+class TestBatchMessage:
+    def test_parse_batch(self):
+        batch = BatchMessage(items=[state_thinking().to_dict(), {"type": "bogus"}, action_cursor_dot(3, 4).to_dict()])
+        parsed = parse_message(json.loads(encode_message(batch)))
+        assert isinstance(parsed, BatchMessage)
+        kinds = [type(m).__name__ for m in parsed.messages()]
+        assert kinds == ["StateMessage", "ActionMessage"]
+
+
+# ── client coalescing ───────────────────────────────────────────
+
+
+def _client(framing=FRAMING_BINARY):
+    client = OverlayClient(framing=framing, frame_interval=0.01)
+    client._writer = _Writer()
+    client._connected = True
+    client._loop = asyncio.get_running_loop()
+    return client
+
+
+class TestClientCoalescing:
+    async def test_updates_in_one_tick_become_one_batch(self):
+        client = _client()
+        for i in range(10):
+            client.post(action_cursor_dot(i, i))
+        client.post(state_thinking("a"))
+        client.post(StateMessage(state="speaking", text="b"))
+        client.post(action_highlight_rect(1, 2, 3, 4))
+        await asyncio.sleep(0.05)
+
+        frames = await client._writer.read_all()
+        assert len(frames) == 1
+        data, framing = frames[0]
+        assert framing == FRAMING_BINARY
+        assert data["type"] == "batch"
+        items = data["items"]
+        assert [i.get("action") or i["state"] for i in items] == ["cursor_dot", "speaking", "highlight"]
+        assert items[0]["x"] == 9
+        assert client.current_state == "speaking"
+        assert client.stats["coalesced"] == 10
+        assert list(client._pending_acks) == [data["id"]]
+
+    async def test_single_update_sent_unbatched(self):
+        client = _client(FRAMING_JSONL)
+        client.post(state_thinking())
+        await client.flush()
+        frames = await client._writer.read_all()
+        assert frames[0][1] == FRAMING_JSONL
+        assert frames[0][0]["type"] == "state"
+
+    async def test_post_from_other_thread(self):
+        client = _client()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, client.post, state_thinking())
+        await asyncio.sleep(0.05)
+        assert len(await client._writer.read_all()) == 1
+
+    async def test_set_position_is_not_reverted_by_pending_state(self):
+        client = _client()
+        client.post(StateMessage(state="thinking", text="a", position=None))
+        await client.set_position("top_right")
+        await asyncio.sleep(0.05)
+
+        frames = [data for data, _ in await client._writer.read_all()]
+        assert [(f["state"], f["position"]) for f in frames] == [
+            ("thinking", "center"),
+            ("thinking", "top_right"),
+        ]
+        assert client.current_position == "top_right"
+
+    async def test_posted_state_takes_position_at_flush(self):
+        client = _client()
+        client.post(StateMessage(state="speaking", position=None))
+        client._current_position = "bottom_left"
+        await client.flush()
+        frames = await client._writer.read_all()
+        assert frames[0][0]["position"] == "bottom_left"
+
+    async def test_no_drain_below_threshold(self):
+        client = _client()
+        await client.send_state(state_thinking())
+        assert client._writer.drains == 0
+
+
+# ── server batch handling ───────────────────────────────────────
+
+
+class TestServerBatch:
+    async def test_batch_acked_once_and_applied_in_order(self):
+        server = OverlayServer()
+        server._writer = _Writer()
+        server._connected = True
+        server._framing = FRAMING_BINARY
+        seen = []
+
+        async def on_state(msg):
+            seen.append(msg.state)
+
+        async def on_action(msg):
+            seen.append(msg.action)
+
+        server.set_state_callback(on_state)
+        server.set_action_callback(on_action)
+        batch = BatchMessage(items=[state_thinking().to_dict(), action_cursor_dot(1, 1).to_dict()])
+        await server._handle_message(parse_message(batch.to_dict()))
+
+        assert seen == ["thinking", "cursor_dot"]
+        replies = await server._writer.read_all()
+        assert len(replies) == 1
+        ack, framing = replies[0]
+        assert framing == FRAMING_BINARY
+        assert parse_message(ack) == AckMessage(id=batch.id, ts=ack["ts"])
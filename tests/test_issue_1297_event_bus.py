@@ -10,16 +10,20 @@ Coverage:
 - Fire-and-forget error handling
 - tool_runner.py event bus integration
 - History with filtering
+- Queued dispatch: per-subscriber queues, overflow policies, lag stats
 """
 
 from __future__ import annotations
 
+import threading
+import time
 from datetime import datetime
 from unittest.mock import patch
 
 import pytest
 
-from bantz.core.events import (Event, EventBus, EventType, get_event_bus,
+from bantz.core.events import (Event, EventBus, EventType, OverflowPolicy,
+                               get_event_bus, progress_coalesce_key,
                                reset_event_bus)
 
 # ═══════════════════════════════════════════════════════════════════
@@ -547,6 +551,145 @@ class TestSingleton:
         reset_event_bus()
 
 
+# ═══════════════════════════════════════════════════════════════════
+# Queued Dispatch
+# ═══════════════════════════════════════════════════════════════════
+
+
+class TestQueuedDispatch:
+    """Per-subscriber bounded queues drained by worker threads."""
+
+    @pytest.fixture
+    def bus(self):
+        bus = EventBus(dispatch="queued", queue_size=4)
+        yield bus
+        bus.close()
+
+    def test_default_dispatch_is_sync(self, monkeypatch):
+        monkeypatch.delenv("BANTZ_EVENT_DISPATCH", raising=False)
+        assert EventBus().dispatch == "sync"
+
+    def test_env_selects_queued(self, monkeypatch):
+        monkeypatch.setenv("BANTZ_EVENT_DISPATCH", "queued")
+        bus = EventBus()
+        assert bus.dispatch == "queued"
+
+    def test_invalid_dispatch(self):
+        with pytest.raises(ValueError):
+            EventBus(dispatch="parallel")
+
+    def test_slow_subscriber_does_not_block_publish(self, bus):
+        release = threading.Event()
+        received = []
+
+        def slow(e):
+            release.wait(2.0)
+            received.append(e.data["i"])
+
+        bus.subscribe("test.slow", slow)
+        started = time.monotonic()
+        for i in range(3):
+            bus.publish("test.slow", {"i": i})
+        assert time.monotonic() - started < 0.5
+        release.set()
+        assert bus.flush(timeout=2.0)
+        assert received == [0, 1, 2]
+
+    def test_drop_oldest_on_overflow(self, bus):
+        release = threading.Event()
+        received = []
+        bus.subscribe("test.x", lambda e: (release.wait(2.0), received.append(e.data["i"])))
+        bus.publish("test.x", {"i": 0})
+        time.sleep(0.05)  # worker picks up event 0 and blocks
+        for i in range(1, 8):
+            bus.publish("test.x", {"i": i})
+        release.set()
+        assert bus.flush(timeout=2.0)
+        assert received == [0, 4, 5, 6, 7]
+        stats = bus.subscriber_stats()[0]
+        assert stats["dropped"] == 3
+        assert stats["delivered"] == 5
+        assert stats["max_depth"] == 4
+
+    def test_drop_newest_on_overflow(self, bus):
+        release = threading.Event()
+        received = []
+        bus.subscribe(
+            "test.x",
+            lambda e: (release.wait(2.0), received.append(e.data["i"])),
+            overflow=OverflowPolicy.DROP_NEWEST,
+            maxsize=2,
+        )
+        bus.publish("test.x", {"i": 0})
+        time.sleep(0.05)
+        for i in range(1, 5):
+            bus.publish("test.x", {"i": i})
+        release.set()
+        assert bus.flush(timeout=2.0)
+        assert received == [0, 1, 2]
+
+    def test_coalesce_progress_events(self, bus):
+        release = threading.Event()
+        received = []
+        bus.subscribe_all(
+            lambda e: (release.wait(2.0), received.append((e.event_type, e.data))),
+            overflow=OverflowPolicy.COALESCE,
+            coalesce_key=progress_coalesce_key,
+        )
+        bus.publish("tool.executed", {"n": 0})
+        time.sleep(0.05)
+        for pct in (10, 50, 90):
+            bus.publish("progress", {"pct": pct}, correlation_id="run-1")
+        bus.publish("tool.executed", {"n": 1})
+        release.set()
+        assert bus.flush(timeout=2.0)
+        assert received == [
+            ("tool.executed", {"n": 0}),
+            ("progress", {"pct": 90}),
+            ("tool.executed", {"n": 1}),
+        ]
+        assert bus.subscriber_stats()[0]["coalesced"] == 2
+
+    def test_inline_subscriber_runs_on_publisher_thread(self, bus):
+        threads = []
+        bus.subscribe("test.x", lambda e: threads.append(threading.current_thread()), inline=True)
+        bus.publish("test.x")
+        assert threads == [threading.current_thread()]
+        assert bus.subscriber_stats() == []
+
+    def test_handler_error_isolated(self, bus):
+        received = []
+
+        def bad(e):
+            raise RuntimeError("boom")
+
+        bus.subscribe("test.x", bad)
+        bus.subscribe("test.x", lambda e: received.append(e))
+        bus.publish("test.x")
+        assert bus.flush(timeout=2.0)
+        assert len(received) == 1
+        assert sum(s["errors"] for s in bus.subscriber_stats()) == 1
+
+    def test_lag_metrics(self, bus):
+        bus.subscribe("test.x", lambda e: time.sleep(0.02))
+        for _ in range(3):
+            bus.publish("test.x")
+        assert bus.flush(timeout=2.0)
+        stats = bus.subscriber_stats()[0]
+        assert stats["max_lag_ms"] >= 20
+        assert stats["avg_lag_ms"] > 0
+
+    def test_unsubscribe_stops_queue(self, bus):
+        received = []
+        handler = lambda e: received.append(e)  # noqa: E731
+        bus.subscribe("test.x", handler)
+        bus.unsubscribe("test.x", handler)
+        bus.publish("test.x")
+        assert bus.flush(timeout=1.0)
+        assert received == []
+        assert bus.subscriber_stats() == []
+
+
 # ═══════════════════════════════════════════════════════════════════
 # tool_runner.py Event Bus Integration
 # ═══════════════════════════════════════════════════════════════════
@@ -0,0 +1,252 @@
+"""
+Tests for the adaptive latency-budget controller.
+
+Covers:
+- StreamingQuantile (P²) accuracy and small-sample exactness
+- RollingQuantile drift tracking
+- AdaptiveLatencyController prediction and degradation order
+- OrchestratorLoop finalization honouring a degraded plan (one plan per turn)
+"""
+
+from __future__ import annotations
+
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from bantz.core.latency_budget import (
+    PHASE_FINALIZER_FAST,
+    PHASE_FINALIZER_QUALITY,
+    PHASE_REFLECTION,
+    PHASE_ROUTER,
+    PHASE_TOOL,
+    AdaptiveLatencyController,
+    DegradationAction,
+    DegradationPlan,
+    RollingQuantile,
+    StreamingQuantile,
+    _percentile,
+)
+
+
+# ─────────────────────────────────────────────────────────────────
+# Streaming quantiles
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestStreamingQuantile:
+    def test_exact_for_first_five(self):
+        sq = StreamingQuantile(0.5)
+        for x in (50, 10, 30, 20, 40):
+            sq.add(x)
+        assert sq.value() == 30
+
+    def test_empty_is_zero(self):
+        assert StreamingQuantile(0.95).value() == 0.0
+
+    @pytest.mark.parametrize("q", [0.5, 0.95])
+    def test_close_to_exact_percentile(self, q):
+        rng = random.Random(42)
+        samples = [rng.lognormvariate(6, 0.5) for _ in range(5000)]
+        sq = StreamingQuantile(q)
+        for x in samples:
+            sq.add(x)
+        exact = _percentile(samples, q * 100)
+        assert sq.value() == pytest.approx(exact, rel=0.05)
+
+    def test_invalid_quantile(self):
+        with pytest.raises(ValueError):
+            StreamingQuantile(1.0)
+
+
+class TestRollingQuantile:
+    def test_follows_drift(self):
+        rq = RollingQuantile(0.5, window=100)
+        for _ in range(300):
+            rq.add(100.0)
+        for _ in range(200):
+            rq.add(1000.0)
+        assert rq.value() == pytest.approx(1000.0)
+
+    def test_count_spans_both_windows(self):
+        rq = RollingQuantile(0.5, window=10)
+        for i in range(15):
+            rq.add(float(i))
+        assert rq.count == 15
+
+
+# ─────────────────────────────────────────────────────────────────
+# Controller
+# ─────────────────────────────────────────────────────────────────
+
+
+def _warm(ctl: AdaptiveLatencyController, phase: str, ms: float, n: int = 20) -> None:
+    for _ in range(n):
+        ctl.observe(phase, ms)
+
+
+class TestAdaptiveLatencyController:
+    def test_cold_controller_never_degrades(self):
+        ctl = AdaptiveLatencyController(target_p95_ms=100, min_samples=10)
+        plan = ctl.plan(elapsed_ms=5000, remaining=[PHASE_REFLECTION, "finalizer"])
+        assert not plan.degraded
+        assert plan.predicted_ms == 5000
+
+    def test_prediction_adds_p50_and_worst_tail(self):
+        ctl = AdaptiveLatencyController(target_p95_ms=10_000, min_samples=5)
+        _warm(ctl, PHASE_REFLECTION, 300)
+        _warm(ctl, PHASE_FINALIZER_QUALITY, 1000)
+        predicted = ctl.predict(500, [PHASE_REFLECTION, PHASE_FINALIZER_QUALITY])
+        assert predicted == pytest.approx(1800)
+
+    def test_on_budget_keeps_full_strategy(self):
+        ctl = AdaptiveLatencyController(target_p95_ms=3000, min_samples=5)
+        _warm(ctl, PHASE_REFLECTION, 300)
+        _warm(ctl, PHASE_FINALIZER_QUALITY, 1000)
+        plan = ctl.plan(elapsed_ms=1000, remaining=[PHASE_REFLECTION, "finalizer"])
+        assert not plan.degraded
+
+    def test_skips_reflection_first(self):
+        ctl = AdaptiveLatencyController(target_p95_ms=2500, min_samples=5)
+        _warm(ctl, PHASE_REFLECTION, 600)
+        _warm(ctl, PHASE_FINALIZER_QUALITY, 1000)
+        _warm(ctl, PHASE_FINALIZER_FAST, 300)
+        plan = ctl.plan(elapsed_ms=1200, remaining=[PHASE_REFLECTION, "finalizer"])
+        assert plan.actions == [DegradationAction.SKIP_REFLECTION]
+        assert plan.skip_reflection and not plan.use_fast_finalizer
+
+    def test_escalates_to_fast_finalizer_then_max_tokens(self):
+        ctl = AdaptiveLatencyController(target_p95_ms=1500, min_samples=5)
+        _warm(ctl, PHASE_REFLECTION, 600)
+        _warm(ctl, PHASE_FINALIZER_QUALITY, 2000)
+        _warm(ctl, PHASE_FINALIZER_FAST, 800)
+        plan = ctl.plan(elapsed_ms=1000, remaining=[PHASE_REFLECTION, "finalizer"])
+        assert plan.actions == [
+            DegradationAction.SKIP_REFLECTION,
+            DegradationAction.SKIP_FINALIZER_USE_3B,
+            DegradationAction.REDUCE_MAX_TOKENS,
+        ]
+        assert plan.use_fast_finalizer
+        assert plan.max_tokens is not None and plan.max_tokens < 512
+
+    def test_no_fast_switch_without_fast_samples(self):
+        ctl = AdaptiveLatencyController(target_p95_ms=1500, min_samples=5)
+        _warm(ctl, PHASE_FINALIZER_QUALITY, 2000)
+        plan = ctl.plan(elapsed_ms=0, remaining=["finalizer"])
+        # Fast finalizer cost unknown → no evidence that switching helps
+        assert not plan.use_fast_finalizer
+        assert plan.actions == [DegradationAction.REDUCE_MAX_TOKENS]
+
+    def test_phase_enum_accepted_and_dashboard(self):
+        from bantz.core.latency_budget import Phase
+
+        ctl = AdaptiveLatencyController(target_p95_ms=2000, min_samples=1)
+        ctl.observe(Phase.ROUTER, 80)
+        ctl.observe(PHASE_TOOL, 400)
+        ctl.observe_turn(1500)
+        dash = ctl.dashboard()
+        assert dash["phases"][PHASE_ROUTER]["count"] == 1
+        assert dash["end_to_end"]["count"] == 1
+        assert dash["target_p95_ms"] == 2000
+
+    def test_default_target_from_config(self):
+        assert AdaptiveLatencyController().target_p95_ms == 2000.0
+
+
+# ─────────────────────────────────────────────────────────────────
+# OrchestratorLoop integration
+# ─────────────────────────────────────────────────────────────────
+
+
+class TestOrchestratorLoopLatencyPlan:
+    @pytest.fixture
+    def loop(self, monkeypatch):
+        from bantz.agent.tools import ToolRegistry
+        from bantz.brain.llm_router import JarvisLLMOrchestrator
+        from bantz.brain.orchestrator_loop import (OrchestratorConfig,
+                                                   OrchestratorLoop)
+
+        monkeypatch.setenv("BANTZ_TIER_FORCE_FINALIZER", "quality")
+        planner = Mock()
+        planner.complete_text = Mock(return_value="Hızlı yanıt efendim.")
+        finalizer = Mock(spec=[])
+        finalizer.complete_text = Mock(return_value="Kaliteli yanıt efendim.")
+        finalizer.model_name = "gemini-2.0-flash"
+        finalizer.backend_name = "gemini"
+        return OrchestratorLoop(
+            orchestrator=JarvisLLMOrchestrator(llm_client=planner),
+            tools=ToolRegistry(),
+            finalizer_llm=finalizer,
+            config=OrchestratorConfig(latency_target_p95_ms=1500),
+        )
+
+    def _finalize(self, loop, plan):
+        from bantz.brain.orchestrator_loop import (OrchestratorOutput,
+                                                   OrchestratorState)
+
+        output = OrchestratorOutput(
+            route="calendar",
+            assistant_reply="",
+            tool_plan=["calendar_create_event"],
+            calendar_intent="create_event",
+            slots={"title": "Toplantı"},
+            confidence=0.95,
+        )
+        return loop._llm_finalization_phase(
+            user_input="Yarın toplantı ayarla",
+            orchestrator_output=output,
+            tool_results=[{"tool": "calendar_create_event", "success": True, "result": {"event_id": "e1"}}],
+            state=OrchestratorState(),
+            latency_plan=plan,
+        )
+
+    def test_controller_enabled_from_config(self, loop):
+        assert loop.latency_controller is not None
+        assert loop.latency_controller.target_p95_ms == 1500
+
+    def test_fast_finalizer_forced(self, loop):
+        plan = DegradationPlan(
+            use_fast_finalizer=True,
+            actions=[DegradationAction.SKIP_FINALIZER_USE_3B],
+        )
+        result = self._finalize(loop, plan)
+        assert result.assistant_reply == "Hızlı yanıt efendim."
+        loop.finalizer_llm.complete_text.assert_not_called()
+
+    def test_max_tokens_capped(self, loop):
+        plan = DegradationPlan(max_tokens=160, actions=[DegradationAction.REDUCE_MAX_TOKENS])
+        result = self._finalize(loop, plan)
+        assert result.assistant_reply == "Kaliteli yanıt efendim."
+        assert loop.finalizer_llm.complete_text.call_args.kwargs["max_tokens"] == 160
+
+    def test_turn_plans_once_and_applies_the_plan(self, loop, monkeypatch):
+        from bantz.brain.orchestrator_loop import OrchestratorOutput
+
+        routed = OrchestratorOutput(
+            route="calendar",
+            assistant_reply="",
+            tool_plan=["calendar_create_event"],
+            calendar_intent="create_event",
+            slots={"title": "Toplantı"},
+            confidence=0.95,
+        )
+        plan = DegradationPlan(
+            skip_reflection=True,
+            use_fast_finalizer=True,
+            actions=[DegradationAction.SKIP_REFLECTION, DegradationAction.SKIP_FINALIZER_USE_3B],
+        )
+        planner = Mock(return_value=plan)
+        reflect = Mock()
+        finalize = Mock(return_value=routed)
+        monkeypatch.setattr(loop.latency_controller, "plan", planner)
+        monkeypatch.setattr(loop.orchestrator, "route", Mock(return_value=routed))
+        monkeypatch.setattr(loop, "_react_execute_loop", Mock(return_value=[]))
+        monkeypatch.setattr(loop, "_reflection_phase", reflect)
+        monkeypatch.setattr(loop, "_llm_finalization_phase", finalize)
+
+        loop.process_turn("xqz takvim deneme")
+
+        assert planner.call_count == 1
+        reflect.assert_not_called()
+        assert finalize.call_args.kwargs["latency_plan"] is plan
@@ -0,0 +1,131 @@
+"""Tests for lazy tool handler binding (bantz.tools.lazy)."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from bantz.tools.lazy import LazyHandler, lazy_handlers, resolve_handler
+
+
+class TestLazyHandler:
+    def test_resolves_on_first_call(self):
+        h = LazyHandler("json", "dumps")
+        assert not h.loaded
+        assert h({"a": 1}) == '{"a": 1}'
+        assert h.loaded
+        assert h.__name__ == "dumps"
+
+    def test_resolve_handler(self):
+        import json
+
+        assert resolve_handler(LazyHandler("json", "dumps")) is json.dumps
+        assert resolve_handler(json.dumps) is json.dumps
+
+    def test_patch_before_first_call_is_honoured(self, monkeypatch):
+        import bantz.tools.time_tools as time_tools
+
+        h = LazyHandler("bantz.tools.time_tools", "time_now_tool")
+        monkeypatch.setattr(time_tools, "time_now_tool", lambda **kw: {"ok": True, "patched": True})
+        assert h()["patched"] is True
+
+    def test_missing_attr_raises_on_call(self):
+        with pytest.raises(AttributeError):
+            LazyHandler("json", "nope")()
+
+
+class TestLazyHandlers:
+    def test_lazy_by_default(self, monkeypatch):
+        monkeypatch.delenv("BANTZ_LAZY_TOOLS", raising=False)
+        (fn,) = lazy_handlers("bantz.tools.time_tools", "time_now_tool")
+        assert isinstance(fn, LazyHandler)
+
+    def test_eager_mode(self, monkeypatch):
+        import bantz.tools.time_tools as time_tools
+
+        monkeypatch.setenv("BANTZ_LAZY_TOOLS", "0")
+        (fn,) = lazy_handlers("bantz.tools.time_tools", "time_now_tool")
+        assert fn is time_tools.time_now_tool
+
+    def test_eager_missing_attr_is_import_error(self, monkeypatch):
+        monkeypatch.setenv("BANTZ_LAZY_TOOLS", "0")
+        with pytest.raises(ImportError):
+            lazy_handlers("json", "nope")
+
+    def test_missing_module_is_import_error(self, monkeypatch):
+        monkeypatch.delenv("BANTZ_LAZY_TOOLS", raising=False)
+        with pytest.raises(ImportError):
+            lazy_handlers("bantz.tools.does_not_exist", "x")
+
+
+def test_dispatch_submits_resolved_handler(monkeypatch):
+    """The orchestrator imports a lazy handler before the timed submit."""
+    from unittest.mock import MagicMock
+
+    import bantz.tools.time_tools as time_tools
+    from bantz.agent.tools import Tool, ToolRegistry
+    from bantz.brain.orchestrator_loop import (OrchestratorLoop,
+                                               OrchestratorOutput,
+                                               OrchestratorState)
+
+    def fake_now(**kwargs):
+        return {"ok": True, "time": "10:00"}
+
+    monkeypatch.setattr(time_tools, "time_now_tool", fake_now)
+    reg = ToolRegistry()
+    reg.register(Tool(
+        name="time.now",
+        description="Get current time",
+        parameters={"type": "object", "properties": {}, "required": []},
+        function=LazyHandler("bantz.tools.time_tools", "time_now_tool"),
+    ))
+    loop = OrchestratorLoop(orchestrator=MagicMock(), tools=reg)
+    loop.safety_guard = None
+    submitted = []
+    submit = loop._tool_executor.submit
+    monkeypatch.setattr(
+        loop._tool_executor, "submit",
+        lambda fn, **kw: submitted.append(fn) or submit(fn, **kw),
+    )
+
+    output = OrchestratorOutput(
+        route="system",
+        assistant_reply="",
+        tool_plan=["time.now"],
+        requires_confirmation=False,
+        calendar_intent="none",
+        slots={},
+        ask_user=False,
+        question="",
+        confidence=0.9,
+    )
+    results = loop._execute_tools_phase(output, OrchestratorState())
+
+    assert submitted == [fake_now]
+    assert results[0]["success"] is True
+
+
+def test_building_registries_does_not_import_handler_modules():
+    code = (
+        "import sys\n"
+        "from bantz.agent.registry import build_default_registry\n"
+        "from bantz.agent.tools import ToolRegistry\n"
+        "from bantz.tools.register_all import _register_browser, _register_calendar, _register_file\n"
+        "reg = build_default_registry()\n"
+        "extra = ToolRegistry()\n"
+        "_register_browser(extra); _register_calendar(extra); _register_file(extra)\n"
+        "assert len(reg.names()) > 40 and len(extra.names()) > 10\n"
+        "loaded = [m for m in ('bantz.tools.calendar_tools', 'bantz.tools.gmail_tools',\n"
+        "                      'bantz.tools.browser_tools', 'bantz.tools.file_tools',\n"
+        "                      'bantz.tools.code_tools') if m in sys.modules]\n"
+        "print(','.join(loaded))\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, timeout=120,
+        env={**os.environ, "BANTZ_LAZY_TOOLS": "1"},
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == ""
@@ -0,0 +1,165 @@
+"""Tests for the LLM request coalescer (bantz.llm.coalescer).
+
+Covers:
+    - Concurrency cap and priority ordering
+    - Inline nested submission, error propagation, shutdown
+    - LLMClient.chat_detailed_batch
+    - LLMIntentClassifier.classify_batch (concurrent, deduped, cached)
+"""
+from __future__ import annotations
+
+import json
+import threading
+import time
+
+import pytest
+
+from bantz.llm.base import LLMClient, LLMMessage, LLMResponse
+from bantz.llm.coalescer import (
+    LLMRequestCoalescer,
+    Priority,
+    gather,
+    get_llm_coalescer,
+    reset_llm_coalescer,
+)
+from bantz.nlu.classifier import ClassifierConfig, LLMIntentClassifier, classify_batch
+
+
+@pytest.fixture(autouse=True)
+def _fresh_coalescer():
+    reset_llm_coalescer()
+    yield
+    reset_llm_coalescer()
+
+
+class SlowClient(LLMClient):
+    """Fake client that sleeps per call and tracks concurrency."""
+
+    def __init__(self, delay: float = 0.05):
+        self.delay = delay
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def _call(self, text: str) -> str:
+        with self._lock:
+            self.calls.append(text)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.delay)
+        with self._lock:
+            self.in_flight -= 1
+        if text == "boom":
+            raise RuntimeError("server error")
+        return json.dumps({"intent": "greeting", "confidence": 0.9, "slots": {}})
+
+    def is_available(self, *, timeout_seconds: float = 1.5) -> bool:
+        return True
+
+    def chat(self, messages, *, temperature=0.4, max_tokens=512) -> str:
+        return self._call(messages[-1].content)
+
+    def chat_detailed(self, messages, *, temperature=0.4, max_tokens=512, seed=None) -> LLMResponse:
+        return LLMResponse(content=self._call(messages[-1].content), model="fake", tokens_used=1, finish_reason="stop")
+
+    def complete_text(self, *, prompt, temperature=0.0, max_tokens=200, system_prompt=None) -> str:
+        return self._call(prompt)
+
+    @property
+    def model_name(self) -> str:
+        return "fake"
+
+    @property
+    def backend_name(self) -> str:
+        return "fake"
+
+
+class TestCoalescer:
+
+    def test_concurrency_is_capped(self):
+        client = SlowClient(delay=0.05)
+        coalescer = LLMRequestCoalescer(max_concurrency=3)
+        start = time.perf_counter()
+        results = coalescer.map(lambda p: client.complete_text(prompt=p), [f"p{i}" for i in range(9)])
+        elapsed = time.perf_counter() - start
+        assert len(results) == 9
+        assert client.peak == 3
+        assert coalescer.stats()["peak_in_flight"] == 3
+        assert elapsed < 9 * 0.05
+        coalescer.shutdown()
+
+    def test_user_priority_overtakes_background(self):
+        coalescer = LLMRequestCoalescer(max_concurrency=1)
+        gate = threading.Event()
+        order: list[str] = []
+        blocker = coalescer.submit(gate.wait)
+        futures = [coalescer.submit(order.append, f"bg{i}", priority=Priority.BACKGROUND) for i in range(3)]
+        futures.append(coalescer.submit(order.append, "user", priority=Priority.USER))
+        gate.set()
+        gather([blocker, *futures])
+        assert order == ["user", "bg0", "bg1", "bg2"]
+        coalescer.shutdown()
+
+    def test_nested_submit_runs_inline(self):
+        coalescer = LLMRequestCoalescer(max_concurrency=1)
+
+        def outer():
+            return coalescer.submit(lambda: "inner").result(timeout=1)
+
+        assert coalescer.submit(outer).result(timeout=2) == "inner"
+        assert coalescer.stats()["inline"] == 1
+        coalescer.shutdown()
+
+    def test_gather_waits_then_raises_first_error(self):
+        client = SlowClient(delay=0.01)
+        coalescer = LLMRequestCoalescer(max_concurrency=4)
+        futures = [coalescer.submit_text(client, p) for p in ("a", "boom", "c")]
+        with pytest.raises(RuntimeError, match="server error"):
+            gather(futures)
+        assert all(f.done() for f in futures)
+        coalescer.shutdown()
+
+    def test_shutdown_drains_queue_and_rejects_new_work(self):
+        coalescer = LLMRequestCoalescer(max_concurrency=1)
+        futures = [coalescer.submit(time.sleep, 0.01) for _ in range(3)]
+        coalescer.shutdown(wait=True)
+        assert all(f.done() for f in futures)
+        with pytest.raises(RuntimeError):
+            coalescer.submit(time.sleep, 0)
+
+    def test_shared_instance(self):
+        assert get_llm_coalescer() is get_llm_coalescer()
+
+
+class TestBatchedCalls:
+
+    def test_chat_detailed_batch_keeps_order(self):
+        client = SlowClient(delay=0.05)
+        batch = [[LLMMessage(role="user", content=f"q{i}")] for i in range(6)]
+        start = time.perf_counter()
+        responses = client.chat_detailed_batch(batch)
+        assert time.perf_counter() - start < 6 * 0.05
+        assert [r.content for r in responses] == [responses[0].content] * 6
+        assert sorted(client.calls) == [f"q{i}" for i in range(6)]
+        assert client.peak > 1
+
+    def test_classify_batch_is_concurrent_deduped_and_cached(self):
+        client = SlowClient(delay=0.05)
+        classifier = LLMIntentClassifier(config=ClassifierConfig(), llm_client=client)
+        texts = ["selam", "merhaba", "Selam ", "", "naber"]
+        results = classifier.classify_batch(texts)
+        assert [r.intent for r in results] == ["greeting", "greeting", "greeting", "unknown", "greeting"]
+        assert len(client.calls) == 3  # "selam" and "Selam " share one call
+        assert client.peak > 1
+
+        classify_batch(["merhaba", "naber"], classifier=classifier)
+        assert len(client.calls) == 3  # served from cache
+
+    def test_classify_batch_error_becomes_unknown(self):
+        client = SlowClient(delay=0.0)
+        classifier = LLMIntentClassifier(config=ClassifierConfig(), llm_client=client)
+        ok, failed = classifier.classify_batch(["selam", "boom"])
+        assert ok.intent == "greeting"
+        assert failed.intent == "unknown"
+        assert failed.metadata["error"] == "server error"
@@ -21,6 +21,9 @@ from bantz.doctor import (
     _check_google_token,
     _check_dangerous_mode,
     _check_llm_endpoint,
+    _check_import_time,
+    format_importtime_report,
+    parse_importtime,
     run_doctor,
 )
 
@@ -136,6 +139,43 @@ class TestLLMEndpoint:
         assert result.status == "warn"
 
 
+IMPORTTIME_SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |     _io
+import time:       300 |        420 |   encodings
+import time:      2000 |       2420 | bantz.cli
+garbage line
+import time:       500 |        500 | json
+"""
+
+
+class TestImportTime:
+    def test_parse(self):
+        timings = parse_importtime(IMPORTTIME_SAMPLE)
+        assert [t.module for t in timings] == ["_io", "encodings", "bantz.cli", "json"]
+        assert [t.depth for t in timings] == [2, 1, 0, 0]
+        assert timings[2].self_us == 2000
+        assert timings[2].cumulative_us == 2420
+
+    def test_report_sorted_by_cumulative(self):
+        report = format_importtime_report(parse_importtime(IMPORTTIME_SAMPLE), top=2)
+        lines = report.splitlines()
+        assert "4 modules, 3 ms total" in lines[0]
+        assert lines[2].endswith("bantz.cli")
+        assert lines[3].endswith("json")
+        assert len(lines) == 4
+
+    def test_check_within_budget(self):
+        r = _check_import_time(parse_importtime(IMPORTTIME_SAMPLE), budget_ms=100)
+        assert r.status == "ok"
+        assert "bantz.cli" in r.message
+
+    def test_check_over_budget(self):
+        r = _check_import_time(parse_importtime(IMPORTTIME_SAMPLE), budget_ms=1)
+        assert r.status == "warn"
+        assert r.action
+
+
 class TestRunDoctor:
     def test_returns_zero_when_ok(self, monkeypatch, capsys):
         """Patches all checks to return ok → exit 0."""
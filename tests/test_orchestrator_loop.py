@@ -543,7 +543,7 @@ class TestVerifyResultsIntegration:
 
         seen = {}
 
-        def fake_finalize(user_input, orchestrator_output, tool_results, state):
+        def fake_finalize(user_input, orchestrator_output, tool_results, state, latency_plan=None):
             seen["tool_results"] = tool_results
             return planned
 
@@ -0,0 +1,265 @@
+"""Tests for concurrent overnight execution with per-domain rate limits.
+
+Covers:
+    - Task domain classification (Gmail, Calendar, Gemini, local LLM)
+    - TokenBucket / DomainRateLimiter (rate, concurrency, backoff)
+    - ConcurrentOvernightRunner (parallelism, limits, retries, checkpoints, cancel)
+    - create_overnight_runner / resume with BANTZ_OVERNIGHT_WORKERS
+"""
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from bantz.automation.overnight import (
+    ConcurrentOvernightRunner,
+    DomainLimit,
+    DomainRateLimiter,
+    OvernightRunner,
+    OvernightState,
+    OvernightStatus,
+    TaskStatus,
+    TokenBucket,
+    classify_task_domains,
+    create_overnight_runner,
+    load_checkpoint,
+    resume_overnight,
+    save_checkpoint,
+    task_domains,
+)
+
+FAST = {
+    "gmail": DomainLimit(requests_per_minute=6000, burst=10, max_concurrent=1),
+    "calendar": DomainLimit(requests_per_minute=6000, burst=10, max_concurrent=1),
+    "gemini": DomainLimit(requests_per_minute=6000, burst=10, max_concurrent=2),
+    "local_llm": DomainLimit(requests_per_minute=6000, burst=10, max_concurrent=10),
+}
+
+
+class RecordingServer:
+    """handle_command stand-in that records concurrency per domain."""
+
+    def __init__(self, delay: float = 0.1, responses=None):
+        self.delay = delay
+        self.responses = dict(responses or {})
+        self.lock = threading.Lock()
+        self.active: Counter = Counter()
+        self.peak: Counter = Counter()
+        self.calls: list[str] = []
+
+    def handle_command(self, text: str) -> dict:
+        domains = classify_task_domains(text)
+        with self.lock:
+            self.calls.append(text)
+            for d in domains:
+                self.active[d] += 1
+                self.peak[d] = max(self.peak[d], self.active[d])
+        time.sleep(self.delay)
+        with self.lock:
+            for d in domains:
+                self.active[d] -= 1
+            response = self.responses.get(text)
+            if isinstance(response, list):
+                response = response.pop(0) if response else None
+        return response or {"ok": True, "text": f"done: {text}"}
+
+
+def make_runner(server, tmp_path, **kwargs) -> ConcurrentOvernightRunner:
+    kwargs.setdefault("limiter", DomainRateLimiter(FAST))
+    kwargs.setdefault("max_workers", 4)
+    return ConcurrentOvernightRunner(bantz_server=server, checkpoint_path=tmp_path / "ckpt.json", **kwargs)
+
+
+# ─────────────────────────────────────────────────────────────────
+# Classification
+# ─────────────────────────────────────────────────────────────────
+
+class TestClassification:
+
+    @pytest.mark.parametrize("text,expected", [
+        ("Maillerimi temizle", ["gmail", "local_llm"]),
+        ("Yarınki toplantıları listele", ["calendar", "local_llm"]),
+        ("AI konferanslarını araştır", ["gemini", "local_llm"]),
+        ("Gelen kutusundaki haberleri özetle", ["gmail", "gemini", "local_llm"]),
+        ("Saat kaç", ["local_llm"]),
+    ])
+    def test_classify(self, text, expected):
+        assert classify_task_domains(text) == expected
+
+    def test_metadata_override_survives_checkpoint(self, tmp_path):
+        state = OvernightState.create(["Saat kaç"])
+        state.tasks[0].metadata["domains"] = ["gemini"]
+        assert task_domains(state.tasks[0]) == ["gemini"]
+        save_checkpoint(state, tmp_path / "c.json")
+        assert task_domains(load_checkpoint(tmp_path / "c.json").tasks[0]) == ["gemini"]
+
+
+# ─────────────────────────────────────────────────────────────────
+# Limiter
+# ─────────────────────────────────────────────────────────────────
+
+class TestDomainRateLimiter:
+
+    def test_token_bucket(self):
+        bucket = TokenBucket(rate=2.0, capacity=2)
+        now = time.monotonic()
+        for _ in range(2):
+            assert bucket.wait_time(now) == 0.0
+            bucket.take()
+        assert bucket.wait_time(now) == pytest.approx(0.5, abs=0.01)
+
+    def test_rate_limit_blocks_until_refill(self):
+        limiter = DomainRateLimiter({"gemini": DomainLimit(requests_per_minute=60, burst=1, max_concurrent=5)})
+        assert limiter.try_acquire(["gemini"]) == 0.0
+        assert 0 < limiter.try_acquire(["gemini"]) <= 1.0
+
+    def test_concurrency_cap(self):
+        limiter = DomainRateLimiter(FAST)
+        assert limiter.try_acquire(["calendar", "local_llm"]) == 0.0
+        assert limiter.try_acquire(["calendar", "local_llm"]) == math.inf
+        # Nothing was reserved by the refused attempt.
+        assert limiter.in_flight("local_llm") == 1
+        limiter.release(["calendar", "local_llm"])
+        assert limiter.try_acquire(["calendar"]) == 0.0
+
+    def test_unknown_domains_are_unlimited(self):
+        limiter = DomainRateLimiter(FAST)
+        for _ in range(100):
+            assert limiter.try_acquire(["web"]) == 0.0
+
+    def test_backoff_after_rate_limit(self):
+        limiter = DomainRateLimiter(FAST)
+        limiter.report_rate_limit(["gmail"])
+        assert limiter.try_acquire(["gmail"]) > 1.0
+        assert limiter.try_acquire(["calendar"]) == 0.0
+
+
+# ─────────────────────────────────────────────────────────────────
+# Runner
+# ─────────────────────────────────────────────────────────────────
+
+class TestConcurrentRunner:
+
+    def test_independent_tasks_run_in_parallel(self, tmp_path):
+        server = RecordingServer(delay=0.2)
+        runner = make_runner(server, tmp_path)
+        runner.add_tasks(["Maillerimi temizle", "Toplantıları listele", "Haberleri araştır", "Saat kaç"])
+
+        start = time.monotonic()
+        state = runner.run()
+        elapsed = time.monotonic() - start
+
+        assert state.status == OvernightStatus.COMPLETED
+        assert state.completed_count == 4
+        assert elapsed < 0.6  # sequential would take >= 0.8s
+        assert "Günaydın" in state.morning_report
+
+    def test_domain_concurrency_respected(self, tmp_path):
+        server = RecordingServer(delay=0.05)
+        runner = make_runner(server, tmp_path, max_workers=8)
+        runner.add_tasks([f"Takvim etkinliği {i} ekle" for i in range(4)] +
+                         [f"Konu {i} araştır" for i in range(4)])
+        state = runner.run()
+        assert state.completed_count == 8
+        assert server.peak["calendar"] == 1
+        assert server.peak["gemini"] == 2
+
+    def test_token_bucket_paces_starts(self, tmp_path):
+        limiter = DomainRateLimiter({"gemini": DomainLimit(requests_per_minute=600, burst=1, max_concurrent=5)})
+        server = RecordingServer(delay=0)
+        runner = make_runner(server, tmp_path, limiter=limiter)
+        runner.add_tasks([f"Konu {i} araştır" for i in range(3)])
+        start = time.monotonic()
+        runner.run()
+        assert time.monotonic() - start >= 0.18  # 10/s after a burst of one
+
+    def test_checkpoint_after_each_completion(self, tmp_path):
+        server = RecordingServer(delay=0.01)
+        runner = make_runner(server, tmp_path)
+        runner.add_tasks(["A", "B", "C"])
+        with patch("bantz.automation.overnight.save_checkpoint") as save:
+            runner.run()
+        assert save.call_count == 4  # 3 completions + final
+
+    def test_checkpoint_writes_consistent_snapshot(self, tmp_path):
+        server = RecordingServer(delay=0.02)
+        runner = make_runner(server, tmp_path)
+        runner.add_tasks(["A", "B", "C", "D"])
+        with patch("bantz.automation.overnight.save_checkpoint") as save:
+            runner.run()
+        for call in save.call_args_list:
+            snapshot = call.args[0]
+            assert isinstance(snapshot, dict)
+            for task in snapshot["tasks"]:
+                if task["status"] == TaskStatus.COMPLETED.value:
+                    assert task["result"] and task["completed_at"]
+
+    def test_retry_then_fail(self, tmp_path):
+        server = RecordingServer(delay=0, responses={"Bozuk": [{"ok": False, "text": "boom"}] * 3})
+        runner = make_runner(server, tmp_path)
+        runner.add_tasks(["Bozuk", "Sağlam"])
+        state = runner.run()
+        broken = state.tasks[0]
+        assert broken.status == TaskStatus.FAILED
+        assert server.calls.count("Bozuk") == 3
+        assert state.tasks[1].status == TaskStatus.COMPLETED
+
+    def test_rate_limit_error_backs_off_domain(self, tmp_path):
+        limiter = DomainRateLimiter(FAST)
+        server = RecordingServer(delay=0, responses={"Mail gönder": [{"ok": False, "text": "Rate limit exceeded"}]})
+        runner = make_runner(server, tmp_path, limiter=limiter)
+        runner.add_task("Mail gönder")
+        with patch.object(limiter, "report_rate_limit") as backoff:
+            runner.run()
+        backoff.assert_called_once_with(["gmail", "local_llm"])
+
+    def test_cancel_stops_dispatch(self, tmp_path):
+        server = RecordingServer(delay=0.2)
+        runner = make_runner(server, tmp_path, max_workers=1)
+        runner.add_tasks(["A", "B", "C"])
+        threading.Timer(0.05, runner.cancel).start()
+        state = runner.run()
+        assert state.status == OvernightStatus.CANCELLED
+        assert server.calls == ["A"]
+        assert state.tasks[0].status == TaskStatus.COMPLETED
+        assert state.tasks[2].status == TaskStatus.PENDING
+
+    def test_resume_runs_only_remaining(self, tmp_path):
+        ckpt = tmp_path / "ckpt.json"
+        state = OvernightState.create(["A", "B", "C"])
+        state.status = OvernightStatus.RUNNING
+        state.tasks[0].status = TaskStatus.COMPLETED
+        state.tasks[1].status = TaskStatus.RUNNING  # crashed mid-task
+        save_checkpoint(state, ckpt)
+
+        server = RecordingServer(delay=0)
+        result = resume_overnight(bantz_server=server, checkpoint_path=ckpt, max_workers=3)
+
+        assert sorted(server.calls) == ["B", "C"]
+        assert result.completed_count == 3
+        assert load_checkpoint(ckpt).status == OvernightStatus.COMPLETED
+
+
+class TestFactory:
+
+    def test_sequential_by_default(self, monkeypatch):
+        monkeypatch.delenv("BANTZ_OVERNIGHT_WORKERS", raising=False)
+        assert type(create_overnight_runner()) is OvernightRunner
+
+    def test_env_selects_runner(self, monkeypatch):
+        monkeypatch.setenv("BANTZ_OVERNIGHT_WORKERS", "1")
+        assert type(create_overnight_runner()) is OvernightRunner
+        monkeypatch.setenv("BANTZ_OVERNIGHT_WORKERS", "5")
+        runner = create_overnight_runner()
+        assert isinstance(runner, ConcurrentOvernightRunner)
+        assert runner.max_workers == 5
+
+    def test_explicit_workers(self, tmp_path):
+        runner = create_overnight_runner(max_workers=2, checkpoint_path=Path(tmp_path / "x.json"))
+        assert isinstance(runner, ConcurrentOvernightRunner)
@@ -0,0 +1,171 @@
+"""Tests for compiled policy lookups (GlobTable, memoised engines)."""
+
+from __future__ import annotations
+
+import json
+import os
+from fnmatch import fnmatch
+
+import pytest
+
+from bantz.policy.decision_table import GlobTable, is_glob
+from bantz.policy.dsl import PermissionDecision
+from bantz.policy.engine_v2 import PolicyDecision, PolicyEngineV2, PolicyPreset, RiskTier
+from bantz.policy.permission_engine import PermissionEngine
+
+
+PATTERNS = [
+    "calendar.create_event",
+    "calendar.*",
+    "*.list_*",
+    "gmail.?end",
+    "system.[ab]*",
+    "*",
+    "calendar.create_event",
+]
+NAMES = [
+    "calendar.create_event", "calendar.list_events", "gmail.send",
+    "gmail.list_labels", "system.abort", "system.zap", "x", "",
+]
+
+
+class TestGlobTable:
+    def test_is_glob(self):
+        assert is_glob("calendar.*")
+        assert is_glob("a?c")
+        assert is_glob("[ab]")
+        assert not is_glob("calendar.create_event")
+
+    @pytest.mark.parametrize("name", NAMES)
+    def test_matches_equal_fnmatch_in_order(self, name):
+        table = GlobTable((p, i) for i, p in enumerate(PATTERNS))
+        expected = [i for i, p in enumerate(PATTERNS) if fnmatch(name, p)]
+        assert table.matches(name) == expected
+
+    def test_first_with_predicate(self):
+        table = GlobTable([("calendar.*", "a"), ("*", "b")])
+        assert table.first("calendar.x") == "a"
+        assert table.first("calendar.x", lambda v: v != "a") == "b"
+        assert GlobTable([("a.*", 1)]).first("b") is None
+
+
+class TestPermissionEngineCompiled:
+    def test_memo_and_rule_replacement(self):
+        engine = PermissionEngine()
+        assert engine.evaluate("calendar.list_events", "read") == PermissionDecision.ALLOW
+        assert ("calendar.list_events", "read") in engine._memo
+        engine.load_policy_str(json.dumps({"permissions": [
+            {"tool": "calendar.list_events", "action": "read", "decision": "deny"},
+        ]}))
+        assert engine.evaluate("calendar.list_events", "read") == PermissionDecision.DENY
+
+    def test_get_risk_ignores_action(self):
+        engine = PermissionEngine()
+        assert engine.get_risk("system.execute_command") == "critical"
+        assert engine.get_risk("calendar.list_events") == "low"
+
+    def test_policy_file_change_invalidates(self, tmp_path):
+        path = tmp_path / "policy.json"
+        path.write_text(json.dumps({"permissions": [
+            {"tool": "web.search", "action": "read", "decision": "allow"},
+        ]}))
+        engine = PermissionEngine()
+        engine.load_policy(str(path))
+        assert engine.evaluate("web.search", "read") == PermissionDecision.ALLOW
+
+        path.write_text(json.dumps({"permissions": [
+            {"tool": "web.search", "action": "read", "decision": "deny"},
+        ]}))
+        st = os.stat(path)
+        os.utime(path, (st.st_atime, st.st_mtime + 5))
+        engine._policy_checked_at = 0.0  # skip the check interval
+        assert engine.evaluate("web.search", "read") == PermissionDecision.DENY
+
+
+def _engine(**kw) -> PolicyEngineV2:
+    kw.setdefault("redact_fields", {"gmail.*": {"body"}})
+    kw.setdefault("editable_fields", {})
+    return PolicyEngineV2(**kw)
+
+
+class TestPolicyEngineV2Compiled:
+    def test_execute_decision_redacts_lazily(self):
+        engine = _engine(risk_overrides={"gmail.list_messages": RiskTier.LOW})
+        calls = []
+        original = engine._redact
+
+        def counting(params, tool_name):
+            calls.append(tool_name)
+            return original(params, tool_name)
+
+        engine._redact = counting
+        d = engine.evaluate("gmail.list_messages", {"body": "secret text", "q": "x"})
+        assert d.action == "execute"
+        assert calls == []
+        assert d.display_params == {}
+        assert d.get_display_params()["body"] == "sec***ext"
+        assert d.get_display_params()["q"] == "x"
+        assert calls == ["gmail.list_messages"]
+
+    def test_execute_decision_redacts_params_as_evaluated(self):
+        engine = _engine()
+        params = {"body": "secret text"}
+        d = engine.evaluate("gmail.list_messages", params)
+        params["body"] = "changed later"
+        assert d.get_display_params() == {"body": "sec***ext"}
+        assert d.to_dict()["display_params"] == {"body": "sec***ext"}
+
+    def test_confirm_decision_redacts_once(self):
+        engine = _engine(risk_overrides={"gmail.send": RiskTier.MED})
+        calls = []
+        original = engine._redact
+        engine._redact = lambda p, t: calls.append(t) or original(p, t)
+        d = engine.evaluate("gmail.send", {"to": "a@b.c"})
+        assert d.action == "confirm"
+        assert len(calls) == 1
+
+    def test_wildcard_tiers_memoised(self):
+        engine = _engine(risk_overrides={"system.*": RiskTier.HIGH})
+        assert engine.get_risk_tier("system.shutdown") == RiskTier.HIGH
+        assert engine._tier_memo["system.shutdown"] == RiskTier.HIGH
+        assert engine.get_risk_tier("nope.tool") == RiskTier.MED
+
+    def test_redact_fields_include_globals_and_wildcards(self):
+        engine = _engine()
+        fields = engine.get_redact_fields("gmail.send")
+        assert {"body", "password", "token"} <= fields
+        fields.add("mutated")
+        assert "mutated" not in engine.get_redact_fields("gmail.send")
+
+    def test_policy_json_change_recompiles(self, tmp_path):
+        path = tmp_path / "policy.json"
+        path.write_text(json.dumps({"tool_levels": {"web.search": "safe"}}))
+        engine = _engine(policy_json_path=path, preset=PolicyPreset.BALANCED)
+        assert engine.get_risk_tier("web.search") == RiskTier.LOW
+
+        path.write_text(json.dumps({"tool_levels": {"web.search": "destructive"}}))
+        st = os.stat(path)
+        os.utime(path, (st.st_atime, st.st_mtime + 5))
+        engine._policy_checked_at = 0.0
+        assert engine.get_risk_tier("web.search") == RiskTier.HIGH
+
+    def test_map_changes_invalidate_memo(self):
+        engine = _engine(risk_overrides={"system.shutdown": RiskTier.HIGH})
+        assert engine.get_risk_tier("system.shutdown") == RiskTier.HIGH
+        engine.set_risk_tier("system.shutdown", RiskTier.LOW)
+        assert engine.get_risk_tier("system.shutdown") == RiskTier.LOW
+
+        engine.set_redact_fields("web.search", {"query"})
+        assert "query" in engine.get_redact_fields("web.search")
+        engine.set_redact_fields("web.search", {"url"})
+        assert "query" not in engine.get_redact_fields("web.search")
+
+        engine._risk_map["system.*"] = RiskTier.MED
+        engine._risk_map.pop("system.shutdown")
+        engine.invalidate()
+        assert engine.get_risk_tier("system.shutdown") == RiskTier.MED
+
+    def test_display_params_defaults(self):
+        decision = PolicyDecision(action="execute", tier=RiskTier.LOW)
+        assert decision.display_params == {}
+        assert PolicyDecision("confirm", RiskTier.MED, "p", {"a": 1}).display_params == {"a": 1}
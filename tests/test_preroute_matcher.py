@@ -0,0 +1,117 @@
+"""Tests for the compiled PreRouter / HybridNLU matcher.
+
+Covers:
+    - Aho–Corasick literal scan and case folding
+    - Rule trigger literals
+    - Compiled vs. rule-loop equivalence on the preroute corpus
+    - The benchmark script
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from bantz.nlu.hybrid import RegexPatterns
+from bantz.routing.preroute import (
+    CompiledRuleMatcher,
+    CompositeRule,
+    IntentCategory,
+    KeywordRule,
+    PatternRule,
+    PreRouteMatch,
+    PreRouter,
+    PreRouteRule,
+)
+from bantz.text.regex_literals import LiteralPrefilter, LiteralScanner, fold_case
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from bench_preroute import legacy_regex_match, load_corpus, main  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def corpus() -> list[str]:
+    texts = load_corpus(None)
+    return texts + [t.upper() for t in texts] + ["  İYİ MİSİN  ", "SAAT KAÇ", "", "   "]
+
+
+class TestLiteralScan:
+
+    def test_overlapping_literals(self):
+        scanner = LiteralScanner(["he", "she", "his", "hers"])
+        assert scanner.scan("ushers") == {"he", "she", "hers"}
+        assert scanner.scan("") == set()
+
+    def test_fold_case_matches_regex_ignorecase(self):
+        assert fold_case("İYİ MISIN") == "iyi misin"
+        prefilter = LiteralPrefilter([("iyi",), None, ("Merhaba",), ()])
+        assert prefilter.candidates("İYİ") == [0, 1]
+        assert prefilter.candidates("merhaba") == [1, 2]
+
+
+class TestTriggerLiterals:
+
+    def test_rule_types(self):
+        keyword = KeywordRule("k", IntentCategory.GREETING, ["Merhaba", "selam"])
+        pattern = PatternRule("p", IntentCategory.TIME_QUERY, [r"saat\s+kaç", r"what\s+time"])
+        wildcard = PatternRule("w", IntentCategory.SMALLTALK, [r"^.{1,3}$"])
+        assert keyword.trigger_literals() == ("merhaba", "selam")
+        assert set(pattern.trigger_literals()) == {"saat", "what"}
+        assert wildcard.trigger_literals() is None
+        assert CompositeRule("c", IntentCategory.GREETING, [keyword, wildcard]).trigger_literals() is None
+        assert CompositeRule(
+            "c", IntentCategory.GREETING, [keyword, wildcard], require_all=True,
+        ).trigger_literals() == ("merhaba", "selam")
+
+    def test_rules_without_triggers_always_run(self):
+        class AnythingRule(PreRouteRule):
+            def match(self, text: str) -> PreRouteMatch:
+                return PreRouteMatch.create(self.intent, 0.99, self.name)
+
+        rules = [KeywordRule("k", IntentCategory.GREETING, ["merhaba"]), AnythingRule("any", IntentCategory.SMALLTALK)]
+        matcher = CompiledRuleMatcher(rules)
+        assert [r.name for r in matcher.candidates("xyz")] == ["any"]
+        assert [m.rule_name for m in matcher.match_all("merhaba")] == ["k", "any"]
+
+
+class TestEquivalence:
+
+    def test_preroute_matches_rule_loop(self, corpus):
+        compiled, loop = PreRouter(), PreRouter(compiled=False)
+        for text in corpus:
+            for pending in (False, True):
+                a = compiled.route(text, has_pending_confirmation=pending)
+                b = loop.route(text, has_pending_confirmation=pending)
+                assert (a.matched, a.intent, a.confidence, a.rule_name, a.extracted) == (
+                    b.matched, b.intent, b.confidence, b.rule_name, b.extracted,
+                ), text
+        assert compiled.get_stats() == loop.get_stats()
+
+    def test_regex_patterns_match_legacy_loop(self, corpus):
+        patterns = RegexPatterns()
+        for text in corpus:
+            a, b = patterns.match(text), legacy_regex_match(patterns, text)
+            assert (a and (a.intent, a.slots)) == (b and (b.intent, b.slots)), text
+
+    def test_rule_edits_rebuild_matcher(self):
+        router = PreRouter()
+        assert not router.route("pizza sipariş et").matched
+        router.add_rule(KeywordRule("pizza", IntentCategory.SMALLTALK, ["pizza"], confidence=0.99))
+        assert router.route("pizza sipariş et").rule_name == "pizza"
+        router.remove_rule("pizza")
+        assert not router.route("pizza sipariş et").matched
+
+
+class TestBenchmark:
+
+    def test_cli(self, tmp_path, capsys):
+        corpus = tmp_path / "inputs.txt"
+        corpus.write_text("merhaba\nsaat kaç\nbugün takvimde ne var\nyoutube aç\n", encoding="utf-8")
+        assert main(["--corpus", str(corpus), "--repeat", "1", "--format", "json"]) == 0
+        result = json.loads(capsys.readouterr().out)
+        assert result["inputs"] == 4
+        assert result["preroute"]["rules_evaluated"] < result["preroute"]["rules"]
+        assert result["hybrid_nlu"]["patterns_evaluated"] < result["hybrid_nlu"]["patterns"]
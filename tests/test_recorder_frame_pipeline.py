@@ -0,0 +1,160 @@
+"""Tests for the frame-diffed recorder pipeline (Issue #7)."""
+import importlib.util
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+def _load_frame_pipeline():
+    # Loaded by path: importing bantz.ui pulls in the Qt overlay, and the
+    # pipeline itself only needs numpy.
+    path = Path(__file__).resolve().parent.parent / "src" / "bantz" / "ui" / "streaming" / "frame_pipeline.py"
+    spec = importlib.util.spec_from_file_location("_frame_pipeline", path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses may inspect sys.modules[cls.__module__] for string annotations.
+    sys.modules["_frame_pipeline"] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+_fp = _load_frame_pipeline()
+FramePipeline, PipelineStats, TileDiff = _fp.FramePipeline, _fp.PipelineStats, _fp.TileDiff
+
+
+W, H = 200, 130  # deliberately not multiples of the tile size
+
+
+def _frame(value: int = 0) -> "np.ndarray":
+    return np.full((H, W, 4), value, dtype=np.uint8)
+
+
+class _Sink:
+    def __init__(self, delay: float = 0.0):
+        self.frames = []
+        self.delay = delay
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def __call__(self, frame):
+        self.gate.wait()
+        if self.delay:
+            time.sleep(self.delay)
+        self.frames.append(frame.copy())
+
+
+class TestTileDiff:
+    def test_first_frame_fully_damaged(self):
+        d = TileDiff(W, H, tile=64)
+        assert d.update(_frame()).shape == (3, 4)
+        assert d.update(_frame()).any() == False  # noqa: E712
+
+    def test_single_pixel_marks_one_tile(self):
+        d = TileDiff(W, H, tile=64)
+        d.update(_frame())
+        f = _frame()
+        f[129, 199, 1] = 7  # bottom-right edge tile
+        mask = d.update(f)
+        assert mask.sum() == 1
+        assert mask[2, 3]
+
+    def test_regions_merge_adjacent_tiles(self):
+        d = TileDiff(W, H, tile=64)
+        d.update(_frame())
+        f = _frame()
+        f[10, 10] = 1
+        f[10, 70] = 1
+        f[100, 195] = 1
+        assert d.regions(d.update(f)) == [(0, 64, 0, 128), (64, 128, 192, 200)]
+
+
+class TestFramePipeline:
+    def test_unchanged_frames_duplicated(self):
+        sink = _Sink()
+        pipe = FramePipeline(sink, W, H)
+        pipe.start()
+        for value in (1, 1, 1, 2):
+            pipe.submit(_frame(value))
+        stats = pipe.stop()
+        assert stats.captured == 4
+        assert stats.changed == 2
+        assert stats.duplicated == 2
+        assert stats.encoded == 4
+        assert [int(f[0, 0, 0]) for f in sink.frames] == [1, 1, 1, 2]
+        assert sink.frames[0].shape == (H, W, 3)
+
+    def test_unchanged_frames_skipped(self):
+        sink = _Sink()
+        pipe = FramePipeline(sink, W, H, unchanged="skip")
+        pipe.start()
+        for value in (1, 1, 1, 2):
+            pipe.submit(_frame(value))
+        stats = pipe.stop()
+        assert stats.skipped == 2
+        assert len(sink.frames) == 2
+
+    def test_damage_regions_rebuild_frame(self):
+        sink = _Sink()
+        pipe = FramePipeline(sink, W, H, damage_regions=True)
+        pipe.start()
+        base = _frame(5)
+        pipe.submit(base)
+        changed = base.copy()
+        changed[100:110, 150:160, :3] = 9
+        pipe.submit(changed)
+        pipe.stop()
+        assert len(sink.frames) == 2
+        assert np.array_equal(sink.frames[1], changed[:, :, :3])
+
+    def test_damage_regions_without_diff_sends_whole_frames(self):
+        sink = _Sink()
+        pipe = FramePipeline(sink, W, H, damage_regions=True, diff=False)
+        pipe.start()
+        for value in (1, 2, 3):
+            assert pipe.submit(_frame(value))
+        stats = pipe.stop()
+        assert stats.dropped == 0
+        assert [int(f[0, 0, 0]) for f in sink.frames] == [1, 2, 3]
+
+    def test_full_queue_drops_and_resends(self):
+        sink = _Sink()
+        sink.gate.clear()  # encoder blocked
+        pipe = FramePipeline(sink, W, H, queue_size=1)
+        pipe.start()
+        results = [pipe.submit(_frame(v)) for v in (1, 2, 3, 4)]
+        assert results.count(False) >= 1
+        assert pipe.stats.dropped >= 1
+        sink.gate.set()
+        time.sleep(0.05)
+        # An unchanged capture after a drop must not duplicate stale content.
+        pipe.submit(_frame(4))
+        pipe.stop()
+        assert int(sink.frames[-1][0, 0, 0]) == 4
+
+    def test_render_hook_runs_on_encoder(self):
+        seen = []
+        sink = _Sink()
+
+        def render(frame, ts):
+            seen.append((threading.current_thread().name, ts))
+            return frame
+
+        pipe = FramePipeline(sink, W, H, render=render)
+        pipe.start()
+        pipe.submit(_frame(1), timestamp=1.5)
+        pipe.stop()
+        assert seen == [("bantz-recorder-encode", 1.5)]
+
+    def test_stats(self):
+        stats = PipelineStats(encoded=40, started_at=10.0, stopped_at=12.0, damaged_tiles=3, total_tiles=12)
+        assert stats.achieved_fps == 20.0
+        assert stats.to_dict()["damage_ratio"] == 0.25
+
+    def test_invalid_unchanged_mode(self):
+        with pytest.raises(ValueError):
+            FramePipeline(_Sink(), W, H, unchanged="drop")
@@ -0,0 +1,182 @@
+"""
+Tests for the single-pass redaction engine (bantz.privacy.engine).
+
+Covers:
+- One scan per string, priority order, spans and counts
+- Templates, callables, per-rule flags and segment fallback
+- Required-literal prefilter and result cache
+- All four redactors routed through the engine
+"""
+
+import re
+
+import pytest
+
+from bantz.privacy.engine import (
+    RedactionEngine,
+    RedactionRule,
+    _required_literals,
+    compile_engine,
+)
+
+EMAIL = RedactionRule("email", r"[\w.+-]+@[\w-]+\.[\w.]+", "[EMAIL]")
+PHONE = RedactionRule("phone", r"\+\d{10,15}", "[PHONE]")
+
+
+class TestScan:
+    def test_single_pass_with_spans_and_counts(self):
+        engine = RedactionEngine([EMAIL, PHONE])
+        text = "a@b.co or +905321234567, c@d.org"
+        result = engine.scan(text)
+        assert engine.passes == 1
+        assert result.redacted == "[EMAIL] or [PHONE], [EMAIL]"
+        assert result.counts == {"email": 2, "phone": 1}
+        assert result.total == 3
+        assert result.rules_matched == ["email", "phone"]
+        assert [text[s.start:s.end] for s in result.spans] == ["a@b.co", "+905321234567", "c@d.org"]
+
+    def test_earlier_rule_wins_at_same_position(self):
+        broad = RedactionRule("digits", r"\d+", "[N]")
+        narrow = RedactionRule("year", r"20\d\d", "[YEAR]")
+        assert RedactionEngine([narrow, broad]).redact("2024 42") == "[YEAR] [N]"
+        assert RedactionEngine([broad, narrow]).redact("2024 42") == "[N] [N]"
+
+    def test_earlier_rule_wins_over_leftmost_overlap(self):
+        # "run" matches further left and swallows the TR number, but "tr"
+        # has priority: as with one re.sub per rule, it is redacted first
+        # and the id is then still found on its own.
+        tr = RedactionRule("tr", r"TR\d\d(?: \d{4}){2}", "[TR]")
+        run = RedactionRule("run", r"\b[A-Z0-9]{2,}(?: [A-Z0-9]{4}){2,}", "[RUN]")
+        ident = RedactionRule("id", r"\b[A-Z]{2}\d{7}\b", "[ID]")
+        result = RedactionEngine([tr, run, ident]).scan("AB1234567 TR33 0006 1005")
+        assert result.redacted == "[ID] [TR]"
+        assert result.counts == {"tr": 1, "id": 1}
+        assert [(s.start, s.end, s.rule) for s in result.spans] == [(10, 24, "tr")]
+
+    def test_non_overlapping_matches_stay_single_pass(self):
+        ident = RedactionRule("id", r"\b[A-Z]{2}\d{7}\b", "[ID]")
+        result = RedactionEngine([PHONE, ident]).scan("+905321234567 AB1234567")
+        assert result.redacted == "[PHONE] [ID]"
+        assert [s.rule for s in result.spans] == ["phone", "id"]
+
+    def test_template_and_callable_replacements(self):
+        engine = RedactionEngine([
+            RedactionRule("url", r"(https?://)[^:@/\s]+:[^@/\s]+@(\S+)", r"\1***@\2"),
+            RedactionRule("name", r"user=(\w)\w*", lambda m: f"user={m.group(1)}***"),
+        ])
+        assert engine.redact("http://u:p@host/x user=alice") == "http://***@host/x user=a***"
+
+    def test_flags_are_scoped_per_rule(self):
+        engine = RedactionEngine([
+            RedactionRule("secret", r"(?i)secret=\S+", "[S]"),
+            RedactionRule("code", r"ABC\d+", "[C]"),
+        ])
+        assert engine.redact("SECRET=x ABC1 abc2") == "[S] [C] abc2"
+
+    def test_compiled_pattern_accepted(self):
+        rule = RedactionRule("tok", re.compile(r"tok_\w+", re.I), "[T]")
+        assert RedactionEngine([rule]).redact("TOK_abc") == "[T]"
+
+    def test_backreference_rule_gets_its_own_scan(self):
+        engine = RedactionEngine([
+            RedactionRule("quoted", r"(['\"]).+?\1", "[Q]"),
+            EMAIL,
+        ])
+        assert engine.passes == 2
+        assert engine.redact("say 'hi' to a@b.co") == "say [Q] to [EMAIL]"
+
+    def test_invalid_rule_raises(self):
+        with pytest.raises(re.error):
+            RedactionEngine([RedactionRule("bad", r"(", "x")])
+
+    def test_empty_text(self):
+        assert RedactionEngine([EMAIL]).scan("").redacted == ""
+
+
+class TestPrefilter:
+    def test_required_literals(self):
+        assert _required_literals(r"\bapi[_-]?key=\S+", 0) == ("key=",)
+        assert _required_literals(r"(?:Sokak|Cadde)\s+\d+", re.I) == ("cadde", "sokak")
+        assert _required_literals(r"\d{3}-\d{4}", 0) == ("-",)
+        assert _required_literals(r"\d+", 0) is None
+
+    def test_skipped_rules_do_not_change_output(self):
+        mahalle = RedactionRule("mahalle", r"\b[\w\s]{2,20}\s+Mah\.?\s*No:\s*\d+", "[ADDR]", re.I)
+        engine = RedactionEngine([mahalle, EMAIL])
+        assert engine.redact("a@b.co") == "[EMAIL]"
+        assert engine.redact("Moda MAH. No: 5, a@b.co") == "[ADDR], [EMAIL]"
+
+    def test_case_fold_fixes(self):
+        rule = RedactionRule("pw", r"password=\S+", "[PW]", re.I)
+        assert RedactionEngine([rule]).redact("PAſSWORD=x") == "[PW]"
+        tc = RedactionRule("tc", r"kimlik no\s*\d+", "[TC]", re.I)
+        assert RedactionEngine([tc]).redact("KİMLİK NO 12345") == "[TC]"
+
+
+class TestCache:
+    def test_repeated_text_is_served_from_cache(self):
+        engine = RedactionEngine([EMAIL])
+        first = engine.scan("mail a@b.co")
+        assert engine.scan("mail a@b.co") is first
+        assert (engine.hits, engine.misses) == (1, 1)
+        engine.clear_cache()
+        assert engine.scan("mail a@b.co") is not first
+
+    def test_cache_is_bounded(self):
+        engine = RedactionEngine([EMAIL], cache_size=2)
+        for text in ("a", "b", "c"):
+            engine.scan(text)
+        engine.scan("a")
+        assert engine.hits == 0
+
+    def test_compile_engine_is_shared(self):
+        assert compile_engine((EMAIL, PHONE)) is compile_engine((EMAIL, PHONE))
+
+
+class TestCallSites:
+    def test_pii_redactor_counts_from_scan(self):
+        from bantz.security.pii_redaction import PIIRedactor
+
+        result = PIIRedactor().redact("ali@example.com ve veli@example.com")
+        assert result.redaction_count == 2
+        assert result.patterns_matched == ["email"]
+
+    @pytest.mark.parametrize("level", ["STANDARD", "STRICT"])
+    @pytest.mark.parametrize("text", [
+        "AB1234567 TR33 0006 1005 1978 6457 8413 26",
+        "Kart: AB1234567 4111 1111 1111 1111",
+    ])
+    def test_pii_redactor_matches_per_pattern_passes(self, level, text):
+        from bantz.security.pii_redaction import PIIRedactor, RedactionLevel
+
+        redactor = PIIRedactor(level=RedactionLevel[level])
+        expected = text
+        for pattern in redactor.patterns:
+            expected = pattern.redact(expected)
+        assert redactor.redact(text).redacted == expected
+
+    def test_pii_redactor_keeps_passport_and_iban(self):
+        from bantz.security.pii_redaction import PIIRedactor, RedactionLevel
+
+        result = PIIRedactor(level=RedactionLevel.STANDARD).redact(
+            "AB1234567 TR33 0006 1005 1978 6457 8413 26"
+        )
+        assert result.redacted == "<PASSPORT> <IBAN>"
+
+    def test_data_masker(self):
+        from bantz.security.masking import DataMasker
+
+        masker = DataMasker()
+        assert "ali@example.com" not in masker.mask("mail: ali@example.com")
+
+    def test_privacy_redact_pii_stats(self):
+        from bantz.privacy.redaction import redact_pii
+
+        text, stats = redact_pii("ali@example.com, veli@example.com", collect_stats=True)
+        assert "@example.com" not in text
+        assert stats.total_redactions == 2
+
+    def test_audit_log_redact_pii(self):
+        from bantz.security.audit_log import redact_pii
+
+        assert redact_pii("ali@example.com token=abc /home/ali/x") == "a***@***.com [REDACTED] ~/.../x"
@@ -0,0 +1,181 @@
+"""Tests for the concurrent replay engine.
+
+Covers:
+    - ReplayEngine in-flight limit, prompt cache, errors, lazy input
+    - replay_dataset streaming, ordering and incremental ReplaySummary
+    - replay_golden_traces with concurrent router calls
+"""
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from bantz.brain import trace_exporter
+from bantz.router.misroute_collector import MisrouteDataset, MisrouteRecord, replay_dataset
+from bantz.router.replay_engine import ReplayEngine, default_max_in_flight
+
+
+class SlowRouter:
+    """Router stand-in that records calls and peak concurrency."""
+
+    def __init__(self, delay: float = 0.05, fail_on: str | None = None):
+        self.delay = delay
+        self.fail_on = fail_on
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.calls: list[str] = []
+
+    def __call__(self, text: str) -> dict:
+        with self.lock:
+            self.calls.append(text)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            time.sleep(self.delay)
+            if self.fail_on and self.fail_on in text:
+                raise RuntimeError("router down")
+            route = "calendar" if "takvim" in text else "smalltalk"
+            return {"route": route, "intent": "query", "slots": {}, "confidence": 0.9, "tools": []}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+@pytest.fixture
+def dataset_path(tmp_path):
+    path = tmp_path / "misroutes.jsonl"
+    dataset = MisrouteDataset(path=str(path), redact=False)
+    for i in range(12):
+        dataset.append(MisrouteRecord(
+            user_text=f"takvim {i % 4}",
+            router_route="smalltalk",
+            router_intent="query",
+            expected_route="calendar",
+            reason="wrong_route",
+        ))
+    return str(path)
+
+
+# ─────────────────────────────────────────────────────────────────
+# Engine
+# ─────────────────────────────────────────────────────────────────
+
+class TestReplayEngine:
+
+    def test_respects_in_flight_limit(self):
+        router = SlowRouter(delay=0.05)
+        engine = ReplayEngine(router, max_in_flight=4, cache=False)
+        calls = list(engine.run(f"soru {i}" for i in range(12)))
+        assert len(calls) == 12
+        assert router.peak == 4
+        assert sorted(c.index for c in calls) == list(range(12))
+
+    def test_concurrency_speeds_up(self):
+        router = SlowRouter(delay=0.05)
+        start = time.monotonic()
+        list(ReplayEngine(router, max_in_flight=8, cache=False).run(f"soru {i}" for i in range(16)))
+        assert time.monotonic() - start < 0.4  # sequential would take 0.8s
+
+    def test_identical_prompts_routed_once(self):
+        router = SlowRouter(delay=0.02)
+        engine = ReplayEngine(router, max_in_flight=4)
+        calls = list(engine.run(["a", "b", "a", "a", "b", "c"]))
+        assert sorted(router.calls) == ["a", "b", "c"]
+        assert sum(c.cached for c in calls) == 3
+        assert engine.stats()["cache_hits"] == 3
+        assert {c.prompt: c.result["route"] for c in calls} == {"a": "smalltalk", "b": "smalltalk", "c": "smalltalk"}
+
+    def test_errors_are_reported_and_not_cached(self):
+        router = SlowRouter(delay=0, fail_on="bozuk")
+        engine = ReplayEngine(router, max_in_flight=1)
+        calls = list(engine.run(["bozuk", "iyi", "bozuk"]))
+        assert [type(c.error) for c in calls] == [RuntimeError, type(None), RuntimeError]
+        assert router.calls.count("bozuk") == 2
+
+    def test_input_consumed_lazily(self):
+        pulled = []
+
+        def items():
+            for i in range(100):
+                pulled.append(i)
+                yield f"soru {i}"
+
+        run = ReplayEngine(SlowRouter(delay=0.01), max_in_flight=3).run(items())
+        next(run)
+        assert len(pulled) <= 4
+        run.close()
+
+    def test_sequential_mode_runs_inline(self):
+        seen = []
+        engine = ReplayEngine(lambda text: seen.append(threading.current_thread()) or {}, max_in_flight=1)
+        list(engine.run(["x", "y"]))
+        assert seen == [threading.main_thread()] * 2
+
+    def test_env_default(self, monkeypatch):
+        monkeypatch.setenv("BANTZ_REPLAY_CONCURRENCY", "3")
+        assert default_max_in_flight() == 3
+        assert ReplayEngine(dict).max_in_flight == 3
+        monkeypatch.setenv("BANTZ_REPLAY_CONCURRENCY", "bogus")
+        assert default_max_in_flight() == 8
+
+
+# ─────────────────────────────────────────────────────────────────
+# replay_dataset / replay_golden_traces
+# ─────────────────────────────────────────────────────────────────
+
+class TestReplayDataset:
+
+    def test_concurrent_replay_matches_sequential(self, dataset_path):
+        sequential = replay_dataset(SlowRouter(delay=0), dataset_path, max_in_flight=1, cache=False)
+        concurrent = replay_dataset(SlowRouter(delay=0.01), dataset_path, max_in_flight=6)
+        assert concurrent.to_dict() | {"cache_hits": 0, "elapsed_s": 0} == \
+            sequential.to_dict() | {"elapsed_s": 0}
+        assert [r.record.user_text for r in concurrent.results] == [f"takvim {i % 4}" for i in range(12)]
+
+    def test_cache_hits_counted(self, dataset_path):
+        router = SlowRouter(delay=0.01)
+        summary = replay_dataset(router, dataset_path, max_in_flight=4)
+        assert len(router.calls) == 4
+        assert summary.cache_hits == 8
+        assert summary.improved == 12
+        assert summary.route_accuracy == 1.0
+
+    def test_incremental_progress(self, dataset_path):
+        snapshots = []
+        replay_dataset(
+            SlowRouter(delay=0), dataset_path, limit=5, max_in_flight=2,
+            on_progress=lambda s: snapshots.append((s.total, s.improved, s.route_accuracy)),
+        )
+        assert [t for t, _, _ in snapshots] == [1, 2, 3, 4, 5]
+        assert snapshots[-1] == (5, 5, 1.0)
+
+    def test_errors_count_against_accuracy(self, dataset_path):
+        summary = replay_dataset(SlowRouter(delay=0, fail_on="takvim 0"), dataset_path, max_in_flight=4)
+        assert summary.total == 12
+        assert summary.errors == 3
+        assert summary.route_accuracy == pytest.approx(9 / 12)
+
+
+class TestReplayGoldenTraces:
+
+    def test_concurrent_router(self, tmp_path, monkeypatch):
+        goldens = [
+            {"user_input": "takvim", "route": "calendar", "tools": []},
+            {"user_input": "selam", "route": "calendar", "tools": []},
+            {"user_input": "takvim", "route": "calendar", "tools": []},
+        ]
+        monkeypatch.setattr(trace_exporter, "load_golden_traces", lambda: goldens)
+        router = SlowRouter(delay=0.01)
+        result = trace_exporter.replay_golden_traces(router, max_in_flight=4)
+        assert result["total"] == 3
+        assert result["failed"] == 1
+        assert result["diffs"][0]["turn"] == 2
+        assert sorted(router.calls) == ["selam", "takvim"]
+
+    def test_router_errors_propagate(self, monkeypatch):
+        monkeypatch.setattr(trace_exporter, "load_golden_traces", lambda: [{"user_input": "bozuk"}])
+        with pytest.raises(RuntimeError):
+            trace_exporter.replay_golden_traces(SlowRouter(delay=0, fail_on="bozuk"))
@@ -0,0 +1,213 @@
+"""Tests for the router decision cache (bantz.brain.router_cache)."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from bantz.brain.llm_router import JarvisLLMOrchestrator, OrchestratorOutput
+from bantz.brain.router_cache import (
+    RouterCacheTracker,
+    RouterResponseCache,
+    normalize_utterance,
+    state_fingerprint,
+)
+
+CALENDAR_JSON = json.dumps({
+    "route": "calendar", "calendar_intent": "query", "slots": {"window_hint": "today"},
+    "confidence": 0.9, "tool_plan": ["calendar.list_events"], "assistant_reply": "",
+})
+UNKNOWN_JSON = json.dumps({
+    "route": "unknown", "calendar_intent": "none", "slots": {},
+    "confidence": 0.1, "tool_plan": [], "assistant_reply": "",
+})
+
+
+class CountingLLM:
+    model_context_length = 32768
+
+    def __init__(self, response: str = CALENDAR_JSON):
+        self.response = response
+        self.calls = 0
+
+    def complete_text(self, *, prompt: str) -> str:
+        self.calls += 1
+        return self.response
+
+
+class FakeEmbedder:
+    """Bag-of-words vectors over a tiny vocabulary."""
+
+    VOCAB = ("bugün", "takvim", "takvimimde", "ne", "var", "neler", "mail")
+
+    def embed(self, text: str) -> list[float]:
+        words = text.split()
+        return [float(words.count(w)) for w in self.VOCAB]
+
+
+def make_output(route: str = "calendar") -> OrchestratorOutput:
+    return OrchestratorOutput(
+        route=route, calendar_intent="query", slots={"window_hint": "today"},
+        confidence=0.9, tool_plan=["calendar.list_events"], assistant_reply="",
+    )
+
+
+@pytest.fixture
+def tracker() -> RouterCacheTracker:
+    return RouterCacheTracker()
+
+
+class TestKeys:
+
+    def test_normalize_utterance(self):
+        assert normalize_utterance("  Bugün TAKVİMİMDE ne var?! ") == "bugün takvimimde ne var"
+        assert normalize_utterance("Iğdır") == "ığdır"
+
+    def test_fingerprint_uses_state_and_date_only(self):
+        base = {"current_datetime": "2026-01-30T10:00:00+03:00", "recent_conversation": ["a"]}
+        later = {"current_datetime": "2026-01-30T18:45:12+03:00", "recent_conversation": ["b"]}
+        assert state_fingerprint(base) == state_fingerprint(later)
+        assert state_fingerprint(base) != state_fingerprint({"current_datetime": "2026-01-31T10:00:00+03:00"})
+        assert state_fingerprint(base) != state_fingerprint(base, pending_confirmation="calendar.create_event")
+        assert state_fingerprint(base) != state_fingerprint({**base, "active_entity": "evt-1"})
+        assert state_fingerprint(None) == ""
+
+    def test_fingerprint_includes_dialog_state(self):
+        ctx = {"current_datetime": "2026-01-30T10:00:00+03:00"}
+        asked = state_fingerprint(ctx, dialog_summary="Bantz: Toplantı ne zaman olsun?")
+        assert asked != state_fingerprint(ctx)
+        assert asked != state_fingerprint(ctx, dialog_summary="Bantz: Alarm ne zaman çalsın?")
+        assert state_fingerprint(ctx, retrieved_memory="ali: doktor") != state_fingerprint(ctx)
+
+
+class TestRouterResponseCache:
+
+    def test_hit_returns_independent_copy(self, tracker):
+        cache = RouterResponseCache(tracker=tracker)
+        cache.put("bugün takvimimde ne var", None, make_output())
+        hit = cache.get("Bugün takvimimde ne var?")
+        assert hit is not None and hit.route == "calendar"
+        hit.slots["title"] = "mutated"
+        assert "title" not in cache.get("bugün takvimimde ne var").slots
+        assert tracker.summary()["hits"] == 2
+
+    def test_ttl_expiry(self, tracker, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("bantz.brain.router_cache.time.monotonic", lambda: now[0])
+        cache = RouterResponseCache(ttl_seconds=10, tracker=tracker)
+        cache.put("mailleri kontrol et", None, make_output("gmail"))
+        now[0] += 11
+        assert cache.get("mailleri kontrol et") is None
+        assert tracker.summary()["expirations"] == 1
+
+    def test_lru_eviction(self, tracker):
+        cache = RouterResponseCache(max_entries=2, tracker=tracker)
+        for text in ("a", "b", "c"):
+            cache.put(text, None, make_output())
+        assert cache.get("a") is None
+        assert cache.get("c") is not None
+        assert tracker.summary()["evictions"] == 1
+
+    def test_registry_change_invalidates(self, tracker):
+        cache = RouterResponseCache(tracker=tracker)
+        cache.put("saat kaç", None, make_output("system"), registry_key=("tools", 1))
+        assert cache.get("saat kaç", registry_key=("tools", 1)) is not None
+        assert cache.get("saat kaç", registry_key=("tools", 2)) is None
+        assert len(cache) == 0
+        assert tracker.summary()["invalidations"] == 1
+
+    def test_semantic_tier(self, tracker):
+        cache = RouterResponseCache(embedder=FakeEmbedder(), similarity_threshold=0.7, tracker=tracker)
+        ctx = {"current_datetime": "2026-01-30T10:00:00"}
+        assert cache.get("bugün takvimimde ne var", ctx) is None
+        cache.put("bugün takvimimde ne var", ctx, make_output())
+        assert cache.get("bugün takvimimde neler var", ctx) is not None
+        assert cache.get("bugün takvimimde neler var", ctx, pending_confirmation="x") is None
+        assert cache.get("mail var mı", ctx) is None
+        summary = tracker.summary()
+        assert summary["semantic_hits"] == 1
+        assert summary["hits_per_100"] == 25.0
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.delenv("BANTZ_ROUTER_CACHE", raising=False)
+        assert RouterResponseCache.from_env() is None
+        monkeypatch.setenv("BANTZ_ROUTER_CACHE", "1")
+        monkeypatch.setenv("BANTZ_ROUTER_CACHE_TTL", "42")
+        cache = RouterResponseCache.from_env()
+        assert cache is not None and cache.ttl_seconds == 42.0
+
+
+class TestOrchestratorIntegration:
+
+    def make_router(self, llm, tracker) -> JarvisLLMOrchestrator:
+        return JarvisLLMOrchestrator(llm=llm, response_cache=RouterResponseCache(tracker=tracker))
+
+    def test_repeated_input_skips_llm(self, tracker):
+        llm = CountingLLM()
+        router = self.make_router(llm, tracker)
+        first = router.route(user_input="bugün takvimimde ne var")
+        second = router.route(user_input="bugün takvimimde ne var ?")
+        assert llm.calls == 1
+        assert second.route == first.route == "calendar"
+        assert second.tool_plan == first.tool_plan
+
+    def test_state_change_misses(self, tracker):
+        llm = CountingLLM()
+        router = self.make_router(llm, tracker)
+        router.route(user_input="ekle", session_context={"current_datetime": "2026-01-30T10:00:00"})
+        router.route(
+            user_input="ekle",
+            session_context={"current_datetime": "2026-01-30T10:00:00"},
+            pending_confirmation="calendar.create_event",
+        )
+        assert llm.calls == 2
+
+    def test_pending_confirmation_stays_out_of_prompt(self, tracker):
+        llm = CountingLLM()
+        prompts: list[str] = []
+        complete = llm.complete_text
+        llm.complete_text = lambda *, prompt: prompts.append(prompt) or complete(prompt=prompt)
+        router = self.make_router(llm, tracker)
+        router.route(user_input="ekle", pending_confirmation="calendar.create_event")
+        assert "pending_confirmation" not in prompts[0]
+
+    def test_clarification_answer_depends_on_dialog(self, tracker):
+        llm = CountingLLM()
+        router = self.make_router(llm, tracker)
+        ctx = {"current_datetime": "2026-01-30T10:00:00"}
+        router.route(user_input="yarın saat 3", dialog_summary="Bantz: Toplantı ne zaman olsun?", session_context=ctx)
+        router.route(user_input="yarın saat 3", dialog_summary="Bantz: Alarm ne zaman çalsın?", session_context=ctx)
+        assert llm.calls == 2
+        router.route(user_input="yarın saat 3", dialog_summary="Bantz: Alarm ne zaman çalsın?", session_context=ctx)
+        assert llm.calls == 2
+
+    def test_uncacheable_decisions_and_bypasses(self, tracker):
+        llm = CountingLLM(UNKNOWN_JSON)
+        router = self.make_router(llm, tracker)
+        router.route(user_input="asdf qwer")
+        router.route(user_input="asdf qwer")
+        assert llm.calls == 2  # low-confidence unknown is not cached
+
+        llm.response = CALENDAR_JSON
+        router.route(user_input="onları göster")
+        router.route(user_input="onları göster")
+        router.route(user_input="bugün ne var", temperature=0.7)
+        router.route(user_input="bugün ne var", temperature=0.7)
+        assert llm.calls == 6
+        assert tracker.summary()["bypasses"] == 2
+
+    def test_tool_sync_invalidates(self, tracker, monkeypatch):
+        monkeypatch.setattr(JarvisLLMOrchestrator, "_VALID_TOOLS", JarvisLLMOrchestrator._VALID_TOOLS)
+        monkeypatch.setattr(JarvisLLMOrchestrator, "SYSTEM_PROMPT", JarvisLLMOrchestrator.SYSTEM_PROMPT)
+        llm = CountingLLM()
+        router = self.make_router(llm, tracker)
+        router.route(user_input="bugün takvimimde ne var")
+        JarvisLLMOrchestrator.sync_valid_tools(sorted(JarvisLLMOrchestrator._VALID_TOOLS - {"gmail.send"}))
+        router.route(user_input="bugün takvimimde ne var")
+        assert llm.calls == 2
+
+    def test_disabled_by_default(self, monkeypatch):
+        monkeypatch.delenv("BANTZ_ROUTER_CACHE", raising=False)
+        router = JarvisLLMOrchestrator(llm=CountingLLM())
+        assert router.response_cache is None
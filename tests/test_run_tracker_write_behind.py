@@ -0,0 +1,180 @@
+"""
+Tests for the batched write-behind path of RunTracker.
+
+Covers:
+- WriteBehindQueue batching, ordering, size trigger and close flush
+- Bad rows falling back to per-row commits
+- RunTracker read-your-writes, shutdown flush and inline mode
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from bantz.data.run_tracker import RunTracker
+from bantz.data.write_behind import WriteBehindQueue
+
+
+_SQL = "INSERT INTO t (k, v) VALUES (?, ?)"
+
+
+@pytest.fixture
+def conn():
+    c = sqlite3.connect(":memory:", check_same_thread=False)
+    c.execute("CREATE TABLE t (k INTEGER PRIMARY KEY, v TEXT NOT NULL)")
+    c.commit()
+    yield c
+    c.close()
+
+
+def _count(conn):
+    return conn.execute("SELECT COUNT(*) FROM t").fetchone()[0]
+
+
+class TestWriteBehindQueue:
+    def test_rows_committed_in_one_batch(self, conn):
+        q = WriteBehindQueue(conn, flush_interval_ms=10_000, max_batch=1000)
+        for i in range(50):
+            q.submit(_SQL, (i, "x"))
+        assert q.pending == 50
+        assert q.flush() == 50
+        assert _count(conn) == 50
+        assert q.stats.batches == 1
+        assert q.stats.largest_batch == 50
+        q.close()
+
+    def test_interval_flush(self, conn):
+        q = WriteBehindQueue(conn, flush_interval_ms=5)
+        q.submit(_SQL, (1, "a"))
+        deadline = time.time() + 2
+        while q.pending and time.time() < deadline:
+            time.sleep(0.005)
+        assert q.pending == 0
+        assert q.stats.written == 1
+        q.close()
+
+    def test_size_trigger_wakes_writer(self, conn):
+        q = WriteBehindQueue(conn, flush_interval_ms=60_000, max_batch=8)
+        for i in range(8):
+            q.submit(_SQL, (i, "x"))
+        deadline = time.time() + 2
+        while q.stats.written < 8 and time.time() < deadline:
+            time.sleep(0.005)
+        assert q.stats.written == 8
+        q.close()
+
+    def test_close_flushes_and_late_writes_go_inline(self, conn):
+        q = WriteBehindQueue(conn, flush_interval_ms=60_000)
+        q.submit(_SQL, (1, "a"))
+        q.close()
+        assert _count(conn) == 1
+        q.submit(_SQL, (2, "b"))
+        assert _count(conn) == 2
+
+    def test_order_preserved_across_statements(self, conn):
+        q = WriteBehindQueue(conn, flush_interval_ms=60_000)
+        q.submit(_SQL, (1, "first"))
+        q.submit("UPDATE t SET v = ? WHERE k = ?", ("second", 1))
+        q.submit(_SQL.replace("INSERT", "INSERT OR REPLACE"), (1, "third"))
+        q.close()
+        assert conn.execute("SELECT v FROM t").fetchone()[0] == "third"
+
+    def test_bad_row_does_not_lose_batch(self, conn):
+        q = WriteBehindQueue(conn, flush_interval_ms=60_000)
+        q.submit(_SQL, (1, "a"))
+        q.submit(_SQL, (2, None))  # NOT NULL violation
+        q.submit(_SQL, (3, "c"))
+        q.close()
+        assert [r[0] for r in conn.execute("SELECT k FROM t ORDER BY k")] == [1, 3]
+        assert q.stats.failed == 1
+
+    def test_concurrent_submitters(self, conn):
+        q = WriteBehindQueue(conn, flush_interval_ms=2, max_batch=64)
+
+        def worker(base):
+            for i in range(200):
+                q.submit(_SQL, (base + i, "x"))
+
+        threads = [threading.Thread(target=worker, args=(n * 1000,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        q.close()
+        assert _count(conn) == 800
+
+
+class TestRunTrackerWriteBehind:
+    def test_writes_are_queued_then_visible(self, tmp_path):
+        t = RunTracker(db_path=str(tmp_path / "obs.db"), flush_interval_ms=60_000)
+        t.initialise_sync()
+        run = t.start_run("hello")
+        t.record_tool_call(run.run_id, "time.now", result="12:00")
+        t.end_run(run)
+        assert t._writer.pending == 3
+        row = t._ensure_conn().execute(
+            "SELECT status FROM runs WHERE run_id = ?", (run.run_id,)
+        ).fetchone()
+        assert row[0] == "success"
+        assert t.write_stats["batches"] == 1
+        t.close_sync()
+
+    def test_read_waits_for_batch_in_flight(self, tmp_path):
+        t = RunTracker(db_path=str(tmp_path / "obs.db"), flush_interval_ms=60_000)
+        t.initialise_sync()
+        writer = t._writer
+        committing = threading.Event()
+        commit = writer._commit
+
+        def slow_commit(batch):
+            committing.set()
+            time.sleep(0.2)
+            commit(batch)
+
+        writer._commit = slow_commit
+        run = t.start_run("hello")
+        writer._wake.set()
+        assert committing.wait(2)
+        assert writer.pending == 0  # dequeued by the writer, not yet committed
+        row = t._ensure_conn().execute(
+            "SELECT user_input FROM runs WHERE run_id = ?", (run.run_id,)
+        ).fetchone()
+        assert row == ("hello",)
+        t.close_sync()
+
+    def test_row_snapshot_taken_at_submit(self, tmp_path):
+        t = RunTracker(db_path=str(tmp_path / "obs.db"), flush_interval_ms=60_000)
+        t.initialise_sync()
+        run = t.start_run("hello")
+        run.route = "changed-after-save"
+        row = t._ensure_conn().execute("SELECT route FROM runs").fetchone()
+        assert row[0] is None
+        t.close_sync()
+
+    async def test_close_flushes_to_disk(self, tmp_path):
+        db = str(tmp_path / "obs.db")
+        t = RunTracker(db_path=db, flush_interval_ms=60_000)
+        await t.initialise()
+        async with t.track_run("q") as run:
+            async with run.track_tool("calendar.list_events", {}) as tc:
+                tc.set_result({"ok": True})
+        await t.save_artifact(run.run_id, "summary", "text")
+        await t.close()
+
+        c = sqlite3.connect(db)
+        assert c.execute("SELECT COUNT(*) FROM runs").fetchone()[0] == 1
+        assert c.execute("SELECT COUNT(*) FROM tool_calls").fetchone()[0] == 1
+        assert c.execute("SELECT COUNT(*) FROM artifacts").fetchone()[0] == 1
+        c.close()
+
+    def test_inline_mode_via_env(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("BANTZ_RUN_TRACKER_WRITE_BEHIND", "0")
+        t = RunTracker(db_path=str(tmp_path / "obs.db"))
+        t.initialise_sync()
+        assert t._writer is None
+        t.start_run("x")
+        assert t.flush() == 0
+        assert t.write_stats == {}
+        t.close_sync()
@@ -0,0 +1,169 @@
+"""
+Tests for the warm interpreter pool behind Sandbox.execute_python.
+
+Covers:
+- Results match running ``python script.py`` (stdout, exit codes, tracebacks)
+- Jobs share no state and reuse warm workers
+- SandboxConfig limits (time, memory, file size)
+- Fallback to a fresh process only when a job could not be dispatched
+- Bounded shared-pool cache
+"""
+
+import os
+import uuid
+
+import pytest
+
+from bantz.security.sandbox import MockSandbox, Sandbox, SandboxConfig
+from bantz.security import sandbox_pool
+from bantz.security.sandbox_pool import get_interpreter_pool, shutdown_pools
+
+pytestmark = pytest.mark.skipif(not hasattr(os, "fork"), reason="fork-server pool needs os.fork")
+
+
+@pytest.fixture(autouse=True, scope="module")
+def _shutdown():
+    yield
+    shutdown_pools()
+
+
+def make_sandbox(**kwargs) -> Sandbox:
+    # A unique environment gives each test its own pool.
+    return Sandbox(SandboxConfig(environment={"BANTZ_POOL_TEST": uuid.uuid4().hex}, **kwargs))
+
+
+def pool_of(sandbox: Sandbox):
+    return sandbox._python_pool()
+
+
+class TestExecution:
+
+    def test_stdout_and_exit_code(self):
+        with make_sandbox() as sandbox:
+            result = sandbox.execute_python("import sys\nprint(__name__, sys.argv[0].endswith('.py'))\nsys.exit(3)")
+            assert result.stdout == "__main__ True\n"
+            assert result.exit_code == 3
+            assert result.success is False
+
+    def test_traceback_like_a_script(self):
+        with make_sandbox() as sandbox:
+            result = sandbox.execute_python("x = 1\n1 / 0\n")
+            assert result.exit_code == 1
+            assert 'sandbox_script.py", line 2, in <module>' in result.stderr
+            assert "sandbox_worker" not in result.stderr
+            assert result.stderr.rstrip().endswith("ZeroDivisionError: division by zero")
+
+    def test_script_classes_pickle_as_main(self):
+        with make_sandbox() as sandbox:
+            result = sandbox.execute_python(
+                "import pickle, sys\n"
+                "class Point:\n"
+                "    x = 1\n"
+                "print(pickle.loads(pickle.dumps(Point())).x, sys.modules['__main__'].Point is Point)\n"
+            )
+            assert result.stdout == "1 True\n", result.stderr
+
+    def test_runs_in_temp_dir(self):
+        with make_sandbox() as sandbox:
+            sandbox.create_file("data.txt", "payload")
+            result = sandbox.execute_python("print(open('data.txt').read())")
+            assert result.success
+            assert result.stdout == "payload\n"
+
+    def test_environment(self):
+        sandbox = Sandbox(SandboxConfig(environment={"BANTZ_POOL_TEST": "env-check"}))
+        with sandbox:
+            result = sandbox.execute_python("import os; print(os.environ['BANTZ_POOL_TEST'])")
+            assert result.stdout == "env-check\n"
+
+
+class TestWarmWorkers:
+
+    def test_jobs_share_no_state(self):
+        with make_sandbox() as sandbox:
+            sandbox.execute_python("import builtins, json\nbuiltins.LEAK = 1\njson.LEAK = 1")
+            result = sandbox.execute_python(
+                "import builtins, json\nprint(hasattr(builtins, 'LEAK'), hasattr(json, 'LEAK'))"
+            )
+            assert result.stdout == "False False\n"
+
+    def test_workers_are_reused(self):
+        with make_sandbox() as sandbox:
+            for i in range(5):
+                assert sandbox.execute_python(f"print({i})").stdout == f"{i}\n"
+            stats = pool_of(sandbox).stats()
+            assert stats["started"] == 1
+            assert stats["jobs"] == 5
+
+    def test_dead_worker_falls_back_and_is_replaced(self):
+        with make_sandbox() as sandbox:
+            sandbox.execute_python("pass")
+            pool = pool_of(sandbox)
+            worker = pool._idle.get_nowait()
+            worker.proc.kill()
+            worker.proc.wait()
+            pool._idle.put(worker)
+            assert sandbox.execute_python("print('ok')").stdout == "ok\n"
+            assert pool.stats()["failures"] == 1
+
+    def test_job_is_not_rerun_when_worker_dies_mid_job(self):
+        with make_sandbox() as sandbox:
+            marker = sandbox.temp_dir / "runs.txt"
+            result = sandbox.execute_python(
+                "import os, signal\n"
+                "with open('runs.txt', 'a') as f:\n"
+                "    f.write('run\\n')\n"
+                "os.kill(os.getppid(), signal.SIGKILL)\n"
+            )
+            assert result.success is False
+            assert result.error
+            assert marker.read_text() == "run\n"
+
+    def test_pool_disabled(self):
+        assert make_sandbox(python_pool_size=0)._python_pool() is None
+        result = make_sandbox(python_pool_size=0).execute_python("print('fresh')")
+        assert result.stdout == "fresh\n"
+
+    def test_mock_sandbox_bypasses_pool(self):
+        result = MockSandbox().execute_python("print('x')")
+        assert result.stdout == "mock output"
+
+    def test_shared_pool_per_config(self):
+        env = {"A": "1"}
+        limits = pool_of(make_sandbox()).limits
+        assert get_interpreter_pool(2, limits, env) is get_interpreter_pool(2, limits, env)
+        assert get_interpreter_pool(0, limits, env) is None
+
+
+class TestLimits:
+
+    def test_timeout_kills_job(self):
+        with make_sandbox() as sandbox:
+            result = sandbox.execute_python("while True:\n    pass", timeout=0.3)
+            assert result.terminated is True
+            assert result.termination_reason == "timeout"
+            assert result.success is False
+            # The worker survives the kill.
+            assert sandbox.execute_python("print(1)").stdout == "1\n"
+
+    def test_memory_limit(self):
+        with make_sandbox(max_memory_mb=256) as sandbox:
+            result = sandbox.execute_python("data = bytearray(512 * 1024 * 1024)")
+            assert result.success is False
+            assert "MemoryError" in result.stderr
+
+    def test_file_size_limit(self):
+        with make_sandbox(max_file_size_mb=1) as sandbox:
+            result = sandbox.execute_python("open('big', 'wb').write(b'x' * 2 * 1024 * 1024)")
+            assert result.success is False
+            assert "File too large" in result.stderr
+
+    def test_shared_pools_are_bounded(self, monkeypatch):
+        monkeypatch.setattr(sandbox_pool, "MAX_SHARED_POOLS", 2)
+        limits = pool_of(make_sandbox()).limits
+        first = get_interpreter_pool(1, limits, {"N": "1"})
+        get_interpreter_pool(1, limits, {"N": "2"})
+        get_interpreter_pool(1, limits, {"N": "3"})
+        assert len(sandbox_pool._pools) <= 2
+        assert first._closed
+        assert get_interpreter_pool(1, limits, {"N": "1"}) is not first
@@ -13,6 +13,7 @@ Tests:
 
 import pytest
 import asyncio
+import time
 from datetime import datetime, timedelta
 from typing import List, Tuple
 from unittest.mock import MagicMock, AsyncMock, patch
@@ -27,6 +28,7 @@ from bantz.skills.summarizer import (
     CacheEntry,
     # Core Classes
     SummaryCache,
+    ContentSummaryCache,
     SummaryHistory,
     RateLimiter,
     PageSummarizer,
@@ -288,6 +290,33 @@ class TestSummaryCache:
         result = await cache.get("https://example.com")
         assert result is None
     
+    @pytest.mark.asyncio
+    async def test_shorter_summary_does_not_replace_full(self, cache):
+        """Test a derived/shorter summary never downgrades a FULL entry."""
+        url = "https://example.com/test"
+        full = PageSummary(
+            title="Test", url=url, short_summary="Short",
+            detailed_summary="Detailed", key_points=["a", "b"],
+            length_type=SummaryLength.FULL,
+        )
+        paragraph = PageSummary(
+            title="Test", url=url, short_summary="Short",
+            detailed_summary="", key_points=[],
+            length_type=SummaryLength.PARAGRAPH,
+        )
+        
+        await cache.set(url, full)
+        await cache.set(url, paragraph)
+        result = await cache.get(url)
+        assert result.length_type == SummaryLength.FULL
+        assert result.detailed_summary == "Detailed"
+        
+        # A longer summary still replaces a shorter one.
+        other = "https://example.com/other"
+        await cache.set(other, paragraph)
+        await cache.set(other, full)
+        assert (await cache.get(other)).length_type == SummaryLength.FULL
+    
     @pytest.mark.asyncio
     async def test_eviction_when_full(self):
         """Test LRU eviction when cache is full."""
@@ -995,5 +1024,176 @@ class TestSummarizerPerformance:
         assert success_count == 5  # Only 5 should succeed
 
 
+# =============================================================================
+# ContentSummaryCache Tests
+# =============================================================================
+
+
+ARTICLE = "Tesla yeni modelini tanıttı. " * 20
+
+
+class _CountingLLM:
+    """LLM stub that counts chat calls."""
+    
+    model_name = "test-model"
+    
+    def __init__(self):
+        self.calls = 0
+    
+    def chat(self, messages, temperature=0.4, max_tokens=512):
+        self.calls += 1
+        if max_tokens >= 800:
+            return "Detaylı özet.\n\nÖnemli Noktalar:\n- Bir\n- İki\n- Üç\n"
+        return "Tesla yeni modelini tanıttı. Fiyatı açıklandı."
+
+
+def _page(url: str, content: str = ARTICLE) -> ExtractedPage:
+    return ExtractedPage(
+        url=url, title="Haber", content=content,
+        content_length=len(content), extracted_at="",
+    )
+
+
+class TestContentSummaryCache:
+    """Tests for the persistent content-addressed cache."""
+    
+    @pytest.fixture
+    def cache(self, tmp_path):
+        c = ContentSummaryCache(tmp_path / "summaries.db")
+        yield c
+        c.close()
+    
+    def _summary(self, length=SummaryLength.FULL):
+        return PageSummary(
+            title="Haber", url="https://a.com/x",
+            short_summary="Kısa özet. " * 40,
+            detailed_summary="Detay" if length == SummaryLength.FULL else "",
+            key_points=["Bir"] if length == SummaryLength.FULL else [],
+            length_type=length,
+        )
+    
+    def test_exact_hit_ignores_whitespace(self, cache):
+        """Test content is normalised before hashing."""
+        cache.set(ARTICLE, self._summary(), model="m")
+        
+        hit = cache.get("  " + ARTICLE.replace(" ", "\n "), SummaryLength.FULL, model="m")
+        
+        assert hit is not None
+        assert hit.from_cache is True
+        assert hit.key_points == ["Bir"]
+    
+    def test_model_is_part_of_key(self, cache):
+        """Test summaries from another model are not reused."""
+        cache.set(ARTICLE, self._summary(), model="m1")
+        
+        assert cache.get(ARTICLE, SummaryLength.FULL, model="m2") is None
+    
+    def test_shorter_length_derived_from_full(self, cache):
+        """Test TWEET and PARAGRAPH are derived from a cached FULL."""
+        cache.set(ARTICLE, self._summary(), model="m")
+        
+        tweet = cache.get(ARTICLE, SummaryLength.TWEET, model="m")
+        paragraph = cache.get(ARTICLE, SummaryLength.PARAGRAPH, model="m")
+        
+        assert tweet.length_type == SummaryLength.TWEET
+        assert len(tweet.short_summary) <= 280
+        assert paragraph.detailed_summary == ""
+        assert cache.stats()["derived_hits"] == 2
+    
+    def test_full_not_derived_from_shorter(self, cache):
+        """Test a FULL request misses when only a TWEET is cached."""
+        cache.set(ARTICLE, self._summary(SummaryLength.TWEET), model="m")
+        
+        assert cache.get(ARTICLE, SummaryLength.FULL, model="m") is None
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test entries survive reopening the database."""
+        first = ContentSummaryCache(tmp_path / "s.db")
+        first.set(ARTICLE, self._summary(), model="m")
+        first.close()
+        
+        second = ContentSummaryCache(tmp_path / "s.db")
+        assert second.get(ARTICLE, SummaryLength.FULL, model="m") is not None
+        second.close()
+    
+    def test_lru_eviction_by_count(self, tmp_path):
+        """Test least recently used entries are evicted."""
+        cache = ContentSummaryCache(tmp_path / "s.db", max_entries=2)
+        cache.set("a" * 200, self._summary())
+        time.sleep(0.01)
+        cache.set("b" * 200, self._summary())
+        time.sleep(0.01)
+        cache.get("a" * 200, SummaryLength.FULL)
+        time.sleep(0.01)
+        cache.set("c" * 200, self._summary())
+        
+        assert cache.get("b" * 200, SummaryLength.FULL) is None
+        assert cache.get("a" * 200, SummaryLength.FULL) is not None
+        assert cache.stats()["size"] == 2
+        cache.close()
+    
+    def test_eviction_by_bytes(self, tmp_path):
+        """Test total payload size is bounded."""
+        cache = ContentSummaryCache(tmp_path / "s.db", max_bytes=1500)
+        for i in range(5):
+            cache.set(f"content {i} " * 30, self._summary())
+        
+        assert cache.stats()["bytes"] <= 1500
+        cache.close()
+
+
+class TestPageSummarizerContentCache:
+    """Tests for PageSummarizer with a content cache."""
+    
+    @pytest.mark.asyncio
+    async def test_same_article_other_url_skips_llm(self, tmp_path):
+        """Test the same content under a new URL is served from cache."""
+        cache = ContentSummaryCache(tmp_path / "s.db")
+        llm = _CountingLLM()
+        summarizer = PageSummarizer(llm_client=llm, content_cache=cache)
+        
+        await summarizer.summarize(extracted=_page("https://a.com/x"))
+        calls = llm.calls
+        second = await summarizer.summarize(extracted=_page("https://b.com/amp/x"))
+        
+        assert llm.calls == calls
+        assert second.from_cache is True
+        assert second.url == "https://b.com/amp/x"
+        assert second.source_content == ARTICLE
+    
+    @pytest.mark.asyncio
+    async def test_survives_restart(self, tmp_path):
+        """Test a new summarizer instance reuses the on-disk cache."""
+        llm = _CountingLLM()
+        first = PageSummarizer(llm_client=llm, content_cache=ContentSummaryCache(tmp_path / "s.db"))
+        await first.summarize(extracted=_page("https://a.com/x"), length=SummaryLength.FULL)
+        calls = llm.calls
+        
+        second = PageSummarizer(llm_client=llm, content_cache=ContentSummaryCache(tmp_path / "s.db"))
+        summary = await second.summarize(extracted=_page("https://a.com/x"), length=SummaryLength.TWEET)
+        
+        assert llm.calls == calls
+        assert summary.length_type == SummaryLength.TWEET
+    
+    @pytest.mark.asyncio
+    async def test_url_cache_does_not_serve_shorter_for_full(self):
+        """Test a cached TWEET is not returned for a FULL request."""
+        llm = _CountingLLM()
+        summarizer = PageSummarizer(llm_client=llm)
+        
+        await summarizer.summarize(extracted=_page("https://a.com/x"), length=SummaryLength.TWEET)
+        full = await summarizer.summarize(extracted=_page("https://a.com/x"), length=SummaryLength.FULL)
+        
+        assert full.length_type == SummaryLength.FULL
+        assert full.from_cache is False
+        assert full.key_points
+    
+    def test_stats_include_content_cache(self, tmp_path):
+        """Test content cache stats are reported."""
+        summarizer = PageSummarizer(content_cache=ContentSummaryCache(tmp_path / "s.db"))
+        
+        assert "content_cache" in summarizer.get_stats()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
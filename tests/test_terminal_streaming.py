@@ -0,0 +1,172 @@
+"""Streaming output capture tests for TerminalExecutor.
+
+Covers:
+- HeadTailBuffer bounds and truncation marker
+- StreamCapture line splitting across chunks
+- OutputPublisher batching onto the EventBus
+- TerminalExecutor.run / run_async in streaming mode (limits, timeouts,
+  terminal.output events)
+"""
+from __future__ import annotations
+
+import pytest
+
+from bantz.coding.capture import (
+    MAX_LINES_PER_EVENT,
+    HeadTailBuffer,
+    OutputPublisher,
+    StreamCapture,
+)
+from bantz.coding.security import SecurityPolicy
+from bantz.coding.terminal import TerminalExecutor
+from bantz.core.events import EventBus
+
+
+@pytest.fixture
+def bus():
+    return EventBus()
+
+
+@pytest.fixture
+def events(bus):
+    received = []
+    bus.subscribe("terminal.output", received.append)
+    return received
+
+
+@pytest.fixture
+def terminal(tmp_path, bus):
+    policy = SecurityPolicy(workspace_root=tmp_path)
+    return TerminalExecutor(tmp_path, security=policy, max_output_size=100, event_bus=bus)
+
+
+# ─────────────────────────────────────────────────────────────────
+# Buffers
+# ─────────────────────────────────────────────────────────────────
+
+class TestHeadTailBuffer:
+
+    def test_small_output_kept_whole(self):
+        buf = HeadTailBuffer(10)
+        buf.feed(b"abc")
+        buf.feed(b"\r\ndef")
+        assert buf.text() == "abc\ndef"
+        assert not buf.truncated
+
+    def test_keeps_head_and_tail(self):
+        buf = HeadTailBuffer(10)
+        for i in range(1000):
+            buf.feed(str(i % 10).encode())
+        assert buf.total == 1000
+        assert buf.dropped == 990
+        assert buf.text() == "01234\n... [truncated 990 of 1000 bytes] ...\n56789"
+
+    def test_tail_memory_is_bounded(self):
+        buf = HeadTailBuffer(100)
+        for _ in range(1000):
+            buf.feed(b"x" * 1000)
+        assert len(buf._tail) <= 2 * 50 + 1000
+
+
+class TestStreamCapture:
+
+    def test_lines_split_across_chunks(self):
+        seen = []
+        cap = StreamCapture("stdout", 1000, lambda name, lines: seen.extend(lines))
+        cap.feed(b"one\ntw")
+        cap.feed(b"o\r\nthr")
+        cap.feed("ü".encode()[:1])  # split multi-byte character
+        cap.feed("ü".encode()[1:] + b"e")
+        cap.close()
+        assert seen == ["one", "two", "thrüe"]
+
+    def test_no_callback_skips_decoding(self):
+        cap = StreamCapture("stdout", 10)
+        cap.feed(b"\xff" * 5)
+        assert cap.total == 5
+
+
+class TestOutputPublisher:
+
+    def test_batches_and_counts_skipped(self, bus, events):
+        pub = OutputPublisher(bus, "cmd", interval=3600)
+        pub.add("stdout", [str(i) for i in range(MAX_LINES_PER_EVENT + 5)])
+        assert events == []
+        pub.finish(return_code=0)
+        (event,) = events
+        assert event.data["done"] is True
+        assert event.data["skipped"] == 5
+        assert event.data["lines"][0] == {"stream": "stdout", "line": "5"}
+
+    def test_publishes_when_interval_elapsed(self, bus, events):
+        pub = OutputPublisher(bus, "cmd", interval=0)
+        pub.add("stderr", ["a"])
+        assert events[0].data["lines"] == [{"stream": "stderr", "line": "a"}]
+        assert events[0].data["done"] is False
+
+
+# ─────────────────────────────────────────────────────────────────
+# TerminalExecutor
+# ─────────────────────────────────────────────────────────────────
+
+class TestStreamingRun:
+
+    def test_output_bounded_while_running(self, terminal):
+        result = terminal.run("seq 1 100000")
+        assert result.ok
+        assert result.truncated
+        assert result.output_bytes == len("\n".join(str(i) for i in range(1, 100001))) + 1
+        assert result.stdout.startswith("1\n2\n")
+        assert result.stdout.endswith("99999\n100000\n")
+        assert len(result.stdout) < 200
+
+    def test_stderr_and_exit_code(self, terminal):
+        result = terminal.run("echo out; echo err >&2; exit 3")
+        assert (result.stdout, result.stderr, result.return_code) == ("out\n", "err\n", 3)
+        assert not result.truncated
+
+    def test_total_output_limit_kills(self, terminal):
+        terminal.max_total_output = 100_000
+        result = terminal.run("yes", timeout=10)
+        assert result.killed
+        assert not result.timed_out
+        assert "output limit of 100000 bytes exceeded" in result.stderr
+
+    def test_timeout_keeps_partial_output(self, terminal):
+        result = terminal.run("echo started; sleep 30", timeout=1)
+        assert result.timed_out
+        assert result.stdout == "started\n"
+
+    def test_publishes_terminal_output(self, terminal, events):
+        terminal.run("echo a; echo b >&2")
+        assert events[-1].data["done"] is True
+        assert events[-1].data["return_code"] == 0
+        lines = [(ln["stream"], ln["line"]) for e in events for ln in e.data["lines"]]
+        assert sorted(lines) == [("stderr", "b"), ("stdout", "a")]
+
+    def test_buffered_mode_still_available(self, tmp_path):
+        policy = SecurityPolicy(workspace_root=tmp_path)
+        t = TerminalExecutor(tmp_path, security=policy, streaming=False)
+        result = t.run("echo legacy")
+        assert result.stdout == "legacy\n"
+        assert result.output_bytes is None
+
+
+class TestStreamingRunAsync:
+
+    async def test_run_async_bounded(self, terminal):
+        result = await terminal.run_async("seq 1 100000")
+        assert result.ok
+        assert result.truncated
+        assert result.stdout.endswith("100000\n")
+
+    async def test_run_async_timeout_keeps_partial_output(self, terminal):
+        result = await terminal.run_async("echo started; sleep 30", timeout=1)
+        assert result.timed_out
+        assert result.stdout == "started\n"
+
+    async def test_run_async_output_limit(self, terminal):
+        terminal.max_total_output = 100_000
+        result = await terminal.run_async("yes", timeout=10)
+        assert result.killed
+        assert result.output_bytes >= 100_000
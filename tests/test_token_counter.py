@@ -0,0 +1,218 @@
+"""Tests for tokenizer-accurate token counting (bantz.llm.token_counter).
+
+Covers:
+- Language detection and calibrated fallback ratios
+- LRU memoisation of exact counts
+- Backend failure → heuristic fallback with retry window
+- vLLM /tokenize backend against the mock server
+- estimate_tokens / trim_to_tokens ``auto`` method
+- Token-aware tool result limiting
+"""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from bantz.llm.token_counter import (
+    TokenCounter,
+    VLLMTokenizeBackend,
+    detect_language,
+    get_token_counter,
+    set_token_counter,
+)
+from bantz.llm.token_utils import estimate_tokens, trim_to_tokens
+
+
+TURKISH = "Yarın sabah saat dokuzda müşteriyle görüşmemiz var, şöyle özetleyeyim. " * 10
+ENGLISH = "Tomorrow morning we have a meeting with the customer, let me summarize. " * 10
+
+
+class _CountingBackend:
+    name = "counting"
+
+    def __init__(self, per_char: float = 0.5):
+        self.calls = 0
+        self.per_char = per_char
+
+    def count(self, text: str) -> int:
+        self.calls += 1
+        return int(len(text) * self.per_char)
+
+
+class _FailingBackend:
+    name = "failing"
+
+    def __init__(self):
+        self.calls = 0
+
+    def count(self, text: str) -> int:
+        self.calls += 1
+        raise ConnectionError("down")
+
+
+@pytest.fixture(autouse=True)
+def _reset_counter():
+    set_token_counter(None)
+    yield
+    set_token_counter(None)
+
+
+class TestLanguageHeuristic:
+
+    def test_detect_turkish(self):
+        assert detect_language(TURKISH) == "tr"
+
+    def test_detect_english(self):
+        assert detect_language(ENGLISH) == "en"
+
+    def test_turkish_counts_more_than_chars4(self):
+        counter = TokenCounter()
+        assert counter.estimate(TURKISH) > len(TURKISH) // 4
+
+    def test_ascii_matches_chars4(self):
+        counter = TokenCounter()
+        assert counter.estimate("abcdefghijkl") == 3
+
+    def test_calibration_moves_ratio_toward_samples(self):
+        counter = TokenCounter()
+        before = counter.ratios["tr"]
+        for _ in range(20):
+            counter.calibrate(TURKISH, len(TURKISH) // 2)  # 2 chars/token
+        after = counter.ratios["tr"]
+        assert 2.0 < after < before
+
+    def test_calibration_ignores_short_text(self):
+        counter = TokenCounter()
+        before = counter.ratios
+        counter.calibrate("kısa", 10)
+        assert counter.ratios == before
+
+
+class TestMemoisation:
+
+    def test_repeated_text_hits_cache(self):
+        backend = _CountingBackend()
+        counter = TokenCounter(backend)
+
+        first = counter.count(TURKISH)
+        second = counter.count(TURKISH)
+
+        assert first == second == len(TURKISH) // 2
+        assert backend.calls == 1
+        assert counter.stats()["hits"] == 1
+
+    def test_lru_eviction(self):
+        backend = _CountingBackend()
+        counter = TokenCounter(backend, cache_size=2)
+
+        counter.count("a")
+        counter.count("b")
+        counter.count("c")
+        counter.count("a")
+
+        assert backend.calls == 4
+
+    def test_failing_backend_falls_back_and_backs_off(self):
+        backend = _FailingBackend()
+        counter = TokenCounter(backend, retry_after=60)
+
+        first = counter.count(TURKISH)
+        counter.count(ENGLISH)
+
+        assert first == counter.estimate(TURKISH)
+        assert backend.calls == 1
+        assert counter.stats()["fallbacks"] == 2
+
+
+class TestVLLMTokenizeBackend:
+
+    def test_counts_via_mock_server(self, vllm_mock_server_url):
+        backend = VLLMTokenizeBackend(vllm_mock_server_url + "/v1")
+        # "merhaba" → "merh" "aba", "," → 1, "dünya" → "düny" "a"
+        assert backend.count("merhaba, dünya") == 5
+
+    def test_counter_uses_vllm_from_env(self, vllm_mock_server_url):
+        env = {"BANTZ_TOKEN_BACKEND": "vllm", "BANTZ_VLLM_URL": vllm_mock_server_url}
+        with patch.dict("os.environ", env):
+            set_token_counter(None)
+            counter = get_token_counter()
+            assert counter.has_backend
+            estimate_tokens("merhaba, dünya")  # heuristic; exact count queued
+            counter.flush(timeout=5)
+            assert estimate_tokens("merhaba, dünya") == 5
+
+    def test_remote_backend_is_not_called_on_hot_path(self):
+        release = threading.Event()
+
+        class _SlowRemote(_CountingBackend):
+            remote = True
+
+            def count(self, text: str) -> int:
+                release.wait(5)
+                return super().count(text)
+
+        backend = _SlowRemote(per_char=1.0)
+        counter = TokenCounter(backend)
+        assert counter.count("abcdefgh") == counter.estimate("abcdefgh")
+        release.set()
+        counter.flush(timeout=5)
+        assert counter.count("abcdefgh") == 8
+        assert backend.calls == 1
+
+
+class TestAutoMethod:
+
+    def test_estimate_tokens_uses_counter(self):
+        set_token_counter(TokenCounter(_CountingBackend(per_char=1.0)))
+        assert estimate_tokens("abcdef") == 6
+
+    def test_trim_respects_exact_budget(self):
+        set_token_counter(TokenCounter(_CountingBackend(per_char=1.0)))
+        result = trim_to_tokens("x" * 100, 10)
+        assert len(result) <= 10
+        assert result.endswith("…")
+
+    def test_trim_always_fits_budget(self):
+        class _OffsetBackend(_CountingBackend):
+            # A fixed overhead per text: the ratio-based shrink steps
+            # keep landing above the budget.
+            def count(self, text: str) -> int:
+                return super().count(text) + 90
+
+        counter = TokenCounter(_OffsetBackend(per_char=1.0))
+        set_token_counter(counter)
+        result = trim_to_tokens("x" * 1000, 100)
+        assert counter.count(result) <= 100
+        assert result == "x" * 9 + "…"
+
+    def test_trim_turkish_uses_calibrated_ratio(self):
+        result = trim_to_tokens(TURKISH, 30)
+        assert estimate_tokens(result) <= 30
+        assert len(result) < 30 * 4
+
+
+class TestToolResultTokenLimit:
+
+    def test_dense_result_truncated_by_tokens(self):
+        from bantz.brain.tool_result_limiter import enforce_result_size_limits
+
+        set_token_counter(TokenCounter(_CountingBackend(per_char=1.0)))
+        results = [{"tool": "gmail.get_message", "result": "x" * 12_000}]
+
+        enforce_result_size_limits(results, token_limit=5_000)
+
+        assert len(results[0]["result"]) < 6_000
+
+    def test_small_result_not_counted(self):
+        from bantz.brain.tool_result_limiter import enforce_result_size_limits
+
+        backend = _CountingBackend()
+        set_token_counter(TokenCounter(backend))
+        results = [{"tool": "calendar.list_events", "result": "ok"}]
+
+        enforce_result_size_limits(results)
+
+        assert backend.calls == 0
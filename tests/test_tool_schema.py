@@ -72,3 +72,59 @@ def test_tool_registry_llm_catalog_deterministic_and_formats():
     assert envelope["version"] == 1
     assert envelope["format"] == "short"
     assert envelope["tools"] == short
+
+
+def _route_registry() -> ToolRegistry:
+    tools = ToolRegistry()
+    for name in ("gmail.send", "gmail.list_messages", "calendar.list_events"):
+        tools.register(
+            Tool(
+                name=name,
+                description=f"{name.split('.')[1]} aracı. Detaylar.",
+                parameters={
+                    "type": "object",
+                    "properties": {"q": {"type": "string"}},
+                    "required": ["q"],
+                },
+            )
+        )
+    return tools
+
+
+def test_tool_registry_views_memoised_until_register():
+    tools = _route_registry()
+    valid = frozenset({"gmail.send", "gmail.list_messages"})
+
+    gen = tools.generation
+    first = tools.as_openai_tools_for_route("gmail", valid_tools=valid)
+    second = tools.as_openai_tools_for_route("gmail", valid_tools=valid)
+    assert [t["function"]["name"] for t in first] == ["gmail.list_messages", "gmail.send"]
+    assert first == second and first is not second
+    assert all(a is b for a, b in zip(first, second))  # no rebuild
+    assert tools.get_schemas_for_route("gmail", valid_tools=valid) is tools.get_schemas_for_route(
+        "gmail", valid_tools=set(valid)
+    )
+    assert tools.as_llm_catalog()[0] is tools.as_llm_catalog()[0]
+
+    tools.register(Tool(name="gmail.archive", description="Arşivler", parameters={}))
+    assert tools.generation == gen + 1
+    assert len(tools.as_openai_tools_for_route("gmail")) == 3
+    assert "gmail.archive" not in tools.get_schemas_for_route("gmail", valid_tools=valid)
+
+
+def test_tool_registry_unregister_invalidates():
+    tools = _route_registry()
+    assert "gmail.send" in tools.get_schemas_for_route("gmail")
+    assert tools.unregister("gmail.send") is True
+    assert tools.unregister("gmail.send") is False
+    assert "gmail.send" not in tools.get_schemas_for_route("gmail")
+    assert tools.names() == ["calendar.list_events", "gmail.list_messages"]
+    assert [t["function"]["name"] for t in tools.as_openai_tools()] == tools.names()
+
+
+def test_tool_registry_valid_tool_sets_cached_separately():
+    tools = _route_registry()
+    all_gmail = tools.get_schemas_for_route("gmail")
+    only_send = tools.get_schemas_for_route("gmail", valid_tools={"gmail.send"})
+    assert all_gmail.count("\n") == 1
+    assert only_send == "- gmail.send(q*) — send aracı [LOW]"
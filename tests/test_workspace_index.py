@@ -0,0 +1,155 @@
+"""
+Tests for the persistent workspace index (bantz.coding.index).
+
+Covers:
+- File, content and symbol queries with their filters
+- Incremental refresh, persistence and FileManager change notifications
+- related_files (tests, imports, importers)
+- Large files and the no-FTS5 fallback
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+import bantz.coding.index as index_mod
+from bantz.coding.files import FileManager
+from bantz.coding.index import WorkspaceIndex, get_workspace_index
+from bantz.tools.code_tools import code_replace_function_tool
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    root = tmp_path / "ws"
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "tests").mkdir()
+    (root / "node_modules" / "dep").mkdir(parents=True)
+    (root / ".git").mkdir()
+    (root / "src" / "pkg" / "__init__.py").write_text("")
+    (root / "src" / "pkg" / "core.py").write_text(
+        "from .util import helper\n\n"
+        "class Engine:\n"
+        "    def start(self):\n"
+        "        return helper()\n"
+    )
+    (root / "src" / "pkg" / "util.py").write_text("def helper():\n    return 'ok'\n")
+    (root / "tests" / "test_core.py").write_text("from pkg.core import Engine\n")
+    (root / "app.js").write_text("export function startApp() {}\nclass Widget {}\n")
+    (root / "README.md").write_text("Engine docs\n")
+    (root / "node_modules" / "dep" / "index.js").write_text("function vendored() {}\n")
+    (root / ".git" / "config").write_text("Engine\n")
+    return root
+
+
+@pytest.fixture
+def index(workspace, tmp_path):
+    ix = WorkspaceIndex(workspace, db_path=tmp_path / "index.db", max_age=3600)
+    yield ix
+    ix.close()
+
+
+class TestQueries:
+    def test_find_files(self, index):
+        assert index.find_files("*.py") == [
+            "src/pkg/__init__.py", "src/pkg/core.py", "src/pkg/util.py", "tests/test_core.py",
+        ]
+        assert index.find_files("*", extensions=[".JS"]) == ["app.js"]
+        assert index.find_files("*.py", directory="src/pkg", max_results=1) == ["src/pkg/__init__.py"]
+        assert index.find_files("pkg/c*.py") == ["src/pkg/core.py"]
+        assert index.find_files("*", directory="/elsewhere") == []
+
+    def test_hidden_and_vendored_dirs_are_skipped(self, index):
+        paths = index.find_files("*")
+        assert not any(p.startswith((".git", "node_modules")) for p in paths)
+
+    def test_search_content(self, index):
+        assert index.search_content(r"class \w+") == ["app.js", "src/pkg/core.py"]
+        assert index.search_content(r"Engine", pattern="*.md") == ["README.md"]
+        # No literal of 3+ chars: every file is checked against the regex.
+        assert index.search_content(r"\(\)\s*\{") == ["app.js"]
+
+    def test_search_symbols(self, index):
+        (hit,) = index.search_symbols("engine")
+        assert hit["file"] == "src/pkg/core.py"
+        assert hit["type"] == "class"
+        short = index.search_symbols("st", symbol_type="method", extensions=[".py"])
+        assert [(s["name"], s["parent"]) for s in short] == [("start", "Engine")]
+        assert [s["name"] for s in index.search_symbols("", symbol_type="class")] == ["Widget", "Engine"]
+        assert index.search_symbols("zzz") == []
+
+    def test_related_files(self, index):
+        assert index.related_files("src/pkg/core.py") == ["src/pkg/util.py", "tests/test_core.py"]
+        # Reverse lookup: who imports util?
+        assert index.related_files("src/pkg/util.py") == ["src/pkg/core.py"]
+
+
+class TestRefresh:
+    def test_incremental_refresh(self, index, workspace):
+        first = index.refresh()
+        assert (first.scanned, first.added) == (6, 6)
+        assert index.refresh().added == 0
+        core = workspace / "src" / "pkg" / "core.py"
+        core.write_text(core.read_text() + "\ndef extra():\n    pass\n")
+        os.utime(core, ns=(1, 1))
+        (workspace / "README.md").unlink()
+        (workspace / "new.py").write_text("def fresh(): pass\n")
+
+        stats = index.refresh()
+        assert (stats.added, stats.updated, stats.removed) == (1, 1, 1)
+        assert index.search_symbols("extra")[0]["file"] == "src/pkg/core.py"
+        assert "README.md" not in index.find_files("*")
+
+    def test_persisted_between_instances(self, workspace, tmp_path):
+        db = tmp_path / "persist.db"
+        WorkspaceIndex(workspace, db_path=db).refresh()
+        again = WorkspaceIndex(workspace, db_path=db)
+        stats = again.refresh()
+        assert stats.added == 0 and stats.updated == 0
+        assert again.search_symbols("helper")[0]["file"] == "src/pkg/util.py"
+
+    def test_file_manager_writes_are_visible_immediately(self, workspace, monkeypatch):
+        monkeypatch.setenv("BANTZ_WORKSPACE_INDEX", "memory")
+        monkeypatch.setenv("BANTZ_WORKSPACE_INDEX_MAX_AGE", "3600")
+        fm = FileManager(workspace, backup_enabled=False)
+        assert fm.search_files("*.py", content_pattern="needle_value") == []
+        fm.create_file("src/pkg/needle.py", "needle_value = 1\n")
+        assert fm.search_files("*.py", content_pattern="needle_value") == ["src/pkg/needle.py"]
+        fm.delete_file("src/pkg/needle.py", confirmed=True)
+        assert fm.search_files("needle.py") == []
+
+    def test_replace_function_tool_updates_index(self, workspace):
+        ix = get_workspace_index(workspace)
+        assert ix.search_symbols("renamed") == []
+        result = code_replace_function_tool(
+            path=str(workspace / "src" / "pkg" / "util.py"),
+            function_name="helper",
+            new_code="def renamed():\n    return 'ok'",
+        )
+        assert result["ok"]
+        assert ix.search_symbols("renamed")[0]["file"] == "src/pkg/util.py"
+
+    def test_default_db_location(self, monkeypatch):
+        monkeypatch.delenv("BANTZ_WORKSPACE_INDEX", raising=False)
+        monkeypatch.setenv("BANTZ_DATA_DIR", "/data")
+        project = index_mod._default_db_path(Path("/srv/project"))
+        assert project.startswith("/data/workspace_index/project-") and project.endswith(".db")
+
+    def test_shared_per_root(self, workspace, monkeypatch):
+        monkeypatch.setenv("BANTZ_WORKSPACE_INDEX", "memory")
+        assert get_workspace_index(workspace) is get_workspace_index(str(workspace))
+
+
+class TestFallbacks:
+    def test_large_files_are_read_at_query_time(self, workspace, tmp_path, monkeypatch):
+        monkeypatch.setattr(index_mod, "MAX_CONTENT_BYTES", 10)
+        ix = WorkspaceIndex(workspace, db_path=":memory:")
+        assert ix.search_content(r"return 'ok'") == ["src/pkg/util.py"]
+        assert ix.stats()["text_files"] == 1  # only the empty __init__.py
+
+    def test_without_fts5(self, workspace, monkeypatch):
+        monkeypatch.setattr(index_mod, "_FTS_SCHEMA", "CREATE VIRTUAL TABLE content_fts USING no_such_module(body);")
+        ix = WorkspaceIndex(workspace, db_path=":memory:")
+        assert ix.stats()["fts"] is False
+        assert ix.search_content(r"def helper") == ["src/pkg/util.py"]
+        assert [s["name"] for s in ix.search_symbols("Engine")] == ["Engine"]